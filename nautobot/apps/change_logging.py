@@ -3,6 +3,7 @@
 from nautobot.extras.context_managers import (
     change_logging,
     ChangeContext,
+    deferred_change_logging_for_bulk_operation,
     JobChangeContext,
     JobHookChangeContext,
     ORMChangeContext,
@@ -17,5 +18,6 @@ __all__ = (
     "ORMChangeContext",
     "WebChangeContext",
     "change_logging",
+    "deferred_change_logging_for_bulk_operation",
     "web_request_context",
 )
@@ -56,6 +56,7 @@ from nautobot.core.utils.migrations import migrate_content_type_references_to_ne
 from nautobot.core.utils.permissions import (
     get_permission_for_model,
     permission_is_exempt,
+    qs_filter_for_user,
     qs_filter_from_constraints,
     resolve_permission,
     resolve_permission_ct,
@@ -163,6 +164,7 @@ __all__ = (
     "normalize_querydict",
     "permission_is_exempt",
     "populate_model_features_registry",
+    "qs_filter_for_user",
     "qs_filter_from_constraints",
     "refresh_job_model_from_job_class",
     "remove_prefix_from_cf_key",
@@ -84,6 +84,8 @@ class Provider(PrimaryModel):
         "admin_contact",
     ]
 
+    supports_bulk_import = True
+
     class Meta:
         ordering = ["name"]
 
@@ -104,6 +106,8 @@ class CircuitType(OrganizationalModel):
         blank=True,
     )
 
+    supports_bulk_import = True
+
     class Meta:
         ordering = ["name"]
 
@@ -171,6 +175,8 @@ class Circuit(PrimaryModel):
         "description",
     ]
 
+    supports_bulk_import = True
+
     class Meta:
         ordering = ["provider", "cid"]
         unique_together = ["provider", "cid"]
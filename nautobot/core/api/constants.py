@@ -5,6 +5,7 @@ NON_FILTER_QUERY_PARAMS = (
     "exclude_m2m",  # used to exclude many-to-many fields from the REST API
     "format",  # "json" or "api", used in the interactive HTML REST API views
     "include",  # used to include computed fields, relationships, config-contexts, etc. (excluded by default)
+    "cursor",  # keyset pagination
     "limit",  # pagination
     "offset",  # pagination
     "sort",  # sorting of results
@@ -224,13 +224,13 @@ class NautobotHyperlinkedRelatedField(WritableSerializerMixin, serializers.Hyper
         )
         return None
 
-    def to_internal_value(self, data):
-        """Convert potentially nested representation to a model instance."""
+    def get_lookup_data(self, data):
+        """Reduce a potentially nested or composite-key representation to a PK, URL, or dictionary of attributes."""
         if isinstance(data, dict):
             if "url" in data:
-                return super().to_internal_value(data["url"])
+                return data["url"]
             elif "id" in data:
-                return super().to_internal_value(data["id"])
+                return data["id"]
         if isinstance(data, str) and not is_uuid(data) and not is_url(data):
             # Maybe it's a composite-key?
             related_model = self._related_model
@@ -243,7 +243,11 @@ class NautobotHyperlinkedRelatedField(WritableSerializerMixin, serializers.Hyper
             elif related_model is not None and related_model.label_lower == "auth.group":
                 # auth.Group is a base Django model and so doesn't implement our natural_key_args_to_kwargs() method
                 data = {"name": deconstruct_composite_key(data)}
-        return super().to_internal_value(data)
+        return data
+
+    def to_internal_value(self, data):
+        """Convert potentially nested representation to a model instance."""
+        return super().to_internal_value(self.get_lookup_data(data))
 
     def to_representation(self, value):
         """Convert URL representation to a brief nested representation."""
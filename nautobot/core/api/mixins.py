@@ -5,8 +5,9 @@ from django.core.exceptions import (
     FieldError,
     MultipleObjectsReturned,
     ObjectDoesNotExist,
+    ValidationError as DjangoValidationError,
 )
-from django.db.models import AutoField, Model
+from django.db.models import AutoField, Case, IntegerField, Model, Q, Value, When
 from rest_framework.exceptions import ValidationError
 
 from nautobot.core.api.utils import dict_to_filter_params
@@ -40,8 +41,15 @@ class WritableSerializerMixin:
     "parent": { "location_type__parent": {"name": "Campus"}, "parent__name": "Campus-29" }
     vs
     "parent": "10dff139-7333-46b0-bef6-f6a5a7b5497c"
+
+    If the serializer context includes a `related_object_cache` dict, objects retrieved by `get_object()` are cached
+    in it, so that serializers sharing that context (such as those used for each row of a CSV import) look up each
+    distinct related object only once. Such a cache can also be populated in advance with `prefetch_objects()`.
     """
 
+    # Maximum number of distinct lookups to combine into a single query in `prefetch_objects()`
+    prefetch_batch_size = 500
+
     def remove_non_filter_fields(self, filter_params):
         """
         Make output from a WritableSerializer "round-trip" capable by automatically stripping from the
@@ -85,26 +93,46 @@ class WritableSerializerMixin:
             ) from e
         return {"pk": pk}
 
+    def get_lookup_data(self, data):
+        """Hook for subclasses to normalize the provided data before it's converted to queryset filter parameters."""
+        return data
+
+    def get_related_object_cache_key(self, queryset, filter_params):
+        """Get the key under which the object matching the given filter parameters is stored in the context cache."""
+        field_name = self.field_name or getattr(self.parent, "field_name", "")
+        try:
+            params = tuple(sorted(filter_params.items()))
+            hash(params)
+        except TypeError:
+            # Unhashable (or unsortable) filter values; don't cache this lookup
+            return None
+        return (type(self.root).__qualname__, field_name, queryset.model._meta.label_lower, params)
+
     def get_object(self, data, queryset):
         """
         Retrieve an unique object based on a dictionary of data attributes and raise errors accordingly if the object is not found.
         """
         filter_params = self.get_queryset_filter_params(data=data, queryset=queryset)
+        related_object_cache = self.context.get("related_object_cache")
+        cache_key = None
+        if related_object_cache is not None:
+            cache_key = self.get_related_object_cache_key(queryset, filter_params)
+            if cache_key in related_object_cache:
+                return related_object_cache[cache_key]
         try:
-            return queryset.get(**filter_params)
+            obj = queryset.get(**filter_params)
         except ObjectDoesNotExist as e:
             raise ValidationError(f"Related object not found using the provided attributes: {filter_params}") from e
         except MultipleObjectsReturned as e:
             raise ValidationError(f"Multiple objects match the provided attributes: {filter_params}") from e
         except FieldError as e:
             raise ValidationError(e) from e
+        if cache_key is not None:
+            related_object_cache[cache_key] = obj
+        return obj
 
-    def to_internal_value(self, data):
-        """
-        Return an object or a list of objects based on a dictionary of data attributes or an UUID.
-        """
-        if data is None:
-            return None
+    def get_lookup_queryset(self):
+        """Get the queryset from which related objects are retrieved, restricted to those the user may view."""
         if hasattr(self, "queryset"):
             queryset = self.queryset
         else:
@@ -118,6 +146,63 @@ class WritableSerializerMixin:
             and hasattr(queryset, "restrict")
         ):
             queryset = queryset.restrict(self.context["request"].user, "view")
+        return queryset
+
+    def prefetch_objects(self, values):
+        """
+        Look up the related objects referenced by the given input values in batches, adding them to the context cache.
+
+        Each batch of distinct lookups is combined into a single query, which annotates each matching object with the
+        index of the lookup it matched. Any lookups that aren't resolved to a single object this way, for example
+        because they match no object or several objects, are left to `get_object()` to handle (and report) as usual.
+
+        Args:
+            values (list): Input data for this field, for example from each row of a CSV import.
+        """
+        related_object_cache = self.context.get("related_object_cache")
+        if related_object_cache is None:
+            return
+        queryset = self.get_lookup_queryset()
+
+        lookups = {}
+        for value in values:
+            if value is None or value == "":
+                continue
+            for entry in value if isinstance(value, list) else [value]:
+                try:
+                    filter_params = self.get_queryset_filter_params(data=self.get_lookup_data(entry), queryset=queryset)
+                except ValidationError:
+                    continue
+                cache_key = self.get_related_object_cache_key(queryset, filter_params)
+                if cache_key is not None and cache_key not in related_object_cache:
+                    lookups.setdefault(cache_key, filter_params)
+
+        lookups = list(lookups.items())
+        for offset in range(0, len(lookups), self.prefetch_batch_size):
+            batch = lookups[offset : offset + self.prefetch_batch_size]
+            lookup_index = Case(
+                *[When(Q(**filter_params), then=Value(i)) for i, (_, filter_params) in enumerate(batch)],
+                default=None,
+                output_field=IntegerField(),
+            )
+            matches = {}
+            try:
+                for obj in queryset.annotate(_lookup_index=lookup_index).filter(_lookup_index__isnull=False):
+                    matches.setdefault(obj._lookup_index, {})[obj.pk] = obj
+            except (FieldError, TypeError, ValueError, DjangoValidationError) as e:
+                logger.debug("Unable to prefetch related objects for %s: %s", self.field_name, e)
+                continue
+            for i, objs in matches.items():
+                if len(objs) == 1:
+                    related_object_cache[batch[i][0]] = next(iter(objs.values()))
+
+    def to_internal_value(self, data):
+        """
+        Return an object or a list of objects based on a dictionary of data attributes or an UUID.
+        """
+        if data is None:
+            return None
+        queryset = self.get_lookup_queryset()
 
         if isinstance(data, list):
             return [self.get_object(data=entry, queryset=queryset) for entry in data]
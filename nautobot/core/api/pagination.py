@@ -1,7 +1,15 @@
+import base64
+import binascii
+
+from django.core.exceptions import ValidationError
+from django.db.models import QuerySet
+from rest_framework.exceptions import NotFound
 from rest_framework.pagination import LimitOffsetPagination
+from rest_framework.utils.urls import remove_query_param, replace_query_param
 
 from nautobot.core.constants import MAX_PAGE_SIZE_DEFAULT, PAGINATE_COUNT_DEFAULT
 from nautobot.core.utils.config import get_settings_or_config
+from nautobot.core.utils.querysets import get_queryset_count
 
 
 class OptionalLimitOffsetPagination(LimitOffsetPagination):
@@ -9,29 +17,118 @@ class OptionalLimitOffsetPagination(LimitOffsetPagination):
     Override the stock paginator to allow setting limit=0 to disable pagination for a request. This returns all objects
     matching a query, but retains the same format as a paginated request. The limit can only be disabled if
     MAX_PAGE_SIZE has been set to 0 or None.
+
+    Additionally, if the `cursor` query parameter is specified (even with an empty value, to request the first page),
+    the queryset is paginated by keyset rather than by offset: records are ordered by primary key, and each page is
+    retrieved by filtering for primary keys greater than the last one on the previous page. This keeps the cost of
+    each page constant regardless of its position, and avoids counting the matching records, so `count` is null.
+
+    Otherwise, the matching records are counted with `get_queryset_count()`, so the `count` may be an estimate for very
+    large querysets, in which case the response additionally includes `"count_is_estimated": true`.
     """
 
+    cursor_query_param = "cursor"
+    cursor_query_description = (
+        "Opaque cursor for keyset pagination, as found in the `next` link of a previous response. "
+        "Specify an empty value to retrieve the first page."
+    )
+    invalid_cursor_message = "Invalid cursor"
+
+    cursor = None
+    next_cursor = None
+    count_is_estimated = False
+    page_length = None
+
     def paginate_queryset(self, queryset, request, view=None):
         # No pagination when rendering to CSV
         if "text/csv" in request.accepted_media_type:
             return None
 
+        self.request = request
+        self.cursor = self.get_cursor(request, queryset)
+        if self.cursor is not None:
+            return self.paginate_queryset_by_cursor(queryset, request)
+
         self.count = self.get_count(queryset)
         self.limit = self.get_limit(request)
         self.offset = self.get_offset(request)
-        self.request = request
 
         if self.limit and self.count > self.limit and self.template is not None:
             self.display_page_controls = True
 
-        if self.count == 0 or self.offset > self.count:
+        # An estimated count may be lower than the actual number of records, so don't rely on it to skip the query
+        if not self.count_is_estimated and (self.count == 0 or self.offset > self.count):
             return []
 
         if self.limit:
-            return list(queryset[self.offset : self.offset + self.limit])
+            results = list(queryset[self.offset : self.offset + self.limit])
+            self.page_length = len(results)
+            return results
         else:
             return list(queryset[self.offset :])
 
+    def paginate_queryset_by_cursor(self, queryset, request):
+        """Get the page of records following the current cursor, without counting or offsetting the queryset."""
+        self.count = None
+        self.limit = self.get_limit(request)
+        self.offset = 0
+        self.next_cursor = None
+
+        queryset = queryset.order_by("pk")
+        if self.cursor:
+            queryset = queryset.filter(pk__gt=self.cursor)
+
+        if not self.limit:
+            return list(queryset)
+
+        # Retrieve one extra record to determine whether there is a next page
+        results = list(queryset[: self.limit + 1])
+        if len(results) > self.limit:
+            results = results[: self.limit]
+            self.next_cursor = str(results[-1].pk)
+        return results
+
+    def get_count(self, queryset):
+        if isinstance(queryset, QuerySet):
+            count, self.count_is_estimated = get_queryset_count(queryset)
+            return count
+        return super().get_count(queryset)
+
+    def get_paginated_response(self, data):
+        response = super().get_paginated_response(data)
+        if self.count_is_estimated:
+            response.data["count_is_estimated"] = True
+        return response
+
+    def get_cursor(self, request, queryset):
+        """
+        Get the primary key value encoded in the `cursor` query parameter.
+
+        Returns:
+            (str): The decoded primary key, an empty string to request the first page, or None if keyset pagination
+                was not requested or is not possible for the given data.
+
+        Raises:
+            NotFound: If the cursor is not valid.
+        """
+        if self.cursor_query_param not in request.query_params or not isinstance(queryset, QuerySet):
+            return None
+
+        encoded_cursor = request.query_params[self.cursor_query_param]
+        if not encoded_cursor:
+            return ""
+
+        try:
+            cursor = base64.urlsafe_b64decode(encoded_cursor.encode("ascii")).decode("utf-8")
+            queryset.model._meta.pk.to_python(cursor)
+        except (binascii.Error, UnicodeError, ValidationError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+        return cursor
+
+    def encode_cursor(self, cursor):
+        """Encode the given primary key value as an opaque `cursor` query parameter value."""
+        return base64.urlsafe_b64encode(cursor.encode("utf-8")).decode("ascii")
+
     def get_limit(self, request):
         if self.limit_query_param:
             try:
@@ -56,6 +153,19 @@ class OptionalLimitOffsetPagination(LimitOffsetPagination):
         if not self.limit:
             return None
 
+        if self.cursor is not None:
+            if self.next_cursor is None:
+                return None
+            url = remove_query_param(self.request.build_absolute_uri(), self.offset_query_param)
+            return replace_query_param(url, self.cursor_query_param, self.encode_cursor(self.next_cursor))
+
+        if self.count_is_estimated:
+            # Continue for as long as pages are full, rather than stopping at the estimated count
+            if self.page_length != self.limit:
+                return None
+            url = replace_query_param(self.request.build_absolute_uri(), self.limit_query_param, self.limit)
+            return replace_query_param(url, self.offset_query_param, self.offset + self.limit)
+
         return super().get_next_link()
 
     def get_previous_link(self):
@@ -63,4 +173,28 @@ class OptionalLimitOffsetPagination(LimitOffsetPagination):
         if not self.limit:
             return None
 
+        # Keyset pagination only supports iterating forward
+        if self.cursor is not None:
+            return None
+
         return super().get_previous_link()
+
+    def get_paginated_response_schema(self, schema):
+        paginated_schema = super().get_paginated_response_schema(schema)
+        # `count` is null when using keyset pagination
+        paginated_schema["properties"]["count"]["nullable"] = True
+        paginated_schema["properties"]["count_is_estimated"] = {"type": "boolean", "example": True}
+        return paginated_schema
+
+    def get_schema_operation_parameters(self, view):
+        parameters = super().get_schema_operation_parameters(view)
+        parameters.append(
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": self.cursor_query_description,
+                "schema": {"type": "string"},
+            }
+        )
+        return parameters
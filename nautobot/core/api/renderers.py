@@ -1,5 +1,4 @@
 import csv
-from io import StringIO
 import json
 import logging
 
@@ -35,6 +34,13 @@ class NautobotJSONRenderer(JSONRenderer):
     encoder_class = NautobotKombuJSONEncoder
 
 
+class _Echo:
+    """Pseudo-buffer for `csv.writer` whose `write()` simply returns the given value, enabling line-by-line output."""
+
+    def write(self, value):
+        return value
+
+
 class NautobotCSVRenderer(BaseRenderer):
     """
     Render to CSV format.
@@ -57,24 +63,47 @@ class NautobotCSVRenderer(BaseRenderer):
         if isinstance(data, dict):
             data = [data]
 
-        headers = self.get_headers(data)
+        return "".join(self.render_iter(data, headers=self.get_headers(data)))
+
+    def render_iter(self, data, *, headers=None, custom_field_keys=None):
+        """
+        Render the provided iterable of records to CSV format, yielding one line of CSV at a time.
+
+        Unlike `render()`, this never holds more than a single record and a single line of CSV in memory, and so is
+        suitable for streaming very large data sets (such as a generator of serialized records) to a file or to a
+        `StreamingHttpResponse`.
+
+        Args:
+            data (iterable): Serialized records (dicts) to render.
+            headers (list): CSV headers to use; if unset, these are derived from the first record via `get_headers()`.
+            custom_field_keys (list): Keys of all custom fields applicable to the records, passed to `get_headers()`.
+        """
+        records = iter(data)
+        try:
+            first_record = next(records)
+        except StopIteration:
+            return
 
-        buffer = StringIO()
-        writer = csv.writer(buffer)
-        writer.writerow(headers)
-        for record in data:
-            writer.writerow(
-                self.object_to_row_elements(
-                    record,
-                    headers=headers,
-                )
-            )
+        if headers is None:
+            headers = self.get_headers([first_record], custom_field_keys=custom_field_keys)
 
-        return buffer.getvalue()
+        writer = csv.writer(_Echo())
+        yield writer.writerow(headers)
+        yield writer.writerow(self.object_to_row_elements(first_record, headers=headers))
+        for record in records:
+            yield writer.writerow(self.object_to_row_elements(record, headers=headers))
 
     @classmethod
-    def get_headers(cls, data):
-        """Identify the appropriate CSV headers corresponding to the given data."""
+    def get_headers(cls, data, custom_field_keys=None):
+        """
+        Identify the appropriate CSV headers corresponding to the given data.
+
+        Args:
+            data (list): Serialized records (dicts) to be rendered.
+            custom_field_keys (list): Keys of all custom fields applicable to the records, for example as reported by
+                `CustomField.objects.keys_for_model()`. If specified, these are used to construct the custom field
+                headers rather than scanning every record in `data` for its custom field keys.
+        """
         base_headers = list(data[0].keys())
 
         # Remove specific headers that we know are irrelevant
@@ -89,15 +118,17 @@ class NautobotCSVRenderer(BaseRenderer):
                 base_headers.remove(undesired_header)
 
         # Add individual headers for each relevant custom field
-        # Since we know there are cases where custom field data may be missing from a given instance,
-        # we iterate over *all* instances in the data set to be safe.
-        if "custom_fields" in data[0]:
+        if "custom_fields" not in data[0]:
+            cf_headers = []
+        elif custom_field_keys is not None:
+            cf_headers = sorted(f"cf_{key}" for key in custom_field_keys)
+        else:
+            # Since we know there are cases where custom field data may be missing from a given instance,
+            # we iterate over *all* instances in the data set to be safe.
             cf_headers = set()
             for record in data:
                 cf_headers |= {f"cf_{key}" for key in record["custom_fields"]}
             cf_headers = sorted(cf_headers)
-        else:
-            cf_headers = []
 
         # TODO: relationships? computed fields?
 
@@ -721,7 +721,10 @@ class BulkOperationIntegerIDSerializer(serializers.Serializer):
 
 
 class GraphQLAPISerializer(serializers.Serializer):
-    query = serializers.CharField(required=True, help_text="GraphQL query")
+    query = serializers.CharField(required=False, help_text="GraphQL query")
+    id = serializers.CharField(
+        required=False, help_text="UUID or name of a saved GraphQL query to execute, if `query` is not specified"
+    )
     variables = serializers.JSONField(required=False, help_text="Variables in JSON Format")
 
 
@@ -1,4 +1,5 @@
 from collections import namedtuple
+import itertools
 import logging
 import platform
 import sys
@@ -120,6 +121,34 @@ def get_serializer_for_model(model, prefix=""):
         ) from exc
 
 
+def iter_serialized_queryset(serializer_class, queryset, *, chunk_size=1000, **kwargs):
+    """
+    Serialize the given queryset `chunk_size` records at a time, yielding each serialized record in turn.
+
+    This keeps memory usage flat when serializing very large querysets (such as for a CSV export), as opposed to
+    `serializer_class(queryset, many=True).data`, which constructs all model instances and all serialized data at once.
+
+    Args:
+        serializer_class (type): Serializer class to use.
+        queryset (QuerySet): Records to serialize, in the desired order.
+        chunk_size (int): Number of records to load and serialize at a time.
+        **kwargs: Additional keyword arguments (such as `context`) to pass when instantiating the serializer.
+
+    Yields:
+        (dict): Serialized data for each record in the queryset.
+    """
+    if queryset.query.is_sliced:
+        # A sliced queryset can't be further filtered, but it's also (presumably) already of a manageable size.
+        yield from serializer_class(queryset, many=True, **kwargs).data
+        return
+
+    pks = queryset.values_list("pk", flat=True).iterator(chunk_size=chunk_size)
+    while chunk_pks := list(itertools.islice(pks, chunk_size)):
+        # Filtering the original queryset, rather than querying the model directly, preserves its ordering,
+        # annotations, and select/prefetch-related optimizations for each chunk.
+        yield from serializer_class(queryset.filter(pk__in=chunk_pks), many=True, **kwargs).data
+
+
 def nested_serializers_for_models(models, prefix=""):
     """
     Dynamically resolve and return the appropriate nested serializers for a list of models.
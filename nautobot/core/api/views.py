@@ -1,4 +1,5 @@
 from collections import OrderedDict
+from contextlib import contextmanager
 import logging
 import os
 import platform
@@ -13,7 +14,7 @@ from django.db import transaction
 from django.db.models import ProtectedError
 from django.db.models.fields.related import ForeignKey, ManyToManyField, RelatedField
 from django.db.models.fields.reverse_related import ManyToManyRel, ManyToOneRel
-from django.http.response import HttpResponseBadRequest
+from django.http.response import HttpResponseBadRequest, StreamingHttpResponse
 from django.shortcuts import get_object_or_404, redirect
 from django.utils.decorators import method_decorator
 from django.views.decorators.gzip import gzip_page
@@ -23,11 +24,10 @@ from drf_spectacular.utils import extend_schema
 from drf_spectacular.views import SpectacularAPIView, SpectacularRedocView, SpectacularSwaggerView
 from graphene_django.settings import graphene_settings
 from graphene_django.views import GraphQLView, HttpError, instantiate_middleware
-from graphql import execute, get_operation_ast, OperationType, parse, validate_schema
+from graphql import execute, get_operation_ast, OperationType, validate_schema
 from graphql.execution import ExecutionResult
 from graphql.execution.middleware import MiddlewareManager
 from graphql.type.schema import GraphQLSchema
-from graphql.validation import validate
 import redis.exceptions
 from rest_framework import routers, serializers as drf_serializers, status
 from rest_framework.exceptions import APIException, ParseError, PermissionDenied
@@ -41,9 +41,11 @@ import yaml
 
 from nautobot.core.api import BulkOperationSerializer
 from nautobot.core.api.exceptions import SerializerNotFound
-from nautobot.core.api.utils import get_serializer_for_model
+from nautobot.core.api.renderers import NautobotCSVRenderer
+from nautobot.core.api.utils import get_serializer_for_model, iter_serialized_queryset
 from nautobot.core.celery import app as celery_app
 from nautobot.core.exceptions import FilterSetFieldNotFound
+from nautobot.core.graphql.documents import get_query_cost_errors, prepare_document
 from nautobot.core.models.fields import TagsField
 from nautobot.core.utils.data import is_uuid, render_jinja2
 from nautobot.core.utils.filtering import get_all_lookup_expr_for_field, get_filterset_parameter_form_field
@@ -51,6 +53,9 @@ from nautobot.core.utils.lookup import get_form_for_model
 from nautobot.core.utils.querysets import maybe_prefetch_related, maybe_select_related
 from nautobot.core.utils.requests import ensure_content_type_and_field_name_in_query_params
 from nautobot.core.views.utils import get_csv_form_fields_from_serializer_class
+from nautobot.extras.context_managers import deferred_change_logging_for_bulk_operation
+from nautobot.extras.models import CustomField, GraphQLQuery
+from nautobot.extras.signals import change_context_state
 
 from . import serializers
 
@@ -87,6 +92,22 @@ class NautobotAPIVersionMixin:
         return response
 
 
+@contextmanager
+def bulk_operation_transaction():
+    """
+    Wrap a bulk create/update/delete operation in a single atomic transaction.
+
+    If change logging is active, the resulting ObjectChange records are created in bulk at the end of the operation,
+    rather than with one `INSERT` per modified object.
+    """
+    if change_context_state.get() is None:
+        with transaction.atomic():
+            yield
+    else:
+        with deferred_change_logging_for_bulk_operation():
+            yield
+
+
 class BulkUpdateModelMixin:
     """
     Support bulk modification of objects using the list endpoint for a model. Accepts a PATCH action with a list of one
@@ -124,7 +145,7 @@ class BulkUpdateModelMixin:
         return Response(data, status=status.HTTP_200_OK)
 
     def perform_bulk_update(self, objects, update_data, partial):
-        with transaction.atomic():
+        with bulk_operation_transaction():
             data_list = []
             for obj in objects:
                 data = update_data.get(str(obj.id))
@@ -167,7 +188,7 @@ class BulkDestroyModelMixin:
         return Response(status=status.HTTP_204_NO_CONTENT)
 
     def perform_bulk_destroy(self, objects):
-        with transaction.atomic():
+        with bulk_operation_transaction():
             for obj in objects:
                 self.perform_destroy(obj)
 
@@ -180,6 +201,9 @@ class BulkDestroyModelMixin:
 class ModelViewSetMixin:
     logger = logging.getLogger(__name__ + ".ModelViewSet")
 
+    # Number of records to load, serialize, and render at a time when streaming a CSV-format list response
+    csv_chunk_size = 1000
+
     # TODO: can't set lookup_value_regex globally; some models/viewsets (ContentType, Group) have integer rather than
     #       UUID PKs and also do NOT support composite-keys.
     #       The impact of NOT setting this is that per the OpenAPI schema, only UUIDs are permitted for most ViewSets;
@@ -287,6 +311,31 @@ class ModelViewSetMixin:
 
         return queryset
 
+    def list(self, request, *args, **kwargs):
+        """Stream CSV-format list responses, rather than rendering the entire response in memory."""
+        if "text/csv" in request.accepted_media_type:
+            return self.list_csv_streaming(request)
+        return super().list(request, *args, **kwargs)
+
+    def list_csv_streaming(self, request):
+        """
+        Serialize and render the filtered queryset to CSV in chunks, returning a `StreamingHttpResponse`.
+
+        CSV-format list responses are never paginated, so this keeps memory usage flat regardless of the queryset size.
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        renderer = NautobotCSVRenderer()
+        records = iter_serialized_queryset(
+            self.get_serializer_class(),
+            queryset,
+            chunk_size=self.csv_chunk_size,
+            context=self.get_serializer_context(),
+        )
+        return StreamingHttpResponse(
+            renderer.render_iter(records, custom_field_keys=CustomField.objects.keys_for_model(queryset.model)),
+            content_type=f"{renderer.media_type}; charset={renderer.charset}",
+        )
+
     def restrict_queryset(self, request, *args, **kwargs):
         """
         Restrict the view's queryset to allow only the permitted objects for the given request.
@@ -368,9 +417,15 @@ class ModelViewSet(
 
         # Enforce object-level permissions on save()
         try:
-            with transaction.atomic():
-                instance = serializer.save()
-                self._validate_objects(instance)
+            if isinstance(serializer, drf_serializers.ListSerializer):
+                # Bulk creation of multiple objects
+                with bulk_operation_transaction():
+                    instance = serializer.save()
+                    self._validate_objects(instance)
+            else:
+                with transaction.atomic():
+                    instance = serializer.save()
+                    self._validate_objects(instance)
         except ObjectDoesNotExist:
             raise PermissionDenied()
 
@@ -762,7 +817,9 @@ class GraphQLDRFAPIView(NautobotAPIVersionMixin, APIView):
         Returns:
             response (dict), status_code (int): Payload of the response to send and the status code.
         """
-        query, variables, operation_name, _id = GraphQLView.get_graphql_params(request, data)
+        query, variables, operation_name, query_id = GraphQLView.get_graphql_params(request, data)
+        if not query and query_id:
+            query = self.get_persisted_query(request, query_id)
 
         execution_result = self.execute_graphql_request(request, data, query, variables, operation_name)
 
@@ -784,6 +841,23 @@ class GraphQLDRFAPIView(NautobotAPIVersionMixin, APIView):
 
         return result, status_code
 
+    def get_persisted_query(self, request, query_id):
+        """Get the text of the saved `GraphQLQuery` with the given ID or name, as a persisted query.
+
+        Args:
+            request (HttpRequest): Request object from Django
+            query_id (str): UUID or name of a saved GraphQL query.
+
+        Returns:
+            (str): GraphQL query
+        """
+        queryset = GraphQLQuery.objects.restrict(request.user, "view")
+        lookup = {"pk": query_id} if is_uuid(query_id) else {"name": query_id}
+        try:
+            return queryset.values_list("query", flat=True).get(**lookup)
+        except GraphQLQuery.DoesNotExist:
+            raise HttpError(HttpResponseBadRequest(f"No saved GraphQL query found matching {query_id!r}."))
+
     def parse_body(self, request):
         """Analyze the request and based on the content type,
         extract the query from the body as a string or as a JSON payload.
@@ -831,10 +905,15 @@ class GraphQLDRFAPIView(NautobotAPIVersionMixin, APIView):
         if schema_validation_errors:
             return ExecutionResult(data=None, errors=schema_validation_errors)
 
+        # Parsing, validation, and cost estimation of the query are cached, as clients often repeat the same queries
+        validation_rules = tuple(self.validation_rules) if self.validation_rules else None
         try:
-            document = parse(query)
+            prepared = prepare_document(schema, query, validation_rules)
         except Exception as e:
             return ExecutionResult(errors=[e])
+        if prepared.document is None:
+            return ExecutionResult(errors=prepared.errors)
+        document = prepared.document
 
         operation_ast = get_operation_ast(document, operation_name)
 
@@ -845,9 +924,14 @@ class GraphQLDRFAPIView(NautobotAPIVersionMixin, APIView):
                 )
             )
 
-        validation_errors = validate(schema, document, self.validation_rules, graphene_settings.MAX_VALIDATION_ERRORS)
-        if validation_errors:
-            return ExecutionResult(data=None, errors=validation_errors)
+        if prepared.errors:
+            return ExecutionResult(data=None, errors=prepared.errors)
+
+        if operation_ast is not None:
+            cost = prepared.costs[operation_ast.name.value if operation_ast.name else None]
+            cost_errors = get_query_cost_errors(cost)
+            if cost_errors:
+                return ExecutionResult(data=None, errors=cost_errors)
 
         try:
             execute_options = {
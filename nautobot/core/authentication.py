@@ -1,4 +1,5 @@
 from collections import defaultdict
+import contextlib
 import logging
 
 from django.conf import settings
@@ -7,11 +8,14 @@ from django.contrib.auth.backends import (
     RemoteUserBackend as _RemoteUserBackend,
 )
 from django.contrib.auth.models import Group
+from django.core.cache import cache
 from django.db.models import Q
+import redis.exceptions
 
+from nautobot.core.utils.cache import construct_cache_key
 from nautobot.core.utils.permissions import (
     permission_is_exempt,
-    qs_filter_from_constraints,
+    qs_filter_for_user,
     resolve_permission,
     resolve_permission_ct,
 )
@@ -31,7 +35,19 @@ class ObjectPermissionBackend(ModelBackend):
     def get_object_permissions(self, user_obj):
         """
         Return all permissions granted to the user by an ObjectPermission.
+
+        The result is cached; the cache of the affected users is explicitly invalidated by `nautobot.users.signals`
+        whenever an ObjectPermission or group membership changes. If the cache is unavailable, the permissions are
+        retrieved from the database.
         """
+        cache_key = construct_cache_key(
+            ObjectPermission.objects, method_name="get_for_user", branch_aware=False, user=user_obj.pk
+        )
+        with contextlib.suppress(redis.exceptions.ConnectionError):
+            perms = cache.get(cache_key)
+            if perms is not None:
+                return perms
+
         # Retrieve all assigned and enabled ObjectPermissions
         object_permissions = ObjectPermission.objects.filter(
             Q(users=user_obj) | Q(groups__user=user_obj), enabled=True
@@ -45,6 +61,8 @@ class ObjectPermissionBackend(ModelBackend):
                     perm_name = f"{object_type.app_label}.{action}_{object_type.model}"
                     perms[perm_name].extend(obj_perm.list_constraints())
 
+        with contextlib.suppress(redis.exceptions.ConnectionError):
+            cache.set(cache_key, perms, timeout=None)
         return perms
 
     def has_perm(self, user_obj, perm, obj=None):
@@ -82,10 +100,7 @@ class ObjectPermissionBackend(ModelBackend):
             raise ValueError(f"Invalid permission {perm} for model {model}")
 
         # Compile a QuerySet filter that matches all instances of the specified model
-        tokens = {
-            "$user": user_obj,
-        }
-        constraints = qs_filter_from_constraints(self.get_all_permissions(user_obj)[perm], tokens)
+        constraints = qs_filter_for_user(user_obj, perm)
 
         # Permission to perform the requested action on the object depends on whether the specified object matches
         # the specified constraints. Note that this check is made against the *database* record representing the object,
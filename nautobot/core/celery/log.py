@@ -1,11 +1,43 @@
 import logging
+import threading
+import time
+import weakref
 
 from celery import current_task
 from django.core.exceptions import ValidationError
+from django.db import connections
+
+# All NautobotDatabaseHandler instances, so that their buffered log entries can be flushed on task completion
+_handlers = weakref.WeakSet()
 
 
 class NautobotDatabaseHandler(logging.Handler):
-    """Custom logging handler to log messages to JobLogEntry database entries."""
+    """
+    Custom logging handler to log messages to JobLogEntry database entries.
+
+    Rather than writing each log record to the database as it is emitted, log entries are buffered in memory per task
+    and saved with a single bulk insert once `flush_size` entries have been buffered for a task, once `flush_interval`
+    seconds have passed since the task's entries were last saved, or when `flush()` or `flush_job_logs()` is called,
+    as happens when a task completes. The `flush_interval` is enforced by a background timer, so that buffered entries
+    are saved even if the task doesn't log anything else for a while.
+
+    If saving the buffered entries fails, they are kept in the buffer, to be saved by the next flush.
+    """
+
+    flush_size = 500
+    flush_interval = 1.0  # seconds
+
+    def __init__(self, level=logging.NOTSET):
+        super().__init__(level)
+        # {task_id: JobResult, or None if there's no JobResult for this task}
+        self.job_results = {}
+        # {task_id: [JobLogEntry, ...]}
+        self.buffers = {}
+        # {task_id: time.monotonic() of the last time this task's buffered entries were saved}
+        self.last_flush_times = {}
+        # {task_id: threading.Timer that will flush this task's buffered entries once flush_interval has passed}
+        self.flush_timers = {}
+        _handlers.add(self)
 
     def emit(self, record):
         if current_task is None:
@@ -15,24 +47,102 @@ class NautobotDatabaseHandler(logging.Handler):
         if getattr(record, "skip_db_logging", False):
             return
 
-        from nautobot.extras.models.jobs import JobResult
-
         try:
             self.format(record)
 
-            try:
-                job_result = JobResult.objects.get(id=record.task_id)
-            except (ValidationError, JobResult.DoesNotExist):
-                # Both of these cases are very rare
-                # ValidationError - because the task_id might not a valid UUID
-                # JobResult.DoesNotExist - because we might not have a JobResult with that ID
+            job_result = self._get_job_result(record.task_id)
+            if job_result is None:
                 return
 
-            job_result.log(
+            log_entry = job_result.get_log_entry(
                 message=record.message,
                 level_choice=record.levelname.lower(),
                 obj=getattr(record, "object", None),
                 grouping=getattr(record, "grouping", record.funcName),
             )
+            buffer = self.buffers.setdefault(record.task_id, [])
+            buffer.append(log_entry)
+            now = time.monotonic()
+            last_flush_time = self.last_flush_times.setdefault(record.task_id, now)
+            if len(buffer) >= self.flush_size or now - last_flush_time >= self.flush_interval:
+                self._flush_task(record.task_id)
+            elif record.task_id not in self.flush_timers:
+                timer = threading.Timer(
+                    self.flush_interval - (now - last_flush_time), self._flush_task_in_background, [record.task_id]
+                )
+                timer.daemon = True
+                self.flush_timers[record.task_id] = timer
+                timer.start()
         except Exception:
             self.handleError(record)
+
+    def _get_job_result(self, task_id):
+        """Get the JobResult (if any) for the given task, caching it for subsequent log records."""
+        from nautobot.extras.models.jobs import JobResult
+
+        if task_id not in self.job_results:
+            try:
+                self.job_results[task_id] = JobResult.objects.get(id=task_id)
+            except (ValidationError, JobResult.DoesNotExist):
+                # Both of these cases are very rare
+                # ValidationError - because the task_id might not a valid UUID
+                # JobResult.DoesNotExist - because we might not have a JobResult with that ID
+                self.job_results[task_id] = None
+        return self.job_results[task_id]
+
+    def _flush_task(self, task_id):
+        """Save all buffered log entries of the given task to the database."""
+        timer = self.flush_timers.pop(task_id, None)
+        if timer is not None:
+            timer.cancel()
+        buffer = self.buffers.pop(task_id, None)
+        self.last_flush_times[task_id] = time.monotonic()
+        if buffer:
+            try:
+                self.job_results[task_id].save_log_entries(buffer)
+            except Exception:
+                self.buffers[task_id] = buffer
+                raise
+
+    def _flush_task_in_background(self, task_id):
+        """Save the buffered log entries of the given task once `flush_interval` has passed, from a timer thread."""
+        try:
+            with self.lock:
+                if self.flush_timers.get(task_id) is threading.current_thread():
+                    self._flush_task(task_id)
+        except Exception:
+            logging.getLogger(__name__).exception("Failed to save buffered job log entries")
+        finally:
+            # Database connections are per-thread, so close any opened by this timer thread
+            connections.close_all()
+
+    def flush(self, task_id=None):
+        """
+        Save the buffered log entries of the given task, or of all tasks, to the database.
+
+        When flushing a specific task, it's assumed that the task has completed, so once its entries are saved, its
+        cached JobResult is discarded.
+        """
+        with self.lock:
+            task_ids = [task_id] if task_id is not None else list(self.buffers)
+            for tid in task_ids:
+                self._flush_task(tid)
+                if task_id is not None:
+                    self.job_results.pop(tid, None)
+                    self.last_flush_times.pop(tid, None)
+
+    def close(self):
+        try:
+            self.flush()
+        finally:
+            _handlers.discard(self)
+            super().close()
+
+
+def flush_job_logs(task_id=None):
+    """Save any log entries of the given task (or all tasks) buffered by any NautobotDatabaseHandler."""
+    for handler in list(_handlers):
+        try:
+            handler.flush(task_id)
+        except Exception:
+            logging.getLogger(__name__).exception("Failed to save buffered job log entries")
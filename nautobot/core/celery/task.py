@@ -9,6 +9,7 @@ from django.contrib.auth import get_user_model
 from kombu.utils.uuid import uuid
 
 from nautobot.core.branching import BranchContext
+from nautobot.core.celery.log import flush_job_logs
 from nautobot.extras.models.jobs import JOB_LOGS
 
 
@@ -31,6 +32,8 @@ class NautobotTask(Task):
         self._nautobot_branch_contexts[task_id] = ctx
 
     def after_return(self, status, retval, task_id, args, kwargs, einfo):
+        # Save any log entries of this task that are still buffered, e.g. if the task was not a Job
+        flush_job_logs(task_id)
         ctx = getattr(self, "_nautobot_branch_contexts", {}).pop(task_id, None)
         if ctx is not None:
             ctx.__exit__(None, None, None)  # TODO: good enough?
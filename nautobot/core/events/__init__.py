@@ -1,8 +1,13 @@
 """Module providing for the publication of event notifications via mechanisms such as Redis, Kafka, syslog, etc."""
 
+import atexit
 import fnmatch
 import json
 import logging
+import os
+import queue
+import threading
+import time
 
 from django.utils.module_loading import import_string
 
@@ -14,6 +19,8 @@ from .redis_broker import RedisEventBroker
 from .syslog_broker import SyslogEventBroker
 
 _EVENT_BROKERS = []
+# {EventBroker: _BackgroundPublisher} for registered brokers with `background_publish` enabled
+_BACKGROUND_PUBLISHERS = {}
 
 
 logger = logging.getLogger(__name__)
@@ -65,6 +72,8 @@ def register_event_broker(event_broker):
     """
     if event_broker not in _EVENT_BROKERS:
         _EVENT_BROKERS.append(event_broker)
+        if getattr(event_broker, "background_publish", False):
+            _BACKGROUND_PUBLISHERS[event_broker] = _BackgroundPublisher(event_broker)
         logger.debug("Registered %s as an event broker", event_broker)
     else:
         logger.warning("Tried to register event broker %s but it was already registered", event_broker)
@@ -79,12 +88,111 @@ def deregister_event_broker(event_broker):
         logger.debug("Deregistered event broker %s", event_broker)
     except ValueError:
         logger.warning("Tried to deregister event broker %s but it wasn't previously registered", event_broker)
+    background_publisher = _BACKGROUND_PUBLISHERS.pop(event_broker, None)
+    if background_publisher is not None:
+        background_publisher.stop()
 
 
 def is_topic_match(topic, patterns):
     return any(fnmatch.fnmatch(topic, pattern) for pattern in patterns)
 
 
+class _BackgroundPublisher:
+    """
+    Publishes events to a single EventBroker from a dedicated daemon thread.
+
+    The thread is started on first use, and restarted with a fresh queue if the process has forked since then
+    (as happens with preforking WSGI servers and Celery workers), since threads do not survive a fork.
+    """
+
+    def __init__(self, event_broker):
+        self.event_broker = event_broker
+        self.max_queue_size = getattr(event_broker, "background_queue_size", 0)
+        self.queue = None
+        self.thread = None
+        self.pid = None
+        self.lock = threading.Lock()
+
+    def _ensure_started(self):
+        if self.pid == os.getpid() and self.thread.is_alive():
+            return
+        with self.lock:
+            if self.pid == os.getpid() and self.thread.is_alive():
+                return
+            if self.pid != os.getpid():
+                self.queue = queue.Queue(maxsize=self.max_queue_size)
+                self.pid = os.getpid()
+            self.thread = threading.Thread(
+                target=self._run, args=(self.queue,), name=f"nautobot-events-{self.event_broker}", daemon=True
+            )
+            self.thread.start()
+
+    def _run(self, event_queue):
+        while True:
+            item = event_queue.get()
+            try:
+                if item is None:
+                    return
+                topic, payload = item
+                try:
+                    self.event_broker.publish(topic=topic, payload=payload)
+                except Exception:
+                    logger.exception("Event broker %s failed to publish event on topic %s", self.event_broker, topic)
+            finally:
+                event_queue.task_done()
+
+    def submit(self, topic, payload):
+        """Queue the given serialized event for publication, or publish it directly if the queue is full."""
+        self._ensure_started()
+        try:
+            self.queue.put_nowait((topic, payload))
+        except queue.Full:
+            logger.warning("Event queue for %s is full, publishing synchronously", self.event_broker)
+            self.event_broker.publish(topic=topic, payload=payload)
+
+    def flush(self, timeout=None):
+        """Wait until all queued events have been published; return False if `timeout` seconds elapse first."""
+        if self.pid != os.getpid():
+            return True
+        event_queue = self.queue
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with event_queue.all_tasks_done:
+            while event_queue.unfinished_tasks:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                event_queue.all_tasks_done.wait(remaining)
+        return True
+
+    def stop(self, timeout=None):
+        """Publish any queued events, then stop the background thread."""
+        with self.lock:
+            if self.pid != os.getpid() or not self.thread.is_alive():
+                return
+            self.queue.put(None)
+            thread = self.thread
+        thread.join(timeout)
+
+
+def flush_events(timeout=None):
+    """
+    Wait until events queued for publication by any background-publishing EventBroker have been published.
+
+    Args:
+        timeout (float): Maximum number of seconds to wait per broker, or None to wait indefinitely.
+
+    Returns:
+        (bool): True if all queued events were published, False if the timeout was reached.
+    """
+    publishers = list(_BACKGROUND_PUBLISHERS.values())
+    return all([background_publisher.flush(timeout) for background_publisher in publishers])
+
+
+@atexit.register
+def _flush_events_at_exit():
+    flush_events(timeout=5)
+
+
 def publish_event(*, topic, payload):
     """Publish the given event payload to the given topic via all registered `EventBroker` instances.
 
@@ -98,11 +206,17 @@ def publish_event(*, topic, payload):
             While not all EventBrokers may actually use JSON as their data format, it makes for a reasonable
             lowest common denominator for serializability.
     """
+    serialized_payload = None
     for event_broker in _EVENT_BROKERS:
-        exclude_topics = event_broker.exclude_topics
-        include_topics = event_broker.include_topics
-        if is_topic_match(topic, include_topics) and not is_topic_match(topic, exclude_topics):
+        if not event_broker.is_topic_match(topic):
+            continue
+        # Serialize the payload only once, and only if at least one broker wants it
+        if serialized_payload is None:
             serialized_payload = json.dumps(payload, cls=NautobotKombuJSONEncoder)
+        background_publisher = _BACKGROUND_PUBLISHERS.get(event_broker)
+        if background_publisher is not None:
+            background_publisher.submit(topic, serialized_payload)
+        else:
             event_broker.publish(topic=topic, payload=serialized_payload)
 
 
@@ -111,6 +225,7 @@ __all__ = (
     "RedisEventBroker",
     "SyslogEventBroker",
     "deregister_event_broker",
+    "flush_events",
     "publish_event",
     "register_event_broker",
 )
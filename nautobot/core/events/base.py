@@ -1,16 +1,92 @@
 """Base classes for Nautobot event notification framework."""
 
 from abc import ABC, abstractmethod
+import fnmatch
+import re
+
+
+def compile_topic_patterns(patterns):
+    """
+    Compile a list of `fnmatch`-style topic patterns into a single regular expression.
+
+    Args:
+        patterns (list): Topic patterns such as `["nautobot.create.*", "*.dcim.device"]`.
+
+    Returns:
+        (re.Pattern): Compiled expression matching any topic that matches any of the patterns,
+            or None if no patterns were given.
+    """
+    if not patterns:
+        return None
+    return re.compile("|".join(fnmatch.translate(pattern) for pattern in patterns))
 
 
 class EventBroker(ABC):
     """Abstract base class for concrete implementations of event brokers such as syslog, Redis, Kafka, etc."""
 
-    def __init__(self, *args, include_topics=None, exclude_topics=None, **kwargs) -> None:
+    # Maximum number of topics whose include/exclude match results are remembered by `is_topic_match()`
+    topic_match_cache_size = 4096
+
+    def __init__(
+        self,
+        *args,
+        include_topics=None,
+        exclude_topics=None,
+        background_publish=False,
+        background_queue_size=10000,
+        **kwargs,
+    ) -> None:
+        """
+        Args:
+            include_topics (list): Topic patterns to publish events for; defaults to all topics.
+            exclude_topics (list): Topic patterns to not publish events for, even if matched by `include_topics`.
+            background_publish (bool): If True, `publish_event()` hands off events for this broker to a background
+                thread rather than calling `publish()` directly, so that a slow broker doesn't delay the caller.
+            background_queue_size (int): Maximum number of events awaiting background publication. If the queue is
+                full, further events are published synchronously until it drains.
+        """
         self.include_topics = include_topics or ["*"]
         self.exclude_topics = exclude_topics or []
+        self.background_publish = background_publish
+        self.background_queue_size = background_queue_size
         super().__init__(*args, **kwargs)
 
+    @property
+    def include_topics(self):
+        return self._include_topics
+
+    @include_topics.setter
+    def include_topics(self, value):
+        self._include_topics = value
+        self._include_regex = compile_topic_patterns(value)
+        self._topic_match_cache = {}
+
+    @property
+    def exclude_topics(self):
+        return self._exclude_topics
+
+    @exclude_topics.setter
+    def exclude_topics(self, value):
+        self._exclude_topics = value
+        self._exclude_regex = compile_topic_patterns(value)
+        self._topic_match_cache = {}
+
+    def is_topic_match(self, topic):
+        """Return True if the given topic is matched by `include_topics` and not by `exclude_topics`."""
+        try:
+            return self._topic_match_cache[topic]
+        except KeyError:
+            pass
+        matched = (
+            self._include_regex is not None
+            and self._include_regex.match(topic) is not None
+            and (self._exclude_regex is None or self._exclude_regex.match(topic) is None)
+        )
+        if len(self._topic_match_cache) >= self.topic_match_cache_size:
+            self._topic_match_cache.clear()
+        self._topic_match_cache[topic] = matched
+        return matched
+
     @abstractmethod
     def publish(self, *, topic, payload):
         """
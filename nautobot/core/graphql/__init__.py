@@ -1,22 +1,31 @@
 from django.test.client import RequestFactory
 from graphene.types import BigInt
 from graphene_django.settings import graphene_settings
-from graphql import execute, parse
+from graphql import execute
+from graphql.execution import ExecutionResult
 
+from nautobot.core.graphql.documents import get_query_cost_errors, prepare_document
 from nautobot.extras.models import GraphQLQuery
 
 
-def execute_query(query, variables=None, request=None, user=None):
+def execute_query(query, variables=None, request=None, user=None, enforce_cost_limits=False):
     """Execute a query from the ORM.
 
+    The query is parsed and validated only once per schema, see `nautobot.core.graphql.documents.prepare_document()`.
+
     Args:
         query (str): String with GraphQL query.
         variables (dict, optional): If the query has variables they need to be passed in as a dictionary.
         request (django.test.client.RequestFactory, optional): Used to authenticate.
         user (django.contrib.auth.models.User, optional): Used to authenticate.
+        enforce_cost_limits (bool, optional): If True, reject the query if its estimated cost exceeds the configured
+            `GRAPHQL_MAX_QUERY_DEPTH` or `GRAPHQL_MAX_QUERY_COST`.
 
     Returns:
-        (GraphQLDocument): Result for query
+        (GraphQLDocument): Result for query, including any validation or cost limit errors
+
+    Raises:
+        GraphQLError: If the query can't be parsed.
     """
     if not request and not user:
         raise ValueError("Either request or username should be provided")
@@ -24,11 +33,20 @@ def execute_query(query, variables=None, request=None, user=None):
         request = RequestFactory().post("/graphql/")
         request.user = user
     schema = graphene_settings.SCHEMA.graphql_schema
-    document = parse(query)
+    prepared = prepare_document(schema, query)
+    if prepared.document is None:
+        # As before documents were prepared, a query that can't be parsed at all raises its syntax error
+        raise prepared.errors[0]
+    if prepared.errors:
+        return ExecutionResult(data=None, errors=prepared.errors)
+    if enforce_cost_limits:
+        cost_errors = [error for cost in prepared.costs.values() for error in get_query_cost_errors(cost)]
+        if cost_errors:
+            return ExecutionResult(data=None, errors=cost_errors)
     if variables:
-        return execute(schema=schema, document=document, context_value=request, variable_values=variables)
+        return execute(schema=schema, document=prepared.document, context_value=request, variable_values=variables)
     else:
-        return execute(schema=schema, document=document, context_value=request)
+        return execute(schema=schema, document=prepared.document, context_value=request)
 
 
 def execute_saved_query(saved_query_name, **kwargs):
@@ -41,6 +59,8 @@ def execute_saved_query(saved_query_name, **kwargs):
         variables (Optional[dict]): If the query has variables they need to be passed in as a dictionary.
         request (Optional[django.test.client.RequestFactory]): Used to authenticate.
         user (Optional[django.contrib.auth.models.User]): Used to authenticate.
+        enforce_cost_limits (Optional[bool]): If True, reject the query if its estimated cost exceeds the configured
+            limits.
 
     Returns:
         (GraphQLDocument): Result for query
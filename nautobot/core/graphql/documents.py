@@ -0,0 +1,178 @@
+"""Parsing, validation, and static cost analysis of GraphQL query documents."""
+
+from collections import namedtuple
+import functools
+
+from django.conf import settings
+from graphene_django.settings import graphene_settings
+from graphql import (
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    get_named_type,
+    get_nullable_type,
+    GraphQLError,
+    InlineFragmentNode,
+    IntValueNode,
+    is_list_type,
+    OperationDefinitionNode,
+    OperationType,
+    parse,
+    validate,
+)
+
+# Number of records assumed to be returned by a list field when no explicit `limit` is given in the query
+DEFAULT_LIST_SIZE = 100
+
+# Arguments that explicitly bound the number of records returned by a list field
+LIST_SIZE_ARGUMENTS = ("limit", "first", "last")
+
+# Static estimate of the work required to execute a GraphQL query operation:
+# - depth: maximum nesting depth of object fields in the operation
+# - breadth: maximum number of fields requested in any single selection set
+# - estimated_rows: estimated number of database records needed to resolve the operation
+QueryCost = namedtuple("QueryCost", ["depth", "breadth", "estimated_rows"])
+
+# A GraphQL query document, parsed and validated against a schema:
+# - document: the parsed DocumentNode, or None if the query text could not be parsed
+# - errors: syntax or validation errors, if any; the document must not be executed if this is non-empty
+# - costs: the QueryCost of each operation in the document, keyed by operation name (None if anonymous)
+PreparedDocument = namedtuple("PreparedDocument", ["document", "errors", "costs"])
+
+
+@functools.lru_cache(maxsize=256)
+def prepare_document(schema, query, validation_rules=None):
+    """
+    Parse and validate the given GraphQL query text, and estimate the cost of each of its operations.
+
+    Results are cached per schema and query text, so that repeated executions of the same query (such as a saved
+    `GraphQLQuery`) don't need to re-parse and re-validate it each time. As the cache is keyed by the schema object
+    itself, any regeneration of the schema results in the query being re-validated against the new schema.
+
+    Args:
+        schema (GraphQLSchema): Schema to validate the query against.
+        query (str): GraphQL query text.
+        validation_rules (tuple): Additional validation rules to apply, if any.
+
+    Returns:
+        (PreparedDocument): The parsed document, any errors, and the estimated costs of its operations.
+    """
+    try:
+        document = parse(query)
+    except GraphQLError as error:
+        return PreparedDocument(document=None, errors=[error], costs={})
+
+    errors = validate(schema, document, validation_rules, graphene_settings.MAX_VALIDATION_ERRORS)
+    if errors:
+        return PreparedDocument(document=document, errors=errors, costs={})
+
+    fragments = {
+        definition.name.value: definition
+        for definition in document.definitions
+        if isinstance(definition, FragmentDefinitionNode)
+    }
+    costs = {}
+    for definition in document.definitions:
+        if isinstance(definition, OperationDefinitionNode):
+            operation_name = definition.name.value if definition.name else None
+            costs[operation_name] = estimate_operation_cost(schema, definition, fragments)
+    return PreparedDocument(document=document, errors=[], costs=costs)
+
+
+def estimate_operation_cost(schema, operation, fragments):
+    """
+    Statically estimate the cost of executing the given operation, without accessing the database.
+
+    Each list field is assumed to return as many records as its `limit` argument, if given as a literal value,
+    or `DEFAULT_LIST_SIZE` records otherwise, for each of the records of its parent field.
+
+    Args:
+        schema (GraphQLSchema): Schema that the operation has already been validated against.
+        operation (OperationDefinitionNode): Operation to estimate.
+        fragments (dict): Fragment definitions in the document, keyed by name.
+
+    Returns:
+        (QueryCost): The estimated cost of the operation.
+    """
+    root_type = {
+        OperationType.QUERY: schema.query_type,
+        OperationType.MUTATION: schema.mutation_type,
+        OperationType.SUBSCRIPTION: schema.subscription_type,
+    }[operation.operation]
+    depth, breadth, estimated_rows = _estimate_selection_set_cost(
+        schema, root_type, operation.selection_set, fragments, rows=1, depth=0
+    )
+    return QueryCost(depth=depth, breadth=breadth, estimated_rows=estimated_rows)
+
+
+def _collect_fields(schema, parent_type, selection_set, fragments):
+    """Yield each `(field_node, parent_type)` in the given selection set, expanding any fragments."""
+    for selection in selection_set.selections:
+        if isinstance(selection, FieldNode):
+            yield selection, parent_type
+        elif isinstance(selection, InlineFragmentNode):
+            fragment_type = schema.get_type(selection.type_condition.name.value) if selection.type_condition else None
+            yield from _collect_fields(schema, fragment_type or parent_type, selection.selection_set, fragments)
+        elif isinstance(selection, FragmentSpreadNode):
+            fragment = fragments[selection.name.value]
+            fragment_type = schema.get_type(fragment.type_condition.name.value)
+            yield from _collect_fields(schema, fragment_type or parent_type, fragment.selection_set, fragments)
+
+
+def _get_list_size(field_node):
+    """Get the number of records that a list field is expected to return."""
+    for argument in field_node.arguments:
+        if argument.name.value in LIST_SIZE_ARGUMENTS and isinstance(argument.value, IntValueNode):
+            return int(argument.value.value)
+    return DEFAULT_LIST_SIZE
+
+
+def _estimate_selection_set_cost(schema, parent_type, selection_set, fragments, rows, depth):
+    """Get the `(depth, breadth, estimated_rows)` of a selection set on `rows` records of `parent_type`."""
+    max_depth = depth
+    max_breadth = 0
+    estimated_rows = 0
+    breadth = 0
+    for field_node, field_parent_type in _collect_fields(schema, parent_type, selection_set, fragments):
+        breadth += 1
+        field_def = getattr(field_parent_type, "fields", {}).get(field_node.name.value)
+        if field_def is None or field_node.selection_set is None:
+            # Scalar fields are resolved from their parent record; introspection fields don't touch the database
+            continue
+        field_rows = rows
+        if is_list_type(get_nullable_type(field_def.type)):
+            field_rows = rows * _get_list_size(field_node)
+        child_depth, child_breadth, child_rows = _estimate_selection_set_cost(
+            schema, get_named_type(field_def.type), field_node.selection_set, fragments, field_rows, depth + 1
+        )
+        max_depth = max(max_depth, child_depth)
+        max_breadth = max(max_breadth, child_breadth)
+        estimated_rows += field_rows + child_rows
+    return max_depth, max(max_breadth, breadth), estimated_rows
+
+
+def get_query_cost_errors(cost):
+    """
+    Check the given query cost against the `GRAPHQL_MAX_QUERY_DEPTH` and `GRAPHQL_MAX_QUERY_COST` settings.
+
+    Args:
+        cost (QueryCost): Estimated cost of a query operation.
+
+    Returns:
+        (list[GraphQLError]): Errors describing each limit exceeded by the query, if any.
+    """
+    errors = []
+    if settings.GRAPHQL_MAX_QUERY_DEPTH and cost.depth > settings.GRAPHQL_MAX_QUERY_DEPTH:
+        errors.append(
+            GraphQLError(
+                f"Query depth of {cost.depth} exceeds the maximum allowed depth of {settings.GRAPHQL_MAX_QUERY_DEPTH}."
+            )
+        )
+    if settings.GRAPHQL_MAX_QUERY_COST and cost.estimated_rows > settings.GRAPHQL_MAX_QUERY_COST:
+        errors.append(
+            GraphQLError(
+                f"Query estimated cost of {cost.estimated_rows} records exceeds the maximum allowed cost of "
+                f"{settings.GRAPHQL_MAX_QUERY_COST} records. Consider adding a `limit` to list fields."
+            )
+        )
+    return errors
@@ -1,16 +1,19 @@
 """Library of generators for GraphQL."""
 
+from collections import defaultdict
 import logging
 
+from django.db.models import Q
 import graphene
 import graphene_django_optimizer as gql_optimizer
 from graphql import GraphQLError
 
+from nautobot.core.graphql.loaders import get_batch_loader, register_batch
 from nautobot.core.graphql.types import OptimizedNautobotObjectType
 from nautobot.core.graphql.utils import get_filtering_args_from_filterset, str_to_var_name
 from nautobot.core.utils.lookup import get_filterset_for_model
 from nautobot.extras.choices import RelationshipSideChoices
-from nautobot.extras.models import RelationshipAssociation
+from nautobot.extras.models import ComputedField, RelationshipAssociation
 
 logger = logging.getLogger(__name__)
 RESOLVER_PREFIX = "resolve_"
@@ -104,7 +107,7 @@ def generate_filter_resolver(schema_type, resolver_name, field_name):
         field = getattr(self, field_name)
 
         if not filterset_class or not kwargs:
-            return field.all()
+            return register_batch(info, field.all())
 
         # Backwards-compatibility with Nautobot v2 - "_type" as a (now deprecated) alias for "type" filter
         if "_type" in kwargs:
@@ -128,7 +131,7 @@ def generate_filter_resolver(schema_type, resolver_name, field_name):
             info.context._gql_filter_cache[cache_key] = set(resolved_obj.qs.values_list("pk", flat=True))
 
         matching_ids = info.context._gql_filter_cache[cache_key]
-        return [obj for obj in field.all() if obj.pk in matching_ids]
+        return register_batch(info, [obj for obj in field.all() if obj.pk in matching_ids])
 
     resolve_filter.__name__ = resolver_name
     return resolve_filter
@@ -152,13 +155,26 @@ def generate_custom_field_resolver(key, resolver_name):
 def generate_computed_field_resolver(name, resolver_name):
     """Generate an instance method for resolving an individual computed field within a given DjangoObjectType.
 
+    The computed field is looked up only once for all objects in the same list of results.
+
     Args:
         name (str): name of the computed field to resolve
         resolver_name (str): name of the resolver as declare in DjangoObjectType
     """
 
+    def batch_render_computed_field(objects, _info):
+        model = type(objects[0])
+        computed_field = next(
+            (cf for cf in ComputedField.objects.get_for_model(model, get_queryset=False) if cf.key == name), None
+        )
+        if computed_field is None:
+            logger.warning("Computed Field with key %s does not exist for model %s", name, model._meta.verbose_name)
+            return {obj.pk: None for obj in objects}
+        return {obj.pk: computed_field.render(context={"obj": obj}) for obj in objects}
+
     def resolve_computed_field(self, info, **kwargs):
-        return self.get_computed_field(key=name)
+        loader = get_batch_loader(info, ("computed_field", self._meta.label_lower, name), batch_render_computed_field)
+        return loader.load(info, self)
 
     resolve_computed_field.__name__ = resolver_name
     return resolve_computed_field
@@ -167,6 +183,9 @@ def generate_computed_field_resolver(name, resolver_name):
 def generate_relationship_resolver(name, resolver_name, relationship, side, peer_model):
     """Generate function to resolve each custom relationship within each DjangoObjectType.
 
+    Associations and peer objects are batch-loaded for all objects in the same list of results at once,
+    so that resolving a relationship for a list of N objects requires a constant number of queries rather than O(N).
+
     Args:
         name (str): name of the custom field to resolve
         resolver_name (str): name of the resolver as declare in DjangoObjectType
@@ -174,74 +193,69 @@ def generate_relationship_resolver(name, resolver_name, relationship, side, peer
         side (str): side of the relationship to use for the resolver
         peer_model (Model): Django Model of the peer of this relationship
     """
+    peer_side = RelationshipSideChoices.OPPOSITE[side]
+    has_many_peers = relationship.has_many(peer_side)
 
-    def resolve_relationship(self, info, **kwargs):
-        """Return a queryset or an object depending on the type of the relationship."""
-        peer_side = RelationshipSideChoices.OPPOSITE[side]
-        query_params = {"relationship": relationship}
-        # https://github.com/nautobot/nautobot/issues/1228
-        # If querying for **only** the ID of the related object, for example:
-        # { device(id:"...") { ... rel_my_relationship { id } } }
-        # we will get this exception:
-        # TypeError: Cannot call select_related() after .values() or .values_list()
-        # This appears to be a bug in graphene_django_optimizer but I haven't found a known issue on GitHub.
-        # For now we just work around it by catching the exception and retrying without optimization, below...
+    def get_peer_ids_by_pk(pks):
+        """Get a dict of `{pk: {peer_id, ...}}` for the given object PKs, with a single query."""
+        peer_ids_by_pk = {pk: set() for pk in pks}
+        associations = RelationshipAssociation.objects.filter(relationship=relationship)
         if not relationship.symmetric:
             # Get the objects on the other side of this relationship
-            query_params[f"{side}_id"] = self.pk
-
-            try:
-                queryset_ids = gql_optimizer.query(
-                    RelationshipAssociation.objects.filter(**query_params).values_list(f"{peer_side}_id", flat=True),
-                    info,
-                )
-            except TypeError:
-                logger.debug("Caught TypeError in graphene_django_optimizer, falling back to un-optimized query")
-                queryset_ids = RelationshipAssociation.objects.filter(**query_params).values_list(
-                    f"{peer_side}_id", flat=True
-                )
+            for pk, peer_id in associations.filter(**{f"{side}_id__in": pks}).values_list(
+                f"{side}_id", f"{peer_side}_id"
+            ):
+                peer_ids_by_pk[pk].add(peer_id)
         else:
             # Get objects that are peers for this relationship, regardless of side
+            for source_id, destination_id in associations.filter(
+                Q(source_id__in=pks) | Q(destination_id__in=pks)
+            ).values_list("source_id", "destination_id"):
+                if source_id in peer_ids_by_pk:
+                    peer_ids_by_pk[source_id].add(destination_id)
+                if destination_id in peer_ids_by_pk:
+                    peer_ids_by_pk[destination_id].add(source_id)
+        return peer_ids_by_pk
+
+    def batch_load_peers(objects, info):
+        peer_ids_by_pk = get_peer_ids_by_pk([obj.pk for obj in objects])
+        all_peer_ids = set().union(*peer_ids_by_pk.values())
+        peers = []
+        if all_peer_ids:
+            # https://github.com/nautobot/nautobot/issues/1228
+            # If querying for **only** the ID of the related object, for example:
+            # { device(id:"...") { ... rel_my_relationship { id } } }
+            # we may get an exception from graphene_django_optimizer such as:
+            # TypeError: Cannot call select_related() after .values() or .values_list()
+            # For now we just work around it by catching the exception and retrying without optimization, below...
             try:
-                queryset_ids = list(
-                    gql_optimizer.query(
-                        RelationshipAssociation.objects.filter(source_id=self.pk, **query_params).values_list(
-                            "destination_id", flat=True
-                        ),
-                        info,
-                    )
-                )
-                queryset_ids += list(
-                    gql_optimizer.query(
-                        RelationshipAssociation.objects.filter(destination_id=self.pk, **query_params).values_list(
-                            "source_id", flat=True
-                        ),
-                        info,
-                    )
-                )
-            except TypeError:
-                logger.debug("Caught TypeError in graphene_django_optimizer, falling back to un-optimized query")
-                queryset_ids = list(
-                    RelationshipAssociation.objects.filter(source_id=self.pk, **query_params).values_list(
-                        "destination_id", flat=True
-                    ),
-                )
-                queryset_ids += list(
-                    RelationshipAssociation.objects.filter(destination_id=self.pk, **query_params).values_list(
-                        "source_id", flat=True
-                    ),
-                )
-
-        if relationship.has_many(peer_side):
-            return gql_optimizer.query(peer_model.objects.filter(id__in=queryset_ids), info)
-
-        # Also apparently a graphene_django_optimizer bug - in the same query case as described above, here we may see:
-        # AttributeError: object has no attribute "only"
-        try:
-            return gql_optimizer.query(peer_model.objects.filter(id__in=queryset_ids).first(), info)
-        except AttributeError:
-            logger.debug("Caught AttributeError in graphene_django_optimizer, falling back to un-optimized query")
-            return peer_model.objects.filter(id__in=queryset_ids).first()
+                peers = list(gql_optimizer.query(peer_model.objects.filter(id__in=all_peer_ids), info))
+            except (AttributeError, TypeError):
+                logger.debug("Caught exception in graphene_django_optimizer, falling back to un-optimized query")
+                peers = list(peer_model.objects.filter(id__in=all_peer_ids))
+
+        pks_by_peer_id = defaultdict(list)
+        for pk, peer_ids in peer_ids_by_pk.items():
+            for peer_id in peer_ids:
+                pks_by_peer_id[peer_id].append(pk)
+        # Iterate over the peers in queryset order so that each object's peers are consistently ordered
+        peers_by_pk = {pk: [] for pk in peer_ids_by_pk}
+        for peer in peers:
+            for pk in pks_by_peer_id[peer.pk]:
+                peers_by_pk[pk].append(peer)
+
+        if has_many_peers:
+            return peers_by_pk
+        return {pk: (obj_peers[0] if obj_peers else None) for pk, obj_peers in peers_by_pk.items()}
+
+    def resolve_relationship(self, info, **kwargs):
+        """Return a list of objects or an object depending on the type of the relationship."""
+        loader = get_batch_loader(info, ("relationship", relationship.pk, side), batch_load_peers)
+        result = loader.load(info, self)
+        if has_many_peers:
+            # Allow the fields of the peer objects to be batch-loaded as well
+            register_batch(info, result)
+        return result
 
     resolve_relationship.__name__ = resolver_name
     return resolve_relationship
@@ -392,7 +406,7 @@ def generate_list_resolver(schema_type, resolver_name):
         if limit:
             qs = qs[:limit]
 
-        return gql_optimizer.query(qs, info)
+        return register_batch(info, gql_optimizer.query(qs, info))
 
     list_resolver.__name__ = resolver_name
     return list_resolver
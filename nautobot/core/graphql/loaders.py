@@ -0,0 +1,159 @@
+"""Per-request batch loading of GraphQL field data, to avoid issuing one or more queries per object in a list."""
+
+from django.db.models import prefetch_related_objects
+
+
+def _get_batch_state(info):
+    """
+    Get the batch-loading state for the GraphQL query currently being executed.
+
+    The state is stored on the request (`info.context`), but is reset whenever a different query (or the same query
+    with different variables) is executed with the same request object, so that results are never shared between them.
+    """
+    state = getattr(info.context, "_gql_batch_state", None)
+    if state is None or state["operation"] is not info.operation or state["variables"] is not info.variable_values:
+        state = {
+            "operation": info.operation,
+            "variables": info.variable_values,
+            "batches": {},
+            "field_names": {},
+            "levels": {},
+            "loaders": {},
+        }
+        info.context._gql_batch_state = state
+    return state
+
+
+def register_batch(info, objects):
+    """
+    Record the list of objects resolved for the current GraphQL field, so that their own fields can be batch-loaded.
+
+    Args:
+        info (GraphQLResolveInfo): Resolver info for the field that resolved to `objects`.
+        objects (iterable): Objects (typically a QuerySet) resolved for this field.
+
+    Returns:
+        (iterable): The given `objects`, unchanged, for convenience.
+    """
+    state = _get_batch_state(info)
+    list_path = tuple(info.path.as_list())
+    state["batches"][list_path] = objects
+    state["field_names"][list_path] = info.field_name
+    return objects
+
+
+def _get_list_objects(state, list_path):
+    """Get the objects registered for the given list path as a dict keyed by primary key, or None if not registered."""
+    batches = state["batches"]
+    if list_path not in batches:
+        return None
+    objects = batches[list_path]
+    if not isinstance(objects, dict):
+        # First lookup against this list; it's been fully evaluated by now, so cache it by primary key
+        objects = batches[list_path] = {item.pk: item for item in objects}
+    return objects
+
+
+def _get_level_objects(state, list_path):
+    """
+    Get the objects of all lists at the same level of the query as the given registered list, keyed by primary key.
+
+    GraphQL resolves each list nested in a parent list (such as the `devices` of each of a list of `locations`) in
+    turn, so the lists nested in the other parent objects are usually not resolved yet. Instead, they are fetched for
+    all parent objects at once with `prefetch_related_objects()`, which also lets their own resolvers use the prefetched
+    results. Lists that don't correspond to a related manager of the parent objects (such as relationships) are not
+    expanded this way.
+    """
+    level_key = tuple(key for key in list_path if not isinstance(key, int))
+    if level_key in state["levels"]:
+        return state["levels"][level_key]
+
+    objects = dict(_get_list_objects(state, list_path))
+    parent_list_path = list_path[:-2]
+    if len(list_path) >= 3 and isinstance(list_path[-2], int) and parent_list_path in state["batches"]:
+        parents = list(_get_level_objects(state, parent_list_path).values())
+        field_name = state["field_names"][list_path]
+        try:
+            prefetch_related_objects(parents, field_name)
+            level_objects = {item.pk: item for parent in parents for item in getattr(parent, field_name).all()}
+        except (AttributeError, ValueError):
+            level_objects = {}
+        # Prefer the instances actually being resolved, where known
+        objects = {**level_objects, **objects}
+
+    state["levels"][level_key] = objects
+    return objects
+
+
+def get_batch(info, obj):
+    """
+    Get the list of objects that were resolved alongside `obj` at the same level of the GraphQL query.
+
+    Because GraphQL resolves the fields of each object in a list in turn, a field resolver has no direct knowledge of
+    the other objects in the same list; this looks up the list previously recorded by `register_batch()`, if any.
+    For a list nested in another list, the objects of the corresponding lists of all the parent objects are included
+    as well, so that the data for a whole level of the query can be loaded at once.
+
+    Args:
+        info (GraphQLResolveInfo): Resolver info for a field of `obj`.
+        obj (Model): Object whose field is being resolved.
+
+    Returns:
+        (list): Objects at the same level as `obj`, including `obj` itself, or just `[obj]` if no such list is known.
+    """
+    object_path = info.path.prev
+    if object_path is None or not isinstance(object_path.key, int) or object_path.prev is None:
+        return [obj]
+    state = _get_batch_state(info)
+    list_path = tuple(object_path.prev.as_list())
+    objects = _get_list_objects(state, list_path)
+    if objects is None or obj.pk not in objects:
+        return [obj]
+    level_objects = _get_level_objects(state, list_path)
+    if obj.pk not in level_objects:
+        return list(objects.values())
+    return list(level_objects.values())
+
+
+class BatchLoader:
+    """
+    Load some data for many objects at once, rather than one object at a time.
+
+    The first time `load()` is called for any object in a given list of GraphQL results, the data for all objects at
+    that level of the query (as identified by `get_batch()`) is loaded with a single call to `batch_load_fn`; subsequent calls for the
+    other objects in the list are then served from the results of that call.
+    """
+
+    def __init__(self, batch_load_fn):
+        """
+        Args:
+            batch_load_fn (callable): Function taking a list of objects and the current resolver info,
+                and returning a dict of `{obj.pk: value}` for those objects.
+        """
+        self.batch_load_fn = batch_load_fn
+        self.results = {}
+
+    def load(self, info, obj):
+        """Get the value for the given object, batch-loading it and its siblings if not already loaded."""
+        if obj.pk not in self.results:
+            batch = [item for item in get_batch(info, obj) if item.pk not in self.results]
+            self.results.update(self.batch_load_fn(batch, info))
+        return self.results.get(obj.pk)
+
+
+def get_batch_loader(info, key, batch_load_fn):
+    """
+    Get the `BatchLoader` for the given key for the current GraphQL request, creating it if needed.
+
+    Args:
+        info (GraphQLResolveInfo): Resolver info for the current field.
+        key (tuple): Unique identifier of the data being loaded, such as `("relationship", relationship.pk, side)`.
+        batch_load_fn (callable): See `BatchLoader`; only used when first creating the loader.
+
+    Returns:
+        (BatchLoader): Loader whose results are shared for the remainder of the current query.
+    """
+    loaders = _get_batch_state(info)["loaders"]
+    if key not in loaders:
+        loaders[key] = BatchLoader(batch_load_fn)
+    return loaders[key]
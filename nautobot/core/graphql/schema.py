@@ -24,6 +24,7 @@ from nautobot.core.graphql.generators import (
     generate_relationship_resolver,
     generate_schema_type,
 )
+from nautobot.core.graphql.loaders import get_batch_loader
 from nautobot.core.graphql.types import ContentTypeType, DateType, JSON
 from nautobot.core.graphql.utils import str_to_var_name
 from nautobot.dcim.graphql.types import (
@@ -367,8 +368,21 @@ def extend_schema_type_config_context(schema_type, model):
     if "local_config_context_data" not in fields_name:
         return schema_type
 
-    def resolve_config_context(self, args):
-        return self.get_config_context()
+    def batch_get_config_context(objects, _info):
+        # Annotate the config context data for the whole batch in a single query, unless already annotated
+        # (as is the case for the root queryset of a query, see optimize_config_context())
+        pks = [obj.pk for obj in objects if not hasattr(obj, "config_context_data")]
+        queryset = model.objects.filter(pk__in=pks)
+        if pks and hasattr(queryset, "annotate_config_context_data"):
+            config_context_data = dict(queryset.annotate_config_context_data().values_list("pk", "config_context_data"))
+            for obj in objects:
+                if obj.pk in config_context_data:
+                    obj.config_context_data = config_context_data[obj.pk]
+        return {obj.pk: obj.get_config_context() for obj in objects}
+
+    def resolve_config_context(self, info):
+        loader = get_batch_loader(info, ("config_context", model._meta.label_lower), batch_get_config_context)
+        return loader.load(info, self)
 
     schema_type._meta.fields["config_context"] = graphene.Field.mounted(generic.GenericScalar())
     setattr(schema_type, "resolve_config_context", resolve_config_context)
@@ -1,6 +1,7 @@
 import codecs
 import contextlib
 from io import BytesIO
+import tempfile
 
 from django.apps import apps as global_apps
 from django.conf import settings
@@ -8,7 +9,7 @@ from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import (
     PermissionDenied,
 )
-from django.db import transaction
+from django.db import IntegrityError, transaction
 from django.db.models import Q
 from django.http import QueryDict
 from django.urls import reverse
@@ -17,7 +18,7 @@ from rest_framework import exceptions as drf_exceptions
 from nautobot.core.api.exceptions import SerializerNotFound
 from nautobot.core.api.parsers import NautobotCSVParser
 from nautobot.core.api.renderers import NautobotCSVRenderer
-from nautobot.core.api.utils import get_serializer_for_model
+from nautobot.core.api.utils import get_serializer_for_model, iter_serialized_queryset
 from nautobot.core.celery import app, register_jobs
 from nautobot.core.exceptions import AbortTransaction
 from nautobot.core.jobs.bulk_actions import BulkDeleteObjects, BulkEditObjects
@@ -55,9 +56,10 @@ from nautobot.extras.jobs import (
     StringVar,
     TextVar,
 )
-from nautobot.extras.models import ExportTemplate, GitRepository, SavedView
+from nautobot.extras.models import CustomField, ExportTemplate, GitRepository, Relationship, SavedView
 from nautobot.extras.plugins import CustomValidator, ValidationError
 from nautobot.extras.registry import registry
+from nautobot.extras.utils import bulk_create_with_bulk_change_logging
 
 name = "System Jobs"
 
@@ -161,6 +163,9 @@ class ExportObjectList(Job):
         required=False,
     )
 
+    # Number of records to load, serialize, and render at a time when exporting to CSV
+    csv_chunk_size = 1000
+
     class Meta:
         name = "Export Object List"
         description = "Export a list of objects to CSV or YAML, or render a specified Export Template."
@@ -231,15 +236,18 @@ class ExportObjectList(Job):
                 object_count,
                 extra={"object": export_template},
             )
-            try:
-                # export_template.render() consumes the whole queryset, so we don't have any way to do a progress bar.
-                output = export_template.render(queryset)
-            except Exception as err:
-                self.logger.error("Error when rendering ExportTemplate: %s", err)
-                raise
             if export_template.file_extension:
                 filename += f".{export_template.file_extension}"
-            self.create_file(filename, output)
+            # Render the template incrementally, spooling it to a temporary file rather than memory
+            with tempfile.TemporaryFile() as output_file:
+                try:
+                    # The template controls iteration over the queryset, so we don't have any way to do a progress bar.
+                    for chunk in export_template.render_iter(queryset):
+                        output_file.write(chunk.encode("utf-8"))
+                except Exception as err:
+                    self.logger.error("Error when rendering ExportTemplate: %s", err)
+                    raise
+                self.create_file(filename, output_file)
 
         elif export_format == "yaml":
             # Device-type (etc.) YAML export
@@ -258,10 +266,20 @@ class ExportObjectList(Job):
             self.logger.info("Exporting %d objects to CSV. This may take some time.", object_count)
             # The force_csv=True attribute is a hack, but much easier than trying to construct a valid HttpRequest
             # object from scratch that passes all implicit and explicit assumptions in Django and DRF.
-            serializer = serializer_class(queryset, many=True, context={"request": None}, force_csv=True)
-            # Explicitly add UTF-8 BOM to the data so that Excel will understand non-ASCII characters correctly...
-            csv_data = codecs.BOM_UTF8 + renderer.render(serializer.data).encode("utf-8")
-            self.create_file(filename + ".csv", csv_data)
+            records = iter_serialized_queryset(
+                serializer_class,
+                queryset,
+                chunk_size=self.csv_chunk_size,
+                context={"request": None},
+                force_csv=True,
+            )
+            # Serialize and render the data in chunks, spooling it to a temporary file rather than memory
+            with tempfile.TemporaryFile() as csv_file:
+                # Explicitly add UTF-8 BOM to the data so that Excel will understand non-ASCII characters correctly...
+                csv_file.write(codecs.BOM_UTF8)
+                for line in renderer.render_iter(records, custom_field_keys=CustomField.objects.keys_for_model(model)):
+                    csv_file.write(line.encode("utf-8"))
+                self.create_file(filename + ".csv", csv_file)
 
 
 class ImportObjects(Job):
@@ -283,6 +301,9 @@ class ImportObjects(Job):
 
     template_name = "system_jobs/import_objects.html"
 
+    # Number of rows to validate and create at a time, for models that support bulk import
+    bulk_import_chunk_size = 1000
+
     class Meta:
         name = "Import Objects"
         description = "Import objects from CSV-formatted data."
@@ -304,32 +325,136 @@ class ImportObjects(Job):
         return [], validation_failed
 
     def _perform_operation(self, data, serializer_class, queryset):
+        model = queryset.model
+        if model.supports_bulk_import and not Relationship.objects.get_required_for_model(model):
+            return self._perform_bulk_operation(data, serializer_class, queryset)
+
         new_objs = []
         validation_failed = False
+        # Shared by all rows, so that each distinct related object is only looked up once
+        context = {"request": None, "related_object_cache": {}}
         for row, entry in enumerate(data, start=1):
-            serializer = serializer_class(data=entry, context={"request": None})
+            serializer = serializer_class(data=entry, context=context)
             if serializer.is_valid():
-                try:
-                    with transaction.atomic():
-                        new_obj = serializer.save()
-                        if not queryset.filter(pk=new_obj.pk).exists():
-                            raise AbortTransaction()
-                    self.logger.info('Row %d: Created record "%s"', row, new_obj, extra={"object": new_obj})
+                new_obj = self._create_object(row, serializer, queryset)
+                if new_obj is not None:
                     new_objs.append(new_obj)
-                except AbortTransaction:
-                    self.logger.error(
-                        'Row %d: User "%s" does not have permission to create an object with these attributes',
-                        row,
-                        self.user,
-                    )
+                else:
                     validation_failed = True
             else:
                 validation_failed = True
-                for field, errs in serializer.errors.items():
-                    for err in errs:
-                        self.logger.error("Row %d: `%s`: `%s`", row, field, err)
+                self._log_serializer_errors(row, serializer)
+        return new_objs, validation_failed
+
+    def _perform_bulk_operation(self, data, serializer_class, queryset):
+        """
+        Create objects from the given rows of data `bulk_import_chunk_size` rows at a time, using `bulk_create()`.
+
+        For each chunk, all related objects referenced by the rows are looked up in batches before the rows are
+        validated, and the validated rows are then inserted with a single `bulk_create()`, permission-checked with a
+        single query, and change-logged in bulk. Rows that set relationships or many-to-many fields (other than tags)
+        are created individually, and if a chunk fails its permission check or violates a database constraint,
+        its rows are retried individually so that the offending rows can be identified and reported.
+        """
+        model = queryset.model
+        context = {"request": None, "related_object_cache": {}}
+        related_fields = {}
+        for field_name, field in serializer_class(context=context).fields.items():
+            field = getattr(field, "child_relation", field)
+            if not field.read_only and hasattr(field, "prefetch_objects"):
+                related_fields[field_name] = field
+        bulk_field_names = {field.name for field in model._meta.concrete_fields} | {"tags"}
+
+        new_objs = []
+        validation_failed = False
+        for offset in range(0, len(data), self.bulk_import_chunk_size):
+            chunk = data[offset : offset + self.bulk_import_chunk_size]
+            for field_name, field in related_fields.items():
+                field.prefetch_objects([entry.get(field_name) for entry in chunk])
+
+            bulk_rows = []
+            for row, entry in enumerate(chunk, start=offset + 1):
+                serializer = serializer_class(data=entry, context=context)
+                if not serializer.is_valid():
+                    validation_failed = True
+                    self._log_serializer_errors(row, serializer)
+                elif all(key in bulk_field_names or not value for key, value in serializer.validated_data.items()):
+                    bulk_rows.append((row, entry, serializer.validated_data))
+                else:
+                    new_obj = self._create_object(row, serializer, queryset)
+                    if new_obj is not None:
+                        new_objs.append(new_obj)
+                    else:
+                        validation_failed = True
+
+            created_objs, failed = self._bulk_create_rows(bulk_rows, serializer_class, queryset, context)
+            new_objs.extend(created_objs)
+            validation_failed = validation_failed or failed
         return new_objs, validation_failed
 
+    def _bulk_create_rows(self, rows, serializer_class, queryset, context):
+        """Create objects for the given validated rows in bulk, falling back to creating them one at a time."""
+        if not rows:
+            return [], False
+        model = queryset.model
+        concrete_field_names = {field.name for field in model._meta.concrete_fields}
+        objs = []
+        tags = {}
+        for _, _, validated_data in rows:
+            obj = model(**{key: value for key, value in validated_data.items() if key in concrete_field_names})
+            objs.append(obj)
+            tags[obj.pk] = validated_data.get("tags") or []
+
+        try:
+            with transaction.atomic():
+                bulk_create_with_bulk_change_logging(objs, tags=tags, batch_size=len(objs))
+                if queryset.filter(pk__in=[obj.pk for obj in objs]).count() != len(objs):
+                    raise AbortTransaction()
+        except (AbortTransaction, IntegrityError) as exc:
+            self.logger.debug(
+                "Bulk creation of rows %d-%d failed (%s), retrying row by row", rows[0][0], rows[-1][0], exc
+            )
+            new_objs = []
+            validation_failed = False
+            for row, entry, _ in rows:
+                serializer = serializer_class(data=entry, context=context)
+                new_obj = None
+                if serializer.is_valid():
+                    new_obj = self._create_object(row, serializer, queryset)
+                else:
+                    self._log_serializer_errors(row, serializer)
+                if new_obj is not None:
+                    new_objs.append(new_obj)
+                else:
+                    validation_failed = True
+            return new_objs, validation_failed
+
+        for (row, _, _), obj in zip(rows, objs):
+            self.logger.info('Row %d: Created record "%s"', row, obj, extra={"object": obj})
+        return objs, False
+
+    def _create_object(self, row, serializer, queryset):
+        """Save a new object from the given validated serializer, or return None if the user may not create it."""
+        try:
+            with transaction.atomic():
+                new_obj = serializer.save()
+                if not queryset.filter(pk=new_obj.pk).exists():
+                    raise AbortTransaction()
+        except AbortTransaction:
+            self.logger.error(
+                'Row %d: User "%s" does not have permission to create an object with these attributes',
+                row,
+                self.user,
+            )
+            return None
+        self.logger.info('Row %d: Created record "%s"', row, new_obj, extra={"object": new_obj})
+        return new_obj
+
+    def _log_serializer_errors(self, row, serializer):
+        for field, errs in serializer.errors.items():
+            for err in errs:
+                self.logger.error("Row %d: `%s`: `%s`", row, field, err)
+
     def run(self, *, content_type, csv_data=None, csv_file=None, roll_back_if_error=False):  # pylint:disable=arguments-differ
         if not self.user.has_perm(f"{content_type.app_label}.add_{content_type.model}"):
             self.logger.error('User "%s" does not have permission to create %s objects', self.user, content_type.model)
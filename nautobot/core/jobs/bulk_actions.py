@@ -19,7 +19,11 @@ from nautobot.extras.jobs import (
     RunJobTaskFailed,
 )
 from nautobot.extras.models import SavedView
-from nautobot.extras.utils import bulk_delete_with_bulk_change_logging, remove_prefix_from_cf_key
+from nautobot.extras.utils import (
+    bulk_delete_with_bulk_change_logging,
+    bulk_update_with_bulk_change_logging,
+    remove_prefix_from_cf_key,
+)
 
 name = "System Jobs"
 
@@ -62,6 +66,20 @@ class BulkEditObjects(Job):
                 if field not in form_custom_fields + form_relationships + ["pk"] + ["object_note"]
             ]
 
+            set_based_changes = self._get_set_based_changes(
+                model, form, standard_fields, form_custom_fields, form_relationships, nullified_fields
+            )
+            if set_based_changes is not None:
+                self.logger.debug(
+                    f"Performing set-based update of {', '.join(set_based_changes)} "
+                    f"on {queryset.count()} {model._meta.verbose_name_plural}"
+                )
+                updated_objects_pk = self._update_objects_set_based(model, queryset, set_based_changes)
+                total_updated_objs = len(updated_objects_pk)
+                if base_queryset.filter(pk__in=updated_objects_pk).count() != total_updated_objs:
+                    raise ObjectDoesNotExist
+                return total_updated_objs
+
             self.logger.debug(f"Performing update on {queryset.count()} {model._meta.verbose_name_plural}")
             for obj in queryset.iterator(chunk_size=1000):
                 # Update standard fields. If a field is listed in _nullify, delete its value.
@@ -114,6 +132,63 @@ class BulkEditObjects(Job):
                 raise ObjectDoesNotExist
             return total_updated_objs
 
+    @staticmethod
+    def _get_set_based_changes(model, form, standard_fields, form_custom_fields, form_relationships, nullified_fields):
+        """
+        Determine whether this edit can be applied to all objects at once with `QuerySet.update()`.
+
+        This is the case only if every field being changed is listed in the model's `set_based_bulk_edit_fields`,
+        and no custom fields, relationships, notes or many-to-many fields are being changed.
+
+        Returns:
+            (dict): Mapping of field names to their new values, or None if the edit must be applied per object.
+        """
+        set_based_fields = getattr(model, "set_based_bulk_edit_fields", ())
+        if not set_based_fields:
+            return None
+
+        nullified_fields = nullified_fields or []
+        for field_name in form_custom_fields + form_relationships:
+            if field_name in nullified_fields or form.cleaned_data.get(field_name) not in (None, "", []):
+                return None
+        if (form.cleaned_data.get("object_note") or "").strip():
+            return None
+
+        changes = {}
+        for field_name in standard_fields:
+            if field_name == "_all":
+                continue
+            if field_name in nullified_fields and field_name in form.nullable_fields:
+                if field_name not in set_based_fields:
+                    return None
+                model_field = model._meta.get_field(field_name)
+                changes[field_name] = None if model_field.null else ""
+            elif form.cleaned_data[field_name] not in (None, "", []):
+                if field_name not in set_based_fields:
+                    return None
+                changes[field_name] = form.cleaned_data[field_name]
+        return changes or None
+
+    def _update_objects_set_based(self, model, queryset, changes):
+        """
+        Apply the given field changes to all objects in the queryset at once, with bulk change logging.
+
+        Every object is validated with the changes applied, but is then updated with `QuerySet.update()` rather than
+        being saved individually.
+
+        Returns:
+            (list): The PKs of the updated objects.
+        """
+        pks = []
+        for obj in queryset.iterator(chunk_size=1000):
+            for field_name, value in changes.items():
+                setattr(obj, field_name, value)
+            obj.full_clean()
+            pks.append(obj.pk)
+
+        bulk_update_with_bulk_change_logging(model.objects.filter(pk__in=pks), changes)
+        return pks
+
     def _process_valid_form(self, model, form, filter_query_params, pk_list, edit_all, nullified_fields, saved_view_id):
         try:
             total_updated_objs = self._update_objects(
@@ -36,9 +36,16 @@ class RefreshDynamicGroupCaches(Job):
             return
 
         self.logger.info("Re-calculating and re-caching group members. This may take some time.")
-        for group in groups:
-            group.update_cached_members()
-            self.logger.info("Cache refreshed successfully, now with %d members", group.count, extra={"object": group})
+        for result in groups.update_cached_members():
+            if result.error is not None:
+                self.fail("Error while refreshing cache: %s", result.error, extra={"object": result.group})
+            else:
+                self.logger.info(
+                    "Cache refreshed successfully, now with %d members, in %.3f seconds",
+                    result.member_count,
+                    result.duration,
+                    extra={"object": result.group},
+                )
 
         self.logger.info("Cache(s) refreshed")
 
@@ -62,6 +62,14 @@ class BaseModel(models.Model):
     is_saved_view_model = False  # SavedViewMixin overrides this to default True
     is_cloud_resource_type_model = False  # CloudResourceTypeMixin overrides this to default True
     is_approval_workflow_model = False  # ApprovableModelMixin overrides this to default True
+    # Fields that the BulkEditObjects job may update with a single `QuerySet.update()` instead of calling `save()` on
+    # each object. Each object is still validated with `full_clean()`, but only list fields whose changes need no side
+    # effects from `save()` or from `pre_save`/`post_save` signal handlers other than change logging.
+    set_based_bulk_edit_fields = ()
+    # Whether the ImportObjects job may create instances of this model with `bulk_create()` instead of calling `save()`
+    # on each one. Only enable this for models whose creation needs no side effects from `save()` or from
+    # `pre_save`/`post_save` signal handlers other than change logging.
+    supports_bulk_import = False
 
     associated_object_metadata = GenericRelation(
         "extras.ObjectMetadata",
@@ -134,11 +134,7 @@ class RestrictedQuerySet(CompositeKeyQuerySetMixin, QuerySet):
 
         # Filter the queryset to include only objects with allowed attributes
         else:
-            tokens = {
-                "$user": user,
-            }
-
-            attrs = permissions.qs_filter_from_constraints(user._object_perm_cache[permission_required], tokens)
+            attrs = permissions.qs_filter_for_user(user, permission_required)
             if attrs:
                 # Use a subquery to avoid duplicate results when constraints span many-to-many joins
                 # (e.g. tags__name__regex matching multiple tags on the same object).
@@ -1,9 +1,13 @@
+import contextlib
+import threading
 import uuid
 
 from django.conf import settings
 from django.core.cache import cache
+from django.db import connection, transaction
 from django.db.models import Case, When
 from django.db.models.signals import post_delete, post_save
+import redis.exceptions
 from tree_queries.compiler import TreeQuery
 from tree_queries.models import TreeNode
 from tree_queries.query import TreeManager as TreeManager_, TreeQuerySet as TreeQuerySet_
@@ -12,6 +16,97 @@ from nautobot.core.models import BaseManager, querysets
 from nautobot.core.signals import invalidate_max_depth_cache
 from nautobot.core.utils.cache import construct_cache_key
 
+# In-process cache of `(version, TreeClosure, thread_id)` for each tree, keyed by `TreeManager.closure_version_cache_key`,
+# where `thread_id` identifies the thread whose transaction a closure was built from uncommitted changes in, if any
+_tree_closures = {}
+
+# Keys of the trees changed in the current transaction of each thread, see `_get_uncommitted_closure_changes()`
+_uncommitted_closure_changes = threading.local()
+
+
+def _get_uncommitted_closure_changes():
+    """Get the set of `TreeManager.closure_version_cache_key` of the trees changed in the current transaction."""
+    if not connection.in_atomic_block or not hasattr(_uncommitted_closure_changes, "version_keys"):
+        # Any changes made in a previous transaction were either committed or rolled back
+        _uncommitted_closure_changes.version_keys = set()
+    return _uncommitted_closure_changes.version_keys
+
+
+class TreeClosure:
+    """
+    In-memory closure of an entire tree, supporting constant-time ancestor, descendant, depth, and subtree lookups.
+
+    Nodes are identified by their primary keys. The nodes are laid out in depth-first order, such that the descendants
+    of any node are a contiguous slice of that order, and subtree membership is a simple comparison of positions.
+    """
+
+    def __init__(self, parent_pks):
+        """
+        Args:
+            parent_pks (dict): Mapping of the pk of each node in the tree to the pk of its parent (None for root nodes).
+        """
+        children_pks = {}
+        root_pks = []
+        for pk, parent_pk in parent_pks.items():
+            if parent_pk is None:
+                root_pks.append(pk)
+            else:
+                children_pks.setdefault(parent_pk, []).append(pk)
+
+        self._parent_pks = parent_pks
+        self._ancestor_pks = {}
+        self._ordered_pks = []
+        self._subtree_bounds = {}
+        stack = [(pk, (), False) for pk in reversed(root_pks)]
+        while stack:
+            pk, ancestor_pks, subtree_complete = stack.pop()
+            if subtree_complete:
+                self._subtree_bounds[pk] = (self._subtree_bounds[pk], len(self._ordered_pks))
+                continue
+            self._subtree_bounds[pk] = len(self._ordered_pks)
+            self._ordered_pks.append(pk)
+            self._ancestor_pks[pk] = ancestor_pks
+            stack.append((pk, ancestor_pks, True))
+            child_ancestor_pks = (*ancestor_pks, pk)
+            stack.extend((child_pk, child_ancestor_pks, False) for child_pk in reversed(children_pks.get(pk, [])))
+
+    def __contains__(self, pk):
+        return pk in self._ancestor_pks
+
+    def __len__(self):
+        return len(self._ordered_pks)
+
+    def parent_pk(self, pk):
+        """Get the pk of the parent of the given node, or None if it's a root node."""
+        return self._parent_pks[pk]
+
+    def ancestor_pks(self, pk, include_self=False):
+        """Get the pks of the ancestors of the given node, starting from the root of the tree."""
+        ancestor_pks = list(self._ancestor_pks[pk])
+        if include_self:
+            ancestor_pks.append(pk)
+        return ancestor_pks
+
+    def descendant_pks(self, pk, include_self=False):
+        """Get the pks of the descendants of the given node, in depth-first order."""
+        start, end = self._subtree_bounds[pk]
+        return self._ordered_pks[start if include_self else start + 1 : end]
+
+    def depth(self, pk):
+        """Get the depth of the given node in the tree, where root nodes have a depth of zero."""
+        return len(self._ancestor_pks[pk])
+
+    def is_descendant(self, pk, of, include_self=False):
+        """Check whether the node `pk` is a descendant of the node `of`."""
+        start, end = self._subtree_bounds[of]
+        position = self._subtree_bounds[pk][0]
+        return (start <= position if include_self else start < position) and position < end
+
+    @property
+    def max_depth(self):
+        """Get the maximum depth of any node in the tree, or zero if the tree is empty."""
+        return max((len(ancestor_pks) for ancestor_pks in self._ancestor_pks.values()), default=0)
+
 
 class TreeQuerySet(TreeQuerySet_, querysets.RestrictedQuerySet):
     """
@@ -35,13 +130,17 @@ class TreeQuerySet(TreeQuerySet_, querysets.RestrictedQuerySet):
         if hasattr(of, "tree_depth"):
             return super().ancestors(of, include_self=include_self)
 
-        # In the other case, traverse the `parent` foreign key until the root.
-        ancestor_pks = []
-        if include_self:
-            ancestor_pks.append(of.pk)
-        while of := of.parent:
-            # Insert in reverse order so that the root is the first element
-            ancestor_pks.insert(0, of.pk)
+        closure = self.model.objects.get_closure() if settings.TREE_CLOSURE_CACHE_ENABLED else None
+        if closure is not None and of.pk in closure and closure.parent_pk(of.pk) == of.parent_id:
+            ancestor_pks = closure.ancestor_pks(of.pk, include_self=include_self)
+        else:
+            # In the other case, traverse the `parent` foreign key until the root.
+            ancestor_pks = []
+            if include_self:
+                ancestor_pks.append(of.pk)
+            while of := of.parent:
+                # Insert in reverse order so that the root is the first element
+                ancestor_pks.insert(0, of.pk)
         # Maintain API compatibility by returning a queryset instead of a list directly.
         # Reference:
         # https://stackoverflow.com/questions/4916851/django-get-a-queryset-from-array-of-ids-in-specific-order
@@ -104,6 +203,8 @@ class TreeManager(TreeManager_, BaseManager.from_queryset(TreeQuerySet)):
 
         Generally TreeManagers are persistent objects while TreeQuerySets are not, hence the difference in behavior.
         """
+        if settings.TREE_CLOSURE_CACHE_ENABLED:
+            return self.get_closure().max_depth
         cache_key = self.max_depth_cache_key
         max_depth = cache.get(cache_key)
         if max_depth is None:
@@ -112,6 +213,63 @@ class TreeManager(TreeManager_, BaseManager.from_queryset(TreeQuerySet)):
             cache.set(cache_key, max_depth, timeout=None)
         return max_depth
 
+    @property
+    def closure_version_cache_key(self):
+        return construct_cache_key(self, method_name="closure_version", branch_aware=True)
+
+    def get_closure(self):
+        """
+        Get the `TreeClosure` of the entire tree of this model.
+
+        The closure is cached in memory in each process, and is rebuilt from a single query whenever the version of the
+        tree recorded in the Django cache no longer matches that of the cached closure (see `invalidate_closure()`). A
+        closure built from changes to the tree not yet committed is only reused within the same transaction, as the
+        version isn't changed again if the transaction is rolled back.
+        """
+        version_key = self.closure_version_cache_key
+        version = cache.get(version_key)
+        if version is None:
+            version = uuid.uuid4().hex
+            if not cache.add(version_key, version, timeout=None):
+                # Another process set the version first
+                version = cache.get(version_key, version)
+        uncommitted_changes = _get_uncommitted_closure_changes()
+        cached_version, closure, thread_id = _tree_closures.get(version_key, (None, None, None))
+        if thread_id is not None and (thread_id != threading.get_ident() or version_key not in uncommitted_changes):
+            # Built from changes in the transaction of another thread, or in a transaction of this thread that has since
+            # ended without its changes having been committed
+            closure = None
+        if closure is None or cached_version != version:
+            closure = TreeClosure(dict(self.without_tree_fields().order_by().values_list("pk", "parent_id")))
+            thread_id = threading.get_ident() if version_key in uncommitted_changes else None
+            _tree_closures[version_key] = (version, closure, thread_id)
+        return closure
+
+    def invalidate_closure(self):
+        """
+        Invalidate the cached `TreeClosure` of this model in all processes, as the structure of the tree has changed.
+
+        The version is changed again once the current transaction (if any) is committed, in case any other process
+        rebuilt its closure from the previously committed state of the tree in the meantime.
+        """
+        if not settings.TREE_CLOSURE_CACHE_ENABLED:
+            return
+
+        version_key = self.closure_version_cache_key
+
+        def change_version():
+            with contextlib.suppress(redis.exceptions.ConnectionError):
+                cache.set(version_key, uuid.uuid4().hex, timeout=None)
+
+        def commit_version():
+            _get_uncommitted_closure_changes().discard(version_key)
+            change_version()
+
+        change_version()
+        if connection.in_atomic_block:
+            _get_uncommitted_closure_changes().add(version_key)
+        transaction.on_commit(commit_version)
+
 
 class TreeModel(TreeNode):
     """
@@ -125,6 +283,11 @@ class TreeModel(TreeNode):
 
     def cacheable_descendants_pks(self, restrict_to_user=None, include_self=False):
         """Cacheable version of descendants() method, with optional permissions restriction."""
+        if restrict_to_user is None and settings.TREE_CLOSURE_CACHE_ENABLED:
+            closure = self.__class__.objects.get_closure()
+            if self.pk in closure:
+                return closure.descendant_pks(self.pk, include_self=include_self)
+
         user_id = restrict_to_user.id if restrict_to_user is not None else None
         cache_key = construct_cache_key(
             self,
@@ -190,6 +353,8 @@ class TreeModel(TreeNode):
         else:
             old_instance = None
             parent_changed = True
+        # Used by nautobot.core.signals.invalidate_max_depth_cache to decide whether the tree structure has changed
+        self._tree_parent_changed = parent_changed
 
         if parent_changed and old_instance is not None:
             for ancestor in old_instance.ancestors(include_self=False):
@@ -91,6 +91,9 @@ if "NAUTOBOT_CHANGELOG_RETENTION" in os.environ and os.environ["NAUTOBOT_CHANGEL
 # when a large number of dynamic groups are present
 CONFIG_CONTEXT_DYNAMIC_GROUPS_ENABLED = is_truthy(os.getenv("NAUTOBOT_CONFIG_CONTEXT_DYNAMIC_GROUPS_ENABLED", "False"))
 
+# Number of seconds to cache the rendered config context of each Device and Virtual Machine. Set to 0 to disable caching.
+CONFIG_CONTEXT_CACHE_TIMEOUT = int(os.getenv("NAUTOBOT_CONFIG_CONTEXT_CACHE_TIMEOUT", "0"))
+
 # UUID uniquely but anonymously identifying this Nautobot deployment.
 if "NAUTOBOT_DEPLOYMENT_ID" in os.environ and os.environ["NAUTOBOT_DEPLOYMENT_ID"] != "":
     DEPLOYMENT_ID = os.environ["NAUTOBOT_DEPLOYMENT_ID"]
@@ -103,6 +106,12 @@ if "NAUTOBOT_DEPLOYMENT_ID" in os.environ and os.environ["NAUTOBOT_DEPLOYMENT_ID
 if "NAUTOBOT_DEVICE_UNIQUENESS" in os.environ and os.environ["NAUTOBOT_DEVICE_UNIQUENESS"] != "":
     DEVICE_UNIQUENESS = os.environ["NAUTOBOT_DEVICE_UNIQUENESS"]
 
+# Incrementally update the cached members of Dynamic Groups whenever a candidate member object is saved or deleted.
+# This could cause performance impacts on object create/update when a large number of dynamic groups are present.
+DYNAMIC_GROUPS_INCREMENTAL_MEMBERSHIP_UPDATES = is_truthy(
+    os.getenv("NAUTOBOT_DYNAMIC_GROUPS_INCREMENTAL_MEMBERSHIP_UPDATES", "False")
+)
+
 # Event Brokers
 EVENT_BROKERS = {}
 
@@ -162,6 +171,7 @@ METRICS_AUTHENTICATED = is_truthy(os.getenv("NAUTOBOT_METRICS_AUTHENTICATED", "F
 METRICS_DISABLED_APPS = []
 if "NAUTOBOT_METRICS_DISABLED_APPS" in os.environ and os.environ["NAUTOBOT_METRICS_DISABLED_APPS"] != "":
     METRICS_DISABLED_APPS = os.getenv("NAUTOBOT_METRICS_DISABLED_APPS", "").split(_CONFIG_SETTING_SEPARATOR)
+METRICS_BACKGROUND_COLLECTION_INTERVAL = int(os.getenv("NAUTOBOT_METRICS_BACKGROUND_COLLECTION_INTERVAL", "0"))
 METRICS_EXPERIMENTAL_CACHING_DURATION = int(os.getenv("NAUTOBOT_METRICS_EXPERIMENTAL_CACHING_DURATION", "0"))
 
 # Napalm
@@ -184,6 +194,13 @@ if (
 if "NAUTOBOT_PAGINATE_COUNT" in os.environ and os.environ["NAUTOBOT_PAGINATE_COUNT"] != "":
     PAGINATE_COUNT = int(os.environ["NAUTOBOT_PAGINATE_COUNT"])
 
+# Number of seconds to cache the exact count of objects in a list view or REST API response. Default is 0 (no caching)
+PAGINATION_COUNT_CACHE_TIMEOUT = int(os.getenv("NAUTOBOT_PAGINATION_COUNT_CACHE_TIMEOUT", "0"))
+
+# Minimum estimated number of objects in a list view or REST API response above which the estimate is displayed
+# instead of counting the objects exactly. Default is 0 (always count exactly)
+PAGINATION_ESTIMATED_COUNT_THRESHOLD = int(os.getenv("NAUTOBOT_PAGINATION_ESTIMATED_COUNT_THRESHOLD", "0"))
+
 # The options displayed in the web interface dropdown to limit the number of objects per page.
 # Default is [25, 50, 100, 250, 500, 1000]
 if "NAUTOBOT_PER_PAGE_DEFAULTS" in os.environ and os.environ["NAUTOBOT_PER_PAGE_DEFAULTS"] != "":
@@ -231,6 +248,9 @@ if (
 ):
     RACK_ELEVATION_UNIT_TWO_DIGIT_FORMAT = is_truthy(os.environ["NAUTOBOT_RACK_ELEVATION_UNIT_TWO_DIGIT_FORMAT"])
 
+# Number of seconds to cache rendered rack elevation SVG images. Default is 0 (no caching)
+RACK_ELEVATION_CACHE_TIMEOUT = int(os.getenv("NAUTOBOT_RACK_ELEVATION_CACHE_TIMEOUT", "0"))
+
 # How frequently to check for a new Nautobot release on GitHub, and the URL to check for this information.
 # Defaults to disabled (no URL) and check every 24 hours when enabled
 if "NAUTOBOT_RELEASE_CHECK_TIMEOUT" in os.environ and os.environ["NAUTOBOT_RELEASE_CHECK_TIMEOUT"] != "":
@@ -238,6 +258,12 @@ if "NAUTOBOT_RELEASE_CHECK_TIMEOUT" in os.environ and os.environ["NAUTOBOT_RELEA
 if "NAUTOBOT_RELEASE_CHECK_URL" in os.environ and os.environ["NAUTOBOT_RELEASE_CHECK_URL"] != "":
     RELEASE_CHECK_URL = os.environ["NAUTOBOT_RELEASE_CHECK_URL"]
 
+# Use and maintain a denormalized index of searchable object text for the global search
+SEARCH_INDEX_ENABLED = is_truthy(os.getenv("NAUTOBOT_SEARCH_INDEX_ENABLED", "False"))
+
+# Cache the structure of each tree model (Location, RackGroup, TenantGroup, etc.) in memory in each process
+TREE_CLOSURE_CACHE_ENABLED = is_truthy(os.getenv("NAUTOBOT_TREE_CLOSURE_CACHE_ENABLED", "False"))
+
 # Global 3rd-party authentication settings
 EXTERNAL_AUTH_DEFAULT_GROUPS = []
 EXTERNAL_AUTH_DEFAULT_PERMISSIONS = {}
@@ -1008,6 +1034,10 @@ GRAPHENE = {
 GRAPHQL_CUSTOM_FIELD_PREFIX = "cf"
 GRAPHQL_RELATIONSHIP_PREFIX = "rel"
 GRAPHQL_COMPUTED_FIELD_PREFIX = "cpf"
+# Maximum estimated cost (number of database records) and nesting depth of GraphQL queries received via the REST API.
+# Set to 0 to disable the respective limit.
+GRAPHQL_MAX_QUERY_COST = int(os.getenv("NAUTOBOT_GRAPHQL_MAX_QUERY_COST", "0"))
+GRAPHQL_MAX_QUERY_DEPTH = int(os.getenv("NAUTOBOT_GRAPHQL_MAX_QUERY_DEPTH", "0"))
 
 
 #
@@ -63,7 +63,8 @@ def disable_for_loaddata(signal_handler):
 
 def invalidate_max_depth_cache(sender, **kwargs):
     """
-    Clear the appropriate TreeManager.max_depth cache as the create/update/delete may have changed the tree.
+    Clear the appropriate TreeManager.max_depth and TreeManager.get_closure() caches as the create/update/delete may
+    have changed the tree.
 
     Note that this signal is connected in `TreeModel.__init_subclass__()` so as to only apply to those models.
     """
@@ -72,8 +73,14 @@ def invalidate_max_depth_cache(sender, **kwargs):
     if not isinstance(sender.objects, TreeManager):
         return
 
-    # If the instance is a TreeNode, and it has siblings, skip invalidating the cache.
     instance = kwargs.get("instance", None)
+
+    # Any creation, deletion, or reparenting of a node changes the structure of the tree, even if not its max depth.
+    # `_tree_parent_changed` is set by `TreeModel.save()`; the `created` kwarg is absent for deletions.
+    if kwargs.get("created", True) or getattr(instance, "_tree_parent_changed", True):
+        sender.objects.invalidate_closure()
+
+    # If the instance is a TreeNode, and it has siblings, skip invalidating the cache.
     if isinstance(instance, TreeNode):
         try:
             parent = getattr(instance, "parent", None)
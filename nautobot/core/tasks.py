@@ -54,3 +54,12 @@ def get_releases(pre_releases=False):
 
     # Since this is a Celery task, we can't return Version objects as they are not JSON serializable.
     return [(str(version), url) for version, url in releases]
+
+
+@celery.nautobot_task
+def refresh_app_metrics_cache():
+    """Collect the metrics of all installed Nautobot Apps and cache them for serving by the `/metrics` endpoint."""
+    from nautobot.core.views.utils import refresh_background_app_metrics  # avoid circular import
+
+    data = refresh_background_app_metrics()
+    logger.debug("Collected Nautobot App metrics in %.3f seconds", data["duration"])
@@ -2,7 +2,7 @@ import csv
 from io import BytesIO, StringIO
 import json
 import os
-from unittest import skip
+from unittest import mock, skip
 import uuid
 
 from constance import config
@@ -189,6 +189,54 @@ class APIPaginationTestCase(testing.APITestCase):
         self.assertHttpStatus(response, 200)
         self.assertEqual(len(response.data["results"]), config.MAX_PAGE_SIZE)
 
+    @override_settings(
+        EXEMPT_VIEW_PERMISSIONS=["*"], PAGINATE_COUNT=5, MAX_PAGE_SIZE=10, PAGINATION_ESTIMATED_COUNT_THRESHOLD=1
+    )
+    def test_pagination_estimated_count(self):
+        """An estimated count is flagged as such, and doesn't prevent paging through all records."""
+        actual_count = Provider.objects.count()
+        with mock.patch("nautobot.core.utils.querysets.get_queryset_count_estimate", return_value=1):
+            response = self.client.get(self.url, **self.header)
+            self.assertHttpStatus(response, 200)
+            self.assertEqual(response.data["count"], 1)
+            self.assertTrue(response.data["count_is_estimated"])
+            if actual_count > settings.PAGINATE_COUNT:
+                self.assertIsNotNone(response.data["next"])
+                response = self.client.get(response.data["next"], **self.header)
+                self.assertHttpStatus(response, 200)
+                self.assertEqual(len(response.data["results"]), min(actual_count - 5, 5))
+
+        response = self.client.get(self.url, **self.header)
+        self.assertHttpStatus(response, 200)
+        self.assertEqual(response.data["count"], actual_count)
+        self.assertNotIn("count_is_estimated", response.data)
+
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=["*"], PAGINATE_COUNT=5, MAX_PAGE_SIZE=10)
+    def test_cursor_pagination(self):
+        """Walk through all records with keyset pagination and verify that each record is returned exactly once."""
+        limit = 2
+        url = f"{self.url}?cursor=&limit={limit}"
+        pks = []
+        while url is not None:
+            response = self.client.get(url, **self.header)
+            self.assertHttpStatus(response, 200)
+            self.assertIsNone(response.data["count"])
+            self.assertIsNone(response.data["previous"])
+            self.assertLessEqual(len(response.data["results"]), limit)
+            pks.extend(result["id"] for result in response.data["results"])
+            url = response.data["next"]
+            if url is not None:
+                self.assertIn("cursor=", url)
+                self.assertNotIn("offset=", url)
+        self.assertEqual(pks, sorted(str(pk) for pk in Provider.objects.values_list("pk", flat=True)))
+
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=["*"])
+    def test_cursor_pagination_invalid_cursor(self):
+        """An invalid cursor results in a 404 response."""
+        for cursor in ["not-valid-base64!", "bm90LWEtdXVpZA=="]:
+            response = self.client.get(f"{self.url}?cursor={cursor}", **self.header)
+            self.assertHttpStatus(response, 404)
+
 
 class APIVersioningTestCase(testing.APITestCase):
     """
@@ -519,6 +567,18 @@ class NautobotCSVRendererTest(TestCase):
         self.assertIn("parent__name", read_data)
         self.assertEqual(read_data["parent__name"], location_type.parent.name)
 
+    def test_render_iter(self):
+        data = [
+            {"id": 1, "name": "a", "url": "/a/", "custom_fields": {"foo": "x"}},
+            {"id": 2, "name": "b", "url": "/b/", "custom_fields": {"foo": None}},
+        ]
+        renderer = NautobotCSVRenderer()
+        lines = list(renderer.render_iter(iter(data), custom_field_keys=["foo", "bar"]))
+        self.assertEqual(lines, ["name,id,cf_bar,cf_foo\r\n", "a,1,,x\r\n", "b,2,,\r\n"])
+        # Without explicit custom_field_keys, output should match that of render()
+        self.assertEqual("".join(renderer.render_iter(data)), renderer.render(data))
+        self.assertEqual(list(renderer.render_iter([])), [])
+
 
 class ModelViewSetMixinTest(testing.APITestCase):
     """Unit tests for ModelViewSetMixin, base class for ModelViewSet/ReadOnlyModelViewSet classes."""
@@ -1,18 +1,22 @@
+from unittest import mock
 import uuid
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group
 from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
 from django.db.models import Q
 from django.test.utils import override_settings
 from django.urls import reverse
 from netaddr import IPNetwork
+import redis.exceptions
 
 from nautobot.core.authentication import assign_permissions_to_user
 from nautobot.core.settings_funcs import sso_auth_enabled
 from nautobot.core.testing import NautobotTestClient, TestCase
 from nautobot.core.utils import lookup
+from nautobot.core.utils.cache import construct_cache_key
 from nautobot.dcim.models import Location, LocationType
 from nautobot.extras.models import ObjectChange, Status
 from nautobot.ipam.models import Namespace, Prefix
@@ -720,3 +724,145 @@ class ObjectPermissionAPIViewTestCase(TestCase):
             response_user2.data["count"], ObjectChange.objects.filter(Q(user=obj_user2) | Q(action="delete")).count()
         )
         self.assertEqual(response_user2.data["results"][0]["user"]["id"], obj_user2.pk)
+
+
+class ObjectPermissionCacheTestCase(TestCase):
+    """Test caching of ObjectPermissions and of the QuerySet filters compiled from their constraints."""
+
+    def setUp(self):
+        super().setUp()
+        self.location_type = LocationType.objects.get(name="Campus")
+        self.locations = list(Location.objects.filter(location_type=self.location_type)[:2])
+        self.location_ct = ContentType.objects.get_for_model(Location)
+        self.obj_perm = ObjectPermission.objects.create(
+            name="Test location permission",
+            constraints={"pk": str(self.locations[0].pk)},
+            actions=["view"],
+        )
+        self.obj_perm.object_types.add(self.location_ct)
+        self.obj_perm.users.add(self.user)
+
+    def get_user(self):
+        """Get a fresh User object, such as would be used by a new request."""
+        return User.objects.get(pk=self.user.pk)
+
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=[])
+    def test_object_permissions_cached_across_requests(self):
+        user = self.get_user()
+        self.assertEqual(list(Location.objects.restrict(user, "view")), [self.locations[0]])
+
+        # A new request doesn't need to query the database for the user's ObjectPermissions
+        user = self.get_user()
+        with self.assertNumQueries(0):
+            user.get_all_permissions()
+
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=[])
+    def test_compiled_filter_reused_within_request(self):
+        user = self.get_user()
+        Location.objects.restrict(user, "view")
+        compiled_filter = user._object_perm_filter_cache["dcim.view_location"]
+        Location.objects.restrict(user, "view")
+        self.assertIs(user._object_perm_filter_cache["dcim.view_location"], compiled_filter)
+        self.assertTrue(user.has_perm("dcim.view_location", self.locations[0]))
+        self.assertFalse(user.has_perm("dcim.view_location", self.locations[1]))
+
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=[])
+    def test_object_permissions_cache_invalidation(self):
+        self.assertEqual(list(Location.objects.restrict(self.get_user(), "view")), [self.locations[0]])
+
+        # Changing the constraints of an ObjectPermission
+        self.obj_perm.constraints = {"pk": str(self.locations[1].pk)}
+        self.obj_perm.save()
+        self.assertEqual(list(Location.objects.restrict(self.get_user(), "view")), [self.locations[1]])
+
+        # Removing the user from an ObjectPermission
+        self.obj_perm.users.remove(self.user)
+        self.assertEqual(list(Location.objects.restrict(self.get_user(), "view")), [])
+
+        # Adding the user to a group with an ObjectPermission
+        group = Group.objects.create(name="Test Group")
+        self.obj_perm.groups.add(group)
+        self.user.groups.add(group)
+        self.assertEqual(list(Location.objects.restrict(self.get_user(), "view")), [self.locations[1]])
+
+        # Deleting the group
+        group.delete()
+        self.assertEqual(list(Location.objects.restrict(self.get_user(), "view")), [])
+
+        # Removing the object types of an ObjectPermission
+        self.obj_perm.users.add(self.user)
+        self.assertEqual(list(Location.objects.restrict(self.get_user(), "view")), [self.locations[1]])
+        self.obj_perm.object_types.remove(self.location_ct)
+        self.assertEqual(list(Location.objects.restrict(self.get_user(), "view")), [])
+
+        # Deleting an ObjectPermission
+        self.obj_perm.object_types.add(self.location_ct)
+        self.assertEqual(list(Location.objects.restrict(self.get_user(), "view")), [self.locations[1]])
+        self.obj_perm.delete()
+        self.assertEqual(list(Location.objects.restrict(self.get_user(), "view")), [])
+
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=[])
+    def test_object_permissions_cache_invalidation_limited_to_affected_users(self):
+        other_user = User.objects.create(username="Other user")
+        group = Group.objects.create(name="Test Group")
+        other_user.groups.add(group)
+
+        def is_cached(user):
+            cache_key = construct_cache_key(
+                ObjectPermission.objects, method_name="get_for_user", branch_aware=False, user=user.pk
+            )
+            return cache.get(cache_key) is not None
+
+        def populate_caches():
+            for user in (self.user, other_user):
+                User.objects.get(pk=user.pk).get_all_permissions()
+            self.assertTrue(is_cached(self.user))
+            self.assertTrue(is_cached(other_user))
+
+        # Changing an ObjectPermission affects only its users
+        populate_caches()
+        self.obj_perm.constraints = {"pk": str(self.locations[1].pk)}
+        self.obj_perm.save()
+        self.assertFalse(is_cached(self.user))
+        self.assertTrue(is_cached(other_user))
+
+        # Adding a group to an ObjectPermission affects only the users of that group
+        populate_caches()
+        self.obj_perm.groups.add(group)
+        self.assertTrue(is_cached(self.user))
+        self.assertFalse(is_cached(other_user))
+        self.assertEqual(
+            list(Location.objects.restrict(User.objects.get(pk=other_user.pk), "view")), [self.locations[1]]
+        )
+
+        # Changing a user's group membership affects only that user
+        populate_caches()
+        self.user.groups.add(group)
+        self.assertFalse(is_cached(self.user))
+        self.assertTrue(is_cached(other_user))
+
+        # Deleting a group affects all of its users
+        populate_caches()
+        group.delete()
+        self.assertFalse(is_cached(self.user))
+        self.assertFalse(is_cached(other_user))
+        self.assertEqual(list(Location.objects.restrict(User.objects.get(pk=other_user.pk), "view")), [])
+
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=[])
+    def test_object_permissions_cache_unavailable(self):
+        with mock.patch.object(cache, "get", side_effect=redis.exceptions.ConnectionError):
+            self.assertEqual(list(Location.objects.restrict(self.get_user(), "view")), [self.locations[0]])
+
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=[])
+    def test_object_permissions_cache_invalidated_again_on_commit(self):
+        cache_key = construct_cache_key(
+            ObjectPermission.objects, method_name="get_for_user", branch_aware=False, user=self.user.pk
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            self.obj_perm.constraints = {"pk": str(self.locations[1].pk)}
+            self.obj_perm.save()
+            self.assertIsNone(cache.get(cache_key))
+            # Simulate another process re-caching the permissions as they were before the transaction is committed
+            cache.set(cache_key, ["stale permissions"], timeout=None)
+        self.assertIsNone(cache.get(cache_key))
+        self.assertEqual(list(Location.objects.restrict(self.get_user(), "view")), [self.locations[1]])
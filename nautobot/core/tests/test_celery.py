@@ -1,8 +1,49 @@
-from unittest import TestCase
+import logging
+import time
+from unittest import mock, TestCase
 
 from nautobot.core import celery
+from nautobot.core.celery.log import NautobotDatabaseHandler
 
 
 class CeleryTest(TestCase):
     def test__dumps(self):
         self.assertEqual('"I am UTF-8! 😀"', celery._dumps("I am UTF-8! 😀"))
+
+
+class NautobotDatabaseHandlerTest(TestCase):
+    def setUp(self):
+        self.handler = NautobotDatabaseHandler()
+        self.addCleanup(self.handler.close)
+        self.job_result = mock.Mock()
+        self.handler.job_results["task-id"] = self.job_result
+
+    def emit(self, message):
+        record = logging.LogRecord("test", logging.INFO, __file__, 1, message, None, None)
+        record.task_id = "task-id"
+        self.handler.emit(record)
+
+    def test_buffered_entries_kept_on_failed_flush(self):
+        self.handler.flush_interval = 60
+        self.job_result.save_log_entries.side_effect = [RuntimeError("Database unavailable"), None]
+        self.emit("Hello")
+        with self.assertRaises(RuntimeError):
+            self.handler.flush("task-id")
+        self.assertEqual(len(self.handler.buffers["task-id"]), 1)
+
+        self.handler.flush("task-id")
+        self.assertEqual(self.job_result.save_log_entries.call_count, 2)
+        self.assertEqual(self.job_result.save_log_entries.call_args_list[0], self.job_result.save_log_entries.call_args)
+        self.assertNotIn("task-id", self.handler.buffers)
+        self.assertNotIn("task-id", self.handler.job_results)
+
+    def test_buffered_entries_flushed_after_interval(self):
+        self.handler.flush_interval = 0.01
+        self.emit("Hello")
+        # No further log records are emitted, but the entry is still saved once the interval has passed
+        deadline = time.monotonic() + 5
+        while not self.job_result.save_log_entries.called and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.job_result.save_log_entries.assert_called_once()
+        self.assertEqual(len(self.job_result.save_log_entries.call_args.args[0]), 1)
+        self.assertNotIn("task-id", self.handler.buffers)
@@ -272,7 +272,7 @@ class CSVParsingRelatedTestCase(TestCase):
         self.client.force_login(user)
         response = self.client.get(reverse("dcim-api:device-list") + "?format=csv")
         self.assertEqual(response.status_code, 200)
-        response_data = response.content.decode(response.charset)
+        response_data = response.getvalue().decode(response.charset)
 
         # parse the csv data
         csv_reader = csv.DictReader(response_data.splitlines())
@@ -2,6 +2,8 @@
 
 from collections import defaultdict
 import json
+import threading
+from unittest import mock
 
 from django.conf import settings
 import redis
@@ -9,6 +11,7 @@ import redis
 from nautobot.core.events import (
     deregister_event_broker,
     EventBroker,
+    flush_events,
     load_event_brokers,
     publish_event,
     register_event_broker,
@@ -98,6 +101,65 @@ class EventNotificationTest(TestCase):
         deregister_event_broker(event_broker)
         deregister_event_broker(event_broker_2)
 
+    def test_topic_matching(self):
+        event_broker = TestEventBroker(include_topics=["nautobot.create.*", "*.dcim.*"], exclude_topics=["*.cable"])
+        self.assertTrue(event_broker.is_topic_match("nautobot.create.ipam.prefix"))
+        self.assertTrue(event_broker.is_topic_match("nautobot.update.dcim.device"))
+        self.assertFalse(event_broker.is_topic_match("nautobot.create.dcim.cable"))
+        self.assertFalse(event_broker.is_topic_match("nautobot.update.ipam.prefix"))
+
+        # Changing the topics after initialization takes effect immediately
+        event_broker.exclude_topics = []
+        self.assertTrue(event_broker.is_topic_match("nautobot.create.dcim.cable"))
+        event_broker.include_topics = ["nautobot.update.*"]
+        self.assertTrue(event_broker.is_topic_match("nautobot.update.ipam.prefix"))
+        self.assertFalse(event_broker.is_topic_match("nautobot.create.ipam.prefix"))
+
+        # By default all topics are included
+        self.assertTrue(TestEventBroker().is_topic_match("anything.at.all"))
+
+    def test_publish_event_serializes_payload_once(self):
+        event_broker = TestEventBroker()
+        event_broker_2 = TestEventBroker()
+        register_event_broker(event_broker)
+        register_event_broker(event_broker_2)
+        try:
+            with mock.patch("nautobot.core.events.json.dumps", wraps=json.dumps) as mock_dumps:
+                publish_event(topic="nautobot.test.event", payload={"a": 1})
+            mock_dumps.assert_called_once()
+            self.assertEqual(event_broker.events["nautobot.test.event"], [json.dumps({"a": 1})])
+            self.assertEqual(event_broker_2.events["nautobot.test.event"], [json.dumps({"a": 1})])
+        finally:
+            deregister_event_broker(event_broker)
+            deregister_event_broker(event_broker_2)
+
+    def test_publish_events_in_background(self):
+        publish_threads = []
+
+        class BackgroundTestEventBroker(TestEventBroker):
+            def publish(self, *, topic, payload):
+                publish_threads.append(threading.current_thread())
+                if payload == json.dumps({"fail": True}):
+                    raise RuntimeError("Broker is unavailable")
+                super().publish(topic=topic, payload=payload)
+
+        event_broker = BackgroundTestEventBroker(background_publish=True)
+        register_event_broker(event_broker)
+        try:
+            with self.assertLogs("nautobot.core.events", level="ERROR"):
+                for i in range(5):
+                    publish_event(topic="nautobot.test.event", payload={"a": i})
+                # A failing broker doesn't raise an exception to the caller or prevent publishing of later events
+                publish_event(topic="nautobot.test.event", payload={"fail": True})
+                publish_event(topic="nautobot.test.event", payload={"a": 5})
+                self.assertTrue(flush_events(timeout=10))
+        finally:
+            deregister_event_broker(event_broker)
+
+        self.assertEqual(event_broker.events["nautobot.test.event"], [json.dumps({"a": i}) for i in range(6)])
+        self.assertEqual(len(publish_threads), 7)
+        self.assertNotIn(threading.current_thread(), publish_threads)
+
     @load_event_broker_override_settings(
         EVENT_BROKERS={
             "SyslogEventBroker": {
@@ -10,10 +10,13 @@ from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group
 from django.contrib.contenttypes.models import ContentType
 from django.core.cache import cache
+from django.db import connection
 from django.db.models import Count, Q
 from django.test import override_settings, tag
 from django.test.client import RequestFactory
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+import graphene
 import graphene.types
 from graphene_django.registry import get_global_registry
 from graphene_django.settings import graphene_settings
@@ -23,6 +26,7 @@ from rest_framework import status
 
 from nautobot.circuits.models import CircuitTermination, Provider
 from nautobot.core.graphql import execute_query, execute_saved_query
+from nautobot.core.graphql.documents import get_query_cost_errors, prepare_document, QueryCost
 from nautobot.core.graphql.generators import (
     _make_filter_cache_key,
     generate_attrs_for_schema_type,
@@ -189,6 +193,13 @@ class GraphQLTestCase(GraphQLTestCaseBase):
         with self.assertRaises(GraphQLError):
             execute_query(query, user=self.user)
 
+    def test_execute_query_with_validation_error(self):
+        query = "query { locations { no_such_field } }"
+        resp = execute_query(query, user=self.user)
+        self.assertIsNone(resp.data)
+        self.assertEqual(len(resp.errors), 1)
+        self.assertIn("no_such_field", resp.errors[0].message)
+
     def test_execute_saved_query(self):
         resp = execute_saved_query("GQL 1", user=self.user)
         self.assertIsNone(resp.errors)
@@ -814,6 +825,36 @@ class GraphQLAPIPermissionTest(GraphQLTestCaseBase):
         location_list = list(Location.objects.values_list("name", flat=True))
         self.assertEqual(location_names, location_list)
 
+    def test_graphql_persisted_query(self):
+        """Validate that a saved query can be executed by its ID or name."""
+        saved_query = GraphQLQuery.objects.create(name="Persisted Racks", query=self.get_racks_var_query)
+        for query_id in (str(saved_query.pk), saved_query.name):
+            with self.subTest(query_id=query_id):
+                payload = {"id": query_id, "variables": {"location": "Location 1"}}
+                response = self.clients[2].post(self.api_url, payload, format="json")
+                self.assertHttpStatus(response, status.HTTP_200_OK)
+                names = [item["name"] for item in response.data["data"]["racks"]]
+                self.assertEqual(names, ["Rack 1-1", "Rack 1-2"])
+
+        # Users without permission to view the saved query can't execute it
+        response = self.clients[3].post(self.api_url, {"id": str(saved_query.pk)}, format="json")
+        self.assertHttpStatus(response, status.HTTP_400_BAD_REQUEST)
+
+    @override_settings(GRAPHQL_MAX_QUERY_COST=150, GRAPHQL_MAX_QUERY_DEPTH=1)
+    def test_graphql_query_cost_limits(self):
+        """Validate that queries exceeding the configured cost limits are rejected without being executed."""
+        response = self.clients[2].post(self.api_url, {"query": self.get_racks_query}, format="json")
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["data"]["racks"]), 4)
+
+        response = self.clients[2].post(self.api_url, {"query": self.get_locations_racks_query}, format="json")
+        self.assertHttpStatus(response, status.HTTP_400_BAD_REQUEST)
+        self.assertNotIn("data", response.data)
+        messages = [error["message"] for error in response.data["errors"]]
+        self.assertEqual(len(messages), 2)
+        self.assertIn("exceeds the maximum allowed depth of 1", messages[0])
+        self.assertIn("exceeds the maximum allowed cost of 150", messages[1])
+
 
 class GraphQLQueryTest(GraphQLTestCaseBase):
     """Execute various GraphQL queries and verify their correct responses."""
@@ -1220,12 +1261,24 @@ class GraphQLQueryTest(GraphQLTestCaseBase):
         )
         cls.rm2ms_assoc_3.validated_save()
 
-    def execute_query(self, query, variables=None):
+    def execute_query(self, query, variables=None, schema=None):
+        schema = schema or self.SCHEMA
         document = parse(query)
         if variables:
-            return execute(schema=self.SCHEMA, document=document, context_value=self.request, variable_values=variables)
+            return execute(schema=schema, document=document, context_value=self.request, variable_values=variables)
         else:
-            return execute(schema=self.SCHEMA, document=document, context_value=self.request)
+            return execute(schema=schema, document=document, context_value=self.request)
+
+    def get_schema_with_relationships(self):
+        """
+        Build a GraphQL schema including the Relationships created in `setUpTestData()`.
+
+        The shared schema is only built once per process, so if another test built it before these Relationships
+        existed, it lacks their fields, and GraphQL silently omits such unknown fields from the results.
+        """
+        for model in (Device, VirtualMachine):
+            extend_schema_type_relationships(registry["graphql_types"][model._meta.label_lower], model)
+        return graphene.Schema(query=graphene_settings.SCHEMA.query, auto_camelcase=False).graphql_schema
 
     @override_settings(EXEMPT_VIEW_PERMISSIONS=["*"])
     def test_query_circuit_terminations_cable_peer(self):
@@ -2609,6 +2662,66 @@ query {
             actual = {iface["name"] for iface in device_data["interfaces"]}
             self.assertEqual(actual, expected, f"Mismatch for device {device_data['name']}")
 
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=["*"])
+    def test_query_relationships_no_n_plus_one(self):
+        """Test that relationships are batch-loaded across all objects in a list, rather than queried per object."""
+        query = "query { devices { id rel_device_to_vm { id } rel_device_group { id } config_context } }"
+        schema = self.get_schema_with_relationships()
+        # Prewarm caches
+        result = self.execute_query(query, schema=schema)
+        self.assertIsNone(result.errors)
+        self.assertGreater(Device.objects.count(), 1, "Need multiple devices to verify N+1 is avoided")
+        with AssertNoRepeatedQueries(self, threshold=2):
+            result = self.execute_query(query, schema=schema)
+        self.assertIsNone(result.errors)
+        # Verify correctness of the batched results
+        expected_device_group_peers = {
+            str(self.device1.id): {str(self.device2.id), str(self.device3.id)},
+            str(self.device2.id): {str(self.device1.id), str(self.device3.id)},
+            str(self.device3.id): {str(self.device1.id), str(self.device2.id)},
+        }
+        for device_data in result.data["devices"]:
+            device = Device.objects.get(id=device_data["id"])
+            if device == self.device1:
+                self.assertEqual(device_data["rel_device_to_vm"], {"id": str(self.virtualmachine.id)})
+            else:
+                self.assertIsNone(device_data["rel_device_to_vm"])
+            self.assertEqual(
+                {peer["id"] for peer in device_data["rel_device_group"]},
+                expected_device_group_peers.get(device_data["id"], set()),
+            )
+            self.assertEqual(device_data["config_context"], device.get_config_context())
+
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=["*"])
+    def test_query_nested_relationships_batched_per_level(self):
+        """Test that relationships of objects in nested lists are batch-loaded once for each level of the query."""
+        query = "query { locations { devices { id rel_device_to_vm { id } rel_device_group { id } } } }"
+        schema = self.get_schema_with_relationships()
+        self.assertGreater(
+            Location.objects.filter(devices__isnull=False).distinct().count(),
+            1,
+            "Need devices in multiple locations to verify batching across nested lists",
+        )
+        with CaptureQueriesContext(connection) as queries:
+            result = self.execute_query(query, schema=schema)
+        self.assertIsNone(result.errors)
+        # One query for the associations of each of the two relationships, regardless of the number of locations
+        association_queries = [
+            query["sql"] for query in queries.captured_queries if "extras_relationshipassociation" in query["sql"]
+        ]
+        self.assertEqual(len(association_queries), 2, association_queries)
+        devices = {
+            device_data["id"]: device_data
+            for location_data in result.data["locations"]
+            for device_data in location_data["devices"]
+        }
+        self.assertEqual(devices[str(self.device1.id)]["rel_device_to_vm"], {"id": str(self.virtualmachine.id)})
+        self.assertIsNone(devices[str(self.device2.id)]["rel_device_to_vm"])
+        self.assertEqual(
+            {peer["id"] for peer in devices[str(self.device3.id)]["rel_device_group"]},
+            {str(self.device1.id), str(self.device2.id)},
+        )
+
 
 class GraphQLTypeTestCase(UnitTestTestCase):
     def test_date_type(self):
@@ -2624,6 +2737,45 @@ class GraphQLTypeTestCase(UnitTestTestCase):
         self.assertIn("Received not compatible date", str(cm.exception))
 
 
+class PrepareDocumentTestCase(UnitTestTestCase):
+    def setUp(self):
+        self.schema = graphene_settings.SCHEMA.graphql_schema
+
+    def test_prepare_document_cached(self):
+        query = "query { devices { name } }"
+        prepared = prepare_document(self.schema, query)
+        self.assertEqual(prepared.errors, [])
+        self.assertIs(prepare_document(self.schema, query), prepared)
+
+    def test_prepare_document_errors(self):
+        prepared = prepare_document(self.schema, "query { devices { name ")
+        self.assertIsNone(prepared.document)
+        self.assertEqual(len(prepared.errors), 1)
+
+        prepared = prepare_document(self.schema, "query { devices { no_such_field } }")
+        self.assertIsNotNone(prepared.document)
+        self.assertEqual(len(prepared.errors), 1)
+
+    def test_estimate_query_cost(self):
+        prepared = prepare_document(
+            self.schema,
+            """
+            query Devices { devices { name location { name } interfaces { name } } }
+            query LimitedDevices { devices(limit: 10) { ...DeviceFields } }
+            fragment DeviceFields on DeviceType { name interfaces { name ip_addresses { address } } }
+            """,
+        )
+        self.assertEqual(prepared.errors, [])
+        self.assertEqual(prepared.costs["Devices"], QueryCost(depth=2, breadth=3, estimated_rows=100 + 100 + 10000))
+        self.assertEqual(
+            prepared.costs["LimitedDevices"], QueryCost(depth=3, breadth=2, estimated_rows=10 + 1000 + 100000)
+        )
+
+    @override_settings(GRAPHQL_MAX_QUERY_COST=0, GRAPHQL_MAX_QUERY_DEPTH=0)
+    def test_get_query_cost_errors_disabled(self):
+        self.assertEqual(get_query_cost_errors(QueryCost(depth=100, breadth=100, estimated_rows=10**9)), [])
+
+
 class MakeFilterCacheKeyTestCase(UnitTestTestCase):
     def test_empty_kwargs(self):
         self.assertEqual(_make_filter_cache_key({}), ())
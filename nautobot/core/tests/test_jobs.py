@@ -9,19 +9,34 @@ from unittest import mock
 
 from django.contrib.contenttypes.models import ContentType
 from django.core.cache import cache
+from django.core.exceptions import ValidationError
 from django.core.files.base import ContentFile
+from django.test import override_settings
 from django.utils import timezone
 import time_machine
 import yaml
 
 from nautobot.circuits.models import Circuit, CircuitType, Provider
 from nautobot.core.celery.encoders import NautobotKombuJSONEncoder
-from nautobot.core.jobs import DeleteCustomFieldData, ExportObjectList, UpdateCustomFieldChoiceData
+from nautobot.core.jobs import DeleteCustomFieldData, ExportObjectList, ImportObjects, UpdateCustomFieldChoiceData
 from nautobot.core.jobs.cleanup import CleanupTypes
 from nautobot.core.testing import create_job_result_and_run_job, TransactionTestCase
 from nautobot.core.testing.context import load_event_broker_override_settings
-from nautobot.dcim.models import Device, DeviceType, FrontPortTemplate, Location, LocationType, Manufacturer
-from nautobot.extras.choices import DynamicGroupTypeChoices, JobResultStatusChoices, LogLevelChoices
+from nautobot.dcim.models import (
+    Device,
+    DeviceType,
+    FrontPortTemplate,
+    Interface,
+    Location,
+    LocationType,
+    Manufacturer,
+)
+from nautobot.extras.choices import (
+    DynamicGroupTypeChoices,
+    JobResultStatusChoices,
+    LogLevelChoices,
+    ObjectChangeActionChoices,
+)
 from nautobot.extras.factory import JobResultFactory, ObjectChangeFactory
 from nautobot.extras.jobs import RunJobTaskFailed
 from nautobot.extras.models import (
@@ -35,6 +50,7 @@ from nautobot.extras.models import (
     ObjectChange,
     Role,
     SavedView,
+    SearchDocument,
     Status,
     Tag,
 )
@@ -129,6 +145,12 @@ class ExportObjectListTest(TransactionTestCase):
         # May be more than one line per Status if they have newlines in their description strings
         self.assertGreaterEqual(len(csv_data.split("\n")), Status.objects.count() + 1, csv_data)  # +1 for CSV header
 
+    @mock.patch.object(ExportObjectList, "csv_chunk_size", 2)
+    def test_export_all_to_csv_in_chunks(self):
+        """Job should export all instances, in order and with a single header row, when serializing in chunks."""
+        rows = self._run_export_job("")
+        self.assertEqual([row["id"] for row in rows], [str(pk) for pk in Status.objects.values_list("pk", flat=True)])
+
     def test_export_all_via_export_template(self):
         """When an export-template is specified, it should be used."""
         et = ExportTemplate.objects.create(
@@ -471,6 +493,92 @@ class ImportObjectsTestCase(TransactionTestCase):
             self.assertTrue(Status.objects.filter(name="test_status4").exists())
             self.assertEqual(log_successes[4].message, "Created 4 status object(s) from 5 row(s) of data")
 
+    @mock.patch.object(ImportObjects, "bulk_import_chunk_size", 2)
+    def test_csv_import_bulk(self):
+        """Objects of models that support bulk import should be created in bulk, with tags and change logging."""
+        provider = Provider.objects.create(name="Bulk Import Provider")
+        circuit_type = CircuitType.objects.create(name="Bulk Import Circuit Type")
+        status = Status.objects.get_for_model(Circuit).first()
+        tag = Tag.objects.create(name="BulkImportTag")
+        tag.content_types.add(ContentType.objects.get_for_model(Circuit))
+        csv_data = "\n".join(
+            ["cid,provider__name,circuit_type,status,tags"]
+            + [f"bulk-{i},{provider.name},{circuit_type.pk},{status.pk},{tag.name}" for i in range(5)]
+        )
+        job_result = create_job_result_and_run_job(
+            "nautobot.core.jobs",
+            "ImportObjects",
+            content_type=ContentType.objects.get_for_model(Circuit).pk,
+            csv_data=csv_data,
+        )
+        self.assertJobResultStatus(job_result)
+        circuits = Circuit.objects.filter(cid__startswith="bulk-")
+        self.assertEqual(circuits.count(), 5)
+        for circuit in circuits:
+            self.assertEqual(circuit.provider, provider)
+            self.assertEqual(circuit.circuit_type, circuit_type)
+            self.assertEqual(list(circuit.tags.all()), [tag])
+        self.assertEqual(
+            ObjectChange.objects.filter(
+                changed_object_type=ContentType.objects.get_for_model(Circuit),
+                changed_object_id__in=circuits.values_list("pk", flat=True),
+                action=ObjectChangeActionChoices.ACTION_CREATE,
+            ).count(),
+            5,
+        )
+        log_successes = JobLogEntry.objects.filter(
+            job_result=job_result, log_level=LogLevelChoices.LOG_INFO, message__startswith="Row"
+        )
+        self.assertEqual(
+            [entry.message for entry in log_successes],
+            [f'Row {i + 1}: Created record "bulk-{i}"' for i in range(5)],
+        )
+
+    @override_settings(SEARCH_INDEX_ENABLED=True)
+    def test_csv_import_bulk_search_index(self):
+        """Objects created in bulk should be added to the global search index."""
+        provider = Provider.objects.create(name="Bulk Import Provider")
+        circuit_type = CircuitType.objects.create(name="Bulk Import Circuit Type")
+        status = Status.objects.get_for_model(Circuit).first()
+        csv_data = "\n".join(
+            ["cid,provider,circuit_type,status"]
+            + [f"bulk-{i},{provider.pk},{circuit_type.pk},{status.pk}" for i in range(5)]
+        )
+        job_result = create_job_result_and_run_job(
+            "nautobot.core.jobs",
+            "ImportObjects",
+            content_type=ContentType.objects.get_for_model(Circuit).pk,
+            csv_data=csv_data,
+        )
+        self.assertJobResultStatus(job_result)
+        self.assertQuerysetEqualAndNotEmpty(
+            SearchDocument.objects.filter_objects(Circuit.objects.all(), "bulk-"),
+            Circuit.objects.filter(cid__startswith="bulk-"),
+            ordered=False,
+        )
+
+    def test_csv_import_bulk_duplicate_rows(self):
+        """If a chunk can't be created in bulk, its rows should be retried individually and errors reported."""
+        provider = Provider.objects.create(name="Bulk Import Provider")
+        circuit_type = CircuitType.objects.create(name="Bulk Import Circuit Type")
+        status = Status.objects.get_for_model(Circuit).first()
+        csv_data = "\n".join(
+            ["cid,provider,circuit_type,status"] + [f"bulk-dupe,{provider.pk},{circuit_type.pk},{status.pk}"] * 2
+        )
+        job_result = create_job_result_and_run_job(
+            "nautobot.core.jobs",
+            "ImportObjects",
+            content_type=ContentType.objects.get_for_model(Circuit).pk,
+            csv_data=csv_data,
+        )
+        self.assertJobResultStatus(job_result, JobResultStatusChoices.STATUS_FAILURE)
+        self.assertEqual(Circuit.objects.filter(cid="bulk-dupe").count(), 1)
+        log_errors = JobLogEntry.objects.filter(
+            job_result=job_result, log_level=LogLevelChoices.LOG_ERROR, message__startswith="Row"
+        )
+        self.assertEqual(len(log_errors), 1)
+        self.assertTrue(log_errors[0].message.startswith("Row 2:"), log_errors[0].message)
+
     def test_csv_import_contact_assignment(self):
         self.add_permissions(
             "dcim.view_locationtype",
@@ -1218,6 +1326,101 @@ class BulkEditTestCase(TransactionTestCase):
 
         self.assertEqual(0, Status.objects.exclude(color="aa1409").count())
 
+    def _create_interfaces(self):
+        """Create a Device with 5 Interfaces for the set-based bulk edit tests."""
+        location_type = LocationType.objects.create(name="Bulk Edit Location Type")
+        location_type.content_types.set([ContentType.objects.get_for_model(Device)])
+        location = Location.objects.create(
+            name="Bulk Edit Location",
+            location_type=location_type,
+            status=Status.objects.get_for_model(Location).first(),
+        )
+        manufacturer = Manufacturer.objects.create(name="Bulk Edit Manufacturer")
+        device_type = DeviceType.objects.create(manufacturer=manufacturer, model="Bulk Edit Device Type")
+        role = Role.objects.create(name="Bulk Edit Device Role")
+        role.content_types.set([ContentType.objects.get_for_model(Device)])
+        device = Device.objects.create(
+            name="Bulk Edit Device",
+            device_type=device_type,
+            location=location,
+            role=role,
+            status=Status.objects.get_for_model(Device).first(),
+        )
+        return [
+            Interface.objects.create(
+                device=device,
+                name=f"eth{x}",
+                type="1000base-t",
+                status=Status.objects.get_for_model(Interface).first(),
+            )
+            for x in range(5)
+        ]
+
+    def test_bulk_edit_objects_set_based(self):
+        """
+        Bulk edit Interfaces, which support set-based updates of the edited fields.
+        """
+        self.add_permissions("dcim.change_interface", "dcim.view_interface")
+        interfaces = self._create_interfaces()
+        new_status = Status.objects.get_for_model(Interface).last()
+        pk_list = [str(interface.pk) for interface in interfaces]
+
+        job_result = create_job_result_and_run_job(
+            "nautobot.core.jobs.bulk_actions",
+            "BulkEditObjects",
+            content_type=ContentType.objects.get_for_model(Interface).id,
+            edit_all=False,
+            filter_query_params={},
+            form_data={"pk": pk_list, "status": str(new_status.pk), "description": "Bulk edited", "mtu": 9000},
+            username=self.user.username,
+        )
+        self._common_no_error_test_assertion(
+            Interface, job_result, len(pk_list), status=new_status, description="Bulk edited", mtu=9000
+        )
+        self.assertEqual(
+            ObjectChange.objects.filter(
+                changed_object_type=ContentType.objects.get_for_model(Interface),
+                changed_object_id__in=pk_list,
+                action=ObjectChangeActionChoices.ACTION_UPDATE,
+                user=self.user,
+            ).count(),
+            len(pk_list),
+        )
+        object_change = ObjectChange.objects.get(
+            changed_object_id=interfaces[0].pk, action=ObjectChangeActionChoices.ACTION_UPDATE
+        )
+        self.assertEqual(object_change.object_data["description"], "Bulk edited")
+
+    def test_bulk_edit_objects_set_based_validates_every_object(self):
+        """
+        A set-based bulk edit should validate each object, and update none of them if any is invalid.
+        """
+        self.add_permissions("dcim.change_interface", "dcim.view_interface")
+        interfaces = self._create_interfaces()
+        pk_list = [str(interface.pk) for interface in interfaces]
+
+        def clean(interface):
+            if interface.name == "eth3":
+                raise ValidationError({"description": "Invalid description for eth3"})
+
+        with mock.patch.object(Interface, "clean", autospec=True, side_effect=clean):
+            job_result = create_job_result_and_run_job(
+                "nautobot.core.jobs.bulk_actions",
+                "BulkEditObjects",
+                content_type=ContentType.objects.get_for_model(Interface).id,
+                edit_all=False,
+                filter_query_params={},
+                form_data={"pk": pk_list, "description": "Bulk edited"},
+                username=self.user.username,
+            )
+        self.assertJobResultStatus(job_result, JobResultStatusChoices.STATUS_FAILURE)
+        self.assertTrue(
+            JobLogEntry.objects.filter(
+                job_result=job_result, log_level=LogLevelChoices.LOG_ERROR, message__contains="eth3"
+            ).exists()
+        )
+        self.assertFalse(Interface.objects.filter(description="Bulk edited").exists())
+
 
 class BulkDeleteTestCase(TransactionTestCase):
     """
@@ -1,5 +1,7 @@
 """Test the nautobot.core.utils.paginator module."""
 
+from unittest import mock
+
 from constance.test import override_config
 from django.conf import settings
 from django.contrib.auth import get_user_model
@@ -8,6 +10,7 @@ from django.urls import reverse
 
 from nautobot.circuits import models as circuits_models
 from nautobot.core import testing
+from nautobot.core.utils.querysets import get_queryset_count
 from nautobot.core.views import paginator
 from nautobot.dcim import models as dcim_models
 from nautobot.extras import models as extras_models
@@ -143,3 +146,34 @@ class PaginatorTestCase(testing.TestCase):
             self.assertEqual(len(table_response.context["table"].page), 20)
             warning_message = "Requested &quot;per_page&quot; is too large."
             self.assertNotIn(warning_message, table_response.content.decode(table_response.charset))
+
+    @override_settings(PAGINATION_COUNT_CACHE_TIMEOUT=60)
+    def test_get_queryset_count_cached(self):
+        """Exact counts are cached per queryset, and empty querysets aren't counted at all."""
+        circuits_models.Provider.objects.bulk_create(circuits_models.Provider(name=f"p-{x}") for x in range(20))
+        queryset = circuits_models.Provider.objects.filter(name__startswith="p-1")
+        self.assertEqual(get_queryset_count(queryset), (11, False))
+        with self.assertNumQueries(0):
+            self.assertEqual(get_queryset_count(queryset.all()), (11, False))
+            self.assertEqual(get_queryset_count(circuits_models.Provider.objects.none()), (0, False))
+        self.assertEqual(get_queryset_count(queryset.filter(name__endswith="9")), (1, False))
+
+    @override_settings(PAGINATION_ESTIMATED_COUNT_THRESHOLD=10)
+    def test_estimated_count(self):
+        """Above the threshold, the estimated count is used, without preventing access to all objects."""
+        circuits_models.Provider.objects.bulk_create(circuits_models.Provider(name=f"p-{x}") for x in range(20))
+        queryset = circuits_models.Provider.objects.all()
+        actual_count = queryset.count()
+        with mock.patch("nautobot.core.utils.querysets.get_queryset_count_estimate", return_value=actual_count - 5):
+            enhanced_paginator = paginator.EnhancedPaginator(queryset, 10)
+            self.assertEqual(enhanced_paginator.count, actual_count - 5)
+            self.assertTrue(enhanced_paginator.count_is_estimated)
+            pks = []
+            for number in range(1, enhanced_paginator.num_pages + 2):
+                pks.extend(obj.pk for obj in enhanced_paginator.page(number))
+            self.assertEqual(sorted(pks), sorted(queryset.values_list("pk", flat=True)))
+
+        with mock.patch("nautobot.core.utils.querysets.get_queryset_count_estimate", return_value=9):
+            enhanced_paginator = paginator.EnhancedPaginator(queryset, 10)
+            self.assertEqual(enhanced_paginator.count, actual_count)
+            self.assertFalse(enhanced_paginator.count_is_estimated)
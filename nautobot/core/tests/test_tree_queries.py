@@ -1,4 +1,5 @@
 from copy import deepcopy
+from unittest import mock
 
 from django.conf import settings
 from django.core.cache import cache
@@ -6,6 +7,7 @@ from django.db import connection
 from django.test import override_settings
 from django.test.utils import CaptureQueriesContext
 
+from nautobot.core.models.tree_queries import TreeClosure
 from nautobot.core.testing import TestCase
 from nautobot.dcim.models import Location
 
@@ -286,3 +288,103 @@ class TreeModelCachedDescendantsPKsTests(TestCase):
                 loc.cacheable_descendants_pks()
             except KeyError as e:
                 self.fail(f"cacheable_descendants_pks raised KeyError when TIMEOUT not in CACHES: {e}")
+
+
+class TreeClosureTests(TestCase):
+    """Tests for `TreeClosure` and its use via the `TREE_CLOSURE_CACHE_ENABLED` setting."""
+
+    def setUp(self):
+        super().setUp()
+        # Discard any closure cached by a previous test, as the tree may since have changed with the cache disabled
+        with override_settings(TREE_CLOSURE_CACHE_ENABLED=True):
+            Location.objects.invalidate_closure()
+
+    def test_closure(self):
+        closure = TreeClosure({"a": None, "b": "a", "c": "b", "d": "a", "e": None})
+        self.assertEqual(len(closure), 5)
+        self.assertIn("c", closure)
+        self.assertNotIn("z", closure)
+        self.assertEqual(closure.parent_pk("c"), "b")
+        self.assertEqual(closure.ancestor_pks("c"), ["a", "b"])
+        self.assertEqual(closure.ancestor_pks("c", include_self=True), ["a", "b", "c"])
+        self.assertEqual(closure.ancestor_pks("e"), [])
+        self.assertEqual(closure.descendant_pks("a"), ["b", "c", "d"])
+        self.assertEqual(closure.descendant_pks("a", include_self=True), ["a", "b", "c", "d"])
+        self.assertEqual(closure.descendant_pks("c"), [])
+        self.assertEqual(closure.depth("a"), 0)
+        self.assertEqual(closure.depth("c"), 2)
+        self.assertTrue(closure.is_descendant("c", of="a"))
+        self.assertFalse(closure.is_descendant("a", of="a"))
+        self.assertTrue(closure.is_descendant("a", of="a", include_self=True))
+        self.assertFalse(closure.is_descendant("d", of="b"))
+        self.assertFalse(closure.is_descendant("e", of="a"))
+        self.assertEqual(closure.max_depth, 2)
+        self.assertEqual(TreeClosure({}).max_depth, 0)
+
+    @override_settings(TREE_CLOSURE_CACHE_ENABLED=True)
+    def test_closure_cache_usage(self):
+        loc = Location.objects.without_tree_fields().exclude(parent__isnull=True).exclude(children__isnull=True).first()
+        self.assertIsNotNone(loc)
+
+        Location.objects.get_closure()
+        with self.assertNumQueries(0):
+            descendants_pks = loc.cacheable_descendants_pks(include_self=True)
+        self.assertEqual(
+            sorted(descendants_pks), sorted(loc.descendants(include_self=True).values_list("pk", flat=True))
+        )
+        with self.assertNumQueries(1):
+            ancestors = list(loc.ancestors(include_self=True))
+        self.assertEqual(ancestors, list(Location.objects.with_tree_fields().ancestors(loc, include_self=True)))
+        self.assertEqual(Location.objects.max_depth, Location.objects.max_tree_depth())
+
+    @override_settings(TREE_CLOSURE_CACHE_ENABLED=False)
+    def test_closure_cache_disabled(self):
+        with mock.patch.object(cache, "set") as mock_cache_set:
+            Location.objects.invalidate_closure()
+        mock_cache_set.assert_not_called()
+
+    @override_settings(TREE_CLOSURE_CACHE_ENABLED=True)
+    def test_closure_cache_uncommitted_changes(self):
+        # The tree was changed in the current transaction by `setUp()`
+        closure = Location.objects.get_closure()
+        self.assertIs(Location.objects.get_closure(), closure)
+        # Once the transaction has ended without being committed (as simulated here), the closure is no longer used
+        with mock.patch.object(connection, "in_atomic_block", False):
+            uncommitted_closure = closure
+            closure = Location.objects.get_closure()
+            self.assertIsNot(closure, uncommitted_closure)
+            self.assertIs(Location.objects.get_closure(), closure)
+
+    @override_settings(TREE_CLOSURE_CACHE_ENABLED=True)
+    def test_closure_cache_invalidation(self):
+        parent = Location.objects.filter(parent__isnull=False, children__isnull=False).first()
+        self.assertIsNotNone(parent)
+        grandparent = parent.parent
+        existing_child = parent.children.first()
+        Location.objects.get_closure()
+
+        new_child = Location.objects.create(
+            name="New child location",
+            status=existing_child.status,
+            location_type=existing_child.location_type,
+            parent=parent,
+        )
+        self.assertIn(new_child.pk, parent.cacheable_descendants_pks())
+        self.assertIn(new_child.pk, grandparent.cacheable_descendants_pks())
+        self.assertEqual([ancestor.pk for ancestor in new_child.ancestors()][-2:], [grandparent.pk, parent.pk])
+
+        # Renaming a node doesn't change the structure of the tree
+        closure = Location.objects.get_closure()
+        new_child.name = "Renamed child location"
+        new_child.save()
+        self.assertIs(Location.objects.get_closure(), closure)
+
+        new_child.parent = existing_child
+        new_child.save()
+        self.assertIsNot(Location.objects.get_closure(), closure)
+        self.assertIn(new_child.pk, existing_child.cacheable_descendants_pks())
+
+        new_child_pk = new_child.pk
+        new_child.delete()
+        self.assertNotIn(new_child_pk, parent.cacheable_descendants_pks())
+        self.assertNotIn(new_child_pk, Location.objects.get_closure())
@@ -1,3 +1,4 @@
+import json
 import os
 import sys
 import tempfile
@@ -27,6 +28,7 @@ from nautobot.core.utils.module_loading import (
     import_modules_privately,
     import_string_optional,
 )
+from nautobot.core.utils.profiling import get_sql_fingerprint, SQLQueryProfiler
 from nautobot.data_validation import models as data_validation_models
 from nautobot.dcim import (
     filters as dcim_filters,
@@ -552,6 +554,57 @@ class IsTaggableTest(TestCase):
         self.assertFalse(models_utils.is_taggable(None))
 
 
+class SQLQueryProfilerTest(TestCase):
+    def test_get_sql_fingerprint(self):
+        self.assertEqual(
+            get_sql_fingerprint('SELECT *\n  FROM "dcim_device" WHERE "id" IN (%s, %s, %s) LIMIT 21'),
+            'SELECT * FROM "dcim_device" WHERE "id" IN (?) LIMIT ?',
+        )
+        self.assertEqual(
+            get_sql_fingerprint('SELECT * FROM "dcim_device" WHERE "name" = \'it\'\'s\' AND "position" = 1.5'),
+            'SELECT * FROM "dcim_device" WHERE "name" = ? AND "position" = ?',
+        )
+
+    def test_profiler(self):
+        statuses = list(extras_models.Status.objects.all()[:3])
+        with SQLQueryProfiler() as profiler:
+            for status in statuses:
+                extras_models.Status.objects.get(pk=status.pk)
+        self.assertEqual(profiler.query_count, len(statuses))
+        self.assertEqual(len(profiler.queries), len(statuses))
+        self.assertGreaterEqual(profiler.total_duration, 0)
+        top_fingerprints = profiler.get_top_fingerprints()
+        self.assertEqual(len(top_fingerprints), 1)
+        self.assertEqual(top_fingerprints[0]["count"], len(statuses))
+        self.assertIn(__file__.rstrip("c"), top_fingerprints[0]["top_call_site"])
+        self.assertFalse(top_fingerprints[0]["likely_n_plus_one"])
+        self.assertEqual(profiler.as_dict()["duplicate_query_count"], len(statuses) - 1)
+
+        # Queries made after exiting the context manager are not recorded
+        extras_models.Status.objects.count()
+        self.assertEqual(profiler.query_count, len(statuses))
+
+    def test_profiler_as_json_max_size(self):
+        statuses = list(extras_models.Status.objects.all()[:10])
+        with SQLQueryProfiler() as profiler:
+            for status in statuses:
+                extras_models.Status.objects.get(pk=status.pk)
+
+        content = profiler.as_json()
+        self.assertEqual(len(json.loads(content)["queries"]), len(statuses))
+
+        # Individual queries are omitted as needed to fit within the maximum size; aggregated data is retained
+        max_size = len(content.encode("utf-8")) // 2
+        truncated_content = profiler.as_json(max_size=max_size)
+        self.assertLessEqual(len(truncated_content.encode("utf-8")), max_size)
+        truncated_data = json.loads(truncated_content)
+        self.assertTrue(truncated_data["queries_truncated"])
+        self.assertGreater(len(truncated_data["queries"]), 0)
+        self.assertLess(len(truncated_data["queries"]), len(statuses))
+        self.assertEqual(truncated_data["query_count"], len(statuses))
+        self.assertEqual(truncated_data["fingerprints"][0]["count"], len(statuses))
+
+
 class IsTruthyTest(TestCase):
     def test_is_truthy(self):
         self.assertTrue(settings_funcs.is_truthy("true"))
@@ -30,7 +30,7 @@ from nautobot.core.utils.lookup import get_filterset_for_model, get_model_from_n
 from nautobot.core.utils.permissions import get_permission_for_model
 from nautobot.core.views import MessagesView, NautobotMetricsView
 from nautobot.core.views.mixins import GetReturnURLMixin
-from nautobot.core.views.utils import METRICS_CACHE_KEY
+from nautobot.core.views.utils import METRICS_BACKGROUND_CACHE_KEY, METRICS_BACKGROUND_LOCK_KEY, METRICS_CACHE_KEY
 from nautobot.dcim.models.locations import Location, LocationType
 from nautobot.extras.choices import CustomFieldTypeChoices
 from nautobot.extras.models import FileProxy, SavedView, Status
@@ -89,6 +89,27 @@ class HomeViewTestCase(TestCase):
         response = self.client.get(f"{url}?{urllib.parse.urlencode(params)}")
         self.assertHttpStatus(response, 200)
 
+    @override_settings(SEARCH_INDEX_ENABLED=True)
+    def test_search_with_search_index(self):
+        provider = Provider.objects.create(name="Indexed Search Provider")
+        self.add_permissions("circuits.view_provider")
+        url = reverse("search")
+
+        # Indexed models without any matching objects are skipped on the initial page load
+        response = self.client.get(f"{url}?{urllib.parse.urlencode({'q': 'Indexed Search Provider'})}")
+        self.assertHttpStatus(response, 200)
+        self.assertIn("circuits.provider", response.context["searchable_models"])
+        self.assertNotIn("circuits.circuit", response.context["searchable_models"])
+        # Models whose search is not handled by the index are always included
+        self.assertIn("ipam.ipaddress", response.context["searchable_models"])
+
+        response = self.client.get(
+            f"{url}?{urllib.parse.urlencode({'q': 'indexed search', 'model': 'circuits.provider'})}",
+            headers={"HX-Request": "true"},
+        )
+        self.assertHttpStatus(response, 200)
+        self.assertEqual(list(response.context["table"].data), [provider])
+
     def test_appropriate_models_included_in_global_search(self):
         # Gather core app configs
         existing_models = []
@@ -1107,6 +1128,33 @@ class MetricsViewTestCase(TestCase):
             second_call_count = mock_metric_function.call_count
             self.assertEqual(first_call_count, second_call_count)
 
+    @tag("example_app")
+    @override_settings(METRICS_BACKGROUND_COLLECTION_INTERVAL=60)
+    def test_metrics_background_collection(self):
+        """Assert that app metrics are collected once in the background and then served from the cache."""
+        from example_app.metrics import metric_example
+
+        cache.delete(METRICS_BACKGROUND_CACHE_KEY)
+        cache.delete(METRICS_BACKGROUND_LOCK_KEY)
+        mock_metric_function = mock.Mock(name="mock_metric_function", side_effect=metric_example)
+        with mock.patch.dict("nautobot.core.views.registry", app_metrics=[mock_metric_function]):
+            first_metric_names = {metric.name for metric in self.query_and_parse_metrics()}
+            second_metric_names = {metric.name for metric in self.query_and_parse_metrics()}
+        self.assertEqual(mock_metric_function.call_count, 1)
+        for metric_names in (first_metric_names, second_metric_names):
+            self.assertIn("nautobot_example_metric_count", metric_names)
+            self.assertIn("nautobot_app_metrics_age_seconds", metric_names)
+
+        # Once the cached metrics are stale, a single scrape schedules a refresh
+        cached_data = cache.get(METRICS_BACKGROUND_CACHE_KEY)
+        cached_data["timestamp"] -= 120
+        cache.set(METRICS_BACKGROUND_CACHE_KEY, cached_data)
+        cache.delete(METRICS_BACKGROUND_LOCK_KEY)
+        with mock.patch("nautobot.core.tasks.refresh_app_metrics_cache.delay") as mock_delay:
+            self.query_and_parse_metrics()
+            self.query_and_parse_metrics()
+        self.assertEqual(mock_delay.call_count, 1)
+
 
 class AuthenticateMetricsTestCase(APITestCase):
     def test_metrics_authentication(self):
@@ -1,5 +1,6 @@
 from collections import namedtuple, OrderedDict
 from decimal import Decimal
+import functools
 import uuid
 
 from django.core import validators
@@ -121,6 +122,33 @@ def render_jinja2(template_code, context):
     return "" + template.render(context=context)
 
 
+@functools.lru_cache(maxsize=128)
+def _compile_jinja2_template(env, template_code):
+    return env.from_string(template_code)
+
+
+def get_jinja2_template(template_code):
+    """
+    Get the compiled Jinja2 template for the given template code.
+
+    Compiled templates are cached (keyed by the template code itself, so any change to the code results in a new
+    compilation), so that repeated renderings of the same template don't need to re-parse it each time.
+    """
+    return _compile_jinja2_template(engines["jinja"].env, template_code)
+
+
+def render_jinja2_iter(template_code, context):
+    """
+    Render a Jinja2 template with the provided context, yielding the rendered content in pieces as it's generated.
+
+    Unlike `render_jinja2()`, this never holds the entire rendered content in memory, so it's suitable for streaming
+    very large output (such as from an export template) to a file or to a `StreamingHttpResponse`.
+    """
+    for chunk in get_jinja2_template(template_code).generate(context):
+        # As in render_jinja2(), ensure that the rendered text isn't treated as safe (escaped) markup
+        yield str(chunk)
+
+
 def shallow_compare_dict(source_dict, destination_dict, exclude=None):
     """
     Return a new dictionary of the different keys. The values of `destination_dict` are returned. Only the equality of
@@ -309,6 +309,43 @@ def get_related_field_for_models(from_model, to_model):
     return matching_field
 
 
+def get_searchable_models():
+    """
+    Get the "app_label.modelname" strings of all models included in the global search, in their display order.
+
+    The models are defined by the `searchable_models` list (if any) of each app, and are ordered as:
+
+    - Device, Location, Prefix, and IPAddress
+    - core models in alphabetical order by app_label.modelname
+    - app models in alphabetical order by app_label.modelname
+
+    Returns:
+        (list[str]): The labels of all searchable models.
+    """
+    searchable_models_set = set()
+    for app_config in apps.get_app_configs():
+        if hasattr(app_config, "searchable_models"):
+            searchable_models_set.update(
+                f"{app_config.label.lower()}.{modelname}" for modelname in app_config.searchable_models
+            )
+
+    searchable_models = []
+    for initial_entry in ["dcim.device", "dcim.location", "ipam.prefix", "ipam.ipaddress"]:
+        if initial_entry in searchable_models_set:  # should always be true, but just in case
+            searchable_models.append(initial_entry)
+            searchable_models_set.remove(initial_entry)
+    # Remaining core models
+    for remaining_entry in sorted(searchable_models_set):
+        if remaining_entry.split(".", 1)[0] in settings.PLUGINS:
+            continue
+        searchable_models.append(remaining_entry)
+        searchable_models_set.remove(remaining_entry)
+    # Remaining app models
+    searchable_models += sorted(searchable_models_set)
+
+    return searchable_models
+
+
 def get_table_for_model(model, suffix=None):
     """Return the `Table` class associated with a given `model`.
 
@@ -101,3 +101,26 @@ def qs_filter_from_constraints(constraints, tokens=None):
             return Q()
 
     return params
+
+
+def qs_filter_for_user(user, permission):
+    """
+    Construct the QuerySet filter from all of the given user's constraints for the given permission.
+
+    The constructed filter is cached on the user object, so that repeated permission checks over the lifetime of that
+    object (typically a single request, including all GraphQL resolvers it invokes) only construct it once.
+
+    Args:
+        user (User): User who has been granted the given permission.
+        permission (str): Permission name, such as "dcim.view_location".
+
+    Returns:
+        (Q): QuerySet filter constructed from the user's constraints, possibly empty.
+    """
+    if not hasattr(user, "_object_perm_cache"):
+        # Populated by ObjectPermissionBackend
+        user.get_all_permissions()
+    compiled_filters = user.__dict__.setdefault("_object_perm_filter_cache", {})
+    if permission not in compiled_filters:
+        compiled_filters[permission] = qs_filter_from_constraints(user._object_perm_cache[permission], {"$user": user})
+    return compiled_filters[permission]
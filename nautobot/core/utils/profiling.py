@@ -0,0 +1,174 @@
+"""Utilities for profiling the database queries made by a block of code."""
+
+from collections import Counter
+import json
+import os
+import re
+import sys
+import time
+
+import django
+from django.db import connections
+
+# Maximum number of individual SQL statements to record; any further statements are only counted and aggregated
+MAX_RECORDED_QUERIES = 10000
+
+# Minimum number of executions of the same query from the same call site to flag as a likely "N+1" query pattern
+N_PLUS_ONE_THRESHOLD = 10
+
+_DJANGO_PATH = os.path.dirname(django.__file__)
+
+_STRING_LITERAL_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL_RE = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER_LIST_RE = re.compile(r"\(\s*(?:%s|\?)(?:\s*,\s*(?:%s|\?))*\s*\)")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def get_sql_fingerprint(sql):
+    """
+    Normalize the given SQL statement so that statements differing only in their parameter values are identical.
+
+    Examples:
+        >>> get_sql_fingerprint('SELECT * FROM "dcim_device" WHERE "id" IN (%s, %s, %s) LIMIT 21')
+        'SELECT * FROM "dcim_device" WHERE "id" IN (?) LIMIT ?'
+    """
+    sql = _STRING_LITERAL_RE.sub("?", sql)
+    sql = _NUMBER_LITERAL_RE.sub("?", sql)
+    sql = _PLACEHOLDER_LIST_RE.sub("(?)", sql.replace("%s", "?"))
+    return _WHITESPACE_RE.sub(" ", sql).strip()
+
+
+def _get_call_site():
+    """Get the `"filename:lineno in function"` of the innermost caller outside of Django and of this module."""
+    frame = sys._getframe(2)
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if not filename.startswith(_DJANGO_PATH) and filename != __file__:
+            return f"{filename}:{frame.f_lineno} in {frame.f_code.co_name}"
+        frame = frame.f_back
+    return "<unknown>"
+
+
+class SQLQueryProfiler:
+    """
+    Context manager recording the SQL statements executed on all database connections in the current thread.
+
+    Each statement is recorded with its duration and the Python call site that caused it to be executed. Statements are
+    also grouped by their normalized "fingerprint", so that the same query executed repeatedly with different parameter
+    values, as in an "N+1" query pattern, can be readily identified.
+
+    Examples:
+        >>> with SQLQueryProfiler() as profiler:
+        ...     for device in Device.objects.all():
+        ...         print(device.location.name)
+        >>> profiler.query_count
+        101
+    """
+
+    def __init__(self):
+        self.query_count = 0
+        self.total_duration = 0.0
+        self.queries = []
+        self.fingerprints = {}
+        self._wrapper_contexts = []
+
+    def __enter__(self):
+        for connection in connections.all():
+            wrapper_context = connection.execute_wrapper(self)
+            wrapper_context.__enter__()
+            self._wrapper_contexts.append(wrapper_context)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        while self._wrapper_contexts:
+            self._wrapper_contexts.pop().__exit__(exc_type, exc_value, traceback)
+
+    def __call__(self, execute, sql, params, many, context):
+        """Execute and record a single SQL statement; called by Django as a database `execute_wrapper`."""
+        start_time = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self._record(sql, time.perf_counter() - start_time, context["connection"].alias)
+
+    def _record(self, sql, duration, alias):
+        call_site = _get_call_site()
+        fingerprint = get_sql_fingerprint(sql)
+        self.query_count += 1
+        self.total_duration += duration
+        if len(self.queries) < MAX_RECORDED_QUERIES:
+            self.queries.append({"sql": sql, "duration": duration, "database": alias, "call_site": call_site})
+        group = self.fingerprints.get(fingerprint)
+        if group is None:
+            group = self.fingerprints[fingerprint] = {"count": 0, "total_duration": 0.0, "call_sites": Counter()}
+        group["count"] += 1
+        group["total_duration"] += duration
+        group["call_sites"][call_site] += 1
+
+    def get_top_fingerprints(self, limit=None):
+        """
+        Get the query fingerprints that took the most total time to execute.
+
+        Args:
+            limit (int): Maximum number of fingerprints to return, or None to return all of them.
+
+        Returns:
+            (list[dict]): Details of each fingerprint, in descending order of total duration.
+        """
+        top_fingerprints = []
+        groups = sorted(self.fingerprints.items(), key=lambda item: item[1]["total_duration"], reverse=True)
+        for fingerprint, group in groups[:limit]:
+            call_site, call_site_count = group["call_sites"].most_common(1)[0]
+            top_fingerprints.append(
+                {
+                    "fingerprint": fingerprint,
+                    "count": group["count"],
+                    "total_duration": group["total_duration"],
+                    "top_call_site": call_site,
+                    "likely_n_plus_one": call_site_count >= N_PLUS_ONE_THRESHOLD,
+                    "call_sites": dict(group["call_sites"].most_common()),
+                }
+            )
+        return top_fingerprints
+
+    def as_dict(self):
+        """Get all recorded data in a JSON-serializable form."""
+        return {
+            "query_count": self.query_count,
+            "total_duration": self.total_duration,
+            "duplicate_query_count": sum(group["count"] - 1 for group in self.fingerprints.values()),
+            "fingerprints": self.get_top_fingerprints(),
+            "queries": self.queries,
+            "queries_truncated": self.query_count > len(self.queries),
+        }
+
+    def as_json(self, max_size=None):
+        """
+        Get all recorded data serialized as JSON.
+
+        Args:
+            max_size (int): Maximum size in bytes of the serialized data, or None for no limit. If necessary, only as
+                many of the individually recorded queries as fit within this size are included; the aggregated
+                fingerprints are always included, so the result may still exceed `max_size` if they alone do so.
+
+        Returns:
+            (str): The JSON document.
+        """
+        data = self.as_dict()
+        content = json.dumps(data, indent=2)
+        if max_size is None or len(content.encode("utf-8")) <= max_size:
+            return content
+
+        # Find the largest number of queries that fits, by bisection
+        queries = data["queries"]
+        data["queries_truncated"] = True
+        low, high = 0, len(queries)
+        while low < high:
+            middle = (low + high + 1) // 2
+            data["queries"] = queries[:middle]
+            if len(json.dumps(data, indent=2).encode("utf-8")) <= max_size:
+                low = middle
+            else:
+                high = middle - 1
+        data["queries"] = queries[:low]
+        return json.dumps(data, indent=2)
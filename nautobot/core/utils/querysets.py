@@ -1,6 +1,13 @@
+import hashlib
+import json
 import logging
 
-from django.db import NotSupportedError
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet
+from django.db import connections, DatabaseError, NotSupportedError, transaction
+
+from nautobot.core.utils.cache import construct_cache_key
 
 logger = logging.getLogger(__name__)
 
@@ -62,3 +69,116 @@ def maybe_prefetch_related(queryset, prefetch_fields):
             )
 
     return queryset
+
+
+class ChunkedQuerySet:
+    """
+    Wrapper around a QuerySet that loads its records `chunk_size` at a time when iterated over.
+
+    Iterating over a QuerySet directly caches all of its records in memory; iterating over this wrapper instead uses
+    `QuerySet.iterator()` so that memory usage stays flat regardless of the number of records. All other attribute
+    access (`.filter()`, `.count()`, `.model`, etc.) is passed through to the wrapped QuerySet, and `len()` uses a
+    `COUNT` query rather than loading all records.
+    """
+
+    def __init__(self, queryset, chunk_size=1000):
+        self.queryset = queryset
+        self.chunk_size = chunk_size
+
+    def __iter__(self):
+        return self.queryset.iterator(chunk_size=self.chunk_size)
+
+    def __len__(self):
+        return self.queryset.count()
+
+    def __bool__(self):
+        return self.queryset.exists()
+
+    def __getattr__(self, name):
+        return getattr(self.queryset, name)
+
+    def __getitem__(self, key):
+        return self.queryset[key]
+
+
+def get_queryset_count_estimate(queryset):
+    """
+    Estimate the number of records in the given queryset from the database's statistics, without counting them.
+
+    For an unfiltered queryset, this uses the table statistics (`pg_class.reltuples` on PostgreSQL, or
+    `information_schema.TABLES.TABLE_ROWS` on MySQL); for a filtered queryset on PostgreSQL, the row estimate of the
+    query planner (`EXPLAIN`) is used. These estimates are only as accurate as the database's most recent `ANALYZE`.
+
+    Returns:
+        (int): The estimated number of records, or None if no estimate is available.
+    """
+    query = queryset.query
+    if query.is_sliced or query.combinator or query.group_by is not None:
+        return None
+
+    connection = connections[queryset.db]
+    table_name = queryset.model._meta.db_table
+    try:
+        with transaction.atomic(using=queryset.db), connection.cursor() as cursor:
+            if connection.vendor == "postgresql":
+                if not query.where:
+                    cursor.execute(
+                        "SELECT reltuples FROM pg_class WHERE oid = %s::regclass",
+                        [connection.ops.quote_name(table_name)],
+                    )
+                    row = cursor.fetchone()
+                    # reltuples is -1 if the table has never been analyzed
+                    return int(row[0]) if row and row[0] >= 0 else None
+                sql, params = queryset.order_by().values("pk").query.sql_with_params()
+                cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+                plan = cursor.fetchone()[0]
+                if isinstance(plan, str):
+                    plan = json.loads(plan)
+                return int(plan[0]["Plan"]["Plan Rows"])
+            if connection.vendor == "mysql" and not query.where:
+                cursor.execute(
+                    "SELECT TABLE_ROWS FROM information_schema.TABLES "
+                    "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s",
+                    [table_name],
+                )
+                row = cursor.fetchone()
+                return int(row[0]) if row and row[0] is not None else None
+    except (DatabaseError, KeyError, IndexError, TypeError, ValueError) as exc:
+        logger.warning("Unable to estimate the number of %s records: %s", queryset.model.__name__, exc)
+    return None
+
+
+def get_queryset_count(queryset):
+    """
+    Count the records in the given queryset, using an estimate or a cached count where configured to do so.
+
+    If the `PAGINATION_ESTIMATED_COUNT_THRESHOLD` setting is nonzero and the database estimates that the queryset
+    contains at least that many records, the estimate is returned instead of counting the records. Otherwise, if the
+    `PAGINATION_COUNT_CACHE_TIMEOUT` setting is nonzero, the exact count is cached for that many seconds, keyed by the
+    SQL of the queryset so that differently filtered or permission-restricted querysets are counted separately.
+
+    Returns:
+        (tuple[int, bool]): The number of records, and whether that number is an estimate.
+    """
+    try:
+        sql, params = queryset.query.sql_with_params()
+    except EmptyResultSet:
+        return 0, False
+
+    threshold = settings.PAGINATION_ESTIMATED_COUNT_THRESHOLD
+    if threshold:
+        estimate = get_queryset_count_estimate(queryset)
+        if estimate is not None and estimate >= threshold:
+            return estimate, True
+
+    timeout = settings.PAGINATION_COUNT_CACHE_TIMEOUT
+    if not timeout:
+        return queryset.count(), False
+
+    signature = hashlib.sha256(f"{queryset.db}:{sql}:{params!r}".encode("utf-8")).hexdigest()
+    cache_key = construct_cache_key(queryset.model, method_name="count", signature=signature)
+    count = cache.get(cache_key)
+    if count is None:
+        count = queryset.count()
+        cache.set(cache_key, count, timeout)
+    return count, False
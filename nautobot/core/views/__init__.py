@@ -11,7 +11,6 @@ import sys
 import time
 
 from db_file_storage.views import get_file
-from django.apps import apps
 from django.conf import settings
 from django.contrib.auth.decorators import permission_required
 from django.contrib.auth.mixins import AccessMixin, LoginRequiredMixin, UserPassesTestMixin
@@ -63,17 +62,21 @@ from nautobot.core.utils.lookup import (
     get_model_from_name,
     get_related_class_for_model,
     get_route_for_model,
+    get_searchable_models,
 )
 from nautobot.core.utils.permissions import get_permission_for_model
 from nautobot.core.utils.requests import normalize_querydict
 from nautobot.core.views.mixins import UIComponentsMixin
 from nautobot.core.views.utils import (
+    collect_app_metrics,
     generate_latest_with_cache,
+    get_background_app_metrics,
+    is_metrics_background_collection_enabled,
     is_metrics_experimental_caching_enabled,
     METRICS_CACHE_KEY,
 )
 from nautobot.extras.forms import GraphQLQueryForm
-from nautobot.extras.models import FileProxy, GraphQLQuery, Status
+from nautobot.extras.models import FileProxy, GraphQLQuery, SearchDocument, Status
 from nautobot.extras.plugins.urls import BASE_URL_TO_APP_LABEL
 from nautobot.extras.registry import registry
 from nautobot.extras.tables import StatusTable
@@ -367,38 +370,28 @@ class SearchView(AccessMixin, View):
         if "q" not in request.GET:
             return render(request, "search.html", {})
 
-        # Build the set of "app_label.modelname" strings, representing all models included in the global search,
-        # based on the `app_config.searchable_models` list (if any) defined by each app
-        searchable_models_set = set()
-        for app_config in apps.get_app_configs():
-            if hasattr(app_config, "searchable_models"):
-                searchable_models_set.update(
-                    f"{app_config.label.lower()}.{modelname}" for modelname in app_config.searchable_models
-                )
-
-        # Sort the searchable_models set into the below "logical" order:
-        # - Device
-        # - Location
-        # - Prefix
-        # - IPAddress
-        # - core models in alphabetical order by app_label.modelname
-        # - app models in alphabetical order by app_label.modelname
-        searchable_models = []
-        for initial_entry in ["dcim.device", "dcim.location", "ipam.prefix", "ipam.ipaddress"]:
-            if initial_entry in searchable_models_set:  # should always be true, but just in case
-                searchable_models.append(initial_entry)
-                searchable_models_set.remove(initial_entry)
-        # Remaining core models
-        for remaining_entry in sorted(searchable_models_set):
-            if remaining_entry.split(".", 1)[0] in settings.PLUGINS:
-                continue
-            searchable_models.append(remaining_entry)
-            searchable_models_set.remove(remaining_entry)
-        # Remaining app models
-        searchable_models += sorted(searchable_models_set)
+        searchable_models = get_searchable_models()
 
         if not request.headers.get("HX-Request", False):
             # Initial page-load request
+            if settings.SEARCH_INDEX_ENABLED and request.GET["q"] == request.GET["q"].strip():
+                # Query the index once to skip requesting results for any models without matching objects, provided
+                # that the index alone determines their results
+                indexed_models = {
+                    model._meta.label_lower
+                    for model in SearchDocument.get_indexed_models()
+                    if not SearchDocument.get_unindexed_predicates(model)
+                }
+                matching_models = {
+                    f"{app_label}.{model}"
+                    for app_label, model in SearchDocument.objects.search(request.GET["q"])
+                    .order_by()
+                    .values_list("content_type__app_label", "content_type__model")
+                    .distinct()
+                }
+                searchable_models = [
+                    label for label in searchable_models if label not in indexed_models or label in matching_models
+                ]
             return render(
                 request,
                 "search.html",
@@ -432,7 +425,10 @@ class SearchView(AccessMixin, View):
 
                 # Construct the results table for this object type
                 if filterset is not None and table is not None:
-                    filtered_queryset = filterset({"q": request.GET.get("q")}, queryset=queryset).qs
+                    if SearchDocument.is_search_indexed(queryset.model, request.GET.get("q")):
+                        filtered_queryset = SearchDocument.objects.filter_objects(queryset, request.GET.get("q"))
+                    else:
+                        filtered_queryset = filterset({"q": request.GET.get("q")}, queryset=queryset).qs
                     table = table(filtered_queryset, hide_hierarchy_ui=True, orderable=False)
                     table.paginate(per_page=SEARCH_MAX_RESULTS)
 
@@ -559,11 +555,19 @@ class NautobotAppMetricsCollector(Collector):
     def collect(self):
         """Collect metrics from plugins."""
         start = time.time()
-        cached_lines = cache.get(METRICS_CACHE_KEY)
-        if not is_metrics_experimental_caching_enabled() or not cached_lines:
+        if is_metrics_background_collection_enabled():
+            # Serve the metrics most recently collected by a background task, without collecting them here
+            background_metrics = get_background_app_metrics()
+            if background_metrics:
+                self.local_cache = background_metrics["lines"]
+                age_gauge = GaugeMetricFamily(
+                    "nautobot_app_metrics_age_seconds", "Time in seconds since the app metrics were collected"
+                )
+                age_gauge.add_metric([], format(time.time() - background_metrics["timestamp"], ".3f"))
+                yield age_gauge
+        elif not is_metrics_experimental_caching_enabled() or not (cached_lines := cache.get(METRICS_CACHE_KEY)):
             # If caching is disabled or no cache is found, generate metrics
-            for metric_generator in registry["app_metrics"]:
-                yield from metric_generator()
+            yield from collect_app_metrics()
         else:
             # We stash the cached lines on the instance of the collector so that we can
             # avoid a potential race condition where the cache expires between
@@ -619,7 +623,7 @@ class NautobotMetricsView(APIView):
             # Collector already registered, we are running without multiprocessing
             pass
 
-        if is_metrics_experimental_caching_enabled():
+        if is_metrics_experimental_caching_enabled() or is_metrics_background_collection_enabled():
             # Use the vendored version of generate_latest with Caching support
             metrics_page = generate_latest_with_cache(prometheus_registry)
         else:
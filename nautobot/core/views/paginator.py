@@ -1,12 +1,18 @@
 from itertools import pairwise
 
-from django.core.paginator import Page, Paginator
+from django.core.paginator import EmptyPage, Page, PageNotAnInteger, Paginator
+from django.db.models import QuerySet
+from django.utils.functional import cached_property
 
 from nautobot.core.constants import MAX_PAGE_SIZE_DEFAULT, PAGINATE_COUNT_DEFAULT
 from nautobot.core.utils import config
+from nautobot.core.utils.querysets import get_queryset_count
 
 
 class EnhancedPaginator(Paginator):
+    # Whether `count` is an estimate rather than an exact count; see `get_queryset_count()`
+    count_is_estimated = False
+
     def __init__(self, object_list, per_page, **kwargs):
         try:
             per_page = int(per_page)
@@ -21,11 +27,48 @@ class EnhancedPaginator(Paginator):
 
         super().__init__(object_list, per_page, **kwargs)
 
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        if not isinstance(queryset, QuerySet):
+            # django-tables2 wraps the queryset of a table in a TableQuerysetData
+            queryset = getattr(queryset, "data", None)
+        if isinstance(queryset, QuerySet):
+            count, self.count_is_estimated = get_queryset_count(queryset)
+            return count
+        return super().count
+
+    def validate_number(self, number):
+        if not (self.count and self.count_is_estimated):
+            return super().validate_number(number)
+        # The actual number of objects may exceed the estimate, so don't reject pages past the estimated last page
+        try:
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger(self.error_messages["invalid_page"])
+        if number < 1:
+            raise EmptyPage(self.error_messages["min_page"])
+        return number
+
+    def page(self, number):
+        if not (self.count and self.count_is_estimated):
+            return super().page(number)
+        # Don't truncate the page to the estimated count
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        return self._get_page(self.object_list[bottom : bottom + self.per_page], number, self)
+
     def _get_page(self, *args, **kwargs):
         return EnhancedPage(*args, **kwargs)
 
 
 class EnhancedPage(Page):
+    def end_index(self):
+        if self.paginator.count_is_estimated:
+            # The estimated count may not match the actual number of objects on the last page(s)
+            return self.start_index() + len(self) - 1
+        return super().end_index()
+
     def smart_pages(self):
         # When dealing with five or fewer pages, simply return the whole list.
         if self.paginator.num_pages <= 5:
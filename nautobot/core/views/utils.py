@@ -1,6 +1,7 @@
 import datetime
 from io import BytesIO
 import logging
+import time
 import urllib.parse
 
 from django.conf import settings
@@ -11,7 +12,8 @@ from django.db.models import ForeignKey
 from django.utils.html import format_html, format_html_join
 from django.utils.safestring import mark_safe
 from django_tables2 import RequestConfig
-from prometheus_client import REGISTRY
+from prometheus_client import CollectorRegistry, generate_latest, REGISTRY
+from prometheus_client.registry import Collector
 from prometheus_client.utils import floatToGoString
 from rest_framework import exceptions, serializers
 
@@ -30,13 +32,19 @@ from nautobot.core.utils.lookup import (
 from nautobot.core.utils.requests import normalize_querydict
 from nautobot.core.views.paginator import EnhancedPaginator, get_paginate_count
 from nautobot.extras.models import SavedView
+from nautobot.extras.registry import registry as nautobot_registry
 from nautobot.extras.tables import AssociatedContactsTable, DynamicGroupTable, ObjectMetadataTable
 
 logger = logging.getLogger(__name__)
 
 METRICS_CACHE_KEY = "nautobot_app_metrics_cache"
+METRICS_BACKGROUND_CACHE_KEY = "nautobot_app_metrics_background_cache"
+METRICS_BACKGROUND_LOCK_KEY = "nautobot_app_metrics_background_refresh_lock"
+# Background-collected metrics are discarded if not refreshed within this many collection intervals
+METRICS_BACKGROUND_EXPIRY_INTERVALS = 10
 always_generated_metrics = [
-    "nautobot_app_metrics_processing_ms"  # Always generate this metric to track the processing time of Nautobot App metrics, improved with caching.
+    "nautobot_app_metrics_processing_ms",  # Always generate this metric to track the processing time of Nautobot App metrics, improved with caching.
+    "nautobot_app_metrics_age_seconds",  # Always generate this metric to track the age of background-collected metrics.
 ]
 
 
@@ -438,6 +446,70 @@ def is_metrics_experimental_caching_enabled():
     return settings.METRICS_EXPERIMENTAL_CACHING_DURATION > 0
 
 
+def is_metrics_background_collection_enabled():
+    """Return True if METRICS_BACKGROUND_COLLECTION_INTERVAL is set to a positive integer."""
+    return settings.METRICS_BACKGROUND_COLLECTION_INTERVAL > 0
+
+
+def collect_app_metrics():
+    """Yield the metrics provided by all installed Nautobot Apps."""
+    for metric_generator in nautobot_registry["app_metrics"]:
+        yield from metric_generator()
+
+
+class _AppMetricsOnlyCollector(Collector):
+    """Collector for only the metrics provided by Nautobot Apps, used for background collection."""
+
+    def collect(self):
+        yield from collect_app_metrics()
+
+
+def refresh_background_app_metrics():
+    """
+    Collect the metrics of all installed Nautobot Apps and store their exposition text in the cache.
+
+    Returns:
+        (dict): The cached data, with keys `lines` (the exposition text, as a list of lines),
+            `timestamp` (the time at which the collection completed), and `duration` (the collection time in seconds).
+    """
+    start = time.time()
+    metrics_registry = CollectorRegistry(auto_describe=False)
+    metrics_registry.register(_AppMetricsOnlyCollector())
+    lines = generate_latest(metrics_registry).decode("utf-8").splitlines(keepends=True)
+    end = time.time()
+    data = {"lines": lines, "timestamp": end, "duration": end - start}
+    cache.set(
+        METRICS_BACKGROUND_CACHE_KEY,
+        data,
+        timeout=settings.METRICS_BACKGROUND_COLLECTION_INTERVAL * METRICS_BACKGROUND_EXPIRY_INTERVALS,
+    )
+    return data
+
+
+def get_background_app_metrics():
+    """
+    Get the most recently background-collected Nautobot App metrics, without collecting them in this process.
+
+    If the cached metrics are missing or older than `METRICS_BACKGROUND_COLLECTION_INTERVAL`, a refresh is enqueued as a
+    Celery task; a cache lock ensures that only one such task is enqueued per interval across all web processes.
+
+    Returns:
+        (dict): The data stored by `refresh_background_app_metrics()`, or None if no metrics have been collected yet.
+    """
+    interval = settings.METRICS_BACKGROUND_COLLECTION_INTERVAL
+    data = cache.get(METRICS_BACKGROUND_CACHE_KEY)
+    if (data is None or time.time() - data["timestamp"] >= interval) and cache.add(
+        METRICS_BACKGROUND_LOCK_KEY, True, timeout=interval
+    ):
+        from nautobot.core.tasks import refresh_app_metrics_cache  # avoid circular import
+
+        refresh_app_metrics_cache.delay()
+        if data is None:
+            # The task may have already completed, for example when Celery tasks are run eagerly
+            data = cache.get(METRICS_BACKGROUND_CACHE_KEY)
+    return data
+
+
 def generate_latest_with_cache(registry=REGISTRY):
     """A vendored version of prometheus_client.generate_latest that caches Nautobot App metrics."""
 
@@ -534,7 +606,7 @@ def generate_latest_with_cache(registry=REGISTRY):
             del collector.local_cache  # avoid re-using stale data on next call
 
     # If we have any cached lines, and the cache is empty or expired, update the cache.
-    if cached_lines and not cache.get(METRICS_CACHE_KEY):
+    if cached_lines and is_metrics_experimental_caching_enabled() and not cache.get(METRICS_CACHE_KEY):
         cache.set(METRICS_CACHE_KEY, cached_lines, timeout=settings.METRICS_EXPERIMENTAL_CACHING_DURATION)
     # END Nautobot-specific logic
 
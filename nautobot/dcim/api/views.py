@@ -252,7 +252,7 @@ class RackViewSet(NautobotModelViewSet):
 
         if data["render"] == "svg":
             # Render and return the elevation as an SVG drawing with the correct content type
-            drawing = rack.get_elevation_svg(
+            svg = rack.render_elevation_svg(
                 face=data["face"],
                 user=request.user,
                 unit_width=data["unit_width"],
@@ -262,7 +262,7 @@ class RackViewSet(NautobotModelViewSet):
                 base_url=request.build_absolute_uri("/"),
                 display_fullname=data["display_fullname"],
             )
-            return HttpResponse(drawing.tostring(), content_type="image/svg+xml")
+            return HttpResponse(svg, content_type="image/svg+xml")
 
         else:
             # Return a JSON representation of the rack units in the elevation
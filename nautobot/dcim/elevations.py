@@ -1,12 +1,19 @@
+import hashlib
+import uuid
+
 from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, Prefetch, prefetch_related_objects
 from django.urls import reverse
 from django.utils.http import urlencode
 import svgwrite
 
+from nautobot.core.utils.cache import construct_cache_key
 from nautobot.core.utils.config import get_settings_or_config
 
 from .choices import DeviceFaceChoices
-from .constants import RACK_ELEVATION_BORDER_WIDTH
+from .constants import RACK_ELEVATION_BORDER_WIDTH, RACK_ELEVATION_LEGEND_WIDTH_DEFAULT
 
 
 class RackElevationSVG:
@@ -17,9 +24,12 @@ class RackElevationSVG:
     :param user: User instance. If specified, only devices viewable by this user will be fully displayed.
     :param include_images: If true, the SVG document will embed front/rear device face images, where available
     :param base_url: Base URL for links within the SVG document. If none, links will be relative.
+    :param permitted_device_ids: IDs of the devices within the rack that are viewable by the user, if already known.
     """
 
-    def __init__(self, rack, user=None, include_images=True, base_url=None, display_fullname=True):
+    def __init__(
+        self, rack, user=None, include_images=True, base_url=None, display_fullname=True, permitted_device_ids=None
+    ):
         self.rack = rack
         self.include_images = include_images
         self.display_fullname = display_fullname
@@ -29,10 +39,13 @@ class RackElevationSVG:
             self.base_url = ""
 
         # Determine the subset of devices within this rack that are viewable by the user, if any
-        permitted_devices = self.rack.devices
-        if user is not None:
-            permitted_devices = permitted_devices.restrict(user, "view")
-        self.permitted_device_ids = permitted_devices.values_list("pk", flat=True)
+        if permitted_device_ids is not None:
+            self.permitted_device_ids = permitted_device_ids
+        else:
+            permitted_devices = self.rack.devices
+            if user is not None:
+                permitted_devices = permitted_devices.restrict(user, "view")
+            self.permitted_device_ids = permitted_devices.values_list("pk", flat=True)
 
     @staticmethod
     def _get_device_description(device):
@@ -177,7 +190,7 @@ class RackElevationSVG:
         query_params = urlencode(
             {
                 "rack": rack.pk,
-                "location": rack.location.pk,
+                "location": rack.location_id,
                 "face": face_id,
                 "position": id_,
             }
@@ -308,3 +321,141 @@ class RackElevationSVG:
         drawing.add(frame)
 
         return drawing
+
+
+def _get_version_cache_key(rack_id):
+    return construct_cache_key(RackElevationSVG, method_name="version", rack=rack_id)
+
+
+def invalidate_rack_elevation_cache(*rack_ids):
+    """
+    Invalidate the cached elevations of the given racks.
+
+    Rather than deleting every cached rendering of a rack (of which there may be many, for each face, size, and user
+    permissions), each rack's renderings are keyed by a version identifier that is replaced here. The version is
+    replaced again once the current transaction (if any) is committed, in case any other process rendered and cached an
+    elevation from the previously committed state of the rack in the meantime.
+    """
+    version_keys = [_get_version_cache_key(rack_id) for rack_id in rack_ids if rack_id]
+    if not version_keys:
+        return
+
+    def change_versions():
+        cache.set_many({version_key: uuid.uuid4().hex for version_key in version_keys}, None)
+
+    change_versions()
+    transaction.on_commit(change_versions)
+
+
+def _get_cache_versions(rack_ids):
+    """Get the current version identifier of the cached elevations of each of the given racks, by rack ID."""
+    version_keys = {rack_id: _get_version_cache_key(rack_id) for rack_id in rack_ids}
+    versions = cache.get_many(version_keys.values())
+    for version_key in version_keys.values():
+        if version_key not in versions:
+            # Don't overwrite a version set concurrently by invalidate_rack_elevation_cache()
+            cache.add(version_key, uuid.uuid4().hex, None)
+            versions[version_key] = cache.get(version_key)
+    return {rack_id: versions[version_key] for rack_id, version_key in version_keys.items()}
+
+
+def render_rack_elevation_svgs(
+    racks,
+    face=DeviceFaceChoices.FACE_FRONT,
+    user=None,
+    unit_width=None,
+    unit_height=None,
+    legend_width=RACK_ELEVATION_LEGEND_WIDTH_DEFAULT,
+    include_images=True,
+    base_url=None,
+    display_fullname=True,
+):
+    """
+    Render the elevations of the given racks as SVG documents, using cached renderings where available.
+
+    The IDs of the devices viewable by the user are retrieved for all racks in a single query, as are the devices and
+    reservations needed to render any racks without a cached rendering. If `RACK_ELEVATION_CACHE_TIMEOUT` is set,
+    renderings are cached by rack, face, size, and the set of devices viewable by the user, until they expire or are
+    invalidated by `invalidate_rack_elevation_cache()`.
+
+    Args:
+        racks (Iterable[Rack]): Racks to render the elevations of.
+        face, user, unit_width, unit_height, legend_width, include_images, base_url, display_fullname: See
+            `Rack.get_elevation_svg()`.
+
+    Returns:
+        (dict): `{rack.pk: svg_document_string, ...}`
+    """
+    from nautobot.dcim.models import Device, RackReservation  # avoid circular import
+
+    racks = list(racks)
+    if not racks:
+        return {}
+    if unit_width is None:
+        unit_width = get_settings_or_config("RACK_ELEVATION_DEFAULT_UNIT_WIDTH", fallback=230)
+    if unit_height is None:
+        unit_height = get_settings_or_config("RACK_ELEVATION_DEFAULT_UNIT_HEIGHT", fallback=22)
+
+    permitted_devices = Device.objects.filter(rack__in=racks)
+    if user is not None:
+        permitted_devices = permitted_devices.restrict(user, "view")
+    permitted_device_ids = {rack.pk: set() for rack in racks}
+    for rack_id, device_id in permitted_devices.values_list("rack_id", "pk"):
+        permitted_device_ids[rack_id].add(device_id)
+
+    svgs = {}
+    cache_keys = {}
+    cache_timeout = settings.RACK_ELEVATION_CACHE_TIMEOUT
+    if cache_timeout:
+        versions = _get_cache_versions([rack.pk for rack in racks])
+        for rack in racks:
+            cache_keys[rack.pk] = construct_cache_key(
+                RackElevationSVG,
+                method_name="render",
+                rack=rack.pk,
+                version=versions[rack.pk],
+                face=face,
+                unit_width=unit_width,
+                unit_height=unit_height,
+                legend_width=legend_width,
+                include_images=include_images,
+                base_url=base_url,
+                display_fullname=display_fullname,
+                two_digit_format=get_settings_or_config("RACK_ELEVATION_UNIT_TWO_DIGIT_FORMAT"),
+                permissions=hashlib.sha256(
+                    ",".join(sorted(str(pk) for pk in permitted_device_ids[rack.pk])).encode()
+                ).hexdigest(),
+            )
+        cached_svgs = cache.get_many(cache_keys.values())
+        for rack in racks:
+            if cache_keys[rack.pk] in cached_svgs:
+                svgs[rack.pk] = cached_svgs[cache_keys[rack.pk]]
+
+    uncached_racks = [rack for rack in racks if rack.pk not in svgs]
+    if uncached_racks:
+        # Used by Rack.get_rack_units() and Rack.get_reserved_units() in place of querying each rack individually
+        prefetch_related_objects(
+            uncached_racks,
+            Prefetch(
+                "devices",
+                queryset=Device.objects.select_related("device_type", "device_type__manufacturer", "role", "status")
+                .annotate(device_bay_count=Count("device_bays"))
+                .filter(position__gt=0, device_type__u_height__gt=0),
+                to_attr="elevation_devices",
+            ),
+            Prefetch("rack_reservations", queryset=RackReservation.objects.select_related("user")),
+        )
+        for rack in uncached_racks:
+            elevation = RackElevationSVG(
+                rack,
+                user=user,
+                include_images=include_images,
+                base_url=base_url,
+                display_fullname=display_fullname,
+                permitted_device_ids=permitted_device_ids[rack.pk],
+            )
+            svgs[rack.pk] = elevation.render(face, unit_width, unit_height, legend_width).tostring()
+        if cache_timeout:
+            cache.set_many({cache_keys[rack.pk]: svgs[rack.pk] for rack in uncached_racks}, cache_timeout)
+
+    return svgs
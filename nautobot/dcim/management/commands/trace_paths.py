@@ -5,6 +5,7 @@ from django.db import connection
 from nautobot.circuits.models import CircuitTermination
 from nautobot.dcim.models import (
     CablePath,
+    CablePathTracer,
     ConsolePort,
     ConsoleServerPort,
     Interface,
@@ -12,7 +13,6 @@ from nautobot.dcim.models import (
     PowerOutlet,
     PowerPort,
 )
-from nautobot.dcim.signals import create_cablepath
 
 ENDPOINT_MODELS = (
     CircuitTermination,
@@ -24,6 +24,9 @@ ENDPOINT_MODELS = (
     PowerPort,
 )
 
+# Number of path origins to trace and save at a time
+BATCH_SIZE = 1000
+
 
 class Command(BaseCommand):
     help = "Generate any missing cable paths among all cable termination objects in Nautobot"
@@ -78,22 +81,24 @@ class Command(BaseCommand):
                 for sql in sequence_sql:
                     cursor.execute(sql)
 
-        # Retrace paths
+        # Retrace paths against an in-memory snapshot of the cable graph
+        self.stdout.write("Loading cables and pass-through ports...")
+        tracer = CablePathTracer()
         for model in ENDPOINT_MODELS:
             origins = model.objects.filter(cable__isnull=False)
             if not options["force"]:
                 origins = origins.filter(_path__isnull=True)
-            origins_count = origins.count()
+            origin_pks = list(origins.values_list("pk", flat=True))
+            origins_count = len(origin_pks)
             if not origins_count:
                 self.stdout.write(f"Found no missing {model._meta.verbose_name} paths; skipping")
                 continue
             self.stdout.write(f"Retracing {origins_count} cabled {model._meta.verbose_name_plural}...")
-            i = 0
-            for i, obj in enumerate(origins, start=1):
-                create_cablepath(obj)
-                if not i % 100:
-                    self.draw_progress_bar(i * 100 / origins_count)
+            for i in range(0, origins_count, BATCH_SIZE):
+                batch = model.objects.filter(pk__in=origin_pks[i : i + BATCH_SIZE]).only("pk")
+                tracer.create_cablepaths(batch, batch_size=BATCH_SIZE)
+                self.draw_progress_bar(min(i + BATCH_SIZE, origins_count) * 100 / origins_count)
             self.draw_progress_bar(100)
-            self.stdout.write(self.style.SUCCESS(f"\n  Retraced {i} {model._meta.verbose_name_plural}"))
+            self.stdout.write(self.style.SUCCESS(f"\n  Retraced {origins_count} {model._meta.verbose_name_plural}"))
 
         self.stdout.write(self.style.SUCCESS("Finished."))
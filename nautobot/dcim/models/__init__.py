@@ -1,4 +1,4 @@
-from .cables import Cable, CablePath
+from .cables import Cable, CablePath, CablePathTracer
 from .device_component_templates import (
     ConsolePortTemplate,
     ConsoleServerPortTemplate,
@@ -55,6 +55,7 @@ __all__ = (
     "BaseInterface",
     "Cable",
     "CablePath",
+    "CablePathTracer",
     "CableTermination",
     "ConsolePort",
     "ConsolePortTemplate",
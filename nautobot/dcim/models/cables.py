@@ -4,8 +4,8 @@ import logging
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ObjectDoesNotExist, ValidationError
-from django.db import models
-from django.db.models import Sum
+from django.db import connection, models, transaction
+from django.db.models import OuterRef, Q, Subquery, Sum
 from django.utils.functional import classproperty
 
 from nautobot.core.constants import CHARFIELD_MAX_LENGTH
@@ -15,6 +15,7 @@ from nautobot.dcim.choices import CableLengthUnitChoices, CableTypeChoices
 from nautobot.dcim.constants import CABLE_TERMINATION_MODELS, COMPATIBLE_TERMINATION_TYPES, NONCONNECTABLE_IFACE_TYPES
 from nautobot.dcim.fields import JSONPathField
 from nautobot.dcim.utils import (
+    compile_path_node,
     decompile_path_node,
     object_to_path_node,
     path_node_to_object,
@@ -34,6 +35,7 @@ from .devices import Device
 __all__ = (
     "Cable",
     "CablePath",
+    "CablePathTracer",
 )
 
 logger = logging.getLogger(__name__)
@@ -481,3 +483,222 @@ class CablePath(BaseModel):
         """
         rearport = path_node_to_object(self.path[-1])
         return FrontPort.objects.filter(rear_port=rearport)
+
+
+class CablePathTracer:
+    """
+    Trace many CablePaths at once against an in-memory graph of all cables, pass-through ports and circuits.
+
+    Where `CablePath.from_origin()` queries the database at every hop of every path, this class loads the cable graph
+    up front in a constant number of bulk queries, after which tracing a path requires no further queries. Use it when
+    (re)computing the paths of many origins at once, such as in the `trace_paths` management command:
+
+        tracer = CablePathTracer()
+        tracer.create_cablepaths(Interface.objects.filter(cable__isnull=False))
+
+    The graph is a snapshot taken when the tracer is instantiated; it does not reflect any later changes to cables.
+    """
+
+    def __init__(self):
+        # Import added here to avoid circular imports with Cable.
+        from nautobot.circuits.models import CircuitTermination
+
+        self.cable_ct_id = ContentType.objects.get_for_model(Cable).pk
+        self.front_port_ct_id = ContentType.objects.get_for_model(FrontPort).pk
+        self.rear_port_ct_id = ContentType.objects.get_for_model(RearPort).pk
+        self.circuit_termination_ct_id = ContentType.objects.get_for_model(CircuitTermination).pk
+        status_connected = Cable.STATUS_CONNECTED
+        self.status_connected_id = status_connected.pk if status_connected is not None else None
+
+        # {(termination type ID, termination ID): (cable ID, cable status ID, (peer type ID, peer ID))}
+        self.cable_peers = {}
+        for cable_id, status_id, a_type_id, a_id, b_type_id, b_id in Cable.objects.values_list(
+            "pk", "status_id", "termination_a_type_id", "termination_a_id", "termination_b_type_id", "termination_b_id"
+        ):
+            self.cable_peers[(a_type_id, a_id)] = (cable_id, status_id, (b_type_id, b_id))
+            self.cable_peers[(b_type_id, b_id)] = (cable_id, status_id, (a_type_id, a_id))
+
+        # Only pass-through ports that can be part of a path (i.e. that are cabled, or whose peer port is) are needed.
+        # {front port ID: (rear port ID, rear port position)} and {(rear port ID, rear port position): front port ID}
+        self.front_ports = {}
+        self.front_ports_by_position = {}
+        for front_port_id, rear_port_id, rear_port_position in FrontPort.objects.filter(
+            Q(cable__isnull=False) | Q(rear_port__cable__isnull=False)
+        ).values_list("pk", "rear_port_id", "rear_port_position"):
+            self.front_ports[front_port_id] = (rear_port_id, rear_port_position)
+            self.front_ports_by_position[(rear_port_id, rear_port_position)] = front_port_id
+
+        # {rear port ID: positions}
+        self.rear_port_positions = dict(
+            RearPort.objects.filter(Q(cable__isnull=False) | Q(front_ports__cable__isnull=False))
+            .distinct()
+            .values_list("pk", "positions")
+        )
+
+        # {circuit termination ID: (circuit ID, term side)} and {(circuit ID, term side): circuit termination ID}
+        self.circuit_terminations = {}
+        self.circuit_terminations_by_side = {}
+        for termination_id, circuit_id, term_side in CircuitTermination.objects.values_list(
+            "pk", "circuit_id", "term_side"
+        ):
+            self.circuit_terminations[termination_id] = (circuit_id, term_side)
+            self.circuit_terminations_by_side[(circuit_id, term_side)] = termination_id
+
+    def trace(self, origin):
+        """
+        Return a new (unsaved) CablePath instance as traced from the given path origin, equivalent to
+        `CablePath.from_origin(origin)`.
+        """
+        if origin is None:
+            return None
+        return self._trace(ContentType.objects.get_for_model(origin).pk, origin.pk)
+
+    def _trace(self, origin_type_id, origin_id):
+        if (origin_type_id, origin_id) not in self.cable_peers:
+            return None
+
+        destination = None
+        path = []
+        position_stack = []
+        is_active = True
+        is_split = False
+
+        node = (origin_type_id, origin_id)
+        visited_nodes = set()
+        while node in self.cable_peers:
+            if node[1] in visited_nodes:
+                raise ValidationError("a loop is detected in the path")
+            visited_nodes.add(node[1])
+            cable_id, cable_status_id, peer_termination = self.cable_peers[node]
+            if cable_status_id != self.status_connected_id:
+                is_active = False
+
+            # Follow the cable to its far-end termination
+            path.append(compile_path_node(self.cable_ct_id, cable_id))
+            peer_type_id, peer_id = peer_termination
+
+            # Follow a FrontPort to its corresponding RearPort
+            if peer_type_id == self.front_port_ct_id:
+                path.append(compile_path_node(*peer_termination))
+                rear_port_id, rear_port_position = self.front_ports[peer_id]
+                node = (self.rear_port_ct_id, rear_port_id)
+                if self.rear_port_positions[rear_port_id] > 1:
+                    position_stack.append(rear_port_position)
+                path.append(compile_path_node(*node))
+
+            # Follow a RearPort to its corresponding FrontPort (if any)
+            elif peer_type_id == self.rear_port_ct_id:
+                path.append(compile_path_node(*peer_termination))
+
+                # Determine the peer FrontPort's position
+                if self.rear_port_positions[peer_id] == 1:
+                    position = 1
+                elif position_stack:
+                    position = position_stack.pop()
+                else:
+                    # No position indicated: path has split, so we stop at the RearPort
+                    is_split = True
+                    break
+
+                front_port_id = self.front_ports_by_position.get((peer_id, position))
+                if front_port_id is None:
+                    # No corresponding FrontPort found for the RearPort
+                    break
+                node = (self.front_port_ct_id, front_port_id)
+                path.append(compile_path_node(*node))
+
+            # Follow a Circuit Termination if there is a corresponding Circuit Termination
+            elif peer_type_id == self.circuit_termination_ct_id:
+                circuit_id, term_side = self.circuit_terminations[peer_id]
+                peer_side = "Z" if term_side == "A" else "A"
+                far_termination_id = self.circuit_terminations_by_side.get((circuit_id, peer_side))
+                # A Circuit Termination does not require a peer.
+                if far_termination_id is None:
+                    destination = peer_termination
+                    break
+                node = (self.circuit_termination_ct_id, far_termination_id)
+                path.append(compile_path_node(*peer_termination))
+                path.append(compile_path_node(*node))
+
+            # Anything else marks the end of the path
+            else:
+                destination = peer_termination
+                break
+
+        if destination is None:
+            is_active = False
+
+        return CablePath(
+            origin_type_id=origin_type_id,
+            origin_id=origin_id,
+            destination_type_id=destination[0] if destination else None,
+            destination_id=destination[1] if destination else None,
+            path=path,
+            is_active=is_active,
+            is_split=is_split,
+        )
+
+    def create_cablepaths(self, origins, batch_size=1000):
+        """
+        Trace the CablePaths of all of the given path origins and save them to the database.
+
+        Paths are written with bulk upserts, replacing any existing CablePath of each origin, and the `_path` of each
+        origin is updated with a single query per batch and origin model. Any existing CablePath of an origin that no
+        longer has a path (because it is not cabled) is deleted.
+
+        Args:
+            origins (Iterable[PathEndpoint]): Path origins to trace, such as a QuerySet of Interfaces.
+            batch_size (int): Number of origins to process within each database transaction.
+
+        Returns:
+            (int): The number of CablePaths created or updated.
+        """
+        count = 0
+        batch = []
+        for origin in origins:
+            batch.append(origin)
+            if len(batch) >= batch_size:
+                count += self._create_cablepaths(batch)
+                batch = []
+        if batch:
+            count += self._create_cablepaths(batch)
+        return count
+
+    def _create_cablepaths(self, origins):
+        cable_paths = []
+        origin_ids_by_model = defaultdict(list)
+        untraced_ids_by_type = defaultdict(list)
+        for origin in origins:
+            origin_type_id = ContentType.objects.get_for_model(origin).pk
+            cable_path = self._trace(origin_type_id, origin.pk)
+            if cable_path is None:
+                untraced_ids_by_type[origin_type_id].append(origin.pk)
+            else:
+                cable_paths.append(cable_path)
+                origin_ids_by_model[origin._meta.model].append(origin.pk)
+
+        with transaction.atomic():
+            for origin_type_id, origin_ids in untraced_ids_by_type.items():
+                CablePath.objects.filter(origin_type_id=origin_type_id, origin_id__in=origin_ids).delete()
+
+            CablePath.objects.bulk_create(
+                cable_paths,
+                update_conflicts=True,
+                # MySQL doesn't support (or need) specifying the conflicting fields
+                unique_fields=(
+                    ["origin_type", "origin_id"] if connection.features.supports_update_conflicts_with_target else None
+                ),
+                update_fields=["destination_type", "destination_id", "path", "is_active", "is_split"],
+            )
+
+            # Record a direct reference to each CablePath on its originating object
+            for model, origin_ids in origin_ids_by_model.items():
+                model.objects.filter(pk__in=origin_ids).update(
+                    _path=Subquery(
+                        CablePath.objects.filter(
+                            origin_type=ContentType.objects.get_for_model(model), origin_id=OuterRef("pk")
+                        ).values("pk")[:1]
+                    )
+                )
+
+        return len(cable_paths)
@@ -755,6 +755,8 @@ class Interface(ModularComponentModel, CableTermination, PathEndpoint, BaseInter
     speed = models.PositiveIntegerField(null=True, blank=True)
     duplex = models.CharField(max_length=10, choices=InterfaceDuplexChoices, blank=True, default="")
 
+    set_based_bulk_edit_fields = ("description", "enabled", "label", "mgmt_only", "mtu", "role", "status")
+
     class Meta(ModularComponentModel.Meta):
         ordering = ("device", "module__id", CollateAsChar("_name"))  # Module.ordering is complex; don't order by module
 
@@ -87,6 +87,8 @@ class Manufacturer(OrganizationalModel):
     name = models.CharField(max_length=CHARFIELD_MAX_LENGTH, unique=True)
     description = models.CharField(max_length=CHARFIELD_MAX_LENGTH, blank=True)
 
+    supports_bulk_import = True
+
     class Meta:
         ordering = ["name"]
 
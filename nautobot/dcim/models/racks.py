@@ -7,6 +7,7 @@ from django.db import models
 from django.db.models import Count, F, Q, Sum
 
 from nautobot.core.constants import CHARFIELD_MAX_LENGTH
+from nautobot.core.models import BaseManager
 from nautobot.core.models.fields import JSONArrayField, NaturalOrderingField
 from nautobot.core.models.generics import OrganizationalModel, PrimaryModel
 from nautobot.core.models.tree_queries import TreeModel
@@ -15,7 +16,8 @@ from nautobot.core.utils.config import get_settings_or_config
 from nautobot.core.utils.data import UtilizationData
 from nautobot.dcim.choices import DeviceFaceChoices, RackDimensionUnitChoices, RackTypeChoices, RackWidthChoices
 from nautobot.dcim.constants import RACK_ELEVATION_LEGEND_WIDTH_DEFAULT, RACK_U_HEIGHT_DEFAULT, RACK_U_HEIGHT_MAXIMUM
-from nautobot.dcim.elevations import RackElevationSVG
+from nautobot.dcim.elevations import RackElevationSVG, render_rack_elevation_svgs
+from nautobot.dcim.querysets import RackQuerySet
 from nautobot.extras.models import RoleField, StatusField
 from nautobot.extras.utils import extras_features
 
@@ -188,6 +190,8 @@ class Rack(PrimaryModel):
     dynamic_group_filter_fields = {}
     dynamic_group_skip_missing_fields = True  # Poor widget selection for `outer_depth` (no validators, limit supplied)
 
+    objects = BaseManager.from_queryset(RackQuerySet)()
+
     class Meta:
         ordering = ("location", "rack_group", "_name")  # (location, rack_group, name) may be non-unique
         unique_together = (
@@ -293,13 +297,21 @@ class Rack(PrimaryModel):
         # Add devices to rack units list
         if self.present_in_database:
             # Retrieve all devices installed within the rack
-            queryset = (
-                Device.objects.select_related("device_type", "device_type__manufacturer", "role")
-                .annotate(device_bay_count=Count("device_bays"))
-                .exclude(pk=exclude)
-                .filter(rack=self, position__gt=0, device_type__u_height__gt=0)
-                .filter(Q(face=face) | Q(device_type__is_full_depth=True))
-            )
+            if hasattr(self, "elevation_devices"):
+                # Devices were prefetched by render_rack_elevation_svgs()
+                queryset = [
+                    device
+                    for device in self.elevation_devices
+                    if device.pk != exclude and (device.face == face or device.device_type.is_full_depth)
+                ]
+            else:
+                queryset = (
+                    Device.objects.select_related("device_type", "device_type__manufacturer", "role")
+                    .annotate(device_bay_count=Count("device_bays"))
+                    .exclude(pk=exclude)
+                    .filter(rack=self, position__gt=0, device_type__u_height__gt=0)
+                    .filter(Q(face=face) | Q(device_type__is_full_depth=True))
+                )
 
             # Determine which devices the user has permission to view
             permitted_device_ids = []
@@ -340,26 +352,33 @@ class Rack(PrimaryModel):
         if exclude is not None:
             devices = devices.exclude(pk__in=exclude)
 
-        # Initialize the rack unit skeleton
-        units = list(range(1, self.u_height + 1))
+        occupied_units = self._get_occupied_units(devices, rack_face=rack_face)
 
-        # Remove units consumed by installed devices
-        for d in devices:
-            if rack_face is None or d.face == rack_face or d.device_type.is_full_depth:
-                for u in range(d.position, d.position + d.device_type.u_height):
-                    try:
-                        units.remove(u)
-                    except ValueError:
-                        # Found overlapping devices in the rack!
-                        pass
-
-        # Remove units without enough space above them to accommodate a device of the specified height
+        # Walk down from the top of the rack, keeping count of the contiguous free units at and above each unit, so as
+        # to skip units without enough space above them to accommodate a device of the specified height
         available_units = []
-        for u in units:
-            if set(range(u, u + u_height)).issubset(units):
+        free_units = 0
+        for u in range(self.u_height, 0, -1):
+            free_units = 0 if occupied_units[u] else free_units + 1
+            if free_units and free_units >= u_height:
                 available_units.append(u)
 
-        return list(reversed(available_units))
+        return available_units
+
+    def _get_occupied_units(self, devices, rack_face=None):
+        """
+        Get a bitmap of the units within the rack occupied by the given devices.
+
+        Returns:
+            (bytearray): One entry per unit, indexed by unit number (index 0 is unused), set to 1 if occupied.
+        """
+        occupied_units = bytearray(self.u_height + 1)
+        for d in devices:
+            if rack_face is None or d.face == rack_face or d.device_type.is_full_depth:
+                # Overlapping devices, or devices extending beyond the top of the rack, are tolerated here
+                for u in range(max(d.position, 1), min(d.position + d.device_type.u_height, self.u_height + 1)):
+                    occupied_units[u] = 1
+        return occupied_units
 
     def get_reserved_units(self):
         """
@@ -408,32 +427,81 @@ class Rack(PrimaryModel):
 
         return elevation.render(face, unit_width, unit_height, legend_width)
 
+    def render_elevation_svg(
+        self,
+        face=DeviceFaceChoices.FACE_FRONT,
+        user=None,
+        unit_width=None,
+        unit_height=None,
+        legend_width=RACK_ELEVATION_LEGEND_WIDTH_DEFAULT,
+        include_images=True,
+        base_url=None,
+        display_fullname=True,
+    ):
+        """
+        Return an SVG document of the rack elevation as a string, using a cached rendering if available.
+
+        Takes the same parameters as `get_elevation_svg()`. To render the elevations of many racks, use
+        `Rack.objects.filter(...).render_elevation_svgs()` instead.
+        """
+        return render_rack_elevation_svgs(
+            [self],
+            face=face,
+            user=user,
+            unit_width=unit_width,
+            unit_height=unit_height,
+            legend_width=legend_width,
+            include_images=include_images,
+            base_url=base_url,
+            display_fullname=display_fullname,
+        )[self.pk]
+
     def get_0u_devices(self):
         return self.devices.filter(position=0)
 
     def get_utilization(self):
         """Gets utilization numerator and denominator for racks.
 
+        When dealing with multiple racks, it is recommended to call `annotate_space_utilization()` on the queryset,
+        in which case the devices and reservations of all racks are retrieved at once.
+
         Returns:
             UtilizationData: (numerator=Occupied Unit Count, denominator=U Height of the rack)
         """
-        # Determine unoccupied units
-        available_units = self.get_available_units()
+        if hasattr(self, "utilization_devices"):
+            # Values were prefetched by RackQuerySet.annotate_space_utilization()
+            devices = self.utilization_devices
+            reserved_units = [u for reservation in self.utilization_reservations for u in reservation.units]
+        else:
+            devices = self.devices.select_related("device_type").filter(position__gte=1)
+            reserved_units = self.get_reserved_units()
 
-        # Remove reserved units
-        for u in self.get_reserved_units():
-            if u in available_units:
-                available_units.remove(u)
+        # Determine occupied units, including reserved units
+        occupied_units = self._get_occupied_units(devices)
+        for u in reserved_units:
+            if 1 <= u <= self.u_height:
+                occupied_units[u] = 1
 
         # Return the numerator and denominator as percentage is to be calculated later where needed
-        return UtilizationData(numerator=self.u_height - len(available_units), denominator=self.u_height)
+        return UtilizationData(numerator=sum(occupied_units), denominator=self.u_height)
 
     def get_power_utilization(self):
         """Determine the utilization numerator and denominator for power utilization on the rack.
 
+        When dealing with multiple racks, it is recommended to call `annotate_power_utilization()` on the queryset,
+        in which case the power utilization of each rack is computed by the database as part of the same query.
+
         Returns:
             UtilizationData: (numerator, denominator)
         """
+        if hasattr(self, "utilization_available_power"):
+            # Values were precomputed by RackQuerySet.annotate_power_utilization()
+            if not self.utilization_available_power:
+                return UtilizationData(numerator=0, denominator=0)
+            return UtilizationData(
+                numerator=int(self.utilization_direct_draw) + int(self.utilization_outlet_draw),
+                denominator=self.utilization_available_power,
+            )
 
         powerfeeds = PowerFeed.objects.filter(rack=self)
         available_power_total = sum(pf.available_power for pf in powerfeeds)
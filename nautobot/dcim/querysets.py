@@ -1,6 +1,116 @@
-from nautobot.core.models.querysets import ClusterToClustersQuerySetMixin
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import DecimalField, F, IntegerField, OuterRef, Prefetch, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+
+from nautobot.core.models.querysets import ClusterToClustersQuerySetMixin, RestrictedQuerySet
+from nautobot.dcim.elevations import render_rack_elevation_svgs
 from nautobot.extras.querysets import ConfigContextModelQuerySet
 
 
 class DeviceQuerySet(ClusterToClustersQuerySetMixin, ConfigContextModelQuerySet):
     pass
+
+
+class RackQuerySet(RestrictedQuerySet):
+    """Queryset for `Rack` objects."""
+
+    def annotate_space_utilization(self):
+        """
+        Prefetch the devices and reservations of each Rack that are needed to compute its space utilization, so that
+        `Rack.get_utilization()` doesn't need to query them for each Rack individually.
+
+        Because devices and reservations may overlap one another (for example, half-depth devices on opposite faces of
+        the same unit, or a reservation of units that are already occupied), the occupied units can't be counted by a
+        simple sum within the database; instead, the devices and reservations of all Racks in the queryset are
+        retrieved in one query each and the occupied units of each Rack are computed from them.
+
+        Attributes added:
+
+        - `utilization_devices`: the Devices occupying at least one unit of the Rack
+        - `utilization_reservations`: the RackReservations of the Rack
+        """
+        from nautobot.dcim.models import Device, RackReservation
+
+        return self.prefetch_related(
+            Prefetch(
+                "devices",
+                queryset=Device.objects.filter(position__gte=1).select_related("device_type").order_by(),
+                to_attr="utilization_devices",
+            ),
+            Prefetch(
+                "rack_reservations",
+                queryset=RackReservation.objects.order_by(),
+                to_attr="utilization_reservations",
+            ),
+        )
+
+    def annotate_power_utilization(self):
+        """
+        Annotate each Rack with the values needed to compute its power utilization, so that
+        `Rack.get_power_utilization()` doesn't need to run several aggregate queries for each Rack individually.
+
+        Annotations added:
+
+        - `utilization_available_power`: the total available power of the PowerFeeds in the Rack
+        - `utilization_direct_draw`: the total draw of the PowerPorts directly connected to those PowerFeeds
+        - `utilization_outlet_draw`: the total draw of the PowerPorts connected to the PowerOutlets that are fed by
+          those PowerPorts
+        """
+        from nautobot.dcim.models import PowerFeed, PowerOutlet, PowerPort
+
+        powerfeed_ct = ContentType.objects.get_for_model(PowerFeed)
+        poweroutlet_ct = ContentType.objects.get_for_model(PowerOutlet)
+        draw = Sum(F("allocated_draw") / F("power_factor"))
+        draw_field = DecimalField(max_digits=20, decimal_places=4)
+
+        available_power = (
+            PowerFeed.objects.filter(rack_id=OuterRef("pk"))
+            .order_by()
+            .values("rack_id")
+            .annotate(total=Sum("available_power"))
+            .values("total")
+        )
+        direct_draw = (
+            PowerPort.objects.filter(
+                _cable_peer_type=powerfeed_ct,
+                _cable_peer_id__in=PowerFeed.objects.filter(rack_id=OuterRef(OuterRef("pk"))).values("id"),
+            )
+            .order_by()
+            .values("_cable_peer_type")
+            .annotate(total=draw)
+            .values("total")
+        )
+        outlet_draw = (
+            PowerPort.objects.filter(
+                _cable_peer_type=poweroutlet_ct,
+                _cable_peer_id__in=PowerOutlet.objects.filter(
+                    power_port__in=PowerPort.objects.filter(
+                        _cable_peer_type=powerfeed_ct,
+                        _cable_peer_id__in=PowerFeed.objects.filter(
+                            rack_id=OuterRef(OuterRef(OuterRef(OuterRef("pk"))))
+                        ).values("id"),
+                    )
+                ).values("id"),
+            )
+            .order_by()
+            .values("_cable_peer_type")
+            .annotate(total=draw)
+            .values("total")
+        )
+
+        return self.annotate(
+            utilization_available_power=Coalesce(Subquery(available_power), Value(0), output_field=IntegerField()),
+            utilization_direct_draw=Coalesce(Subquery(direct_draw), Value(0), output_field=draw_field),
+            utilization_outlet_draw=Coalesce(Subquery(outlet_draw), Value(0), output_field=draw_field),
+        )
+
+    def render_elevation_svgs(self, **kwargs):
+        """
+        Render the elevations of all Racks in the queryset as SVG documents, using cached renderings where available.
+
+        Takes the same keyword arguments as `Rack.get_elevation_svg()`; see `render_rack_elevation_svgs()`.
+
+        Returns:
+            (dict): `{rack.pk: svg_document_string, ...}`
+        """
+        return render_rack_elevation_svgs(self, **kwargs)
@@ -1,18 +1,21 @@
 import logging
 
+from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
 from django.db import transaction
-from django.db.models.signals import m2m_changed, post_save, pre_delete
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete, pre_save
 from django.dispatch import receiver
 
 from nautobot.core.signals import disable_for_loaddata
 
+from .elevations import invalidate_rack_elevation_cache
 from .models import (
     Cable,
     CablePath,
     ControllerManagedDeviceGroup,
     Device,
+    DeviceBay,
     DeviceRedundancyGroup,
     Interface,
     InterfaceVDCAssignment,
@@ -21,6 +24,7 @@ from .models import (
     PowerPanel,
     Rack,
     RackGroup,
+    RackReservation,
     VirtualChassis,
 )
 from .utils import validate_interface_tagged_vlans
@@ -151,6 +155,51 @@ def handle_rack_location_change(instance, created, raw=False, **kwargs):
                 device.save()
 
 
+#
+# Rack elevation cache
+#
+
+
+@receiver(post_save, sender=Rack)
+@receiver(post_delete, sender=Rack)
+def invalidate_rack_elevation_cache_for_rack(instance, raw=False, **kwargs):
+    """Invalidate the cached elevations of a Rack when it is changed."""
+    if raw or not settings.RACK_ELEVATION_CACHE_TIMEOUT:
+        return
+    invalidate_rack_elevation_cache(instance.pk)
+
+
+@receiver(post_save, sender=Device)
+@receiver(post_delete, sender=Device)
+@receiver(post_save, sender=RackReservation)
+@receiver(post_delete, sender=RackReservation)
+def invalidate_rack_elevation_cache_for_rack_contents(instance, raw=False, **kwargs):
+    """Invalidate the cached elevations of the Rack containing a Device or RackReservation when it is changed."""
+    if raw or not settings.RACK_ELEVATION_CACHE_TIMEOUT:
+        return
+    invalidate_rack_elevation_cache(instance.rack_id)
+
+
+@receiver(pre_save, sender=Device)
+def invalidate_rack_elevation_cache_for_moved_device(instance, raw=False, **kwargs):
+    """Invalidate the cached elevations of the Rack that a Device is being moved out of."""
+    if raw or not settings.RACK_ELEVATION_CACHE_TIMEOUT or not instance.present_in_database:
+        return
+    original_rack_id = Device.objects.filter(pk=instance.pk).values_list("rack_id", flat=True).first()
+    if original_rack_id != instance.rack_id:
+        invalidate_rack_elevation_cache(original_rack_id)
+
+
+@receiver(post_save, sender=DeviceBay)
+@receiver(post_delete, sender=DeviceBay)
+def invalidate_rack_elevation_cache_for_device_bay(instance, raw=False, **kwargs):
+    """Invalidate the cached elevations of the Rack containing a DeviceBay's parent Device when it is changed."""
+    if raw or not settings.RACK_ELEVATION_CACHE_TIMEOUT:
+        return
+    rack_id = Device.objects.filter(pk=instance.device_id).values_list("rack_id", flat=True).first()
+    invalidate_rack_elevation_cache(rack_id)
+
+
 #
 # Device redundancy group
 #
@@ -1,7 +1,7 @@
 import datetime
 import json
 import tempfile
-from unittest import skip
+from unittest import mock, skip
 
 from constance.test import override_config
 from django.contrib.auth import get_user_model
@@ -28,6 +28,7 @@ from nautobot.dcim.choices import (
     SoftwareImageFileHashingAlgorithmChoices,
     SubdeviceRoleChoices,
 )
+from nautobot.dcim.elevations import RackElevationSVG
 from nautobot.dcim.models import (
     Cable,
     ConsolePort,
@@ -918,6 +919,46 @@ class RackTest(APIViewTestCases.APIViewTestCase):
         self.assertEqual(response.get("Content-Type"), "image/svg+xml")
         self.assertIn(b'<text class="unit" x="15.0" y="915.0">01</text>', response.content)
 
+    @override_settings(RACK_ELEVATION_CACHE_TIMEOUT=300)
+    def test_get_rack_elevation_svg_cached(self):
+        """
+        GET a single rack elevation in SVG format, with caching of rendered elevations enabled.
+        """
+        rack = Rack.objects.get(name="Populated Rack")
+        device = rack.devices.first()
+        device.name = "Cached Device"
+        device.save()
+        self.add_permissions("dcim.view_rack", "dcim.view_device")
+        url = f"{reverse('dcim-api:rack-elevation', kwargs={'pk': rack.pk})}?render=svg"
+
+        response = self.client.get(url, **self.header)
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertIn(b"Cached Device", response.content)
+
+        # The same elevation is served from the cache without being rendered again
+        with mock.patch.object(RackElevationSVG, "render") as mock_render:
+            cached_response = self.client.get(url, **self.header)
+        mock_render.assert_not_called()
+        self.assertEqual(cached_response.content, response.content)
+
+        # Changes to devices in the rack invalidate the cached elevation
+        device.name = "Renamed Device"
+        device.save()
+        response = self.client.get(url, **self.header)
+        self.assertIn(b"Renamed Device", response.content)
+        self.assertNotIn(b"Cached Device", response.content)
+
+        # An elevation cached by another request before the change is committed is invalidated on commit
+        with self.captureOnCommitCallbacks(execute=True):
+            device.name = "Committed Device"
+            device.save()
+            # Simulate a concurrent request caching an elevation rendered from the previously committed state
+            with mock.patch.object(RackElevationSVG, "render", return_value=mock.Mock(tostring=lambda: "stale")):
+                self.assertEqual(self.client.get(url, **self.header).content, b"stale")
+        response = self.client.get(url, **self.header)
+        self.assertIn(b"Committed Device", response.content)
+        self.assertNotEqual(response.content, b"stale")
+
     @override_settings(RACK_ELEVATION_DEFAULT_UNIT_HEIGHT=22, RACK_ELEVATION_DEFAULT_UNIT_WIDTH=230)
     def test_get_rack_elevation_svg_front_face_device_rendering(self):
         """Test that a front-facing device is rendered with role color rect and status square on front face SVG."""
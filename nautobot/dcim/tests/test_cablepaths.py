@@ -6,6 +6,7 @@ from nautobot.circuits.models import Circuit, CircuitTermination, CircuitType, P
 from nautobot.dcim.models import (
     Cable,
     CablePath,
+    CablePathTracer,
     ConsolePort,
     ConsoleServerPort,
     Device,
@@ -1494,3 +1495,70 @@ class CablePathTestCase(TestCase):
                 rearport1: 2,
             }
         )
+
+    def test_401_bulk_trace_paths(self):
+        """
+        Check that CablePathTracer produces the same paths as CablePath.from_origin():
+
+        [IF1] --C1-- [FP1:1] [RP1] --C3-- [RP2] [FP2:1] --C4-- [CT1A] [CT1Z] --C5-- [IF3]
+        [IF2] --C2-- [FP1:2]                    [FP2:2] --C6 (planned)-- [IF4]
+                                          [RP3] --C7-- [IF5]
+        """
+        interfaces = [
+            Interface.objects.create(device=self.device, name=f"Interface {i}", status=self.interface_status)
+            for i in range(1, 6)
+        ]
+        rearport1 = RearPort.objects.create(device=self.device, name="Rear Port 1", positions=2)
+        rearport2 = RearPort.objects.create(device=self.device, name="Rear Port 2", positions=2)
+        rearport3 = RearPort.objects.create(device=self.device, name="Rear Port 3", positions=4)
+        frontport1_1 = FrontPort.objects.create(
+            device=self.device, name="Front Port 1:1", rear_port=rearport1, rear_port_position=1
+        )
+        frontport1_2 = FrontPort.objects.create(
+            device=self.device, name="Front Port 1:2", rear_port=rearport1, rear_port_position=2
+        )
+        frontport2_1 = FrontPort.objects.create(
+            device=self.device, name="Front Port 2:1", rear_port=rearport2, rear_port_position=1
+        )
+        frontport2_2 = FrontPort.objects.create(
+            device=self.device, name="Front Port 2:2", rear_port=rearport2, rear_port_position=2
+        )
+        circuittermination1 = CircuitTermination.objects.create(
+            circuit=self.circuit, location=self.location, term_side="A"
+        )
+        circuittermination2 = CircuitTermination.objects.create(
+            circuit=self.circuit, location=self.location, term_side="Z"
+        )
+        for termination_a, termination_b, status in (
+            (interfaces[0], frontport1_1, self.status),
+            (interfaces[1], frontport1_2, self.status),
+            (rearport1, rearport2, self.status),
+            (frontport2_1, circuittermination1, self.status),
+            (circuittermination2, interfaces[2], self.status),
+            (frontport2_2, interfaces[3], self.status_planned),
+            (rearport3, interfaces[4], self.status),
+        ):
+            Cable.objects.create(termination_a=termination_a, termination_b=termination_b, status=status)
+
+        origins = [*interfaces, circuittermination1, circuittermination2]
+        fields = ("origin_type", "origin_id", "destination_type", "destination_id", "path", "is_active", "is_split")
+        expected_paths = list(CablePath.objects.order_by("origin_id").values_list(*fields))
+        self.assertEqual(len(expected_paths), len(origins))
+
+        # Retrace all paths from scratch
+        CablePath.objects.all().delete()
+        tracer = CablePathTracer()
+        with self.assertNumQueries(0):
+            for origin in origins:
+                tracer.trace(origin)
+        self.assertEqual(tracer.create_cablepaths(origins), len(origins))
+        self.assertEqual(list(CablePath.objects.order_by("origin_id").values_list(*fields)), expected_paths)
+        for origin in origins:
+            origin.refresh_from_db()
+            self.assertPathIsSet(origin, CablePath.objects.get(origin_id=origin.pk))
+
+        # Retracing existing paths updates them in place
+        cable_path_pks = set(CablePath.objects.values_list("pk", flat=True))
+        self.assertEqual(tracer.create_cablepaths(origins), len(origins))
+        self.assertEqual(set(CablePath.objects.values_list("pk", flat=True)), cable_path_pks)
+        self.assertEqual(list(CablePath.objects.order_by("origin_id").values_list(*fields)), expected_paths)
@@ -71,6 +71,7 @@ from nautobot.dcim.models import (
     PowerPortTemplate,
     Rack,
     RackGroup,
+    RackReservation,
     RearPort,
     RearPortTemplate,
     SoftwareImageFile,
@@ -1250,6 +1251,63 @@ class RackTestCase(ModelTestCases.BaseModelTestCase):
             rack.validated_save()
         self.assertIn('Racks may not associate to locations of type "Location Type B"', str(cm.exception))
 
+    def test_space_utilization(self):
+        half_depth_type = DeviceType.objects.create(
+            manufacturer=self.manufacturer, model="HalfDepth 2U", u_height=2, is_full_depth=False
+        )
+        for name, device_type, position, face in (
+            ("Full Depth", self.device_type["ff2048"], 10, DeviceFaceChoices.FACE_FRONT),
+            ("Half Depth Front", half_depth_type, 20, DeviceFaceChoices.FACE_FRONT),
+            ("Half Depth Rear", half_depth_type, 20, DeviceFaceChoices.FACE_REAR),
+        ):
+            Device.objects.create(
+                name=name,
+                device_type=device_type,
+                role=self.device_roles[0],
+                status=self.device_status,
+                location=self.location1,
+                rack=self.rack,
+                position=position,
+                face=face,
+            )
+        user = User.objects.create(username="Test User", is_active=True)
+        RackReservation.objects.create(rack=self.rack, units=[10, 11, 30], user=user, description="Reserved")
+
+        self.assertEqual(
+            self.rack.get_available_units(u_height=2, rack_face=DeviceFaceChoices.FACE_FRONT),
+            [u for u in range(41, 0, -1) if u not in (9, 10, 19, 20, 21)],
+        )
+        self.assertEqual(self.rack.get_utilization(), (5, 42))
+
+        # RackQuerySet.annotate_space_utilization() should produce the same results in bulk
+        with self.assertNumQueries(3):
+            annotated_racks = list(Rack.objects.annotate_space_utilization())
+        for annotated_rack in annotated_racks:
+            with self.subTest(rack=str(annotated_rack)):
+                with self.assertNumQueries(0):
+                    utilization = annotated_rack.get_utilization()
+                self.assertEqual(utilization, Rack.objects.get(pk=annotated_rack.pk).get_utilization())
+
+    def test_render_elevation_svgs(self):
+        Device.objects.create(
+            name="TestSwitch1",
+            device_type=self.device_type["ff2048"],
+            role=self.device_roles[0],
+            status=self.device_status,
+            location=self.location1,
+            rack=self.rack,
+            position=10,
+            face=DeviceFaceChoices.FACE_FRONT,
+        )
+        racks = Rack.objects.filter(location=self.location1)
+        for face in DeviceFaceChoices.values():
+            with self.subTest(face=face):
+                svgs = racks.render_elevation_svgs(face=face)
+                self.assertEqual(set(svgs), {rack.pk for rack in racks})
+                for rack in racks:
+                    self.assertEqual(svgs[rack.pk], rack.get_elevation_svg(face=face).tostring())
+                self.assertIn("TestSwitch1", svgs[self.rack.pk])
+
 
 class LocationTypeTestCase(TestCase):
     def test_reserved_names(self):
@@ -888,6 +888,22 @@ class RackTestCase(ViewTestCases.PrimaryObjectViewTestCase):
         """
         self.assertContains(response, total_utilization_html, html=True)
 
+        # RackQuerySet.annotate_power_utilization() should produce the same results in bulk
+        with self.assertNumQueries(1):
+            annotated_racks = list(Rack.objects.annotate_power_utilization())
+        for annotated_rack in annotated_racks:
+            with self.subTest(rack=str(annotated_rack)):
+                expected_utilization = Rack.objects.get(pk=annotated_rack.pk).get_power_utilization()
+                self.assertEqual(annotated_rack.get_power_utilization(), expected_utilization)
+
+        # The rack list view computes the utilization of the whole page of racks at once
+        response = self.client.get(f"{reverse('dcim:rack_list')}?id={self.racks[0].pk}")
+        self.assertHttpStatus(response, 200)
+        self.assertContains(response, total_utilization_html, html=True)
+        for rack in response.context["table"].data:
+            self.assertTrue(hasattr(rack, "utilization_available_power"))
+            self.assertTrue(hasattr(rack, "utilization_devices"))
+
 
 class DeviceFamilyTestCase(ViewTestCases.PrimaryObjectViewTestCase):
     model = DeviceFamily
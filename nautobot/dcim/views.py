@@ -4,6 +4,7 @@ from functools import partial
 import logging
 import uuid
 
+from django.conf import settings
 from django.contrib import messages
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ObjectDoesNotExist, PermissionDenied, ValidationError
@@ -103,6 +104,7 @@ from . import filters, forms, tables
 from .api import serializers
 from .choices import DeviceFaceChoices
 from .constants import DEVICE_RECURSION_DEPTH_LIMIT, NONCONNECTABLE_IFACE_TYPES
+from .elevations import render_rack_elevation_svgs
 from .models import (
     Cable,
     CablePath,
@@ -855,6 +857,13 @@ class RackUIViewSet(NautobotUIViewSet):
         }
     )
 
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action == "list":
+            # Compute the utilization shown in the table for the whole page of racks at once
+            queryset = queryset.annotate_space_utilization().annotate_power_utilization()
+        return queryset
+
     class ImageAttachmentObjectsTablePanel(object_detail.ObjectsTablePanel):
         def _get_table_add_url(self, context):
             request = context["request"]
@@ -1155,6 +1164,13 @@ class RackElevationListView(generic.ObjectListView):
         if rack_face not in DeviceFaceChoices.values():
             rack_face = DeviceFaceChoices.FACE_FRONT
 
+        if settings.RACK_ELEVATION_CACHE_TIMEOUT:
+            # Render all elevations on this page at once, so that the browser's subsequent request for each elevation
+            # (with the default parameters used by the template) can be served from the cache
+            render_rack_elevation_svgs(
+                page, face=rack_face, user=request.user, base_url=request.build_absolute_uri("/")
+            )
+
         return {
             "paginator": paginator,
             "page": page,
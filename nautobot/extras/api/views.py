@@ -739,7 +739,15 @@ class GraphQLQueryViewSet(NotesViewSetMixin, ModelViewSet):
     def run(self, request, pk):
         try:
             query = get_object_or_404(self.queryset, pk=pk)
-            result = execute_saved_query(query.name, variables=request.data.get("variables"), request=request)
+            result = execute_saved_query(
+                query.name, variables=request.data.get("variables"), request=request, enforce_cost_limits=True
+            )
+            if result.data is None and result.errors:
+                # The query was rejected outright, e.g. as invalid or as exceeding the configured cost limits
+                return Response(
+                    {"errors": [GraphQLView.format_error(error) for error in result.errors]},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
             return Response({"data": result.data, "errors": result.errors})
         except GraphQLError as error:
             return Response(
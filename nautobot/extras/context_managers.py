@@ -11,7 +11,7 @@ from nautobot.extras.choices import ObjectChangeEventContextChoices
 from nautobot.extras.constants import CHANGELOG_MAX_CHANGE_CONTEXT_DETAIL
 from nautobot.extras.models import ObjectChange
 from nautobot.extras.signals import change_context_state, get_user_if_authenticated
-from nautobot.extras.webhooks import enqueue_webhooks
+from nautobot.extras.webhooks import enqueue_batched_webhooks, enqueue_webhooks
 
 
 class ChangeContext:
@@ -36,6 +36,9 @@ class ChangeContext:
     """
 
     defer_object_changes = False  # advanced usage, for creating object changes in bulk
+    # When deferring, whether deleted objects should be serialized at deletion time (the default), or whether the caller
+    # is responsible for creating the ObjectChange records for deleted objects itself
+    serialize_deferred_deletions = True
 
     def __init__(
         self,
@@ -111,10 +114,14 @@ class ChangeContext:
             create_object_changes = []
             for key in self._object_change_batch(batch_size):
                 for entry in self.deferred_object_changes[key]:
-                    objectchange = entry["instance"].to_objectchange(entry["action"])
+                    # Deletions are serialized up front, as the instance no longer exists by the time we get here
+                    if "objectchange" in entry:
+                        objectchange = entry["objectchange"]
+                    else:
+                        objectchange = entry["instance"].to_objectchange(entry["action"])
                     if objectchange is not None:
                         objectchange.user = entry["user"]
-                        objectchange.user_name = objectchange.user.username
+                        objectchange.user_name = objectchange.user.username if objectchange.user else "Undefined"
                         objectchange.request_id = self.change_id
                         objectchange.change_context = self.context
                         objectchange.change_context_detail = self.context_detail[:CHANGELOG_MAX_CHANGE_CONTEXT_DETAIL]
@@ -124,6 +131,11 @@ class ChangeContext:
                             # Set the component fields individually:
                             objectchange.changed_object_id = entry.get("changed_object_id")
                             objectchange.changed_object_type = entry.get("changed_object_type")
+                        elif "objectchange" in entry:
+                            # The changed object (and possibly the related object) may have been deleted since;
+                            # drop the cached GenericForeignKey instances but keep the IDs that were recorded.
+                            objectchange._state.fields_cache.pop("changed_object", None)
+                            objectchange._state.fields_cache.pop("related_object", None)
                         create_object_changes.append(objectchange)
                 self.deferred_object_changes.pop(key, None)
             ObjectChange.objects.bulk_create(create_object_changes, batch_size=batch_size)
@@ -230,9 +242,13 @@ def web_request_context(
         # In bulk operations, we are performing the same action (create/update/delete) on the same content-type.
         # Save some repeated database queries by reusing the same evaluated querysets where applicable:
         jobhook_queryset = None
-        webhook_queryset = None
         last_action = None
         last_content_type = None
+        # Webhooks to call, keyed by (content_type_id, action), so they're only looked up once per request
+        webhook_querysets = {}
+        # Changes to send to Webhooks with batch delivery enabled, keyed by Webhook PK
+        batched_webhook_changes = {}
+        user_name = None
         # enqueue jobhooks and webhooks, use change_context.change_id in case change_id was not supplied
         for oc in (
             ObjectChange.objects.select_related("changed_object_type", "user")
@@ -242,7 +258,6 @@ def web_request_context(
         ):
             if oc.action != last_action or oc.changed_object_type != last_content_type:
                 jobhook_queryset = None
-                webhook_queryset = None
 
             if context != ObjectChangeEventContextChoices.CONTEXT_JOB_HOOK:
                 # Make sure JobHooks are up to date (only once) before calling them
@@ -258,7 +273,14 @@ def web_request_context(
                 pre_object_data.get(str(oc.changed_object_id), None) if pre_object_data else None,
                 pre_object_data_v2.get(str(oc.changed_object_id), None) if pre_object_data_v2 else None,
             )
-            webhook_queryset = enqueue_webhooks(oc, snapshots=snapshots, webhook_queryset=webhook_queryset)
+            webhook_key = (oc.changed_object_type_id, oc.action)
+            webhook_querysets[webhook_key] = enqueue_webhooks(
+                oc,
+                snapshots=snapshots,
+                webhook_queryset=webhook_querysets.get(webhook_key),
+                batched_changes=batched_webhook_changes,
+            )
+            user_name = oc.user_name
 
             # topic examples: "nautobot.change.dcim.device", "nautobot.add.ipam.ipaddress"
             event_topic = f"nautobot.{oc.action}.{oc.changed_object_type.app_label}.{oc.changed_object_type.model}"
@@ -275,18 +297,42 @@ def web_request_context(
             last_action = oc.action
             last_content_type = oc.changed_object_type
 
+        if batched_webhook_changes:
+            enqueue_batched_webhooks(batched_webhook_changes, username=user_name, request_id=change_context.change_id)
+
 
 @contextmanager
 def deferred_change_logging_for_bulk_operation():
     """
-    Defers change logging until the end of the context manager to improve performance. For use with bulk edit views. This
-    context manager is wrapped in an atomic transaction.
+    Defers change logging until the end of the context manager to improve performance. For use with bulk edit views,
+    bulk REST API operations, and Jobs that create or modify many objects. This context manager is wrapped in an atomic
+    transaction.
+
+    Rather than one `INSERT` per change, the ObjectChange records for all objects created, updated, or deleted within
+    this context are written with `bulk_create()` once the wrapped code completes successfully. If an exception is
+    raised, the transaction is rolled back and no ObjectChange records are written.
+
+    If change logging is already being deferred by an enclosing use of this context manager, nested uses simply
+    participate in the enclosing deferral.
     """
 
     change_context = change_context_state.get()
     if change_context is None:
         raise ValueError("Change logging must be enabled before using deferred_change_logging_for_bulk_operation")
 
+    if change_context.defer_object_changes:
+        # Already deferring; the outermost deferred context will flush all changes.
+        # If this inner block is rolled back, make sure we don't go on to log its changes regardless.
+        prior_keys = set(change_context.deferred_object_changes)
+        try:
+            with transaction.atomic():
+                yield
+        except Exception:
+            for key in set(change_context.deferred_object_changes) - prior_keys:
+                change_context.deferred_object_changes.pop(key, None)
+            raise
+        return
+
     with transaction.atomic():
         try:
             change_context.defer_object_changes = True
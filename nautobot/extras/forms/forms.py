@@ -2600,6 +2600,7 @@ class WebhookBulkEditForm(BootstrapMixin, NoteModelBulkEditFormMixin):
     type_update = forms.NullBooleanField(required=False, widget=BulkEditNullBooleanSelect)
     type_delete = forms.NullBooleanField(required=False, widget=BulkEditNullBooleanSelect)
     ssl_verification = forms.NullBooleanField(required=False, widget=BulkEditNullBooleanSelect)
+    batch_delivery = forms.NullBooleanField(required=False, widget=BulkEditNullBooleanSelect)
 
     # Editable string fields
     payload_url = forms.CharField(required=False, max_length=500)
@@ -2663,6 +2664,7 @@ class WebhookForm(BootstrapMixin, forms.ModelForm):
             "secret",
             "ssl_verification",
             "ca_file_path",
+            "batch_delivery",
         )
 
     def clean(self):
@@ -20,7 +20,7 @@ from django.apps import apps
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.core.cache import cache
-from django.core.files.base import ContentFile
+from django.core.files.base import ContentFile, File
 from django.core.files.uploadedfile import UploadedFile
 from django.core.validators import RegexValidator
 from django.db.models import Model
@@ -32,6 +32,7 @@ from prometheus_client import Counter
 import yaml
 
 from nautobot.core.celery import import_jobs, nautobot_task
+from nautobot.core.celery.log import flush_job_logs
 from nautobot.core.events import publish_event
 from nautobot.core.forms import (
     DynamicModelChoiceField,
@@ -43,6 +44,7 @@ from nautobot.core.utils.cache import construct_cache_key
 from nautobot.core.utils.config import get_settings_or_config
 from nautobot.core.utils.logging import sanitize
 from nautobot.core.utils.lookup import get_model_from_name
+from nautobot.core.utils.profiling import SQLQueryProfiler
 from nautobot.extras.choices import (
     JobResultStatusChoices,
     ObjectChangeActionChoices,
@@ -178,18 +180,56 @@ class BaseJob:
                 )
 
                 pr = None
+                sql_profiler = SQLQueryProfiler()
                 try:
-                    with cProfile.Profile() as pr:
+                    with cProfile.Profile() as pr, sql_profiler:
                         return self.run(*args, **deserialized_kwargs)
                 finally:
+                    # Failing to save the profiling data must not mask the job's own return value or exception
                     if pr:
                         import marshal
 
                         pr.create_stats()
-                        self.create_file(profile_filename, content=marshal.dumps(pr.stats))
+                        try:
+                            self.create_file(profile_filename, content=marshal.dumps(pr.stats))
+                        except Exception as exc:
+                            self.logger.warning(
+                                "Unable to save profiling data: %s", exc, extra={"grouping": "profiling"}
+                            )
+                    try:
+                        self._save_sql_profile(sql_profiler)
+                    except Exception as exc:
+                        self.logger.warning(
+                            "Unable to save SQL profiling data: %s", exc, extra={"grouping": "profiling"}
+                        )
             else:
                 return self.run(*args, **deserialized_kwargs)
 
+    def _save_sql_profile(self, sql_profiler, top_count=5):
+        """Save the SQL queries recorded during job execution as a file, and log a summary of the costliest ones."""
+        # Omit individual queries as needed to stay within the maximum size enforced by create_file()
+        max_size = get_settings_or_config("JOB_CREATE_FILE_MAX_SIZE", fallback=10 << 20)
+        self.create_file(
+            f"nautobot-jobresult-{self.job_result.id}-sql.json",
+            content=sql_profiler.as_json(max_size=max_size),
+        )
+        self.logger.info(
+            "Executed %d SQL queries in %.3f seconds",
+            sql_profiler.query_count,
+            sql_profiler.total_duration,
+            extra={"grouping": "profiling"},
+        )
+        for fingerprint in sql_profiler.get_top_fingerprints(limit=top_count):
+            self.logger.info(
+                "%s%d queries in %.3f seconds, mostly from `%s`:\n```sql\n%s\n```",
+                "Likely N+1 query pattern: " if fingerprint["likely_n_plus_one"] else "",
+                fingerprint["count"],
+                fingerprint["total_duration"],
+                fingerprint["top_call_site"],
+                fingerprint["fingerprint"],
+                extra={"grouping": "profiling"},
+            )
+
     def __str__(self):
         return str(self.name)
 
@@ -828,7 +868,8 @@ class BaseJob:
 
         Args:
             filename (str): Name of the file to create, including extension
-            content (str, bytes): Content to populate the created file with.
+            content (str, bytes, file): Content to populate the created file with. This may be a seekable binary
+                file-like object (such as a `tempfile.TemporaryFile`), which avoids holding large content in memory.
 
         Raises:
             (ValueError): if the provided content exceeds JOB_CREATE_FILE_MAX_SIZE in length
@@ -838,13 +879,17 @@ class BaseJob:
         """
         if isinstance(content, str):
             content = content.encode("utf-8")
+        if isinstance(content, bytes):
+            actual_size = len(content)
+            file = ContentFile(content, name=filename)
+        else:
+            actual_size = content.seek(0, os.SEEK_END)
+            content.seek(0)
+            file = File(content, name=filename)
         max_size = get_settings_or_config("JOB_CREATE_FILE_MAX_SIZE", fallback=10 << 20)
-        actual_size = len(content)
         if actual_size > max_size:
             raise ValueError(f"Provided {actual_size} bytes of content, but JOB_CREATE_FILE_MAX_SIZE is {max_size}")
-        fp = FileProxy.objects.create(
-            name=filename, job_result=self.job_result, file=ContentFile(content, name=filename)
-        )
+        fp = FileProxy.objects.create(name=filename, job_result=self.job_result, file=file)
         self.logger.info("Created file [%s](%s)", filename, fp.file.url)
         return fp
 
@@ -1397,6 +1442,8 @@ def run_job(self, job_class_path, *args, **kwargs):
         if status == JobResultStatusChoices.STATUS_SUCCESS:
             return result
 
+        # Save any buffered log entries before the JobResult is marked as failed (and its log counts are stored)
+        flush_job_logs(self.request.id)
         # Report a failure, but with a result rather than an exception and einfo:
         self.update_state(
             state=status,
@@ -1442,7 +1489,12 @@ def run_job(self, job_class_path, *args, **kwargs):
         raise
 
     finally:
-        _cleanup_job(job, event_payload, status, kwargs)
+        try:
+            _cleanup_job(job, event_payload, status, kwargs)
+        finally:
+            # Save any remaining buffered log entries before the result backend marks the JobResult as completed,
+            # except when the job failed without raising an exception, in which case it has already been marked above
+            flush_job_logs(self.request.id)
 
 
 @nautobot_task(bind=True)
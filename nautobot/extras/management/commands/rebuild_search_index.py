@@ -0,0 +1,46 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from nautobot.core.utils.lookup import get_model_from_name
+from nautobot.extras.models import SearchDocument
+
+
+class Command(BaseCommand):
+    help = "Rebuild the global search index documents of all objects of the given models, or of all indexed models."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "args",
+            metavar="app_label.modelname",
+            nargs="*",
+            help="One or more specific models to rebuild the index of, e.g. dcim.device",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of objects to index at a time.",
+        )
+
+    def handle(self, *args, **kwargs):
+        """Rebuild the search index documents of the requested models."""
+        indexed_models = SearchDocument.get_indexed_models()
+        models = None
+        if args:
+            models = []
+            for label in args:
+                try:
+                    model = get_model_from_name(label.lower())
+                except TypeError as exc:
+                    raise CommandError(f"Unknown model {label}: {exc}")
+                if model not in indexed_models:
+                    raise CommandError(f"{label} is not indexed by the global search")
+                models.append(model)
+
+        self.stdout.write(self.style.NOTICE("Rebuilding global search index..."))
+        document_counts = SearchDocument.objects.rebuild(models=models, batch_size=max(kwargs["batch_size"], 1))
+        for model, document_count in document_counts.items():
+            if kwargs["verbosity"] >= 2:
+                self.stdout.write(f"Indexed {document_count} {model._meta.verbose_name_plural}")
+        self.stdout.write(
+            self.style.SUCCESS(f"Indexed {sum(document_counts.values())} objects of {len(document_counts)} models")
+        )
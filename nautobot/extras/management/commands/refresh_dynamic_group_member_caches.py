@@ -6,15 +6,31 @@ from nautobot.extras.models import DynamicGroup
 class Command(BaseCommand):
     help = "Update the member caches for all DynamicGroups."
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Maximum number of Dynamic Groups to refresh concurrently, each with its own database connection.",
+        )
+
     def handle(self, *args, **kwargs):
         """Run through all Dynamic Groups and ensure their member caches are up to date."""
 
         self.stdout.write(self.style.NOTICE("Refreshing DynamicGroup member caches..."))
 
-        dynamic_groups = DynamicGroup.objects.all()
+        # Each group is refreshed exactly once, only after any of its child groups have been refreshed
+        results = DynamicGroup.objects.all().update_cached_members(max_workers=max(kwargs["workers"], 1))
+
+        for result in results:
+            if result.error is not None:
+                self.stderr.write(self.style.ERROR(f"Error while refreshing {result.group}: {result.error}"))
+            elif kwargs["verbosity"] >= 2:
+                self.stdout.write(
+                    f"Refreshed {result.group} ({result.member_count} members) in {result.duration:.3f} seconds"
+                )
 
-        for dynamic_group in dynamic_groups:
-            try:
-                dynamic_group.update_cached_members()
-            except Exception as err:
-                self.stderr.write(self.style.ERROR(f"Error while refreshing {dynamic_group}: {err}"))
+        total_duration = sum(result.duration for result in results)
+        self.stdout.write(
+            self.style.SUCCESS(f"Refreshed {len(results)} DynamicGroup member caches in {total_duration:.3f} seconds")
+        )
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.15 on 2026-10-16 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("extras", "0142_remove_scheduledjob_approval_required"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="webhook",
+            name="batch_delivery",
+            field=models.BooleanField(
+                default=False,
+                help_text="Send all matching changes made by a single request or Job in one HTTP request, with a list of <code>changes</code> in place of the <code>event</code>, <code>model</code>, <code>data</code>, and <code>snapshots</code> context data.",
+            ),
+        ),
+    ]
@@ -0,0 +1,69 @@
+# Generated by Django 5.2.15 on 2026-10-16 12:00
+
+import logging
+import uuid
+
+from django.db import DatabaseError, migrations, models, transaction
+import django.db.models.deletion
+
+logger = logging.getLogger(__name__)
+
+
+def create_trigram_index(apps, schema_editor):
+    """On PostgreSQL, index the search text with trigrams so that substring searches don't require a table scan."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    try:
+        with transaction.atomic(using=schema_editor.connection.alias):
+            schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    except DatabaseError as exc:
+        logger.warning(
+            "Unable to enable the pg_trgm extension (%s); the global search index will not be trigram-indexed.", exc
+        )
+        return
+    schema_editor.execute(
+        "CREATE INDEX extras_searchdocument_text_trgm ON extras_searchdocument USING gin (text gin_trgm_ops)"
+    )
+
+
+def drop_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS extras_searchdocument_text_trgm")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("extras", "0143_webhook_batch_delivery"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SearchDocument",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True
+                    ),
+                ),
+                ("object_id", models.UUIDField()),
+                ("object_repr", models.CharField(max_length=255)),
+                ("text", models.TextField(help_text="Searchable field values of the object, one per line")),
+                (
+                    "content_type",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="contenttypes.contenttype",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["content_type", "object_repr"],
+                "unique_together": {("content_type", "object_id")},
+            },
+        ),
+        migrations.RunPython(create_trigram_index, drop_trigram_index),
+    ]
@@ -43,6 +43,7 @@ from .models import (
 )
 from .relationships import Relationship, RelationshipAssociation, RelationshipModel
 from .roles import Role, RoleField
+from .search import SearchDocument
 from .secrets import Secret, SecretsGroup, SecretsGroupAssociation
 from .statuses import Status, StatusField
 from .tags import Tag, TaggedItem
@@ -99,6 +100,7 @@ __all__ = (
     "SavedViewMixin",
     "ScheduledJob",
     "ScheduledJobs",
+    "SearchDocument",
     "Secret",
     "SecretsGroup",
     "SecretsGroupAssociation",
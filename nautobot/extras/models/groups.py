@@ -4,6 +4,7 @@ import logging
 from typing import Optional
 
 from django import forms
+from django.conf import settings
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
@@ -382,6 +383,8 @@ class DynamicGroup(PrimaryModel):
                 for obj in objects_to_add
             ]
             StaticGroupAssociation.all_objects.bulk_create(sgas, batch_size=1000)
+            # bulk_create() doesn't send post_save signals, so handle any affected config contexts directly
+            self._invalidate_members_config_context_cache([sga.associated_object_id for sga in sgas])
 
     _add_members.alters_data = True
 
@@ -402,34 +405,49 @@ class DynamicGroup(PrimaryModel):
 
     def _remove_members(self, objects_to_remove):
         """Internal API for removing the given list or QuerySet from the cached/static members of this Group."""
-        from nautobot.extras.signals import _handle_deleted_object  # avoid circular import
+        from nautobot.extras.signals import (  # avoid circular import
+            _handle_deleted_object,
+            invalidate_config_context_cache_for_association,
+        )
 
         # For non-static groups, we aren't going to change log the StaticGroupAssociation deletes anyway,
         # so save some performance on signals -- important especially when we're dealing with thousands of records
         if self.group_type != DynamicGroupTypeChoices.TYPE_STATIC:
             logger.debug("Temporarily disconnecting the _handle_deleted_object signal for performance")
             pre_delete.disconnect(_handle_deleted_object)
+            pre_delete.disconnect(invalidate_config_context_cache_for_association, sender=StaticGroupAssociation)
         try:
             if isinstance(objects_to_remove, models.QuerySet):
-                StaticGroupAssociation.all_objects.filter(
-                    dynamic_group=self,
-                    associated_object_type=self.content_type,
-                    associated_object_id__in=objects_to_remove.values_list("id", flat=True),
-                ).delete()
+                pks_to_remove = objects_to_remove.values_list("id", flat=True)
             else:
                 pks_to_remove = [obj.id for obj in objects_to_remove]
-                StaticGroupAssociation.all_objects.filter(
-                    dynamic_group=self,
-                    associated_object_type=self.content_type,
-                    associated_object_id__in=pks_to_remove,
-                ).delete()
+            associations = StaticGroupAssociation.all_objects.filter(
+                dynamic_group=self,
+                associated_object_type=self.content_type,
+                associated_object_id__in=pks_to_remove,
+            )
+            if self.group_type != DynamicGroupTypeChoices.TYPE_STATIC:
+                self._invalidate_members_config_context_cache(
+                    associations.values_list("associated_object_id", flat=True)
+                )
+            associations.delete()
         finally:
             if self.group_type != DynamicGroupTypeChoices.TYPE_STATIC:
                 logger.debug("Re-connecting the _handle_deleted_object signal")
                 pre_delete.connect(_handle_deleted_object)
+                pre_delete.connect(invalidate_config_context_cache_for_association, sender=StaticGroupAssociation)
 
     _remove_members.alters_data = True
 
+    def _invalidate_members_config_context_cache(self, pks):
+        """Invalidate the cached config context of the given member objects, if config contexts may depend on them."""
+        from nautobot.extras.models import ConfigContextModel  # avoid circular import
+
+        if not settings.CONFIG_CONTEXT_CACHE_TIMEOUT or not settings.CONFIG_CONTEXT_DYNAMIC_GROUPS_ENABLED:
+            return
+        if self.model is not None and issubclass(self.model, ConfigContextModel):
+            self.model.invalidate_config_context_cache(pks)
+
     @property
     @method_deprecated("Members are now cached in the database via StaticGroupAssociations rather than in Redis.")
     def members_cache_key(self):
@@ -465,6 +483,67 @@ class DynamicGroup(PrimaryModel):
 
     update_cached_members.alters_data = True
 
+    def update_cached_membership_of(self, obj, is_cached_member=None):
+        """
+        Re-evaluate whether the given object belongs to this group, and add it to or remove it from the cached members.
+
+        Unlike `update_cached_members()`, only the given object is evaluated against this group's query, so this is
+        inexpensive regardless of the size of the group, but it does not account for changes to any other objects.
+
+        Args:
+            obj (django.db.models.Model): The object to evaluate; must be an instance of this group's `model`.
+            is_cached_member (bool, optional): Whether `obj` is currently a cached member of this group, if known.
+
+        Returns:
+            bool: True if the cached membership of the given object was changed, otherwise False.
+        """
+        if is_cached_member is None:
+            cached_member_pks = None
+        else:
+            cached_member_pks = {obj.pk} if is_cached_member else set()
+        return bool(self.update_cached_membership_of_objects([obj], cached_member_pks))
+
+    update_cached_membership_of.alters_data = True
+
+    def update_cached_membership_of_objects(self, objs, cached_member_pks=None):
+        """
+        Re-evaluate whether each of the given objects belongs to this group, updating the cached members accordingly.
+
+        As `update_cached_membership_of()`, but for many objects at once, evaluating all of them in a single query.
+
+        Args:
+            objs (list[django.db.models.Model]): The objects to evaluate; must be instances of this group's `model`.
+            cached_member_pks (set, optional): The PKs of those of `objs` that are currently cached members of this
+                group, if known.
+
+        Returns:
+            (list[django.db.models.Model]): The objects whose cached membership of this group was changed.
+        """
+        if self.group_type == DynamicGroupTypeChoices.TYPE_STATIC:
+            return []  # nothing to do
+        if self.group_type not in (
+            DynamicGroupTypeChoices.TYPE_DYNAMIC_FILTER,
+            DynamicGroupTypeChoices.TYPE_DYNAMIC_SET,
+        ):
+            raise RuntimeError(f"Unknown/invalid group_type {self.group_type}")
+
+        pks = [obj.pk for obj in objs]
+        if cached_member_pks is None:
+            cached_member_pks = set(self.members.filter(pk__in=pks).values_list("pk", flat=True))
+        member_pks = set(self.model.objects.filter(self.generate_query(), pk__in=pks).values_list("pk", flat=True))
+
+        to_add = [obj for obj in objs if obj.pk in member_pks and obj.pk not in cached_member_pks]
+        to_remove = [obj for obj in objs if obj.pk in cached_member_pks and obj.pk not in member_pks]
+        if to_add:
+            self._add_members(to_add)
+            logger.debug("Added %d objects to cached members of %s", len(to_add), self)
+        if to_remove:
+            self._remove_members(to_remove)
+            logger.debug("Removed %d objects from cached members of %s", len(to_remove), self)
+        return to_add + to_remove
+
+    update_cached_membership_of_objects.alters_data = True
+
     def has_member(self, obj, use_cache=False):
         """
         Return True if the given object is a member of this group.
@@ -639,9 +718,20 @@ class DynamicGroup(PrimaryModel):
         super().save(*args, **kwargs)
 
         if update_cached_members:
-            self.update_cached_members()
-            for ancestor in self.get_ancestors():
-                ancestor.update_cached_members()
+            self.update_cached_members_with_ancestors()
+
+    def update_cached_members_with_ancestors(self):
+        """
+        Update the cached members of this group and of each of its ancestors, refreshing each group exactly once.
+
+        Raises:
+            Exception: the first error encountered while refreshing any of these groups, in which case the remaining
+                groups are not refreshed.
+        """
+        pks = [self.pk, *(ancestor.pk for ancestor in self.get_ancestors())]
+        DynamicGroup.objects.filter(pk__in=pks).update_cached_members(raise_on_error=True)
+
+    update_cached_members_with_ancestors.alters_data = True
 
     def _generate_query_for_filter(self, filter_field, value):
         """
@@ -1177,9 +1267,7 @@ class DynamicGroupMembership(BaseModel):
         super().save(*args, **kwargs)
 
         if update_cached_members:
-            self.parent_group.update_cached_members()
-            for ancestor in self.parent_group.get_ancestors():
-                ancestor.update_cached_members()
+            self.parent_group.update_cached_members_with_ancestors()
 
 
 class StaticGroupAssociationManager(BaseManager.from_queryset(RestrictedQuerySet)):
@@ -1119,6 +1119,22 @@ class JobResult(SavedViewMixin, BaseModel, CustomFieldModel):
         level_choice (LogLevelChoices): Message severity level
         grouping (str): Grouping to store the log message under
         """
+        self.save_log_entries([self.get_log_entry(message, obj=obj, level_choice=level_choice, grouping=grouping)])
+
+    log.alters_data = True
+
+    def get_log_entry(
+        self,
+        message,
+        obj=None,
+        level_choice=LogLevelChoices.LOG_INFO,
+        grouping="main",
+    ):
+        """
+        Construct (but do not save) a JobLogEntry associated with this JobResult.
+
+        Takes the same arguments as `log()`; use `save_log_entries()` to save the returned entries to the database.
+        """
         if level_choice not in LogLevelChoices.as_dict():
             raise ValueError(f"Unknown logging level: {level_choice}")
 
@@ -1146,12 +1162,22 @@ class JobResult(SavedViewMixin, BaseModel, CustomFieldModel):
                 log_object=str(obj)[:JOB_LOG_MAX_LOG_OBJECT_LENGTH] if obj else "",
                 absolute_url="",
             )
+        return log
+
+    def save_log_entries(self, log_entries):
+        """
+        Save the given JobLogEntry records, as returned by `get_log_entry()`, to the database in bulk.
+
+        If console logging is enabled for this JobResult, a JobConsoleEntry is also created for each entry.
+        """
+        if not log_entries:
+            return
         # If the override is provided, we want to use the default database(pass no using argument)
         # Otherwise we want to use a separate database here so that the logs are created immediately
         # instead of within transaction.atomic(). This allows us to be able to report logs when the jobs
         # are running, and allow us to rollback the database without losing the log entries.
         if not self.use_job_logs_db or not JOB_LOGS:
-            log.save()
+            JobLogEntry.objects.bulk_create(log_entries)
         else:
             try:
                 conn = connections[JOB_LOGS]
@@ -1159,23 +1185,25 @@ class JobResult(SavedViewMixin, BaseModel, CustomFieldModel):
                 # Without this, job logs connections persist indefinitely, regardless of the CONN_MAX_AGE setting.
                 # A subsequent ORM call will automatically open a new connection.
                 conn.close_if_unusable_or_obsolete()
-                log.save(using=JOB_LOGS)
+                JobLogEntry.objects.using(JOB_LOGS).bulk_create(log_entries)
             # Some failure scenarios, such as a DB connection closed by the server, cannot be easily detected.
             # In these cases, we manually clear the connection and retry.
             except (InterfaceError, OperationalError):
                 # Explicitly clear the connection socket due to MySQL not playing nicely with conn.close()
                 conn.connection = None
                 conn.ensure_connection()
-                log.save(using=JOB_LOGS)
+                JobLogEntry.objects.using(JOB_LOGS).bulk_create(log_entries)
 
         if self.celery_kwargs.get("nautobot_job_console_log", False):
-            job_console_entry = JobConsoleEntry(job_result=self, timestamp=timezone.now(), text=message)
+            job_console_entries = [
+                JobConsoleEntry(job_result=self, timestamp=timezone.now(), text=log.message) for log in log_entries
+            ]
             if not self.use_job_logs_db or not JOB_LOGS:
-                job_console_entry.save()
+                JobConsoleEntry.objects.bulk_create(job_console_entries)
             else:
-                job_console_entry.save(using=JOB_LOGS)
+                JobConsoleEntry.objects.using(JOB_LOGS).bulk_create(job_console_entries)
 
-    log.alters_data = True
+    save_log_entries.alters_data = True
 
     def save(self, *args, **kwargs):
         """When a JobResult is saved and in a terminal state, store missing log counts for summary."""
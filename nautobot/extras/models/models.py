@@ -1,4 +1,6 @@
 from collections import OrderedDict
+from functools import partial
+import itertools
 import json
 
 from db_file_storage.model_utils import delete_file, delete_file_if_needed
@@ -7,12 +9,13 @@ from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.core.files.storage import storages
 from django.core.serializers.json import DjangoJSONEncoder
 from django.core.validators import MinValueValidator
-from django.db import models
-from django.http import HttpResponse
+from django.db import models, transaction
+from django.http import StreamingHttpResponse
 from graphql import IntValueNode, parse, StringValueNode
 from graphql.error import GraphQLSyntaxError
 from graphql.language.ast import ExecutableDefinitionNode
@@ -24,10 +27,14 @@ from nautobot.core.constants import CHARFIELD_MAX_LENGTH
 from nautobot.core.models import BaseManager, BaseModel
 from nautobot.core.models.fields import ForeignKeyWithAutoRelatedName, LaxURLField
 from nautobot.core.models.generics import OrganizationalModel, PrimaryModel
-from nautobot.core.utils.data import deepmerge, render_jinja2
+from nautobot.core.models.querysets import RestrictedQuerySet
+from nautobot.core.utils.cache import construct_cache_key
+from nautobot.core.utils.data import deepmerge, render_jinja2, render_jinja2_iter
 from nautobot.core.utils.lookup import get_filterset_for_model, get_model_for_view_name
+from nautobot.core.utils.querysets import ChunkedQuerySet
 from nautobot.extras.choices import (
     ButtonClassChoices,
+    ObjectChangeActionChoices,
     WebhookHttpMethodChoices,
 )
 from nautobot.extras.constants import HTTP_CONTENT_TYPE_JSON
@@ -209,6 +216,31 @@ class ConfigContextModel(models.Model, ConfigContextSchemaValidationMixin):
     def get_config_context(self):
         """
         Return the rendered configuration context for a device or VM.
+
+        If `settings.CONFIG_CONTEXT_CACHE_TIMEOUT` is set, the merged data of all applicable ConfigContexts is cached
+        per object, so that subsequent calls only need a single cache lookup. The cached data is invalidated by signals
+        whenever a change is made that may affect which ConfigContexts apply to this object.
+        """
+        cache_key = None
+        data = None
+        if settings.CONFIG_CONTEXT_CACHE_TIMEOUT and self.present_in_database:
+            cache_key = self._get_config_context_cache_key(self.pk)
+            data = cache.get(cache_key)
+
+        if data is None:
+            data = self._get_merged_config_context_data()
+            if cache_key is not None:
+                cache.set(cache_key, data, settings.CONFIG_CONTEXT_CACHE_TIMEOUT)
+
+        # If the object has local config context data defined, merge it last
+        if self.local_config_context_data:
+            data = deepmerge(data, self.local_config_context_data)
+
+        return data
+
+    def _get_merged_config_context_data(self):
+        """
+        Return the merged data of all ConfigContexts applicable to this object, excluding its local config context data.
         """
         if not hasattr(self, "config_context_data"):
             # Annotation not available, so fall back to manually querying for the config context
@@ -223,12 +255,28 @@ class ConfigContextModel(models.Model, ConfigContextSchemaValidationMixin):
         for context in config_context_data:
             data = deepmerge(data, context)
 
-        # If the object has local config context data defined, merge it last
-        if self.local_config_context_data:
-            data = deepmerge(data, self.local_config_context_data)
-
         return data
 
+    @classmethod
+    def _get_config_context_cache_key(cls, pk):
+        return construct_cache_key(cls, method_name="get_config_context", branch_aware=True, pk=pk)
+
+    @classmethod
+    def invalidate_config_context_cache(cls, pks):
+        """
+        Discard the cached rendered config context (if any) of the objects of this model with the given primary keys.
+
+        The cache is cleared immediately, so that later reads within the current transaction see the change, and again
+        once the transaction is committed, in case another process re-cached the old data in the meantime.
+        """
+        if not settings.CONFIG_CONTEXT_CACHE_TIMEOUT:
+            return
+        cache_keys = [cls._get_config_context_cache_key(pk) for pk in pks]
+        if not cache_keys:
+            return
+        cache.delete_many(cache_keys)
+        transaction.on_commit(partial(cache.delete_many, cache_keys))
+
     def clean(self):
         super().clean()
 
@@ -444,23 +492,39 @@ class ExportTemplate(
         """
         Render the contents of the template.
         """
-        context = {"queryset": queryset}
-        output = render_jinja2(self.template_code, context)
+        return "".join(self.render_iter(queryset))
 
-        # Replace CRLF-style line terminators
-        output = output.replace("\r\n", "\n")
+    def render_iter(self, queryset, chunk_size=1000):
+        """
+        Render the contents of the template incrementally, yielding pieces of the output as they're generated.
 
-        return output
+        The `queryset` context variable is provided as a `ChunkedQuerySet`, so that iterating over it in the template
+        loads only `chunk_size` records at a time, rather than caching the entire queryset in memory.
+        """
+        context = {"queryset": ChunkedQuerySet(queryset, chunk_size=chunk_size)}
+        # Replace CRLF-style line terminators, taking care of those that are split across two pieces of output
+        pending_cr = ""
+        for chunk in render_jinja2_iter(self.template_code, context):
+            chunk = pending_cr + chunk
+            pending_cr = "\r" if chunk.endswith("\r") else ""
+            chunk = chunk[: len(chunk) - len(pending_cr)].replace("\r\n", "\n")
+            if chunk:
+                yield chunk
+        if pending_cr:
+            yield pending_cr
 
     def render_to_response(self, queryset):
         """
-        Render the template to an HTTP response, delivered as a named file attachment
+        Render the template to a streaming HTTP response, delivered as a named file attachment
         """
-        output = self.render(queryset)
+        output = self.render_iter(queryset)
+        # Render the first piece of output now, so that any errors in compiling the template or beginning to render it
+        # are raised to the caller, rather than occurring after the response has started to be sent
+        first_chunk = next(output, "")
         mime_type = "text/plain" if not self.mime_type else self.mime_type
 
         # Build the response
-        response = HttpResponse(output, content_type=mime_type)
+        response = StreamingHttpResponse(itertools.chain([first_chunk], output), content_type=mime_type)
         extension = f".{self.file_extension}" if self.file_extension else ""
         filename = f"{settings.BRANDING_PREPENDED_FILENAME}{queryset.model._meta.verbose_name_plural}{extension}"
         response["Content-Disposition"] = f'attachment; filename="{filename}"'
@@ -969,6 +1033,33 @@ class UserSavedViewAssociation(BaseModel):
 #
 # Webhooks
 #
+
+
+class WebhookManager(BaseManager.from_queryset(RestrictedQuerySet)):
+    def get_for_change(self, content_type, action):
+        """
+        Return (and cache) a list of all enabled Webhooks to be called for the given content-type and change action.
+
+        Args:
+            content_type (ContentType): Content-type of the changed object.
+            action (str): One of the `ObjectChangeActionChoices` values.
+        """
+        cache_key = construct_cache_key(
+            self, method_name="get_for_change", branch_aware=True, content_type=content_type.pk, action=action
+        )
+        webhooks = cache.get(cache_key)
+        if webhooks is None:
+            action_flag = {
+                ObjectChangeActionChoices.ACTION_CREATE: "type_create",
+                ObjectChangeActionChoices.ACTION_UPDATE: "type_update",
+                ObjectChangeActionChoices.ACTION_DELETE: "type_delete",
+            }[action]
+            webhooks = list(self.get_queryset().filter(content_types=content_type, enabled=True, **{action_flag: True}))
+            # cache is explicitly invalidated by nautobot.extras.signals.invalidate_webhook_cache
+            cache.set(cache_key, webhooks, timeout=None)
+        return webhooks
+
+
 @extras_features("graphql")
 class Webhook(
     ChangeLoggedModel,
@@ -1047,6 +1138,14 @@ class Webhook(
         "Leave blank to use the system defaults.",
         default="",
     )
+    batch_delivery = models.BooleanField(
+        default=False,
+        help_text="Send all matching changes made by a single request or Job in one HTTP request, "
+        "with a list of <code>changes</code> in place of the <code>event</code>, <code>model</code>, "
+        "<code>data</code>, and <code>snapshots</code> context data.",
+    )
+
+    objects = WebhookManager()
 
     class Meta:
         ordering = ("name",)
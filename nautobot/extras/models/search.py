@@ -0,0 +1,145 @@
+"""Models for the global search index."""
+
+import functools
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.core.exceptions import FieldDoesNotExist
+from django.db import models
+
+from nautobot.core.constants import CHARFIELD_MAX_LENGTH
+from nautobot.core.models import BaseManager, BaseModel
+from nautobot.core.utils.lookup import get_filterset_for_model, get_model_from_name, get_searchable_models
+from nautobot.extras.querysets import SearchDocumentQuerySet
+
+
+class SearchDocument(BaseModel):
+    """
+    Denormalized record of the searchable text of a single object, used by the global search.
+
+    When `SEARCH_INDEX_ENABLED` is set, documents are kept up to date as objects are saved and deleted, and the global
+    search queries the documents of all indexed models at once rather than filtering each model's table in turn.
+    """
+
+    content_type = models.ForeignKey(to=ContentType, on_delete=models.CASCADE, related_name="+")
+    object_id = models.UUIDField()
+    object_repr = models.CharField(max_length=CHARFIELD_MAX_LENGTH)
+    text = models.TextField(help_text="Searchable field values of the object, one per line")
+
+    objects = BaseManager.from_queryset(SearchDocumentQuerySet)()
+
+    class Meta:
+        unique_together = [["content_type", "object_id"]]
+        ordering = ["content_type", "object_repr"]
+
+    def __str__(self):
+        return self.object_repr
+
+    @staticmethod
+    @functools.cache
+    def get_indexed_models():
+        """
+        Get the searchable models that use the search index, and the attribute paths to index for each.
+
+        A model is indexed if the `q` filter of its FilterSet is a `SearchFilter`; models whose `q` filter implements
+        custom search logic (such as network containment for IP addresses) keep using their FilterSet. The attribute
+        paths are those of the `SearchFilter` predicates that are `icontains` lookups of a field of the model or,
+        through a chain of foreign keys, of a field of a related model. Any other predicates, such as exact matches of
+        numbers or lookups spanning many-to-many or reverse relations, are instead given by `get_unindexed_predicates()`.
+
+        Returns:
+            (dict): `{model_class: [attribute_path, ...], ...}`, with paths in Django lookup (`a__b`) syntax.
+        """
+        indexed_models = {}
+        for label in get_searchable_models():
+            model = get_model_from_name(label)
+            search_filter = _get_search_filter(model)
+            if search_filter is None:
+                continue
+            indexed_models[model] = [
+                path
+                for path, lookup_info in search_filter.filter_predicates.items()
+                if _is_indexable_predicate(model, path, lookup_info)
+            ]
+        return indexed_models
+
+    @staticmethod
+    @functools.cache
+    def get_unindexed_predicates(model):
+        """
+        Get the `SearchFilter` predicates of the given indexed model that can't be evaluated using the search index.
+
+        These predicates are instead evaluated against the model's own table whenever the model is searched.
+
+        Returns:
+            (dict): `{attribute_path: lookup_info, ...}`, in the format of `SearchFilter.filter_predicates`, excluding
+                the default match on `id` (which `SearchDocumentQuerySet.search()` handles).
+        """
+        return {
+            path: lookup_info
+            for path, lookup_info in _get_search_filter(model).filter_predicates.items()
+            if not _is_indexable_predicate(model, path, lookup_info)
+            and not (path == "id" and lookup_info in ("exact", "iexact"))
+        }
+
+    @classmethod
+    def is_search_indexed(cls, model, value):
+        """
+        Check whether searching objects of the given model for the given text should use the search index.
+
+        The index gives the same results as the model's FilterSet, except when the search text has leading or trailing
+        whitespace, which only some `SearchFilter` predicates strip, so such searches always use the FilterSet.
+        """
+        return settings.SEARCH_INDEX_ENABLED and value == value.strip() and model in cls.get_indexed_models()
+
+    @staticmethod
+    def get_document_fields(obj, paths):
+        """Get the `object_repr` and `text` of the document for the given object, from the given attribute paths."""
+        object_repr = str(obj)[:CHARFIELD_MAX_LENGTH]
+        # The object_repr is used only for ranking results, as the FilterSet doesn't necessarily match on it
+        values = []
+        for path in paths:
+            value = obj
+            for attr in path.split("__"):
+                value = getattr(value, attr, None)
+                if value is None:
+                    break
+            if value not in (None, ""):
+                values.append(str(value))
+        return {"object_repr": object_repr, "text": "\n".join(values)}
+
+
+def _get_search_filter(model):
+    """Get the `q` filter of the FilterSet of the given model, if it's a `SearchFilter`, otherwise None."""
+    from nautobot.core.filters import SearchFilter  # avoid circular import
+
+    filterset_class = get_filterset_for_model(model)
+    search_filter = filterset_class.base_filters.get("q") if filterset_class is not None else None
+    return search_filter if isinstance(search_filter, SearchFilter) else None
+
+
+def _is_indexable_predicate(model, path, lookup_info):
+    """Check whether the given `SearchFilter` predicate can be evaluated by a case-insensitive match of the index."""
+    if path == "id":
+        return False
+    if isinstance(lookup_info, dict):
+        # Stripping whitespace makes no difference, as `SearchDocument.is_search_indexed()` excludes such search text
+        if lookup_info.get("preprocessor") is not str.strip:
+            return False
+        lookup_info = lookup_info.get("lookup_expr")
+    return lookup_info == "icontains" and _is_indexable_path(model, path)
+
+
+def _is_indexable_path(model, path):
+    """Check whether the given lookup path is a field of `model`, possibly through a chain of foreign keys."""
+    *relation_names, field_name = path.split("__")
+    try:
+        for relation_name in relation_names:
+            field = model._meta.get_field(relation_name)
+            if not (field.many_to_one or field.one_to_one) or not field.concrete:
+                return False
+            model = field.related_model
+        field = model._meta.get_field(field_name)
+    except FieldDoesNotExist:
+        return False
+    return field.concrete and not field.is_relation
@@ -1,13 +1,30 @@
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+import logging
+import time
+
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
-from django.db.models import F, Model, OuterRef, ProtectedError, Q, Subquery
-from django.db.models.functions import JSONObject
+from django.db import connection, transaction
+from django.db.models import Case, F, IntegerField, Model, OuterRef, ProtectedError, Q, Subquery, Value, When
+from django.db.models.functions import Coalesce, JSONObject
 
 from nautobot.core.models.query_functions import EmptyGroupByJSONBAgg
 from nautobot.core.models.querysets import RestrictedQuerySet
-from nautobot.extras.choices import ScheduledJobStateChoices
+from nautobot.core.utils.data import is_uuid
+from nautobot.core.utils.querysets import maybe_select_related
+from nautobot.extras.choices import DynamicGroupTypeChoices, ScheduledJobStateChoices
 from nautobot.extras.models.tags import TaggedItem
 
+logger = logging.getLogger(__name__)
+
+# Outcome of refreshing the cached members of a single DynamicGroup:
+# - group: the DynamicGroup that was refreshed
+# - member_count: number of members of the group after the refresh, or None if the refresh failed
+# - duration: time taken to refresh the group, in seconds
+# - error: the exception raised while refreshing the group, if any
+DynamicGroupRefreshResult = namedtuple("DynamicGroupRefreshResult", ["group", "member_count", "duration", "error"])
+
 
 class ConfigContextQuerySet(RestrictedQuerySet):
     def get_for_object(self, obj):
@@ -119,6 +136,74 @@ class ConfigContextModelQuerySet(RestrictedQuerySet):
             )
         ).distinct()
 
+    def get_for_config_context(self, config_context):
+        """
+        Return all objects within the scope of the given ConfigContext, regardless of whether it is active.
+
+        This is the inverse of `ConfigContextQuerySet.get_for_object()`, and is used to find the objects whose rendered
+        config context may be affected by a change to the given ConfigContext.
+        """
+        from nautobot.dcim.models import Device
+        from nautobot.extras.models import StaticGroupAssociation
+
+        if issubclass(self.model, Device):
+            location_query_string = "location"
+            cluster_query_string = "clusters"
+        else:
+            if (
+                config_context.device_types.exists()
+                or config_context.device_families.exists()
+                or config_context.device_redundancy_groups.exists()
+            ):
+                # Virtual machines never match a ConfigContext scoped by any of these
+                return self.none()
+            location_query_string = "cluster__location"
+            cluster_query_string = "cluster"
+
+        scope_filters = {
+            location_query_string: self._get_tree_descendant_pks(config_context.locations.all()),
+            "role": config_context.roles.all(),
+            "platform": config_context.platforms.all(),
+            "tenant": config_context.tenants.all(),
+            "tenant__tenant_group": self._get_tree_descendant_pks(config_context.tenant_groups.all()),
+            "tags": config_context.tags.all(),
+            cluster_query_string: config_context.clusters.all(),
+            f"{cluster_query_string}__cluster_group": config_context.cluster_groups.all(),
+        }
+        if issubclass(self.model, Device):
+            scope_filters["device_type"] = config_context.device_types.all()
+            scope_filters["device_type__device_family"] = config_context.device_families.all()
+            scope_filters["device_redundancy_group"] = config_context.device_redundancy_groups.all()
+
+        query = Q()
+        for query_string, values in scope_filters.items():
+            # An empty scope attribute means that the ConfigContext is not restricted by that attribute
+            if values.exists():
+                query &= Q(**{f"{query_string}__in": values})
+        if settings.CONFIG_CONTEXT_DYNAMIC_GROUPS_ENABLED and config_context.dynamic_groups.exists():
+            query &= Q(
+                pk__in=StaticGroupAssociation.all_objects.filter(
+                    dynamic_group__in=config_context.dynamic_groups.all(),
+                ).values("associated_object_id")
+            )
+
+        return self.filter(query).distinct()
+
+    @staticmethod
+    def _get_tree_descendant_pks(queryset):
+        """Return the PKs of the given tree objects and all of their descendants."""
+        pks = set()
+        for obj in queryset:
+            pks.update(obj.cacheable_descendants_pks(include_self=True))
+        return queryset.model.objects.filter(pk__in=pks)
+
+    def invalidate_config_context_cache(self):
+        """
+        Discard the cached rendered config context (if any) of each object in this queryset.
+        """
+        if settings.CONFIG_CONTEXT_CACHE_TIMEOUT:
+            self.model.invalidate_config_context_cache(self.order_by().values_list("pk", flat=True).distinct())
+
     def _get_config_context_filters(self):
         """
         This method is constructing the set of Q objects for the specific object types.
@@ -218,6 +303,179 @@ class DynamicGroupQuerySet(RestrictedQuerySet):
             static_group_associations__associated_object_id=obj.id,
         )
 
+    def update_cached_members_for_object(self, obj, created=False):
+        """
+        Incrementally update the cached membership of the given object in each non-static group of its content type.
+
+        Each dynamic-filter group is evaluated against just this object; dynamic-set groups are then re-evaluated only
+        if they are ancestors of a group whose membership changed (or for a newly created object, which may match a
+        set group such as "everything not in group X" without matching any of its children).
+
+        Args:
+            obj (django.db.models.Model): The created or updated object.
+            created (bool): Whether `obj` was newly created.
+
+        Returns:
+            (list[DynamicGroup]): The groups whose cached membership of `obj` was changed.
+        """
+        return self.update_cached_members_for_objects([obj], created=created)
+
+    update_cached_members_for_object.alters_data = True
+
+    def update_cached_members_for_objects(self, objs, created=False):
+        """
+        Incrementally update the cached membership of the given objects in each non-static group of their content type.
+
+        As `update_cached_members_for_object()`, but for many objects of the same model at once, evaluating all of the
+        objects against each group in a single query.
+
+        Args:
+            objs (list[django.db.models.Model]): The created or updated objects, all of the same model.
+            created (bool): Whether `objs` were newly created.
+
+        Returns:
+            (list[DynamicGroup]): The groups whose cached membership of any of `objs` was changed.
+        """
+        from nautobot.extras.models import DynamicGroupMembership, StaticGroupAssociation
+
+        if not objs:
+            return []
+        groups = {
+            group.pk: group
+            for group in self.get_for_model(type(objs[0])).exclude(group_type=DynamicGroupTypeChoices.TYPE_STATIC)
+        }
+        if not groups:
+            return []
+
+        cached_member_pks = {pk: set() for pk in groups}
+        for group_pk, obj_pk in StaticGroupAssociation.all_objects.filter(
+            dynamic_group__in=groups.keys(), associated_object_id__in=[obj.pk for obj in objs]
+        ).values_list("dynamic_group_id", "associated_object_id"):
+            cached_member_pks[group_pk].add(obj_pk)
+        set_group_pks = {
+            pk for pk, group in groups.items() if group.group_type == DynamicGroupTypeChoices.TYPE_DYNAMIC_SET
+        }
+
+        changed = []
+        for pk, group in groups.items():
+            if pk not in set_group_pks and group.update_cached_membership_of_objects(objs, cached_member_pks[pk]):
+                changed.append(group)
+
+        if created:
+            set_groups_to_update = set_group_pks
+        else:
+            # Walk up the ancestor chain of each changed group to find the set groups that may be affected
+            parent_pks = {}
+            for parent_pk, child_pk in DynamicGroupMembership.objects.filter(
+                parent_group__in=set_group_pks
+            ).values_list("parent_group_id", "group_id"):
+                parent_pks.setdefault(child_pk, set()).add(parent_pk)
+            set_groups_to_update = set()
+            pending = [group.pk for group in changed]
+            while pending:
+                for parent_pk in parent_pks.get(pending.pop(), ()):
+                    if parent_pk not in set_groups_to_update:
+                        set_groups_to_update.add(parent_pk)
+                        pending.append(parent_pk)
+
+        for pk in set_groups_to_update:
+            if groups[pk].update_cached_membership_of_objects(objs, cached_member_pks[pk]):
+                changed.append(groups[pk])
+
+        return changed
+
+    update_cached_members_for_objects.alters_data = True
+
+    def get_refresh_generations(self):
+        """
+        Order the non-static groups in this queryset such that each group comes after all of its descendants.
+
+        Returns:
+            (list[list[DynamicGroup]]): Successive "generations" of groups; the groups within each generation don't
+                have any ancestor/descendant relationship with one another, and so can be refreshed in any order.
+        """
+        from nautobot.extras.models import DynamicGroupMembership
+
+        groups = {group.pk: group for group in self.exclude(group_type=DynamicGroupTypeChoices.TYPE_STATIC)}
+        child_pks = {pk: set() for pk in groups}
+        for parent_pk, child_pk in DynamicGroupMembership.objects.filter(
+            parent_group__in=groups.keys(), group__in=groups.keys()
+        ).values_list("parent_group_id", "group_id"):
+            child_pks[parent_pk].add(child_pk)
+
+        generations = []
+        remaining = set(groups)
+        while remaining:
+            ready = {pk for pk in remaining if not child_pks[pk] & remaining}
+            if not ready:
+                raise RuntimeError("Dynamic Group memberships contain a cycle")
+            generations.append(sorted((groups[pk] for pk in ready), key=lambda group: group.name))
+            remaining -= ready
+        return generations
+
+    def update_cached_members(self, max_workers=1, raise_on_error=False):
+        """
+        Refresh the cached members of each non-static group in this queryset exactly once, in dependency order.
+
+        Each group is refreshed only after all of its descendants in this queryset have been refreshed (see
+        `get_refresh_generations()`), and groups that don't depend on one another can be refreshed concurrently.
+
+        Args:
+            max_workers (int): Maximum number of groups to refresh concurrently. If greater than 1, each group is
+                refreshed in a separate thread with its own database connection, and so outside of any transaction
+                that the caller may be in; if 1 (the default), groups are refreshed one at a time in the current thread.
+            raise_on_error (bool): If True, stop at the first error refreshing any group and raise it, rather than
+                continuing with the remaining groups. When refreshing groups concurrently, the other groups of the same
+                generation as the failed group are still refreshed, but no groups of any later generation.
+
+        Returns:
+            (list[DynamicGroupRefreshResult]): The outcome of refreshing each group, in the order they were refreshed.
+                Unless `raise_on_error` is True, an error refreshing one group doesn't prevent the remaining groups from
+                being refreshed.
+        """
+        results = []
+        generations = self.get_refresh_generations()
+        if max_workers > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for generation in generations:
+                    generation_results = list(executor.map(self._refresh_cached_members_in_thread, generation))
+                    results.extend(generation_results)
+                    errors = [result.error for result in generation_results if result.error is not None]
+                    if raise_on_error and errors:
+                        raise errors[0]
+        else:
+            for generation in generations:
+                for group in generation:
+                    result = self._refresh_cached_members(group)
+                    results.append(result)
+                    if raise_on_error and result.error is not None:
+                        raise result.error
+        return results
+
+    update_cached_members.alters_data = True
+
+    @staticmethod
+    def _refresh_cached_members(group):
+        """Refresh the cached members of the given group, returning a `DynamicGroupRefreshResult`."""
+        start_time = time.monotonic()
+        try:
+            group.update_cached_members()
+            member_count = group.count
+        except Exception as error:
+            logger.exception("Error while refreshing the cached members of %s", group)
+            return DynamicGroupRefreshResult(group, None, time.monotonic() - start_time, error)
+        duration = time.monotonic() - start_time
+        logger.debug("Refreshed cache for %s, now with %d members, in %.3f seconds", group, member_count, duration)
+        return DynamicGroupRefreshResult(group, member_count, duration, None)
+
+    @classmethod
+    def _refresh_cached_members_in_thread(cls, group):
+        """Refresh the cached members of the given group from a worker thread, then close its database connection."""
+        try:
+            return cls._refresh_cached_members(group)
+        finally:
+            connection.close()
+
     def get_by_natural_key(self, slug):
         return self.get(slug=slug)
 
@@ -273,3 +531,143 @@ class ScheduledJobExtendedQuerySet(RestrictedQuerySet):
         Return only ScheduledJob instances that are enabled and approved (if approval required)
         """
         return self.filter(state=ScheduledJobStateChoices.ACTIVE)
+
+
+class SearchDocumentQuerySet(RestrictedQuerySet):
+    """
+    Queryset for `SearchDocument` records, providing the means to query and maintain the global search index.
+    """
+
+    def search(self, value):
+        """
+        Filter to the documents matching the given search text, annotated with and ordered by their `rank`.
+
+        Documents whose object's string representation is exactly the search text rank highest, followed by those
+        whose representation starts with or contains it, followed by those matching only on other fields.
+        """
+        value = value.strip()
+        query = Q(text__icontains=value)
+        if is_uuid(value):
+            query |= Q(object_id=value)
+        return (
+            self.filter(query)
+            .annotate(
+                rank=Case(
+                    When(object_repr__iexact=value, then=Value(3)),
+                    When(object_repr__istartswith=value, then=Value(2)),
+                    When(object_repr__icontains=value, then=Value(1)),
+                    default=Value(0),
+                    output_field=IntegerField(),
+                )
+            )
+            .order_by("-rank", "object_repr")
+        )
+
+    def filter_objects(self, queryset, value):
+        """
+        Filter the given queryset to the objects matching the given search text, ordered by rank.
+
+        Objects are matched by their documents, or by any predicates of their model's `SearchFilter` that can't be
+        evaluated using the index (see `SearchDocument.get_unindexed_predicates()`).
+
+        Args:
+            queryset (QuerySet): Objects of an indexed model, typically already restricted by permissions.
+            value (str): Search text.
+
+        Returns:
+            (QuerySet): The matching objects, annotated with their `search_rank`.
+        """
+        from nautobot.core.filters import SearchFilter  # avoid circular import
+
+        documents = self.search(value).filter(content_type=ContentType.objects.get_for_model(queryset.model))
+        query = Q(pk__in=documents.order_by().values("object_id"))
+        unindexed_predicates = self.model.get_unindexed_predicates(queryset.model)
+        if unindexed_predicates:
+            # Evaluate these against the model's table instead, in a subquery as they may span multi-valued relations
+            search_filter = SearchFilter(filter_predicates=unindexed_predicates)
+            query |= Q(pk__in=queryset.model.objects.filter(search_filter.generate_query(value)).values("pk"))
+        rank = Subquery(documents.filter(object_id=OuterRef("pk")).order_by().values("rank")[:1])
+        return (
+            queryset.filter(query)
+            .annotate(search_rank=Coalesce(rank, Value(0)))
+            .order_by("-search_rank", *queryset.model._meta.ordering)
+        )
+
+    def update_for_object(self, obj):
+        """
+        Create or update the document of the given object, if it is of an indexed model.
+
+        Returns:
+            (SearchDocument): The document, or None if the object's model is not indexed.
+        """
+        paths = self.model.get_indexed_models().get(obj._meta.concrete_model)
+        if paths is None:
+            return None
+        document, _ = self.update_or_create(
+            content_type=ContentType.objects.get_for_model(obj),
+            object_id=obj.pk,
+            defaults=self.model.get_document_fields(obj, paths),
+        )
+        return document
+
+    def remove_for_object(self, obj):
+        """Delete the document of the given object, if any."""
+        self.filter(content_type=ContentType.objects.get_for_model(obj), object_id=obj.pk).delete()
+
+    def update_for_queryset(self, queryset, batch_size=1000):
+        """
+        Create or replace the documents of all objects in the given queryset, if they are of an indexed model.
+
+        This is needed wherever objects are created or changed without sending the `post_save` signal, such as by
+        `bulk_create()` or `QuerySet.update()`.
+
+        Returns:
+            (int): The number of documents created.
+        """
+        paths = self.model.get_indexed_models().get(queryset.model._meta.concrete_model)
+        if paths is None:
+            return 0
+        content_type = ContentType.objects.get_for_model(queryset.model)
+        objects = list(maybe_select_related(queryset, _get_related_paths(paths)))
+        with transaction.atomic():
+            self.filter(content_type=content_type, object_id__in=[obj.pk for obj in objects]).delete()
+            documents = [
+                self.model(content_type=content_type, object_id=obj.pk, **self.model.get_document_fields(obj, paths))
+                for obj in objects
+            ]
+            return len(self.bulk_create(documents, batch_size=batch_size))
+
+    def rebuild(self, models=None, batch_size=1000):
+        """
+        Replace the documents of all objects of the given indexed models with freshly generated ones.
+
+        Args:
+            models (list): Model classes to rebuild the documents of, or None to rebuild those of all indexed models.
+            batch_size (int): Number of objects to load, and documents to create, at a time.
+
+        Returns:
+            (dict): The number of documents created for each model, keyed by model class.
+        """
+        document_counts = {}
+        for model, paths in self.model.get_indexed_models().items():
+            if models is not None and model not in models:
+                continue
+            content_type = ContentType.objects.get_for_model(model)
+            queryset = maybe_select_related(model.objects.all(), _get_related_paths(paths))
+            document_counts[model] = 0
+            with transaction.atomic():
+                self.filter(content_type=content_type).delete()
+                batch = []
+                for obj in queryset.iterator(chunk_size=batch_size):
+                    fields = self.model.get_document_fields(obj, paths)
+                    batch.append(self.model(content_type=content_type, object_id=obj.pk, **fields))
+                    if len(batch) >= batch_size:
+                        document_counts[model] += len(self.bulk_create(batch))
+                        batch = []
+                document_counts[model] += len(self.bulk_create(batch))
+        return document_counts
+
+
+def _get_related_paths(paths):
+    """Get the foreign key paths to `select_related()` in order to retrieve the given document attribute paths."""
+    return {path.rsplit("__", 1)[0] for path in paths if "__" in path}
@@ -1,5 +1,6 @@
 import contextlib
 import contextvars
+import functools
 import logging
 import os
 import shutil
@@ -8,11 +9,14 @@ import uuid
 
 from db_file_storage.model_utils import delete_file
 from db_file_storage.storage import DatabaseFileStorage
+from django.apps import apps
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
 from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.core.files.storage import storages
+from django.db import transaction
+from django.db.models import Q
 from django.db.models.signals import m2m_changed, post_delete, post_migrate, post_save, pre_delete, pre_save
 from django.dispatch import receiver
 from django.utils import timezone
@@ -27,6 +31,7 @@ from nautobot.core.utils.logging import sanitize
 from nautobot.extras.choices import (
     ApprovalWorkflowStateChoices,
     ButtonClassChoices,
+    DynamicGroupTypeChoices,
     JobResultStatusChoices,
     ObjectChangeActionChoices,
 )
@@ -34,6 +39,8 @@ from nautobot.extras.constants import CHANGELOG_MAX_CHANGE_CONTEXT_DETAIL, PENDI
 from nautobot.extras.customfields import enqueue_custom_field_job
 from nautobot.extras.models import (
     ComputedField,
+    ConfigContext,
+    ConfigContextModel,
     ContactAssociation,
     CustomField,
     CustomFieldChoice,
@@ -46,6 +53,10 @@ from nautobot.extras.models import (
     MetadataType,
     ObjectChange,
     Relationship,
+    SearchDocument,
+    StaticGroupAssociation,
+    TaggedItem,
+    Webhook,
 )
 from nautobot.extras.models.approvals import (
     ApprovalWorkflow,
@@ -197,6 +208,16 @@ def invalidate_models_cache(sender, **kwargs):
             cache.delete_pattern(f"{cache_key}(*)")
 
 
+@receiver(post_save, sender=Webhook)
+@receiver(post_delete, sender=Webhook)
+@receiver(m2m_changed, sender=Webhook.content_types.through)
+def invalidate_webhook_cache(sender, **kwargs):
+    """Invalidate the cached lists of Webhooks to be called for each content-type and change action."""
+    with contextlib.suppress(redis.exceptions.ConnectionError):
+        cache_key = construct_cache_key(Webhook.objects, method_name="get_for_change", branch_aware=True)
+        cache.delete_pattern(f"{cache_key}(*)")
+
+
 @receiver(post_delete, sender=CustomField)
 @receiver(post_delete, sender=CustomFieldChoice)
 @receiver(post_save, sender=CustomFieldChoice)
@@ -262,6 +283,182 @@ def invalidate_gitrepository_provided_contents_cache(sender, **kwargs):
         cache.delete_pattern(f"{cache_key}(*)")
 
 
+#
+# Config context cache
+#
+
+# Fields of related models that determine which ConfigContexts apply to a Device or VirtualMachine
+CONFIG_CONTEXT_SCOPE_DEPENDENCY_FIELDS = {
+    "dcim.devicetype": ("device_family_id",),
+    "dcim.location": ("parent_id",),
+    "tenancy.tenant": ("tenant_group_id",),
+    "tenancy.tenantgroup": ("parent_id",),
+    "virtualization.cluster": ("cluster_group_id", "location_id"),
+}
+
+
+def _get_config_context_models():
+    """Return all installed models that have a rendered config context."""
+    return [model for model in apps.get_models() if issubclass(model, ConfigContextModel)]
+
+
+def _invalidate_config_context_scope_cache(config_contexts):
+    """Invalidate the cached config context of all objects within the scope of any of the given ConfigContexts."""
+    for model in _get_config_context_models():
+        for config_context in config_contexts:
+            model.objects.get_for_config_context(config_context).invalidate_config_context_cache()
+
+
+def _get_config_context_scope_dependents(instance):
+    """
+    Return the querysets of Devices and VirtualMachines whose applicable ConfigContexts depend on the given instance.
+    """
+    from nautobot.dcim.models import Device, DeviceType, Location
+    from nautobot.tenancy.models import Tenant, TenantGroup
+    from nautobot.virtualization.models import Cluster, VirtualMachine
+
+    if isinstance(instance, DeviceType):
+        return [Device.objects.filter(device_type=instance)]
+    if isinstance(instance, Location):
+        locations = instance.descendants(include_self=True)
+        return [
+            Device.objects.filter(location__in=locations),
+            VirtualMachine.objects.filter(cluster__location__in=locations),
+        ]
+    if isinstance(instance, Tenant):
+        return [Device.objects.filter(tenant=instance), VirtualMachine.objects.filter(tenant=instance)]
+    if isinstance(instance, TenantGroup):
+        tenant_groups = instance.descendants(include_self=True)
+        return [
+            Device.objects.filter(tenant__tenant_group__in=tenant_groups),
+            VirtualMachine.objects.filter(tenant__tenant_group__in=tenant_groups),
+        ]
+    if isinstance(instance, Cluster):
+        return [Device.objects.filter(clusters=instance), VirtualMachine.objects.filter(cluster=instance)]
+    return []
+
+
+@receiver(post_save, sender=ConfigContext)
+@receiver(pre_delete, sender=ConfigContext)
+def invalidate_config_context_cache_for_config_context(sender, instance, raw=False, **kwargs):
+    """Invalidate the cached config context of all objects within the scope of a created/updated/deleted ConfigContext."""
+    if raw or not settings.CONFIG_CONTEXT_CACHE_TIMEOUT:
+        return
+    with contextlib.suppress(redis.exceptions.ConnectionError):
+        _invalidate_config_context_scope_cache([instance])
+
+
+@receiver(m2m_changed)
+def invalidate_config_context_cache_for_m2m_change(sender, instance, action, reverse, model, pk_set, **kwargs):
+    """
+    Invalidate cached config contexts affected by a change to the scope of a ConfigContext, or to the tags or clusters
+    of a Device or VirtualMachine.
+    """
+    if not settings.CONFIG_CONTEXT_CACHE_TIMEOUT:
+        return
+    with contextlib.suppress(redis.exceptions.ConnectionError):
+        if isinstance(instance, ConfigContext):
+            # Invalidate the scope both before and after the change, as it may have been narrowed or widened
+            _invalidate_config_context_scope_cache([instance])
+        elif not action.startswith("post_"):
+            return
+        elif isinstance(instance, ConfigContextModel):
+            type(instance).invalidate_config_context_cache([instance.pk])
+        elif reverse and issubclass(model, ConfigContextModel) and pk_set:
+            model.invalidate_config_context_cache(pk_set)
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def invalidate_config_context_cache_for_object(sender, instance, raw=False, created=False, **kwargs):
+    """Invalidate the cached config context of an updated or deleted Device or VirtualMachine."""
+    if raw or created or not settings.CONFIG_CONTEXT_CACHE_TIMEOUT or not isinstance(instance, ConfigContextModel):
+        return
+    with contextlib.suppress(redis.exceptions.ConnectionError):
+        type(instance).invalidate_config_context_cache([instance.pk])
+
+
+@receiver(post_save, sender=TaggedItem)
+@receiver(post_delete, sender=TaggedItem)
+@receiver(post_save, sender=StaticGroupAssociation)
+@receiver(pre_delete, sender=StaticGroupAssociation)
+def invalidate_config_context_cache_for_association(sender, instance, raw=False, **kwargs):
+    """Invalidate the cached config context of a Device or VirtualMachine whose tags or group memberships changed."""
+    if raw or not settings.CONFIG_CONTEXT_CACHE_TIMEOUT:
+        return
+    if sender is TaggedItem:
+        model = instance.content_type.model_class()
+        pk = instance.object_id
+    elif settings.CONFIG_CONTEXT_DYNAMIC_GROUPS_ENABLED:
+        model = instance.associated_object_type.model_class()
+        pk = instance.associated_object_id
+    else:
+        return
+    if model is not None and issubclass(model, ConfigContextModel):
+        with contextlib.suppress(redis.exceptions.ConnectionError):
+            model.invalidate_config_context_cache([pk])
+
+
+@receiver(pre_save)
+def _cache_config_context_scope_dependency_fields(sender, instance, raw=False, **kwargs):
+    """Record the prior values of any fields of this object that affect which ConfigContexts apply to other objects."""
+    if raw or not settings.CONFIG_CONTEXT_CACHE_TIMEOUT:
+        return
+    fields = CONFIG_CONTEXT_SCOPE_DEPENDENCY_FIELDS.get(sender._meta.label_lower)
+    if fields and instance.present_in_database:
+        instance._config_context_scope_dependency_values = (
+            sender.objects.filter(pk=instance.pk).values_list(*fields).first()
+        )
+
+
+@receiver(post_save)
+def invalidate_config_context_cache_for_scope_dependency(sender, instance, raw=False, created=False, **kwargs):
+    """
+    Invalidate the cached config context of objects related to a changed DeviceType, Location, Tenant, TenantGroup,
+    or Cluster, if that change affects which ConfigContexts apply to them (for example a change of parent Location).
+    """
+    if raw or created or not settings.CONFIG_CONTEXT_CACHE_TIMEOUT:
+        return
+    fields = CONFIG_CONTEXT_SCOPE_DEPENDENCY_FIELDS.get(sender._meta.label_lower)
+    if not fields:
+        return
+    old_values = instance.__dict__.pop("_config_context_scope_dependency_values", None)
+    if old_values == tuple(getattr(instance, field) for field in fields):
+        return
+    with contextlib.suppress(redis.exceptions.ConnectionError):
+        for queryset in _get_config_context_scope_dependents(instance):
+            queryset.invalidate_config_context_cache()
+
+
+@receiver(pre_delete)
+@receiver(post_delete)
+def invalidate_config_context_cache_for_scope_object(sender, instance, signal, **kwargs):
+    """
+    Invalidate cached config contexts affected by the deletion of an object that scopes one or more ConfigContexts.
+
+    Deleting such an object implicitly removes it from the scope of those ConfigContexts without sending `m2m_changed`,
+    so the scope of each is invalidated both before and after the deletion.
+    """
+    if not settings.CONFIG_CONTEXT_CACHE_TIMEOUT or sender is ConfigContext:
+        return
+    if signal is pre_delete:
+        scope_fields = [
+            field.name
+            for field in ConfigContext._meta.many_to_many
+            if field.related_model is sender._meta.concrete_model
+        ]
+        if not scope_fields:
+            return
+        query = Q()
+        for field_name in scope_fields:
+            query |= Q(**{field_name: instance})
+        instance._scoped_config_contexts = list(ConfigContext.objects.filter(query).distinct())
+    config_contexts = getattr(instance, "_scoped_config_contexts", None)
+    if config_contexts:
+        with contextlib.suppress(redis.exceptions.ConnectionError):
+            _invalidate_config_context_scope_cache(config_contexts)
+
+
 def _object_change_branch_name(instance):
     """
     Get the version-control branch name (if any) that needs to be switched to for ObjectChanges on a given instance.
@@ -423,6 +620,11 @@ def _handle_deleted_object(sender, instance, **kwargs):
                 cached_related_change = change_context.deferred_object_changes[unique_object_change_id][-1]
                 if cached_related_change["action"] != ObjectChangeActionChoices.ACTION_CREATE:
                     cached_related_change["action"] = ObjectChangeActionChoices.ACTION_DELETE
+                    if change_context.defer_object_changes and change_context.serialize_deferred_deletions:
+                        # Serialize the object now, while it still exists
+                        cached_related_change["objectchange"] = instance.to_objectchange(
+                            ObjectChangeActionChoices.ACTION_DELETE
+                        )
                     save_new_objectchange = False
 
                 related_changes = ObjectChange.objects.filter(
@@ -445,16 +647,21 @@ def _handle_deleted_object(sender, instance, **kwargs):
                             save_new_objectchange = False
 
             if save_new_objectchange:
-                change_context.deferred_object_changes.setdefault(unique_object_change_id, []).append(
-                    {
-                        "action": ObjectChangeActionChoices.ACTION_DELETE,
-                        "instance": instance,
-                        "user": user,
-                        "changed_object_id": changed_object_id,
-                        "changed_object_type": changed_object_type,
-                    }
-                )
-                if not change_context.defer_object_changes:
+                deferred_change = {
+                    "action": ObjectChangeActionChoices.ACTION_DELETE,
+                    "instance": instance,
+                    "user": user,
+                    "changed_object_id": changed_object_id,
+                    "changed_object_type": changed_object_type,
+                }
+                change_context.deferred_object_changes.setdefault(unique_object_change_id, []).append(deferred_change)
+                if change_context.defer_object_changes:
+                    if change_context.serialize_deferred_deletions:
+                        # Serialize the object now, while it still exists, but defer the actual database write
+                        deferred_change["objectchange"] = instance.to_objectchange(
+                            ObjectChangeActionChoices.ACTION_DELETE
+                        )
+                else:
                     objectchange = instance.to_objectchange(ObjectChangeActionChoices.ACTION_DELETE)
                     if objectchange is not None:
                         objectchange.user = user
@@ -633,6 +840,62 @@ m2m_changed.connect(dynamic_group_children_changed, sender=DynamicGroup.children
 pre_save.connect(dynamic_group_membership_created, sender=DynamicGroupMembership)
 
 
+@receiver(post_save)
+def update_dynamic_group_memberships_for_object(sender, instance, raw=False, created=False, **kwargs):
+    """Incrementally update the cached dynamic group memberships of a created or updated object."""
+    if (
+        raw
+        or not settings.DYNAMIC_GROUPS_INCREMENTAL_MEMBERSHIP_UPDATES
+        or not getattr(sender, "is_dynamic_group_associable_model", False)
+    ):
+        return
+    # Defer evaluation until the transaction is committed, so that changes made after the object itself was saved,
+    # such as to its tags, are also taken into account.
+    transaction.on_commit(
+        functools.partial(DynamicGroup.objects.update_cached_members_for_object, instance, created=created)
+    )
+
+
+@receiver(post_delete)
+def remove_dynamic_group_memberships_for_object(sender, instance, **kwargs):
+    """Remove the cached dynamic group memberships of a deleted object."""
+    if not settings.DYNAMIC_GROUPS_INCREMENTAL_MEMBERSHIP_UPDATES or not getattr(
+        sender, "is_dynamic_group_associable_model", False
+    ):
+        return
+    if hasattr(sender, "static_group_association_set"):
+        return  # associations were already deleted by cascade
+    for dynamic_group in DynamicGroup.objects.get_for_object(instance).exclude(
+        group_type=DynamicGroupTypeChoices.TYPE_STATIC
+    ):
+        dynamic_group._remove_members([instance])
+
+
+#
+# Global search index
+#
+
+
+@receiver(post_save)
+def update_search_document_for_object(sender, instance, raw=False, **kwargs):
+    """Create or update the global search index document of a created or updated object."""
+    if (
+        raw
+        or not settings.SEARCH_INDEX_ENABLED
+        or sender._meta.concrete_model not in SearchDocument.get_indexed_models()
+    ):
+        return
+    SearchDocument.objects.update_for_object(instance)
+
+
+@receiver(post_delete)
+def remove_search_document_for_object(sender, instance, **kwargs):
+    """Remove the global search index document of a deleted object."""
+    if not settings.SEARCH_INDEX_ENABLED or sender._meta.concrete_model not in SearchDocument.get_indexed_models():
+        return
+    SearchDocument.objects.remove_for_object(instance)
+
+
 #
 # Jobs
 #
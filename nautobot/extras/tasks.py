@@ -67,19 +67,9 @@ def process_webhook(webhook_pk, data, model_name, event, timestamp, username, re
     Make a POST request to the defined Webhook
     """
     from nautobot.extras.models import Webhook  # avoiding circular import
-    from nautobot.extras.webhooks import validate_webhook_url  # avoiding circular import
 
     webhook = Webhook.objects.get(pk=webhook_pk)
 
-    # SSRF defense-in-depth: re-validate the URL here (with DNS resolution) since the worker is the entity opening
-    # the outbound connection, and its DNS view may differ from the web server's. Catches any rows that predate
-    # the SSRF policy. Returns the resolved IP for use below in DNS-rebinding mitigation.
-    try:
-        validated_ip = validate_webhook_url(webhook.payload_url)
-    except ValidationError as e:
-        logger.error("Webhook %s payload URL %r blocked by SSRF policy: %s", webhook, webhook.payload_url, e)
-        raise
-
     context = {
         "event": dict(ObjectChangeActionChoices)[event].lower(),
         "timestamp": timestamp,
@@ -89,6 +79,58 @@ def process_webhook(webhook_pk, data, model_name, event, timestamp, username, re
         "data": data,
         "snapshots": snapshots,
     }
+    return _send_webhook(webhook, context, f"{context['model']} {context['event']}")
+
+
+@nautobot_task
+def process_webhook_batch(webhook_pk, changes, timestamp, username, request_id):
+    """
+    Make a single POST request to the defined Webhook describing multiple changes.
+
+    Args:
+        webhook_pk (str): PK of a Webhook with `batch_delivery` enabled.
+        changes (list): One dict per change, with the same `event`, `model`, `data`, and `snapshots` keys as the
+            context of a non-batched webhook request.
+        timestamp (str): Time at which the changes were enqueued.
+        username (str): Name of the user who made the changes.
+        request_id (str): Change ID of the request or Job that made the changes.
+    """
+    from nautobot.extras.models import Webhook  # avoiding circular import
+
+    webhook = Webhook.objects.get(pk=webhook_pk)
+
+    context = {
+        "event": "batch",
+        "timestamp": timestamp,
+        "username": username,
+        "request_id": request_id,
+        "changes": [
+            {
+                "event": dict(ObjectChangeActionChoices)[change["event"]].lower(),
+                "model": change["model"],
+                "data": change["data"],
+                "snapshots": change["snapshots"],
+            }
+            for change in changes
+        ],
+    }
+    return _send_webhook(webhook, context, f"batch of {len(changes)} changes")
+
+
+def _send_webhook(webhook, context, description):
+    """
+    Render and send the HTTP request for the given Webhook and context data.
+    """
+    from nautobot.extras.webhooks import validate_webhook_url  # avoiding circular import
+
+    # SSRF defense-in-depth: re-validate the URL here (with DNS resolution) since the worker is the entity opening
+    # the outbound connection, and its DNS view may differ from the web server's. Catches any rows that predate
+    # the SSRF policy. Returns the resolved IP for use below in DNS-rebinding mitigation.
+    try:
+        validated_ip = validate_webhook_url(webhook.payload_url)
+    except ValidationError as e:
+        logger.error("Webhook %s payload URL %r blocked by SSRF policy: %s", webhook, webhook.payload_url, e)
+        raise
 
     # Build the headers for the HTTP request
     headers = {
@@ -114,7 +156,7 @@ def process_webhook(webhook_pk, data, model_name, event, timestamp, username, re
         "headers": headers,
         "data": body.encode("utf8"),
     }
-    logger.info("Sending %s request to %s (%s %s)", params["method"], params["url"], context["model"], context["event"])
+    logger.info("Sending %s request to %s (%s)", params["method"], params["url"], description)
     logger.debug("%s", params)
     try:
         prepared_request = requests.Request(**params).prepare()
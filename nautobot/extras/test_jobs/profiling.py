@@ -1,5 +1,6 @@
 from nautobot.core.celery import register_jobs
 from nautobot.extras.jobs import get_task_logger, Job
+from nautobot.extras.models import Status
 
 logger = get_task_logger(__name__)
 
@@ -17,6 +18,8 @@ class TestProfilingJob(Job):
         """
 
         logger.info("Profiling test.")
+        for status in Status.objects.all():
+            status.content_types.count()
 
         return []
 
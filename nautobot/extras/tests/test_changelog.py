@@ -419,6 +419,59 @@ class ChangeLogAPITest(APITestCase):
         self.assertEqual(oc.object_data["tags"], sorted([tag.name for tag in self.tags[:2]]))
         self.assertEqual(oc.user_id, self.user.pk)
 
+    def test_bulk_create_objects(self):
+        """Test that bulk creation via the REST API creates ObjectChanges in bulk."""
+        location_type = LocationType.objects.get(name="Campus")
+        data = [
+            {
+                "name": f"Test Location {i}",
+                "status": self.statuses[0].pk,
+                "location_type": f"{location_type.pk}",
+                "tags": [{"name": self.tags[0].name}],
+            }
+            for i in range(1, 4)
+        ]
+        url = reverse("dcim-api:location-list")
+        self.add_permissions("dcim.add_location", "dcim.view_locationtype", "extras.view_tag", "extras.view_status")
+
+        response = self.client.post(url, data, format="json", **self.header)
+        self.assertHttpStatus(response, status.HTTP_201_CREATED)
+
+        for location_data in response.data:
+            location = Location.objects.get(pk=location_data["id"])
+            ocs = get_changes_for_model(location)
+            self.assertEqual(ocs.count(), 1)
+            oc = ocs.first()
+            self.assertEqual(oc.action, ObjectChangeActionChoices.ACTION_CREATE)
+            self.assertEqual(oc.object_data["tags"], [self.tags[0].name])
+            self.assertEqual(oc.user_id, self.user.pk)
+            self.assertEqual(oc.user_name, self.user.username)
+
+    def test_bulk_delete_objects(self):
+        """Test that deleted objects are serialized prior to deletion, even though ObjectChanges are deferred."""
+        location_type = LocationType.objects.get(name="Campus")
+        locations = []
+        for i in range(1, 4):
+            location = Location.objects.create(
+                name=f"Test Location {i}", location_type=location_type, status=self.statuses[0]
+            )
+            location.tags.set(self.tags[:2])
+            locations.append(location)
+        self.add_permissions("dcim.delete_location", "extras.view_status")
+        url = reverse("dcim-api:location-list")
+
+        response = self.client.delete(
+            url, [{"id": location.pk} for location in locations], format="json", **self.header
+        )
+        self.assertHttpStatus(response, status.HTTP_204_NO_CONTENT)
+
+        for location in locations:
+            oc = ObjectChange.objects.get(changed_object_id=location.pk)
+            self.assertEqual(oc.action, ObjectChangeActionChoices.ACTION_DELETE)
+            self.assertEqual(oc.object_repr, location.name)
+            self.assertEqual(oc.object_data["tags"], sorted([tag.name for tag in self.tags[:2]]))
+            self.assertEqual(oc.user_id, self.user.pk)
+
     @override_settings(EXEMPT_VIEW_PERMISSIONS=["*"])
     def test_get_graphql_object(self):
         """Test GET with changelogs via GraphQL."""
@@ -1,10 +1,11 @@
 import random
+from unittest import mock
 
 from django.apps import apps
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
 from django.db.models import ProtectedError, QuerySet
-from django.test import tag
+from django.test import override_settings, tag
 from django.urls import reverse
 
 from nautobot.core.forms.fields import (
@@ -35,6 +36,7 @@ from nautobot.extras.choices import (
     DynamicGroupTypeChoices,
     RelationshipTypeChoices,
 )
+from nautobot.extras.context_managers import web_request_context
 from nautobot.extras.filters import DynamicGroupFilterSet, DynamicGroupMembershipFilterSet
 from nautobot.extras.models import (
     CustomField,
@@ -44,10 +46,16 @@ from nautobot.extras.models import (
     Relationship,
     RelationshipAssociation,
     Role,
+    StaticGroupAssociation,
     Status,
     Tag,
 )
-from nautobot.extras.utils import FeatureQuery, fixup_dynamic_group_group_types
+from nautobot.extras.utils import (
+    bulk_create_with_bulk_change_logging,
+    bulk_update_with_bulk_change_logging,
+    FeatureQuery,
+    fixup_dynamic_group_group_types,
+)
 from nautobot.ipam.models import IPAddress, Prefix
 from nautobot.ipam.querysets import PrefixQuerySet
 from nautobot.tenancy.models import Tenant
@@ -470,6 +478,194 @@ class DynamicGroupModelTest(DynamicGroupTestBase):  # TODO: BaseModelTestCase mi
         # Test idempotence
         group.update_cached_members()
 
+    def test_update_cached_membership_of(self):
+        """Test `DynamicGroup.update_cached_membership_of()`."""
+        group = self.first_child
+        device = self.devices[1]
+        group.update_cached_members()
+        self.assertFalse(group.has_member(device))
+
+        device.location = self.locations[0]
+        device.save()
+        self.assertFalse(group.has_member(device))
+        self.assertTrue(group.update_cached_membership_of(device))
+        self.assertTrue(group.has_member(device))
+        # Test idempotence
+        self.assertFalse(group.update_cached_membership_of(device))
+
+        device.location = self.locations[1]
+        device.save()
+        self.assertTrue(group.update_cached_membership_of(device, is_cached_member=True))
+        self.assertFalse(group.has_member(device))
+
+    @override_settings(DYNAMIC_GROUPS_INCREMENTAL_MEMBERSHIP_UPDATES=True)
+    def test_incremental_membership_updates(self):
+        """Test that cached members are incrementally updated when an object is created, updated, or deleted."""
+        for group in self.groups:
+            group.update_cached_members()
+
+        def assert_members_up_to_date():
+            for group in self.groups:
+                with self.subTest(group.name):
+                    self.assertEqual(
+                        sorted(group.members.values_list("pk", flat=True)),
+                        sorted(group._get_group_queryset().values_list("pk", flat=True)),
+                    )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            device = Device.objects.create(
+                name="device-location-3-new",
+                status=self.status_3,
+                role=self.device_role,
+                device_type=self.device_type,
+                location=self.locations[2],
+            )
+        self.assertTrue(self.second_child.has_member(device))
+        self.assertTrue(self.parent.has_member(device))
+        assert_members_up_to_date()
+
+        # Membership of the nested child group should propagate to its ancestors
+        with self.captureOnCommitCallbacks(execute=True):
+            device.status = self.status_1
+            device.save()
+        self.assertTrue(self.nested_child.has_member(device))
+        self.assertTrue(self.third_child.has_member(device))
+        self.assertFalse(self.parent.has_member(device))
+        assert_members_up_to_date()
+
+        device_pk = device.pk
+        device.delete()
+        self.assertFalse(StaticGroupAssociation.all_objects.filter(associated_object_id=device_pk).exists())
+
+    @override_settings(DYNAMIC_GROUPS_INCREMENTAL_MEMBERSHIP_UPDATES=True)
+    def test_incremental_membership_updates_for_bulk_changes(self):
+        """Test that cached members are incrementally updated when objects are created or updated in bulk."""
+        for group in self.groups:
+            group.update_cached_members()
+
+        def assert_members_up_to_date():
+            for group in self.groups:
+                with self.subTest(group.name):
+                    self.assertEqual(
+                        sorted(group.members.values_list("pk", flat=True)),
+                        sorted(group._get_group_queryset().values_list("pk", flat=True)),
+                    )
+
+        with self.captureOnCommitCallbacks(execute=True), web_request_context(self.user):
+            devices = bulk_create_with_bulk_change_logging(
+                [
+                    Device(
+                        name=f"device-location-3-bulk-{i}",
+                        status=self.status_3,
+                        role=self.device_role,
+                        device_type=self.device_type,
+                        location=self.locations[2],
+                    )
+                    for i in range(3)
+                ]
+            )
+        for device in devices:
+            self.assertTrue(self.second_child.has_member(device))
+            self.assertTrue(self.parent.has_member(device))
+        assert_members_up_to_date()
+
+        with self.captureOnCommitCallbacks(execute=True), web_request_context(self.user):
+            bulk_update_with_bulk_change_logging(
+                Device.objects.filter(pk__in=[device.pk for device in devices]), {"status": self.status_1}
+            )
+        for device in devices:
+            self.assertTrue(self.nested_child.has_member(device))
+            self.assertTrue(self.third_child.has_member(device))
+            self.assertFalse(self.parent.has_member(device))
+        assert_members_up_to_date()
+
+    def test_get_refresh_generations(self):
+        """Test `DynamicGroupQuerySet.get_refresh_generations()`."""
+        generations = DynamicGroup.objects.filter(pk__in=[group.pk for group in self.groups]).get_refresh_generations()
+        self.assertEqual(len(generations), 3)
+        self.assertEqual(
+            {group.pk for group in generations[0]},
+            {group.pk for group in self.groups if group.group_type == DynamicGroupTypeChoices.TYPE_DYNAMIC_FILTER},
+        )
+        self.assertEqual([group.pk for group in generations[1]], [self.third_child.pk])
+        self.assertEqual([group.pk for group in generations[2]], [self.parent.pk])
+
+        # Descendants outside of the queryset are not considered
+        queryset = DynamicGroup.objects.filter(pk__in=[self.parent.pk, self.nested_child.pk])
+        generations = queryset.get_refresh_generations()
+        self.assertEqual(
+            [[group.pk for group in generation] for generation in generations],
+            [[self.nested_child.pk, self.parent.pk]],
+        )
+
+    def test_queryset_update_cached_members(self):
+        """Test `DynamicGroupQuerySet.update_cached_members()`."""
+        queryset = DynamicGroup.objects.filter(pk__in=[group.pk for group in self.groups])
+        results = queryset.update_cached_members()
+        self.assertEqual(len(results), len(self.groups))
+        self.assertEqual(len({result.group.pk for result in results}), len(self.groups))
+        # Each group is refreshed after its descendants
+        refreshed = [result.group.pk for result in results]
+        self.assertLess(refreshed.index(self.nested_child.pk), refreshed.index(self.third_child.pk))
+        self.assertLess(refreshed.index(self.third_child.pk), refreshed.index(self.parent.pk))
+        for result in results:
+            with self.subTest(result.group.name):
+                self.assertIsNone(result.error)
+                self.assertGreaterEqual(result.duration, 0)
+                self.assertEqual(result.member_count, result.group.count)
+
+    def test_queryset_update_cached_members_concurrently(self):
+        """Test `DynamicGroupQuerySet.update_cached_members()` with multiple workers."""
+        queryset = DynamicGroup.objects.filter(pk__in=[group.pk for group in self.groups])
+        refreshed = []
+
+        def update_cached_members(group, members=None):
+            refreshed.append(group.pk)
+            if group.pk == self.nested_child.pk:
+                raise RuntimeError("Refresh failed")
+
+        # The worker threads don't see the data of this test's transaction, so the refresh itself is mocked out
+        with (
+            mock.patch.object(DynamicGroup, "update_cached_members", autospec=True, side_effect=update_cached_members),
+            mock.patch.object(DynamicGroup, "count", new_callable=mock.PropertyMock, return_value=0),
+        ):
+            results = queryset.update_cached_members(max_workers=4)
+
+            # Each group is refreshed after its descendants, even if refreshing one of them failed
+            self.assertEqual(sorted(refreshed), sorted(group.pk for group in self.groups))
+            self.assertLess(refreshed.index(self.nested_child.pk), refreshed.index(self.third_child.pk))
+            self.assertLess(refreshed.index(self.third_child.pk), refreshed.index(self.parent.pk))
+            self.assertEqual(len(results), len(self.groups))
+            for result in results:
+                with self.subTest(result.group.name):
+                    if result.group.pk == self.nested_child.pk:
+                        self.assertIsInstance(result.error, RuntimeError)
+                        self.assertIsNone(result.member_count)
+                    else:
+                        self.assertIsNone(result.error)
+                        self.assertEqual(result.member_count, 0)
+
+            # With raise_on_error, no later generation of groups is refreshed after the error
+            refreshed.clear()
+            with self.assertRaisesRegex(RuntimeError, "Refresh failed"):
+                queryset.update_cached_members(max_workers=4, raise_on_error=True)
+            self.assertIn(self.nested_child.pk, refreshed)
+            self.assertNotIn(self.third_child.pk, refreshed)
+            self.assertNotIn(self.parent.pk, refreshed)
+
+    def test_save_stops_refreshing_after_error(self):
+        """Test that an error refreshing a group's cached members stops `DynamicGroup.save()` at once."""
+        refreshed = []
+
+        def update_cached_members(group, members=None):
+            refreshed.append(group.pk)
+            raise RuntimeError("Refresh failed")
+
+        with mock.patch.object(DynamicGroup, "update_cached_members", autospec=True, side_effect=update_cached_members):
+            with self.assertRaisesRegex(RuntimeError, "Refresh failed"):
+                self.nested_child.save(update_cached_members=True)
+        self.assertEqual(refreshed, [self.nested_child.pk])
+
     def test_count(self):
         """Test `DynamicGroup.count`."""
         expected = [
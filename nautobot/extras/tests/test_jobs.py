@@ -42,7 +42,7 @@ from nautobot.extras.choices import (
 )
 from nautobot.extras.context_managers import change_logging, JobHookChangeContext, web_request_context
 from nautobot.extras.jobs import BaseJob, get_job, get_jobs, run_console_log_job_and_return_job_result
-from nautobot.extras.models import Job, JobQueue, JobResult
+from nautobot.extras.models import Job, JobQueue, JobResult, Status
 from nautobot.extras.models.jobs import JOB_LOGS, JobLogEntry
 
 
@@ -995,6 +995,38 @@ class JobTransactionTest(TransactionTestCase):
         self.assertFalse(logs.filter(message="I should NOT be logged to the database").exists())
         self.assertTrue(logs.filter(message="I should be logged to the database").exists())
 
+    def test_buffered_logs_saved_on_failure(self):
+        """
+        Test that log entries buffered by the database log handler are saved even when the job fails.
+        """
+        module = "fail"
+        name = "TestFailJob"
+        job_result = create_job_result_and_run_job(module, name)
+
+        self.assertEqual(job_result.status, JobResultStatusChoices.STATUS_FAILURE)
+        logs = job_result.job_log_entries
+        self.assertTrue(logs.filter(message="before_start() was called as expected").exists())
+        self.assertTrue(logs.filter(message="I'm a test job that fails!").exists())
+        self.assertTrue(logs.filter(message="on_failure() was called as expected").exists())
+        self.assertEqual(job_result.info_log_count, logs.filter(log_level=LogLevelChoices.LOG_INFO).count())
+
+    def test_buffered_logs_saved_on_clean_failure(self):
+        """
+        Test that log entries buffered by the database log handler are saved and counted when the job calls self.fail().
+        """
+        module = "fail"
+        name = "TestFailCleanly"
+        job_result = create_job_result_and_run_job(module, name)
+
+        self.assertEqual(job_result.status, JobResultStatusChoices.STATUS_FAILURE)
+        logs = job_result.job_log_entries
+        self.assertTrue(logs.filter(message="I'm a test job that fails!").exists())
+        self.assertTrue(logs.filter(message="Failure", log_level=LogLevelChoices.LOG_FAILURE).exists())
+        self.assertTrue(logs.filter(message="on_failure() was called as expected").exists())
+        self.assertTrue(logs.filter(message="after_return() was called as expected").exists())
+        self.assertEqual(job_result.info_log_count, logs.filter(log_level=LogLevelChoices.LOG_INFO).count())
+        self.assertEqual(job_result.error_log_count, logs.filter(log_level=LogLevelChoices.LOG_FAILURE).count())
+
     def test_log_counts_by_level(self):
         """
         Test that related JobLogEntry counts are stored for JobResult list summary.
@@ -1097,13 +1129,45 @@ class JobTransactionTest(TransactionTestCase):
 
         self.assertJobResultStatus(job_result)
 
-        # Profiling data is available as a downloadable FileProxy linked to the JobResult
+        # Profiling data is available as downloadable FileProxies linked to the JobResult
         job_result.refresh_from_db()
-        self.assertEqual(job_result.files.count(), 1)
-        file_proxy = job_result.files.first()
-        self.assertEqual(file_proxy.name, f"nautobot-jobresult-{job_result.id}.pstats")
+        self.assertEqual(job_result.files.count(), 2)
+        file_proxy = job_result.files.get(name=f"nautobot-jobresult-{job_result.id}.pstats")
         self.assertGreater(len(file_proxy.file.read()), 0)
 
+        file_proxy = job_result.files.get(name=f"nautobot-jobresult-{job_result.id}-sql.json")
+        sql_profile = json.loads(file_proxy.file.read())
+        status_count = Status.objects.count()
+        self.assertGreater(sql_profile["query_count"], status_count)
+        self.assertEqual(len(sql_profile["queries"]), sql_profile["query_count"])
+        self.assertGreaterEqual(sql_profile["duplicate_query_count"], status_count - 1)
+        # The repeated per-Status query is grouped under a single fingerprint and attributed to the job's code
+        fingerprint = next(
+            fingerprint
+            for fingerprint in sql_profile["fingerprints"]
+            if "extras_status_content_types" in fingerprint["fingerprint"]
+        )
+        self.assertEqual(fingerprint["count"], status_count)
+        self.assertIn("profiling.py", fingerprint["top_call_site"])
+        self.assertTrue(JobLogEntry.objects.filter(job_result=job_result, message__startswith="Executed ").exists())
+
+    def test_job_profiling_exceeds_max_file_size(self):
+        """Failure to save profiling data that is too large doesn't affect the outcome of the job."""
+        module = "profiling"
+        name = "TestProfilingJob"
+
+        with override_config(JOB_CREATE_FILE_MAX_SIZE=1):
+            job_result = create_job_result_and_run_job(module, name, profile=True)
+
+        self.assertJobResultStatus(job_result)
+        self.assertEqual(job_result.result, [])
+        self.assertEqual(job_result.files.count(), 0)
+        self.assertTrue(
+            JobLogEntry.objects.filter(
+                job_result=job_result, message__startswith="Unable to save SQL profiling data"
+            ).exists()
+        )
+
     def test_job_singleton(self):
         module = "singleton"
         name = "TestSingletonJob"
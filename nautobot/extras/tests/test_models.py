@@ -10,6 +10,7 @@ from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group
 from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.db.models import ProtectedError
@@ -54,6 +55,7 @@ from nautobot.extras.constants import (
     JOB_LOG_MAX_LOG_OBJECT_LENGTH,
     JOB_OVERRIDABLE_FIELDS,
 )
+from nautobot.extras.context_managers import web_request_context
 from nautobot.extras.datasources.registry import get_datasource_contents
 from nautobot.extras.jobs import get_job
 from nautobot.extras.models import (
@@ -84,6 +86,7 @@ from nautobot.extras.models import (
     Role,
     SavedView,
     ScheduledJob,
+    SearchDocument,
     Secret,
     SecretsGroup,
     SecretsGroupAssociation,
@@ -96,7 +99,8 @@ from nautobot.extras.models import (
 from nautobot.extras.registry import registry
 from nautobot.extras.secrets.exceptions import SecretParametersError, SecretProviderError, SecretValueNotFoundError
 from nautobot.extras.tests.git_helper import create_and_populate_git_repository
-from nautobot.ipam.models import IPAddress
+from nautobot.extras.utils import bulk_update_with_bulk_change_logging
+from nautobot.ipam.models import IPAddress, VLAN
 from nautobot.tenancy.models import Tenant
 from nautobot.virtualization.models import (
     Cluster,
@@ -1385,6 +1389,75 @@ class ConfigContextTest(ModelTestCases.BaseModelTestCase):
             annotated_device = Device.objects.filter(pk=self.device.pk).annotate_config_context_data().first()
             self.assertEqual(self.device.get_config_context(), annotated_device.get_config_context())
 
+    @override_settings(CONFIG_CONTEXT_CACHE_TIMEOUT=60)
+    def test_config_context_cache(self):
+        """
+        Verify that rendered config contexts are cached, and that changes invalidate only the affected objects.
+        """
+        other_location = Location.objects.create(
+            name="Other Location",
+            location_type=self.location.location_type,
+            status=self.location.status,
+            parent=self.parent_location,
+        )
+        device2 = Device.objects.create(
+            name="Device 2",
+            location=other_location,
+            role=self.devicerole,
+            status=self.device_status,
+            device_type=self.devicetype,
+        )
+        self.device.local_config_context_data = {"local": True}
+        self.device.save()
+        expected_data = {"a": 123, "b": 456, "c": 777, "local": True}
+        self.assertEqual(self.device.get_config_context(), expected_data)
+        device2.get_config_context()
+        device2_cache_key = Device._get_config_context_cache_key(device2.pk)
+        self.assertIsNotNone(cache.get(device2_cache_key))
+
+        # Subsequent reads are a cache lookup only
+        device = Device.objects.get(pk=self.device.pk)
+        with self.assertNumQueries(0):
+            self.assertEqual(device.get_config_context(), expected_data)
+
+        # Scoping a new ConfigContext to one location invalidates only the devices in that location
+        location_context = ConfigContext.objects.create(name="location", weight=200, data={"b": 1})
+        device2.get_config_context()
+        location_context.locations.add(self.location)
+        self.assertEqual(device.get_config_context(), {**expected_data, "b": 1})
+        self.assertIsNotNone(cache.get(device2_cache_key))
+
+        # Changing the data of a ConfigContext
+        location_context.data = {"b": 2}
+        location_context.save()
+        self.assertEqual(device.get_config_context(), {**expected_data, "b": 2})
+        self.assertIsNotNone(cache.get(device2_cache_key))
+
+        # Changing a scoping attribute of a device
+        tag_context = ConfigContext.objects.create(name="tag", weight=300, data={"c": 3})
+        tag_context.tags.add(self.tag)
+        self.assertEqual(device.get_config_context(), {**expected_data, "b": 2})
+        device.tags.add(self.tag)
+        self.assertEqual(device.get_config_context(), {**expected_data, "b": 2, "c": 3})
+        device.location = other_location
+        device.save()
+        self.assertEqual(device.get_config_context(), {**expected_data, "c": 3})
+
+        # Changing the hierarchy of a scoping object
+        other_location.parent = self.location
+        other_location.save()
+        self.assertEqual(device.get_config_context(), {**expected_data, "b": 2, "c": 3})
+        self.assertEqual(device2.get_config_context(), {"a": 123, "b": 2, "c": 777})
+
+        # Deleting an object that scopes a ConfigContext widens that ConfigContext's scope
+        self.tag.delete()
+        self.assertEqual(device2.get_config_context(), {"a": 123, "b": 2, "c": 3})
+
+        # Deleting a ConfigContext
+        location_context.delete()
+        self.assertEqual(device.get_config_context(), {**expected_data, "c": 3})
+        self.assertEqual(device2.get_config_context(), {"a": 123, "b": 456, "c": 3})
+
 
 class ConfigContextSchemaTestCase(ModelTestCases.BaseModelTestCase):
     """
@@ -1666,6 +1739,27 @@ class ExportTemplateTest(ModelTestCases.BaseModelTestCase):
             )
             nonduplicate_template.validated_save()
 
+    def test_render_iter(self):
+        """Rendering incrementally should produce the same output as rendering all at once."""
+        export_template = ExportTemplate(
+            content_type=self.device_ct,
+            name="Streaming Export Template",
+            template_code="{% for device in queryset %}{{ device.name }}\r\n{% endfor %}{{ queryset|length }}\r\n",
+        )
+        queryset = Device.objects.all()
+        output = "".join(export_template.render_iter(queryset, chunk_size=2))
+        self.assertEqual(output, export_template.render(queryset))
+        self.assertNotIn("\r", output)
+        expected_lines = [str(device.name) for device in queryset] + [str(queryset.count())]
+        self.assertEqual(output.splitlines(), expected_lines)
+
+    def test_render_to_response(self):
+        export_template = ExportTemplate.objects.get(name="Export Template 1")
+        response = export_template.render_to_response(Device.objects.all())
+        self.assertTrue(response.streaming)
+        self.assertEqual(b"".join(response.streaming_content), b"hello world")
+        self.assertIn("attachment;", response["Content-Disposition"])
+
 
 class ExternalIntegrationTest(ModelTestCases.BaseModelTestCase):
     """
@@ -3620,6 +3714,102 @@ class ScheduledJobTest(ModelTestCases.BaseModelTestCase):
     #     scheduler.apply_async(entry=entry, producer=None, advance=False)
 
 
+@override_settings(SEARCH_INDEX_ENABLED=True)
+class SearchDocumentTest(TestCase):
+    """Tests for the SearchDocument model and queryset."""
+
+    def setUp(self):
+        self.tenant_ct = ContentType.objects.get_for_model(Tenant)
+        self.tenants = (
+            Tenant.objects.create(name="Searchable"),
+            Tenant.objects.create(name="Searchable Tenant"),
+            Tenant.objects.create(name="Other Tenant", description="Not so searchable"),
+        )
+
+    def test_get_indexed_models(self):
+        indexed_models = SearchDocument.get_indexed_models()
+        self.assertIn(Tenant, indexed_models)
+        self.assertIn("description", indexed_models[Tenant])
+        # IPAddress search implements custom logic and is not indexed
+        self.assertNotIn(IPAddress, indexed_models)
+        # Exact matches of numbers aren't indexed, but evaluated against the model's table
+        self.assertNotIn("vid", indexed_models[VLAN])
+        self.assertIn("vid", SearchDocument.get_unindexed_predicates(VLAN))
+        self.assertEqual(SearchDocument.get_unindexed_predicates(Tenant), {})
+
+    def test_is_search_indexed(self):
+        self.assertTrue(SearchDocument.is_search_indexed(Tenant, "searchable"))
+        # Only some predicates strip whitespace, so such searches use the FilterSet
+        self.assertFalse(SearchDocument.is_search_indexed(Tenant, " searchable"))
+        self.assertFalse(SearchDocument.is_search_indexed(IPAddress, "10.0.0.1"))
+        with override_settings(SEARCH_INDEX_ENABLED=False):
+            self.assertFalse(SearchDocument.is_search_indexed(Tenant, "searchable"))
+
+    def test_document_updated_on_save_and_removed_on_delete(self):
+        tenant = self.tenants[0]
+        document = SearchDocument.objects.get(content_type=self.tenant_ct, object_id=tenant.pk)
+        self.assertEqual(document.object_repr, "Searchable")
+
+        tenant.description = "A new description"
+        tenant.save()
+        document.refresh_from_db()
+        self.assertIn("A new description", document.text.splitlines())
+
+        tenant.delete()
+        self.assertFalse(SearchDocument.objects.filter(content_type=self.tenant_ct, object_id=tenant.pk).exists())
+
+    def test_search_ranking(self):
+        documents = SearchDocument.objects.filter(content_type=self.tenant_ct).search("searchable")
+        self.assertEqual(
+            [document.object_id for document in documents],
+            [self.tenants[0].pk, self.tenants[1].pk, self.tenants[2].pk],
+        )
+        self.assertEqual([document.rank for document in documents], [3, 2, 0])
+
+    def test_search_by_id(self):
+        documents = SearchDocument.objects.search(str(self.tenants[2].pk))
+        self.assertEqual([document.object_id for document in documents], [self.tenants[2].pk])
+
+    def test_filter_objects(self):
+        queryset = SearchDocument.objects.filter_objects(Tenant.objects.all(), "searchable tenant")
+        self.assertQuerysetEqualAndNotEmpty(queryset, [self.tenants[1]])
+        queryset = SearchDocument.objects.filter_objects(Tenant.objects.exclude(pk=self.tenants[0].pk), "searchable")
+        self.assertEqual(list(queryset), [self.tenants[1], self.tenants[2]])
+
+    def test_filter_objects_unindexed_predicates(self):
+        vlan = VLAN.objects.create(vid=4001, name="Searchable VLAN", status=Status.objects.get_for_model(VLAN).first())
+        queryset = SearchDocument.objects.filter_objects(VLAN.objects.filter(pk=vlan.pk), "4001")
+        self.assertQuerysetEqualAndNotEmpty(queryset, [vlan])
+        # Objects matching only unindexed predicates have the lowest rank
+        self.assertEqual(queryset.first().search_rank, 0)
+        # Unlike the index, the vid predicate is an exact match
+        self.assertNotIn(vlan, SearchDocument.objects.filter_objects(VLAN.objects.all(), "400"))
+
+    def test_rebuild(self):
+        SearchDocument.objects.all().delete()
+        counts = SearchDocument.objects.rebuild(models=[Tenant])
+        self.assertEqual(counts, {Tenant: Tenant.objects.count()})
+        self.assertEqual(SearchDocument.objects.filter(content_type=self.tenant_ct).count(), Tenant.objects.count())
+        self.assertEqual(SearchDocument.objects.exclude(content_type=self.tenant_ct).count(), 0)
+
+    def test_update_for_queryset(self):
+        Tenant.objects.filter(pk__in=[self.tenants[0].pk, self.tenants[1].pk]).update(description="Updated in bulk")
+        self.assertFalse(SearchDocument.objects.search("updated in bulk").exists())
+        count = SearchDocument.objects.update_for_queryset(Tenant.objects.filter(description="Updated in bulk"))
+        self.assertEqual(count, 2)
+        queryset = SearchDocument.objects.filter_objects(Tenant.objects.all(), "updated in bulk")
+        self.assertQuerysetEqualAndNotEmpty(queryset, [self.tenants[0], self.tenants[1]], ordered=False)
+        self.assertEqual(SearchDocument.objects.filter(content_type=self.tenant_ct).count(), Tenant.objects.count())
+        # IPAddress search implements custom logic and is not indexed
+        self.assertEqual(SearchDocument.objects.update_for_queryset(IPAddress.objects.all()), 0)
+
+    def test_bulk_update_with_bulk_change_logging(self):
+        with web_request_context(self.user):
+            bulk_update_with_bulk_change_logging(Tenant.objects.filter(pk=self.tenants[2].pk), {"name": "Renamed"})
+        queryset = SearchDocument.objects.filter_objects(Tenant.objects.all(), "renamed")
+        self.assertQuerysetEqualAndNotEmpty(queryset, [self.tenants[2]])
+
+
 class SecretTest(ModelTestCases.BaseModelTestCase):
     """
     Tests for the `Secret` model class.
@@ -23,7 +23,7 @@ from nautobot.extras.context_managers import web_request_context
 from nautobot.extras.models import Tag, Webhook
 from nautobot.extras.models.statuses import Status
 from nautobot.extras.registry import registry
-from nautobot.extras.tasks import _send_webhook_request_pinned, process_webhook
+from nautobot.extras.tasks import _send_webhook_request_pinned, process_webhook, process_webhook_batch
 from nautobot.extras.utils import generate_signature
 from nautobot.extras.webhooks import validate_webhook_url, validate_webhook_url_format
 
@@ -518,7 +518,99 @@ class WebhookTest(APITestCase):
         all_changes = get_changes_for_model(location)
         self.assertEqual(all_changes.count(), 1)
         change = all_changes.first()
-        mock_enqueue_webhooks.assert_called_once_with(change, snapshots=change.get_snapshots(), webhook_queryset=None)
+        mock_enqueue_webhooks.assert_called_once_with(
+            change, snapshots=change.get_snapshots(), webhook_queryset=None, batched_changes={}
+        )
+
+    @patch("nautobot.extras.tasks.process_webhook_batch.apply_async")
+    @patch("nautobot.extras.tasks.process_webhook.apply_async")
+    def test_enqueue_webhooks_batch_delivery(self, mock_async, mock_batch_async):
+        """
+        Make sure that a Webhook with batch delivery enabled is enqueued once for all changes in the change context.
+        """
+        request_id = uuid.uuid4()
+        webhook = Webhook.objects.get(type_create=True)
+        webhook.batch_delivery = True
+        webhook.save()
+        location_type = LocationType.objects.get(name="Campus")
+
+        with web_request_context(self.user, change_id=request_id):
+            for i in range(3):
+                Location.objects.create(name=f"Location {i}", location_type=location_type, status=self.statuses[0])
+
+        mock_async.assert_not_called()
+        mock_batch_async.assert_called_once()
+        args = mock_batch_async.call_args[1]["args"]
+        self.assertEqual(args[0], webhook.pk)
+        self.assertEqual([change["data"]["name"] for change in args[1]], ["Location 0", "Location 1", "Location 2"])
+        self.assertEqual({change["event"] for change in args[1]}, {ObjectChangeActionChoices.ACTION_CREATE})
+        self.assertEqual({change["model"] for change in args[1]}, {"location"})
+        self.assertEqual(args[1][0]["snapshots"]["postchange"]["name"], "Location 0")
+        self.assertEqual(args[3], self.user.username)
+        self.assertEqual(args[4], request_id)
+
+    def test_webhooks_process_webhook_batch(self):
+        """
+        Mock a Session.send to inspect the result of `process_webhook_batch()`.
+        """
+        request_id = uuid.uuid4()
+        webhook = Webhook.objects.get(type_create=True)
+        timestamp = str(timezone.now())
+        changes = [
+            {
+                "event": ObjectChangeActionChoices.ACTION_CREATE,
+                "model": "location",
+                "data": {"name": f"Location {i}"},
+                "snapshots": {"prechange": None, "postchange": {"name": f"Location {i}"}, "differences": {}},
+            }
+            for i in range(2)
+        ]
+
+        def mock_send(_, request, **kwargs):
+            self.assertEqual(request.headers["X-Hook-Signature"], generate_signature(request.body, webhook.secret))
+            body = json.loads(request.body)
+            self.assertEqual(body["event"], "batch")
+            self.assertEqual(body["timestamp"], timestamp)
+            self.assertEqual(body["username"], "nautobotuser")
+            self.assertEqual(body["request_id"], str(request_id))
+            self.assertEqual(len(body["changes"]), 2)
+            self.assertEqual(body["changes"][0]["event"], "created")
+            self.assertEqual(body["changes"][0]["model"], "location")
+            self.assertEqual(body["changes"][1]["data"]["name"], "Location 1")
+            self.assertEqual(body["changes"][1]["snapshots"]["postchange"]["name"], "Location 1")
+
+            class FakeResponse:
+                ok = True
+                status_code = 200
+
+            return FakeResponse()
+
+        with patch.object(Session, "send", mock_send):
+            process_webhook_batch(webhook.pk, changes, timestamp, "nautobotuser", str(request_id))
+
+    def test_webhook_cache_invalidation(self):
+        """
+        Make sure the cached Webhooks for a content-type and action are updated when Webhooks change.
+        """
+        location_ct = ContentType.objects.get_for_model(Location)
+        location_type_ct = ContentType.objects.get_for_model(LocationType)
+        webhook = Webhook.objects.get(type_create=True)
+        action = ObjectChangeActionChoices.ACTION_CREATE
+
+        self.assertEqual(Webhook.objects.get_for_change(location_ct, action), [webhook])
+        self.assertEqual(Webhook.objects.get_for_change(location_type_ct, action), [])
+        with self.assertNumQueries(0):
+            Webhook.objects.get_for_change(location_ct, action)
+
+        webhook.content_types.add(location_type_ct)
+        self.assertEqual(Webhook.objects.get_for_change(location_type_ct, action), [webhook])
+
+        webhook.enabled = False
+        webhook.save()
+        self.assertEqual(Webhook.objects.get_for_change(location_ct, action), [])
+
+        webhook.delete()
+        self.assertEqual(Webhook.objects.get_for_change(location_type_ct, action), [])
 
     def test_all_webhook_supported_models(self):
         """
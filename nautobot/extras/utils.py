@@ -1,6 +1,7 @@
 import collections
 import contextlib
 import copy
+import functools
 import hashlib
 import hmac
 import json
@@ -19,6 +20,7 @@ from django.db import transaction
 from django.db.models import Model, Q
 from django.db.models.deletion import Collector
 from django.template.loader import get_template, TemplateDoesNotExist
+from django.utils import timezone
 from django.utils.deconstruct import deconstructible
 import kubernetes.client
 import redis.exceptions
@@ -29,7 +31,7 @@ from nautobot.core.constants import CHARFIELD_MAX_LENGTH
 from nautobot.core.exceptions import FilterSetFieldNotFound
 from nautobot.core.models import BaseModel
 from nautobot.core.models.managers import TagsManager
-from nautobot.core.models.utils import find_models_with_matching_fields
+from nautobot.core.models.utils import find_models_with_matching_fields, serialize_object_v2
 from nautobot.core.utils.cache import construct_cache_key
 from nautobot.core.utils.data import is_uuid
 from nautobot.core.utils.lookup import get_filterset_for_model, get_model_for_view_name
@@ -971,9 +973,17 @@ def bulk_delete_with_bulk_change_logging(qs, batch_size=1000):
         oc.change_context_detail = context_detail
         return oc
 
+    # If changes are already being deferred by an enclosing context, write out those pending changes first,
+    # as the deferred changes are reset below after each batch.
+    was_deferring = change_context.defer_object_changes
+    if was_deferring:
+        change_context.create_object_changes(batch_size=batch_size)
+
     with transaction.atomic():
         try:
             change_context.defer_object_changes = True
+            # We build the ObjectChange records for deleted objects ourselves below
+            change_context.serialize_deferred_deletions = False
 
             # Snapshot parent PKs first so deletes in earlier batches do not shift later ones.
             parent_pks = list(qs.values_list("pk", flat=True))
@@ -1027,10 +1037,194 @@ def bulk_delete_with_bulk_change_logging(qs, batch_size=1000):
 
             return total_deleted, deleted_by_label
         finally:
-            change_context.defer_object_changes = False
+            change_context.defer_object_changes = was_deferring
+            change_context.serialize_deferred_deletions = True
             change_context.reset_deferred_object_changes()
 
 
+def bulk_update_with_bulk_change_logging(qs, field_values, batch_size=1000):
+    """
+    Update objects in the provided queryset with `QuerySet.update()` and create ObjectChange instances in bulk.
+
+    This bypasses the `save()` method and the `pre_save`/`post_save` signals of each object, so it must only be used
+    for fields whose changes require no side effects beyond the change log entry. Any `auto_now` fields (such as
+    `last_updated`) are updated as well. Objects are processed in chunks of ``batch_size``, and the whole operation
+    is wrapped in an atomic transaction.
+
+    Args:
+        qs (QuerySet): Objects to update.
+        field_values (dict): Mapping of field names to the new value of that field for all objects.
+        batch_size (int): Number of objects to update and log at a time.
+
+    Returns:
+        (int): The number of objects updated.
+    """
+    # Lazy imports to avoid circular imports.
+    from nautobot.extras.models import DynamicGroup, ObjectChange, SearchDocument
+    from nautobot.extras.signals import change_context_state
+
+    change_context = change_context_state.get()
+    if change_context is None:
+        raise ValueError("Change logging must be enabled before using bulk_update_with_bulk_change_logging")
+
+    user = change_context.get_user()
+    user_name = user.username if user is not None else ""
+    model = qs.model
+    content_type = ContentType.objects.get_for_model(model)
+
+    update_kwargs = dict(field_values)
+    now = timezone.now()
+    for field in model._meta.concrete_fields:
+        if getattr(field, "auto_now", False):
+            update_kwargs[field.name] = now
+
+    def _build_objectchange(obj):
+        if not hasattr(obj, "to_objectchange"):
+            return None
+        oc = obj.to_objectchange(ObjectChangeActionChoices.ACTION_UPDATE)
+        if oc is None:
+            return None
+        oc.user = user
+        oc.user_name = user_name
+        oc.request_id = change_context.change_id
+        oc.change_context = change_context.context
+        oc.change_context_detail = change_context.context_detail[:CHANGELOG_MAX_CHANGE_CONTEXT_DETAIL]
+        return oc
+
+    # If changes are already being deferred by an enclosing context, write out those pending changes first,
+    # so that the ObjectChange records remain in chronological order.
+    if change_context.defer_object_changes:
+        change_context.create_object_changes(batch_size=batch_size)
+
+    with transaction.atomic():
+        # Snapshot PKs first so that updates in earlier batches do not shift later ones.
+        pks = list(qs.values_list("pk", flat=True))
+
+        for offset in range(0, len(pks), batch_size):
+            batch_pks = pks[offset : offset + batch_size]
+            batch_qs = model.objects.filter(pk__in=batch_pks)
+
+            # As in _handle_changed_object_pre_save(), cache the pre-change data of any objects that have no
+            # ObjectChange yet, so that webhooks and events can report the prior state of these objects. Only the
+            # serialized data is needed, so there's no need to build an ObjectChange for each of these objects.
+            logged_pks = set(
+                ObjectChange.objects.filter(
+                    changed_object_type=content_type, changed_object_id__in=batch_pks
+                ).values_list("changed_object_id", flat=True)
+            )
+            if len(logged_pks) < len(batch_pks) and hasattr(model, "to_objectchange"):
+                if change_context.pre_object_data_v2 is None:
+                    change_context.pre_object_data_v2 = {}
+                for obj in batch_qs.exclude(pk__in=logged_pks):
+                    change_context.pre_object_data_v2.setdefault(str(obj.pk), serialize_object_v2(obj))
+
+            batch_qs.update(**update_kwargs)
+
+            queued = [oc for oc in (_build_objectchange(obj) for obj in batch_qs) if oc is not None]
+            if queued:
+                ObjectChange.objects.bulk_create(queued, batch_size=batch_size)
+
+            # As in update_search_document_for_object(), keep the global search index up to date.
+            if settings.SEARCH_INDEX_ENABLED:
+                SearchDocument.objects.update_for_queryset(batch_qs, batch_size=batch_size)
+
+            # As in update_dynamic_group_memberships_for_object(), once committed, update the cached memberships
+            if settings.DYNAMIC_GROUPS_INCREMENTAL_MEMBERSHIP_UPDATES and getattr(
+                model, "is_dynamic_group_associable_model", False
+            ):
+                transaction.on_commit(
+                    functools.partial(DynamicGroup.objects.update_cached_members_for_objects, list(batch_qs))
+                )
+
+        return len(pks)
+
+
+def bulk_create_with_bulk_change_logging(objs, tags=None, batch_size=1000):
+    """
+    Create the provided (unsaved) objects with `bulk_create()` and create ObjectChange instances in bulk.
+
+    This bypasses the `save()` method and the `pre_save`/`post_save` signals of each object, so it must only be used
+    for models whose creation requires no side effects beyond the change log entry. Objects are processed in chunks
+    of ``batch_size``, and the whole operation is wrapped in an atomic transaction.
+
+    Args:
+        objs (list): Unsaved instances of a single model to create.
+        tags (dict): Optional mapping of the PK of each object to the list of Tags to assign to it.
+        batch_size (int): Number of objects to create and log at a time.
+
+    Returns:
+        (list): The created objects.
+    """
+    # Lazy imports to avoid circular imports.
+    from nautobot.extras.models import DynamicGroup, ObjectChange, SearchDocument, TaggedItem
+    from nautobot.extras.signals import change_context_state
+
+    change_context = change_context_state.get()
+    if change_context is None:
+        raise ValueError("Change logging must be enabled before using bulk_create_with_bulk_change_logging")
+    if not objs:
+        return []
+
+    user = change_context.get_user()
+    user_name = user.username if user is not None else ""
+    model = type(objs[0])
+    content_type = ContentType.objects.get_for_model(model)
+    tags = tags or {}
+
+    def _build_objectchange(obj):
+        if not hasattr(obj, "to_objectchange"):
+            return None
+        oc = obj.to_objectchange(ObjectChangeActionChoices.ACTION_CREATE)
+        if oc is None:
+            return None
+        oc.user = user
+        oc.user_name = user_name
+        oc.request_id = change_context.change_id
+        oc.change_context = change_context.context
+        oc.change_context_detail = change_context.context_detail[:CHANGELOG_MAX_CHANGE_CONTEXT_DETAIL]
+        return oc
+
+    # If changes are already being deferred by an enclosing context, write out those pending changes first,
+    # so that the ObjectChange records remain in chronological order.
+    if change_context.defer_object_changes:
+        change_context.create_object_changes(batch_size=batch_size)
+
+    with transaction.atomic():
+        for offset in range(0, len(objs), batch_size):
+            batch = model.objects.bulk_create(objs[offset : offset + batch_size], batch_size=batch_size)
+
+            tagged_items = []
+            for obj in batch:
+                obj_tags = tags.get(obj.pk, [])
+                # Cache the tags on the instance for change logging, as serialize_object() does for updates
+                obj._tags = obj_tags
+                tagged_items.extend(
+                    TaggedItem(content_type=content_type, object_id=obj.pk, tag=tag) for tag in obj_tags
+                )
+            if tagged_items:
+                TaggedItem.objects.bulk_create(tagged_items, batch_size=batch_size)
+
+            queued = [oc for oc in (_build_objectchange(obj) for obj in batch) if oc is not None]
+            if queued:
+                ObjectChange.objects.bulk_create(queued, batch_size=batch_size)
+
+            # As in update_search_document_for_object(), keep the global search index up to date.
+            if settings.SEARCH_INDEX_ENABLED:
+                SearchDocument.objects.update_for_queryset(
+                    model.objects.filter(pk__in=[obj.pk for obj in batch]), batch_size=batch_size
+                )
+
+            # As in update_dynamic_group_memberships_for_object(), once committed, update the cached memberships
+            if settings.DYNAMIC_GROUPS_INCREMENTAL_MEMBERSHIP_UPDATES and getattr(
+                model, "is_dynamic_group_associable_model", False
+            ):
+                transaction.on_commit(
+                    functools.partial(DynamicGroup.objects.update_cached_members_for_objects, batch, created=True)
+                )
+
+        return objs
+
+
 def fixup_filterset_query_params(param_dict, view_name, non_filter_params):
     """
     Called before saving query filter parameters to a SavedView's config. This function will format
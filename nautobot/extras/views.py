@@ -4761,7 +4761,7 @@ class WebhookUIViewSet(NautobotUIViewSet):
                 label="HTTP",
                 section=SectionChoices.LEFT_HALF,
                 weight=100,
-                fields=("http_method", "http_content_type", "payload_url", "additional_headers"),
+                fields=("http_method", "http_content_type", "payload_url", "additional_headers", "batch_delivery"),
                 value_transforms={"additional_headers": [partial(helpers.pre_tag, format_empty_value=False)]},
             ),
             object_detail.ObjectFieldsPanel(
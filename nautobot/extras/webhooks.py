@@ -8,13 +8,15 @@ from django.core.validators import URLValidator
 from django.utils import timezone
 import netaddr
 
-from nautobot.extras.choices import ObjectChangeActionChoices
 from nautobot.extras.models import Webhook
 from nautobot.extras.registry import registry
-from nautobot.extras.tasks import process_webhook
+from nautobot.extras.tasks import process_webhook, process_webhook_batch
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of changes sent in a single HTTP request to a Webhook with `batch_delivery` enabled
+WEBHOOK_BATCH_MAX_CHANGES = 1000
+
 
 def _webhook_addr_is_builtin_blocked(addr):
     """Return True if ``addr`` is in a never-legitimate range. Admins cannot disable these via configuration."""
@@ -176,7 +178,7 @@ def validate_webhook_url(url):
     return chosen
 
 
-def enqueue_webhooks(object_change, snapshots=None, webhook_queryset=None):
+def enqueue_webhooks(object_change, snapshots=None, webhook_queryset=None, batched_changes=None):
     """
     Find Webhook(s) assigned to this instance + action and enqueue them to be processed.
 
@@ -184,9 +186,12 @@ def enqueue_webhooks(object_change, snapshots=None, webhook_queryset=None):
         object_change (ObjectChange): The change that may trigger Webhooks to be sent.
         snapshots (list): The before/after data snapshots corresponding to the object_change.
         webhook_queryset (QuerySet): Previously retrieved set of Webhooks to potentially send.
+        batched_changes (dict): If provided, changes for Webhooks with `batch_delivery` enabled are appended to
+            `batched_changes[webhook.pk]` rather than being enqueued immediately;
+            see `enqueue_batched_webhooks()`.
 
     Returns:
-        webhook_queryset (QuerySet): for reuse when processing multiple ObjectChange with the same content-type+action.
+        webhook_queryset (list): for reuse when processing multiple ObjectChange with the same content-type+action.
     """
     # Determine whether this type of object supports webhooks
     app_label = object_change.changed_object_type.app_label
@@ -195,16 +200,10 @@ def enqueue_webhooks(object_change, snapshots=None, webhook_queryset=None):
         return webhook_queryset
 
     # Retrieve any applicable Webhooks
-    content_type = object_change.changed_object_type
-    action_flag = {
-        ObjectChangeActionChoices.ACTION_CREATE: "type_create",
-        ObjectChangeActionChoices.ACTION_UPDATE: "type_update",
-        ObjectChangeActionChoices.ACTION_DELETE: "type_delete",
-    }[object_change.action]
     if webhook_queryset is None:
-        webhook_queryset = Webhook.objects.filter(content_types=content_type, enabled=True, **{action_flag: True})
+        webhook_queryset = Webhook.objects.get_for_change(object_change.changed_object_type, object_change.action)
 
-    if webhook_queryset:  # not .exists() as we *want* to populate the queryset cache
+    if webhook_queryset:
         if snapshots is None:
             snapshots = object_change.get_snapshots()
         # fall back to object_data if object_data_v2 is not available
@@ -214,6 +213,16 @@ def enqueue_webhooks(object_change, snapshots=None, webhook_queryset=None):
 
         # Enqueue the webhooks
         for webhook in webhook_queryset:
+            if batched_changes is not None and webhook.batch_delivery:
+                batched_changes.setdefault(webhook.pk, []).append(
+                    {
+                        "event": object_change.action,
+                        "model": model_name,
+                        "data": serialized_data,
+                        "snapshots": snapshots,
+                    }
+                )
+                continue
             args = [
                 webhook.pk,
                 serialized_data,
@@ -227,3 +236,21 @@ def enqueue_webhooks(object_change, snapshots=None, webhook_queryset=None):
             process_webhook.apply_async(args=args)
 
     return webhook_queryset
+
+
+def enqueue_batched_webhooks(batched_changes, username, request_id, batch_size=WEBHOOK_BATCH_MAX_CHANGES):
+    """
+    Enqueue one task per Webhook (per `batch_size` changes) to send the changes collected by `enqueue_webhooks()`.
+
+    Args:
+        batched_changes (dict): `{webhook_pk: [change, ...]}` as populated by `enqueue_webhooks()`.
+        username (str): Name of the user who made the changes.
+        request_id (UUID): Change ID of the request or Job that made the changes.
+        batch_size (int): Maximum number of changes to send in a single HTTP request.
+    """
+    timestamp = str(timezone.now())
+    for webhook_pk, changes in batched_changes.items():
+        for offset in range(0, len(changes), batch_size):
+            process_webhook_batch.apply_async(
+                args=[webhook_pk, changes[offset : offset + batch_size], timestamp, username, request_id]
+            )
@@ -1,3 +1,5 @@
+from itertools import islice
+
 from django.conf import settings
 from django.core.cache import cache
 from django.shortcuts import get_object_or_404
@@ -235,9 +237,8 @@ class PrefixViewSet(NautobotModelViewSet):
                 return Response(serializer.data, status=status.HTTP_201_CREATED)
 
         else:
-            available_prefixes = prefix.get_available_prefixes()
             serializer = serializers.AvailablePrefixSerializer(
-                available_prefixes.iter_cidrs(),
+                prefix.iter_available_prefixes(),
                 many=True,
                 context={
                     "request": request,
@@ -307,12 +308,8 @@ class PrefixViewSet(NautobotModelViewSet):
         if response := error_response_start or error_response_end:
             return response
 
-        available_ips = prefix.get_available_ips()
         # range_start and range_end are inclusive
-        if range_start > default_first:
-            available_ips.remove(netaddr.IPRange(default_first, range_start - 1))
-        if range_end < default_last:
-            available_ips.remove(netaddr.IPRange(range_end + 1, default_last))
+        available_ips = prefix.iter_available_ips(range_start=range_start, range_end=range_end)
 
         # Create the next available IP within the prefix
         if request.method == "POST":
@@ -322,13 +319,14 @@ class PrefixViewSet(NautobotModelViewSet):
                 # Normalize to a list of objects
                 requested_ips = request.data if isinstance(request.data, list) else [request.data]
 
-                # Determine if the requested number of IPs is available
-                if available_ips.size < len(requested_ips):
+                # Determine if the requested number of IPs is available, without enumerating any more than needed
+                allocated_ips = list(islice(available_ips, len(requested_ips)))
+                if len(allocated_ips) < len(requested_ips):
                     return Response(
                         {
                             "detail": (
                                 f"An insufficient number of IP addresses are available within the prefix {prefix} "
-                                f"({len(requested_ips)} requested, {available_ips.size} available between "
+                                f"({len(requested_ips)} requested, {len(allocated_ips)} available between "
                                 f"{range_start} and {range_end})."
                             )
                         },
@@ -337,9 +335,8 @@ class PrefixViewSet(NautobotModelViewSet):
 
                 # Assign addresses from the list of available IPs and copy Namespace assignment from the parent Prefix
                 prefix_length = prefix.prefix.prefixlen
-                available_ips_iter = iter(available_ips)
-                for requested_ip in requested_ips:
-                    requested_ip["address"] = f"{next(available_ips_iter)}/{prefix_length}"
+                for requested_ip, allocated_ip in zip(requested_ips, allocated_ips):
+                    requested_ip["address"] = f"{allocated_ip}/{prefix_length}"
                     requested_ip["namespace"] = prefix.namespace
 
                 # Initialize the serializer with a list or a single object depending on what was requested
@@ -368,12 +365,8 @@ class PrefixViewSet(NautobotModelViewSet):
             if get_settings_or_config("MAX_PAGE_SIZE", fallback=MAX_PAGE_SIZE_DEFAULT):
                 limit = min(limit, get_settings_or_config("MAX_PAGE_SIZE", fallback=MAX_PAGE_SIZE_DEFAULT))
 
-            # Calculate available IPs within the prefix
-            ip_list = []
-            for index, ip in enumerate(available_ips, start=1):
-                ip_list.append(ip)
-                if index == limit:
-                    break
+            # Calculate available IPs within the prefix; a non-positive limit means "no limit"
+            ip_list = list(islice(available_ips, limit if limit > 0 else None))
             serializer = serializers.AvailableIPSerializer(
                 ip_list,
                 many=True,
@@ -21,7 +21,7 @@ from nautobot.core.utils.data import UtilizationData
 from nautobot.dcim.models import Interface
 from nautobot.extras.models import RoleField, StatusField
 from nautobot.extras.utils import extras_features
-from nautobot.ipam import choices, constants
+from nautobot.ipam import choices, constants, ranges
 from nautobot.virtualization.models import VMInterface
 
 from .fields import VarbinaryIPField
@@ -482,6 +482,8 @@ class RouteTarget(PrimaryModel):
         null=True,
     )
 
+    supports_bulk_import = True
+
     class Meta:
         ordering = ["name"]
 
@@ -509,6 +511,8 @@ class RIR(OrganizationalModel):
 
     objects = BaseManager.from_queryset(RIRQuerySet)()
 
+    supports_bulk_import = True
+
     class Meta:
         ordering = ["name"]
         verbose_name = "RIR"
@@ -1171,43 +1175,91 @@ class Prefix(PrimaryModel):
     def next_sibling(self):
         return self.siblings().filter(network__gt=self.network).first()
 
-    def get_available_prefixes(self):
-        """
-        Return all available Prefixes within this prefix as an IPSet.
-        """
-        prefix = netaddr.IPSet(self.prefix)
-        child_prefixes = netaddr.IPSet([child.prefix for child in self.descendants()])
-        available_prefixes = prefix - child_prefixes
+    def _iter_prefix_ranges(self, queryset):
+        """Yield the inclusive `(first, last)` integer range of each Prefix in `queryset`, ordered by network."""
+        for network, broadcast in (
+            queryset.order_by("network").values_list("network", "broadcast").iterator(chunk_size=1000)
+        ):
+            yield int(netaddr.IPAddress(network)), int(netaddr.IPAddress(broadcast))
 
-        return available_prefixes
+    def _iter_ip_ranges(self, first, last):
+        """Yield a single-address `(host, host)` integer range for each IP address in this prefix, ordered by host."""
+        queryset = self.get_all_ips().filter(
+            host__gte=str(netaddr.IPAddress(first, version=self.ip_version)),
+            host__lte=str(netaddr.IPAddress(last, version=self.ip_version)),
+        )
+        for host in queryset.order_by("host").values_list("host", flat=True).iterator(chunk_size=1000):
+            value = int(netaddr.IPAddress(host))
+            yield value, value
 
-    def get_available_ips(self):
+    def _get_usable_ip_range(self):
         """
-        Return all available IPs within this prefix as an IPSet.
-        """
-        prefix = netaddr.IPSet(self.prefix)
-        child_ips = netaddr.IPSet([ip.address.ip for ip in self.get_all_ips()])
-        available_ips = prefix - child_ips
+        Return the inclusive `(first, last)` integer range of IP addresses within this prefix that may be allocated.
 
-        # IPv6, pool, or IPv4 /31-32 sets are fully usable
-        if any(
+        IPv6, pool, and IPv4 /31-32 prefixes are fully usable; otherwise the first and last addresses are omitted.
+        """
+        first, last = self.prefix.first, self.prefix.last
+        if not any(
             [
                 self.ip_version == choices.IPAddressVersionChoices.VERSION_6,
                 self.type == choices.PrefixTypeChoices.TYPE_POOL,
                 self.ip_version == choices.IPAddressVersionChoices.VERSION_4 and self.prefix_length >= 31,
             ]
         ):
-            return available_ips
+            first, last = first + 1, last - 1
+        return first, last
 
-        # Omit first and last IP address from the available set
-        # For "normal" IPv4 prefixes, omit first and last addresses
-        available_ips -= netaddr.IPSet(
-            [
-                netaddr.IPAddress(self.prefix.first),
-                netaddr.IPAddress(self.prefix.last),
-            ]
-        )
-        return available_ips
+    def iter_available_prefixes(self):
+        """
+        Yield each available child prefix within this prefix as a `netaddr.IPNetwork`, in ascending order.
+
+        Descendant prefixes are read from the database as an ordered stream and merged on the fly, so the caller
+        can stop iterating (e.g. with `itertools.islice()`) once enough results have been obtained, without the full
+        set of available space ever being computed.
+        """
+        gaps = ranges.iter_gaps(self.prefix.first, self.prefix.last, self._iter_prefix_ranges(self.descendants()))
+        yield from ranges.iter_range_cidrs(gaps, self.ip_version)
+
+    def iter_available_ips(self, range_start=None, range_end=None):
+        """
+        Yield each available IP within this prefix as a `netaddr.IPAddress`, in ascending order.
+
+        Existing IP addresses are read from the database as an ordered stream, so the caller can stop iterating
+        (e.g. with `itertools.islice()`) once enough results have been obtained.
+
+        Args:
+            range_start (netaddr.IPAddress): If specified, do not yield any IPs lower than this address.
+            range_end (netaddr.IPAddress): If specified, do not yield any IPs higher than this address.
+        """
+        first, last = self._get_usable_ip_range()
+        if range_start is not None:
+            first = max(first, int(range_start))
+        if range_end is not None:
+            last = min(last, int(range_end))
+        if first > last:
+            return
+        gaps = ranges.iter_gaps(first, last, self._iter_ip_ranges(first, last))
+        yield from ranges.iter_range_ips(gaps, self.ip_version)
+
+    def get_available_prefixes(self):
+        """
+        Return all available Prefixes within this prefix as an IPSet.
+
+        If only some of the available prefixes are needed, `iter_available_prefixes()` is more efficient.
+        """
+        return netaddr.IPSet(self.iter_available_prefixes())
+
+    def get_available_ips(self):
+        """
+        Return all available IPs within this prefix as an IPSet.
+
+        If only some of the available IPs are needed, `iter_available_ips()` is more efficient.
+        """
+        first, last = self._get_usable_ip_range()
+        if first > last:
+            return netaddr.IPSet()
+        gaps = ranges.iter_gaps(first, last, self._iter_ip_ranges(first, last))
+        return netaddr.IPSet(ranges.iter_range_cidrs(gaps, self.ip_version))
 
     def get_child_ips(self):
         """
@@ -1254,19 +1306,16 @@ class Prefix(PrimaryModel):
         """
         Return the first available child prefix within the prefix (or None).
         """
-        available_prefixes = self.get_available_prefixes()
-        if not available_prefixes:
-            return None
-        return available_prefixes.iter_cidrs()[0]
+        return next(self.iter_available_prefixes(), None)
 
     def get_first_available_ip(self):
         """
         Return the first available IP within the prefix (or None).
         """
-        available_ips = self.get_available_ips()
-        if not available_ips:
+        available_ip = next(self.iter_available_ips(), None)
+        if available_ip is None:
             return None
-        return f"{next(available_ips.__iter__())}/{self.prefix_length}"
+        return f"{available_ip}/{self.prefix_length}"
 
     def get_utilization(self):
         """Return the utilization of this prefix as a UtilizationData object.
@@ -1275,43 +1324,43 @@ class Prefix(PrimaryModel):
 
         For NETWORK and POOL prefixes, individual IP addresses not already covered by a child prefix are also counted.
 
-        It is recommended that when using this method you add the following prefetch to the queryset when dealing with
-        multiple prefixes to ensure good performance:
+        When dealing with multiple prefixes, it is recommended to call `annotate_utilization()` on the queryset,
+        in which case the utilization of each prefix is computed by the database as part of the same query:
 
         ```
-        prefetch_related(
-            Prefetch(
-                "children", queryset=Prefix.objects.only("network", "prefix_length", "parent_id").order_by()
-            )
-        )
+        Prefix.objects.filter(...).annotate_utilization()
         ```
 
         Returns:
             UtilizationData (namedtuple): (numerator, denominator)
         """
-        denominator = self.prefix.size
-        child_ips = netaddr.IPSet()
-        child_prefixes = netaddr.IPSet()
+        if hasattr(self, "utilization_ip_count"):
+            # Values were precomputed by PrefixQuerySet.annotate_utilization()
+            numerator = int(self.utilization_child_prefixes_size) + self.utilization_ip_count
+            boundary_used = self.utilization_boundary_used
+        else:
+            child_ips = netaddr.IPSet()
+            child_prefixes = netaddr.IPSet()
 
-        # NETWORK and POOL prefixes, but not CONTAINER prefixes, count contained IPAddresses towards utilization.
-        if self.type != choices.PrefixTypeChoices.TYPE_CONTAINER:
-            pool_ips = IPAddress.objects.filter(
-                parent__namespace_id=self.namespace_id,
-                ip_version=self.ip_version,
-                host__gte=self.network,
-                host__lte=self.broadcast,
-            ).values_list("host", flat=True)
-            child_ips = netaddr.IPSet(pool_ips)
+            # NETWORK and POOL prefixes, but not CONTAINER prefixes, count contained IPAddresses towards utilization.
+            if self.type != choices.PrefixTypeChoices.TYPE_CONTAINER:
+                pool_ips = IPAddress.objects.filter(
+                    parent__namespace_id=self.namespace_id,
+                    ip_version=self.ip_version,
+                    host__gte=self.network,
+                    host__lte=self.broadcast,
+                ).values_list("host", flat=True)
+                child_ips = netaddr.IPSet(pool_ips)
 
-        # CONTAINER and NETWORK prefixes, but not POOL prefixes, count contained Prefixes towards utilization.
-        if self.type != choices.PrefixTypeChoices.TYPE_POOL:
-            # Using self.children.all over self.children.iterator (with chunk_size given or not) consistently shaves
-            # off around 200 extra SQL queries and shows better performance.
-            # Also note that this is meant to be used in conjunction with a Prefetch on an only query. This query is
-            # performed in nautobot.ipam.tables.PrefixDetailTable.
-            child_prefixes = netaddr.IPSet(p.prefix for p in self.children.all())
+            # CONTAINER and NETWORK prefixes, but not POOL prefixes, count contained Prefixes towards utilization.
+            if self.type != choices.PrefixTypeChoices.TYPE_POOL:
+                child_prefixes = netaddr.IPSet(p.prefix for p in self.children.all())
 
-        numerator_set = child_ips | child_prefixes
+            numerator_set = child_ips | child_prefixes
+            numerator = numerator_set.size
+            boundary_used = self.network in numerator_set or self.broadcast in numerator_set
+
+        denominator = self.prefix.size
 
         # Exclude network and broadcast IPs from the denominator unless they're assigned to an IPAddress or child pool.
         # Only applies to IPv4 network prefixes with a prefix length of /30 or shorter
@@ -1322,10 +1371,10 @@ class Prefix(PrimaryModel):
                 self.ip_version == choices.IPAddressVersionChoices.VERSION_4,
             ]
         ):
-            if not any([self.network in numerator_set, self.broadcast in numerator_set]):
+            if not boundary_used:
                 denominator -= 2
 
-        return UtilizationData(numerator=numerator_set.size, denominator=denominator)
+        return UtilizationData(numerator=numerator, denominator=denominator)
 
 
 @extras_features("graphql")
@@ -2,10 +2,27 @@ import re
 
 from django.core.exceptions import ValidationError
 from django.core.validators import validate_ipv46_address
-from django.db.models import ProtectedError, Q
+from django.db.models import (
+    BooleanField,
+    Case,
+    Count,
+    DecimalField,
+    Exists,
+    ExpressionWrapper,
+    F,
+    IntegerField,
+    OuterRef,
+    ProtectedError,
+    Q,
+    Subquery,
+    Sum,
+    Value,
+    When,
+)
+from django.db.models.functions import Cast, Coalesce, Power
 import netaddr
 
-from nautobot.core.models.querysets import LocationToLocationsQuerySetMixin, RestrictedQuerySet
+from nautobot.core.models.querysets import count_related, LocationToLocationsQuerySetMixin, RestrictedQuerySet
 from nautobot.core.utils.data import merge_dicts_without_collision
 
 
@@ -383,6 +400,70 @@ class PrefixQuerySet(LocationToLocationsQuerySetMixin, BaseNetworkQuerySet):
         except IndexError:
             raise self.model.DoesNotExist(f"Could not determine parent Prefix for {cidr}")
 
+    def annotate_utilization(self):
+        """
+        Annotate each Prefix with the values needed to compute its utilization, so that `Prefix.get_utilization()`
+        doesn't need to query and merge each Prefix's child prefixes and IP addresses individually.
+
+        This relies on the fact that a Prefix's direct `children` never overlap one another, and that the IP addresses
+        whose `parent` is a given Prefix are exactly those that fall within it but outside any of its children, so the
+        size of the union of the two can be computed as a simple sum within the database.
+
+        Annotations added:
+
+        - `utilization_child_prefixes_size`: the total size of all child prefixes (0 for POOL prefixes)
+        - `utilization_ip_count`: the number of IP addresses not covered by a child prefix (all contained IP addresses
+          for POOL prefixes; 0 for CONTAINER prefixes)
+        - `utilization_boundary_used`: whether the first or last address of the prefix is itself utilized
+        """
+        from nautobot.ipam.choices import PrefixTypeChoices
+        from nautobot.ipam.models import IPAddress
+
+        prefix_size = Power(
+            Cast(Value(2), output_field=DecimalField(max_digits=40, decimal_places=0)),
+            Case(When(ip_version=4, then=Value(32) - F("prefix_length")), default=Value(128) - F("prefix_length")),
+        )
+        child_prefixes_size = (
+            self.model.objects.filter(parent_id=OuterRef("pk"))
+            .order_by()
+            .values("parent_id")
+            .annotate(size=Sum(prefix_size, output_field=DecimalField(max_digits=40, decimal_places=0)))
+            .values("size")
+        )
+        contained_ip_count = (
+            IPAddress.objects.filter(
+                parent__namespace_id=OuterRef("namespace_id"),
+                ip_version=OuterRef("ip_version"),
+                host__gte=OuterRef("network"),
+                host__lte=OuterRef("broadcast"),
+            )
+            .order_by()
+            .values("ip_version")
+            .annotate(count=Count("*"))
+            .values("count")
+        )
+        boundary_q = Q(network=OuterRef("network")) | Q(broadcast=OuterRef("broadcast"))
+        boundary_ip_q = Q(host=OuterRef("network")) | Q(host=OuterRef("broadcast"))
+
+        return self.annotate(
+            utilization_child_prefixes_size=Case(
+                When(type=PrefixTypeChoices.TYPE_POOL, then=Value(0)),
+                default=Coalesce(Subquery(child_prefixes_size), Value(0)),
+                output_field=DecimalField(max_digits=40, decimal_places=0),
+            ),
+            utilization_ip_count=Case(
+                When(type=PrefixTypeChoices.TYPE_CONTAINER, then=Value(0)),
+                When(type=PrefixTypeChoices.TYPE_POOL, then=Coalesce(Subquery(contained_ip_count), Value(0))),
+                default=count_related(IPAddress, "parent"),
+                output_field=IntegerField(),
+            ),
+            utilization_boundary_used=ExpressionWrapper(
+                Q(Exists(self.model.objects.filter(boundary_q, parent_id=OuterRef("pk"))))
+                | Q(Exists(IPAddress.objects.filter(boundary_ip_q, parent_id=OuterRef("pk")))),
+                output_field=BooleanField(),
+            ),
+        )
+
 
 class IPAddressQuerySet(BaseNetworkQuerySet):
     """Queryset for `IPAddress` objects."""
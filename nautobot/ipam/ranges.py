@@ -0,0 +1,97 @@
+"""Streaming helpers for working with sorted ranges of integer IP address values.
+
+These helpers operate on plain `(first, last)` integer tuples (both ends inclusive), so that callers can compute
+available or utilized address space by walking an ordered database query, rather than materializing every address
+into a `netaddr.IPSet` first.
+"""
+
+import netaddr
+
+
+def merge_ranges(ranges):
+    """
+    Merge an iterable of `(first, last)` integer ranges, sorted by `first`, into non-overlapping ranges.
+
+    Overlapping and directly adjacent ranges are coalesced. The input is consumed lazily, so this is safe to use
+    with a database iterator.
+
+    Args:
+        ranges (Iterable[tuple[int, int]]): Inclusive ranges, sorted ascending by their first value.
+
+    Yields:
+        (tuple[int, int]): Merged inclusive ranges, in ascending order.
+    """
+    current_first = current_last = None
+    for first, last in ranges:
+        if current_first is None:
+            current_first, current_last = first, last
+        elif first <= current_last + 1:
+            current_last = max(current_last, last)
+        else:
+            yield current_first, current_last
+            current_first, current_last = first, last
+    if current_first is not None:
+        yield current_first, current_last
+
+
+def iter_gaps(first, last, occupied_ranges):
+    """
+    Yield the inclusive `(first, last)` ranges within `first..last` that are not covered by `occupied_ranges`.
+
+    Args:
+        first (int): First value of the enclosing range.
+        last (int): Last value of the enclosing range.
+        occupied_ranges (Iterable[tuple[int, int]]): Inclusive ranges, sorted ascending by their first value.
+            They need not be merged and may extend beyond the enclosing range.
+
+    Yields:
+        (tuple[int, int]): Free inclusive ranges, in ascending order.
+    """
+    cursor = first
+    for occupied_first, occupied_last in merge_ranges(occupied_ranges):
+        if occupied_last < cursor:
+            continue
+        if occupied_first > last:
+            break
+        if occupied_first > cursor:
+            yield cursor, occupied_first - 1
+        cursor = occupied_last + 1
+        if cursor > last:
+            return
+    if cursor <= last:
+        yield cursor, last
+
+
+def ranges_size(ranges):
+    """Return the total number of values covered by the given non-overlapping inclusive ranges."""
+    return sum(last - first + 1 for first, last in ranges)
+
+
+def iter_range_ips(ranges, version):
+    """
+    Yield each individual `netaddr.IPAddress` within the given inclusive integer ranges.
+
+    Args:
+        ranges (Iterable[tuple[int, int]]): Inclusive ranges of integer address values.
+        version (int): IP version (4 or 6) of the addresses.
+    """
+    for first, last in ranges:
+        value = first
+        while value <= last:
+            yield netaddr.IPAddress(value, version=version)
+            value += 1
+
+
+def iter_range_cidrs(ranges, version):
+    """
+    Yield the minimal list of `netaddr.IPNetwork` CIDRs exactly covering each of the given inclusive integer ranges.
+
+    Args:
+        ranges (Iterable[tuple[int, int]]): Inclusive ranges of integer address values.
+        version (int): IP version (4 or 6) of the addresses.
+    """
+    for first, last in ranges:
+        yield from netaddr.iprange_to_cidrs(
+            netaddr.IPAddress(first, version=version),
+            netaddr.IPAddress(last, version=version),
+        )
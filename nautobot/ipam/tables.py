@@ -1,6 +1,7 @@
-from django.db.models import Prefetch
 from django.utils.safestring import mark_safe
 import django_tables2 as tables
+from django_tables2.data import TableData
+from django_tables2.rows import BoundRows
 from django_tables2.utils import Accessor
 
 from nautobot.core.tables import (
@@ -35,6 +36,7 @@ from .models import (
     VRFDeviceAssignment,
     VRFPrefixAssignment,
 )
+from .querysets import PrefixQuerySet
 
 AVAILABLE_LABEL = mark_safe('<span class="badge bg-success">Available</span>')
 
@@ -481,12 +483,15 @@ class PrefixDetailTable(PrefixTable):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.add_conditional_prefetch(
-            "utilization",
-            prefetch=Prefetch(
-                "children", queryset=Prefix.objects.only("network", "prefix_length", "parent_id").order_by()
-            ),
-        )
+        # Compute utilization for the whole page of prefixes in the database, rather than one Prefix at a time
+        if (
+            "utilization" in self.columns
+            and self.columns["utilization"].visible
+            and isinstance(self.data.data, PrefixQuerySet)
+        ):
+            self.data = TableData.from_data(self.data.data.annotate_utilization())
+            self.data.set_table(self)
+            self.rows = BoundRows(data=self.data, table=self, pinned_data=self.pinned_data)
 
     class Meta(PrefixTable.Meta):
         fields = (
@@ -1490,6 +1490,48 @@ class TestPrefix(ModelTestCases.BaseModelTestCase):
         available_ips = parent_prefix.get_available_ips()
         self.assertEqual(available_ips, missing_ips)
 
+    def test_iter_available_prefixes(self):
+        parent = Prefix.objects.create(
+            prefix="10.0.0.0/16", type=PrefixTypeChoices.TYPE_CONTAINER, status=self.status, namespace=self.namespace
+        )
+        Prefix.objects.create(prefix="10.0.0.0/20", status=self.status, namespace=self.namespace)
+        # Nested and adjacent descendants should be merged into a single allocated range
+        Prefix.objects.create(prefix="10.0.16.0/20", status=self.status, namespace=self.namespace)
+        Prefix.objects.create(prefix="10.0.16.0/24", status=self.status, namespace=self.namespace)
+        Prefix.objects.create(prefix="10.0.128.0/18", status=self.status, namespace=self.namespace)
+
+        self.assertEqual(
+            list(parent.iter_available_prefixes()),
+            [
+                netaddr.IPNetwork("10.0.32.0/19"),
+                netaddr.IPNetwork("10.0.64.0/18"),
+                netaddr.IPNetwork("10.0.192.0/18"),
+            ],
+        )
+        self.assertEqual(netaddr.IPSet(parent.iter_available_prefixes()), parent.get_available_prefixes())
+
+    def test_iter_available_ips(self):
+        parent_prefix = Prefix.objects.create(prefix="10.0.0.0/24", status=self.status, namespace=self.namespace)
+        for address in ["10.0.0.1/24", "10.0.0.2/24", "10.0.0.5/24"]:
+            IPAddress.objects.create(address=address, status=self.status, namespace=self.namespace)
+
+        available_ips = parent_prefix.iter_available_ips()
+        self.assertEqual(
+            [next(available_ips) for _ in range(3)],
+            [netaddr.IPAddress("10.0.0.3"), netaddr.IPAddress("10.0.0.4"), netaddr.IPAddress("10.0.0.6")],
+        )
+        # The network and broadcast addresses are never available
+        self.assertEqual(len(list(parent_prefix.iter_available_ips())), 254 - 3)
+        self.assertEqual(
+            list(
+                parent_prefix.iter_available_ips(
+                    range_start=netaddr.IPAddress("10.0.0.2"), range_end=netaddr.IPAddress("10.0.0.6")
+                )
+            ),
+            [netaddr.IPAddress("10.0.0.3"), netaddr.IPAddress("10.0.0.4"), netaddr.IPAddress("10.0.0.6")],
+        )
+        self.assertEqual(netaddr.IPSet(parent_prefix.iter_available_ips()).size, parent_prefix.get_available_ips().size)
+
     def test_get_first_available_prefix(self):
         prefixes = [
             Prefix(
@@ -1709,6 +1751,15 @@ class TestPrefix(ModelTestCases.BaseModelTestCase):
         )
         self.assertSequenceEqual(v4_10dot_address_space_in_v6.get_utilization(), (0, 2**120))
 
+        # PrefixQuerySet.annotate_utilization() should produce the same results in bulk
+        with self.assertNumQueries(1):
+            annotated_prefixes = list(Prefix.objects.filter(namespace=self.namespace).annotate_utilization())
+        for annotated_prefix in annotated_prefixes:
+            with self.subTest(prefix=str(annotated_prefix)):
+                with self.assertNumQueries(0):
+                    utilization = annotated_prefix.get_utilization()
+                self.assertEqual(utilization, Prefix.objects.get(pk=annotated_prefix.pk).get_utilization())
+
     #
     # Uniqueness enforcement tests
     #
@@ -59,6 +59,8 @@ class Tenant(PrimaryModel):
         "description",
     ]
 
+    supports_bulk_import = True
+
     class Meta:
         ordering = ["tenant_group", "name"]
 
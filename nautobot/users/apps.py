@@ -8,3 +8,7 @@ class UsersConfig(NautobotConfig):
 
     # Flag for version control app to skip versioning user app models
     is_version_controlled = False
+
+    def ready(self):
+        super().ready()
+        import nautobot.users.signals  # noqa: F401  # unused-import -- but this import installs the signals
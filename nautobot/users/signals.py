@@ -0,0 +1,92 @@
+"""Signal handlers for the users application."""
+
+import contextlib
+from functools import partial
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Q
+from django.db.models.signals import m2m_changed, post_save, pre_delete
+from django.dispatch import receiver
+import redis.exceptions
+
+from nautobot.core.utils.cache import construct_cache_key
+from nautobot.users.models import ObjectPermission
+
+User = get_user_model()
+
+
+# Models through which users are granted ObjectPermissions, from the most to the least specific
+_PERMISSION_GRANT_MODELS = (User, Group, ObjectPermission, ContentType)
+
+
+def _get_grant_model_rank(model):
+    """Get the index in `_PERMISSION_GRANT_MODELS` of the given model, lower meaning more specific."""
+    return next(rank for rank, grant_model in enumerate(_PERMISSION_GRANT_MODELS) if issubclass(model, grant_model))
+
+
+def _delete_cache_keys(cache_keys):
+    """Delete the given cache keys, ignoring an unavailable cache."""
+    with contextlib.suppress(redis.exceptions.ConnectionError):
+        cache.delete_many(cache_keys)
+
+
+def _get_affected_user_pks(instance, model=None, pk_set=None):
+    """
+    Get the PKs of the users whose ObjectPermissions are changed by a change to the given instance.
+
+    For an `m2m_changed` signal adding or removing specific objects, only the users granted permissions through the
+    more specific side of the changed relation are affected; for example, adding a Group to an ObjectPermission
+    affects only the users of that Group, not those of any other Group with the same ObjectPermission.
+
+    Args:
+        instance (Model): The ObjectPermission, Group, User or ContentType being changed.
+        model (type): For `m2m_changed` signals, the model class of the objects being added or removed.
+        pk_set (set): For `m2m_changed` signals, the PKs of the objects being added or removed, or None when clearing.
+    """
+    grant_model, pks = type(instance), {instance.pk}
+    if pk_set is not None and _get_grant_model_rank(model) < _get_grant_model_rank(grant_model):
+        grant_model, pks = model, pk_set
+
+    if issubclass(grant_model, User):
+        return set(pks)
+    if issubclass(grant_model, Group):
+        users_filter = Q(groups__in=pks)
+    elif issubclass(grant_model, ObjectPermission):
+        users_filter = Q(object_permissions__in=pks) | Q(groups__object_permissions__in=pks)
+    else:
+        users_filter = Q(object_permissions__object_types__in=pks) | Q(groups__object_permissions__object_types__in=pks)
+    return set(User.objects.filter(users_filter).values_list("pk", flat=True).distinct())
+
+
+@receiver(post_save, sender=ObjectPermission)
+@receiver(pre_delete, sender=ObjectPermission)
+@receiver(m2m_changed, sender=ObjectPermission.object_types.through)
+@receiver(m2m_changed, sender=ObjectPermission.groups.through)
+@receiver(m2m_changed, sender=ObjectPermission.users.through)
+@receiver(m2m_changed, sender=User.groups.through)
+@receiver(pre_delete, sender=Group)
+@receiver(pre_delete, sender=User)
+def invalidate_object_permissions_cache(sender, instance, model=None, pk_set=None, **kwargs):
+    """
+    Invalidate the cached ObjectPermissions of the users affected by a change to an ObjectPermission or group.
+
+    Deletions are handled before the fact, while the deleted object's users and groups can still be looked up. For
+    `m2m_changed`, both the "pre" and "post" signals are handled, so that the users related through the relations
+    both before and after a `clear()` or `set()` are covered.
+
+    The cache is cleared immediately, so that later reads within the current transaction see the change, and again
+    once the transaction is committed, in case another process re-cached the old permissions in the meantime.
+    """
+    user_pks = _get_affected_user_pks(instance, model=model, pk_set=pk_set)
+    if not user_pks:
+        return
+    cache_keys = [
+        construct_cache_key(ObjectPermission.objects, method_name="get_for_user", branch_aware=False, user=pk)
+        for pk in user_pks
+    ]
+    _delete_cache_keys(cache_keys)
+    transaction.on_commit(partial(_delete_cache_keys, cache_keys))
@@ -364,6 +364,8 @@ class VMInterface(PrimaryModel, BaseInterface):
         verbose_name="IP Addresses",
     )
 
+    set_based_bulk_edit_fields = ("description", "enabled", "mtu", "role", "status")
+
     class Meta:
         verbose_name = "VM interface"
         ordering = ("virtual_machine", CollateAsChar("_name"))